@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from bridge.phase21_fields import add_phase21_fields as _phase21_fields
+
 HENRIK = "Henrik Friis"
 PER = "Per Føge Jensen"
 
@@ -106,6 +108,108 @@ def compute_result_status(row) -> tuple[str, str]:
     return "PLAYED", "Spillet"
 
 
+# -----------------------------
+# Vectorized role / pct / status
+# -----------------------------
+
+_SEAT_COLUMNS = (("ns1", "N"), ("ns2", "S"), ("ew1", "Ø"), ("ew2", "V"))
+
+# Seat → seat on declarer's left (the opening leader): left_of() as a table
+_LHO = {seat: left_of(seat) for seat in ("N", "Ø", "S", "V")}
+
+_STATUS_TEXT = {
+    "SITOUT": "Oversidder",
+    "NOT_PLAYED_AVERAGE": "Ikke spillet (gennemsnit 50/50)",
+    "PLAYED": "Spillet",
+}
+
+
+def _column_values(df: pd.DataFrame, col: str, default) -> np.ndarray:
+    """Column as an object array (row.get(col, default) for every row)."""
+    if col not in df.columns:
+        return np.full(len(df), default, dtype=object)
+    return df[col].to_numpy(dtype=object)
+
+
+def _seats_of(df: pd.DataFrame, player: str) -> np.ndarray:
+    """
+    Seat of player per row ("" when not at the table).
+
+    Same precedence as role()'s positions dict: if the name occurs in more
+    than one column, the last of ns1/ns2/ew1/ew2 wins.
+    """
+    conds = [_column_values(df, col, "") == player for col, _ in reversed(_SEAT_COLUMNS)]
+    seats = [seat for _, seat in reversed(_SEAT_COLUMNS)]
+    return np.select(conds, seats, default="").astype(object)
+
+
+def _roles(df: pd.DataFrame, player: str) -> np.ndarray:
+    """role(row, player) for every row."""
+    seat = _seats_of(df, player)
+    decl = _column_values(df, "decl", "")
+    has_decl = np.fromiter((bool(d) for d in decl), dtype=bool, count=len(decl))
+    active = (seat != "") & has_decl
+
+    seat_ns = (seat == "N") | (seat == "S")
+    decl_ns = (decl == "N") | (decl == "S")
+    declarer = active & (seat == decl)
+    dummy = active & ~declarer & (seat_ns == decl_ns)
+    defence = active & ~declarer & ~dummy
+
+    lho = np.array([_LHO.get(d, "") if isinstance(d, str) else "" for d in decl], dtype=object)
+    unknown = defence & (lho == "")
+    if unknown.any():
+        # role() looks the seat up with list.index(): keep its error
+        bad = decl[np.flatnonzero(unknown)[0]]
+        raise ValueError(f"{bad!r} is not in list")
+
+    return np.select(
+        [~active, declarer, dummy, seat == lho],
+        ["", "Declarer", "Dummy", "Defense_Leader"],
+        default="Defense_Partner",
+    ).astype(object)
+
+
+def _pcts(df: pd.DataFrame, player: str) -> pd.Series:
+    """pct_for(row, player) for every row (NS membership checked first)."""
+    at_ns = (_column_values(df, "ns1", "") == player) | (_column_values(df, "ns2", "") == player)
+    at_ew = (_column_values(df, "ew1", "") == player) | (_column_values(df, "ew2", "") == player)
+    pct = np.where(
+        at_ns,
+        _column_values(df, "pct_NS", np.nan),
+        np.where(at_ew, _column_values(df, "pct_ØV", np.nan), np.nan),
+    )
+    # dtype inferred from the values, as apply() does
+    return pd.Series(pct.tolist(), index=df.index, dtype=None if len(pct) else float)
+
+
+def _is_fifty(df: pd.DataFrame, col: str) -> np.ndarray:
+    """_to_float_or_none(row.get(col)) == 50.0 for every row."""
+    if col in df.columns and pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col]):
+        return (df[col].to_numpy(dtype=float, na_value=np.nan) == 50.0)
+    vals = _column_values(df, col, None)
+    return np.fromiter((_to_float_or_none(v) == 50.0 for v in vals), dtype=bool, count=len(vals))
+
+
+def _result_status_codes(df: pd.DataFrame) -> np.ndarray:
+    """compute_result_status(row)[0] for every row."""
+    sitout = np.zeros(len(df), dtype=bool)
+    for col, _ in _SEAT_COLUMNS:
+        if col in df.columns:
+            names = pd.Series(_column_values(df, col, None)).map(lambda v: str(v or ""))
+            sitout |= names.str.contains("Oversidder", regex=False).to_numpy(dtype=bool)
+
+    missing = np.zeros(len(df), dtype=bool)
+    for col in ("contract_raw", "decl"):
+        vals = _column_values(df, col, None)
+        missing |= np.fromiter((_is_missing(v) for v in vals), dtype=bool, count=len(vals))
+    average = missing & _is_fifty(df, "pct_NS") & _is_fifty(df, "pct_ØV")
+
+    return np.select(
+        [sitout, average], ["SITOUT", "NOT_PLAYED_AVERAGE"], default="PLAYED",
+    ).astype(object)
+
+
 def add_roles_and_pct(df: pd.DataFrame, henrik: str = HENRIK, per: str = PER) -> pd.DataFrame:
     """
     Adds:
@@ -114,18 +218,19 @@ def add_roles_and_pct(df: pd.DataFrame, henrik: str = HENRIK, per: str = PER) ->
       result_status_code, result_status_text
 
     Must not change existing calculations: only adds columns.
+    Column-wise equivalent of role() / pct_for() / compute_result_status().
     """
     df = df.copy()
 
-    df["Henrik_role"] = df.apply(lambda r: role(r, henrik), axis=1)
-    df["Per_role"] = df.apply(lambda r: role(r, per), axis=1)
-    df["Henrik_pct"] = df.apply(lambda r: pct_for(r, henrik), axis=1)
-    df["Per_pct"] = df.apply(lambda r: pct_for(r, per), axis=1)
+    df["Henrik_role"] = pd.Series(_roles(df, henrik), index=df.index)
+    df["Per_role"] = pd.Series(_roles(df, per), index=df.index)
+    df["Henrik_pct"] = _pcts(df, henrik)
+    df["Per_pct"] = _pcts(df, per)
 
     # v0.1.x: status fields (pure metadata)
-    df[["result_status_code", "result_status_text"]] = df.apply(
-        lambda r: pd.Series(compute_result_status(r)), axis=1
-    )
+    codes = pd.Series(_result_status_codes(df), index=df.index)
+    df["result_status_code"] = codes
+    df["result_status_text"] = codes.map(_STATUS_TEXT)
 
     return df
 
@@ -467,7 +572,7 @@ def make_pair_declarer_report(df: pd.DataFrame, min_boards: int = 0) -> pd.DataF
     return out
 def add_phase21_fields(df, n_min=12):
     """
-    Phase 2.1 reference-lag berigelse.
+    Phase 2.1 reference-lag berigelse (se bridge.phase21_fields).
 
     Forventet input-DataFrame med kolonner:
     - tournament_date (str)
@@ -484,190 +589,4 @@ def add_phase21_fields(df, n_min=12):
     - Board_Type, competitive_flag, expected_pct
     - contract_norm, double_state
     """
-    if df.empty:
-        print("⚠️ Phase 2.1: Input DataFrame er tom")
-        return df
-
-    df = df.copy()
-
-    # === STEP 1: Normaliser kontrakter ===
-    df["contract_norm"] = df["contract"].astype(str)
-    df["double_state"] = ""
-
-    for idx, row in df.iterrows():
-        contract = str(row["contract"])
-        if contract.endswith("XX"):
-            df.at[idx, "contract_norm"] = contract[:-2]
-            df.at[idx, "double_state"] = "XX"
-        elif contract.endswith("X"):
-            df.at[idx, "contract_norm"] = contract[:-1]
-            df.at[idx, "double_state"] = "X"
-        else:
-            df.at[idx, "contract_norm"] = contract
-            df.at[idx, "double_state"] = ""
-
-    # === STEP 2: Initialiser output-kolonner ===
-    df["reference_scope"] = None
-    df["N_section_played"] = 0
-    df["N_club_played"] = 0
-    df["reference_n_played"] = 0
-    df["field_mode_contract"] = None
-    df["field_mode_count"] = None
-    df["field_mode_freq"] = None
-    df["top2_contract_1"] = None
-    df["top2_contract_2"] = None
-    df["top2_count_1"] = None
-    df["top2_count_2"] = None
-    df["Board_Type"] = "LOW_SAMPLE"
-    df["competitive_flag"] = False
-    df["expected_pct"] = None
-
-    # === STEP 3: Filter kun PLAYED rækker med gyldig pct ===
-    played_df = df[
-        (df["result_status_code"] == "PLAYED") & (df["pct"].notna())
-    ].copy()
-
-    if played_df.empty:
-        print("⚠️ Phase 2.1: Ingen PLAYED rækker med gyldig pct")
-        return df
-
-    print(f"✓ Phase 2.1: {len(played_df)} PLAYED rækker fundet")
-
-    # === STEP 4: Beregn N_section_played og N_club_played ===
-    section_groups = played_df.groupby(
-        ["tournament_date", "board_no", "section"]
-    ).size()
-    club_groups = played_df.groupby(["tournament_date", "board_no"]).size()
-
-    for idx, row in df.iterrows():
-        date = row["tournament_date"]
-        board = row["board_no"]
-        sec = row["section"]
-        df.at[idx, "N_section_played"] = section_groups.get((date, board, sec), 0)
-        df.at[idx, "N_club_played"] = club_groups.get((date, board), 0)
-
-    # === STEP 5: Vælg reference_scope ===
-    for idx, row in df.iterrows():
-        n_section = df.at[idx, "N_section_played"]
-        n_club = df.at[idx, "N_club_played"]
-        if n_section >= n_min:
-            df.at[idx, "reference_scope"] = "SECTION"
-            df.at[idx, "reference_n_played"] = n_section
-        elif n_club >= n_min:
-            df.at[idx, "reference_scope"] = "CLUB"
-            df.at[idx, "reference_n_played"] = n_club
-        else:
-            df.at[idx, "reference_scope"] = "LOW_SAMPLE"
-            df.at[idx, "reference_n_played"] = n_club
-
-    # === STEP 6: MAIN LOOP – per (tournament_date, board_no, section) ===
-    unique_groups = df[["tournament_date", "board_no", "section"]].drop_duplicates()
-    print(
-        f"✓ Phase 2.1: Behandler {len(unique_groups)} unikke grupper"
-        " (turnering+board+sektion)"
-    )
-
-    for group_idx, (_, group_row) in enumerate(unique_groups.iterrows(), 1):
-        date = group_row["tournament_date"]
-        board = group_row["board_no"]
-        sec = group_row["section"]
-
-        group_mask = (
-            (df["tournament_date"] == date)
-            & (df["board_no"] == board)
-            & (df["section"] == sec)
-        )
-        group_indices = df[group_mask].index
-
-        if len(group_indices) == 0:
-            continue
-
-        ref_scope = df.at[group_indices[0], "reference_scope"]
-        ref_n = df.at[group_indices[0], "reference_n_played"]
-
-        # Bestem referencegruppe
-        if ref_scope == "SECTION":
-            ref_mask = (
-                (played_df["tournament_date"] == date)
-                & (played_df["board_no"] == board)
-                & (played_df["section"] == sec)
-            )
-        else:
-            ref_mask = (played_df["tournament_date"] == date) & (
-                played_df["board_no"] == board
-            )
-
-        ref_group = played_df[ref_mask]
-        if ref_group.empty:
-            continue
-
-        # Tæl kontrakt-frekvenser
-        contract_counts = ref_group["contract_norm"].value_counts().to_dict()
-        if not contract_counts:
-            continue
-
-        sorted_contracts = sorted(
-            contract_counts.items(), key=lambda x: x[1], reverse=True
-        )
-        top1_contract, top1_count = sorted_contracts[0]
-        top1_freq = top1_count / ref_n if ref_n > 0 else 0.0
-        top2_contract = (
-            sorted_contracts[1][0] if len(sorted_contracts) > 1 else None
-        )
-        top2_count = (
-            sorted_contracts[1][1] if len(sorted_contracts) > 1 else None
-        )
-
-        # Klassificér Board_Type
-        if ref_scope == "LOW_SAMPLE":
-            board_type = "LOW_SAMPLE"
-        else:
-            p1 = top1_count / ref_n if ref_n > 0 else 0.0
-            p2 = (
-                (top2_count / ref_n)
-                if (top2_count is not None and ref_n > 0)
-                else 0.0
-            )
-            if p1 >= 0.70:
-                board_type = "Dominant"
-            elif (p1 + p2) >= 0.80 and p2 >= 0.25:
-                board_type = "Split"
-            else:
-                board_type = "Wild"
-
-        # Beregn expected_pct
-        if top1_count >= 3:
-            mode_mask = ref_mask & (played_df["contract_norm"] == top1_contract)
-            mode_pcts = played_df[mode_mask]["pct"]
-            expected_pct_val = mode_pcts.mean() if len(mode_pcts) > 0 else None
-        else:
-            expected_pct_val = (
-                ref_group["pct"].mean() if len(ref_group) > 0 else None
-            )
-
-        for idx in group_indices:
-            df.at[idx, "field_mode_contract"] = top1_contract
-            df.at[idx, "field_mode_count"] = top1_count
-            df.at[idx, "field_mode_freq"] = top1_freq
-            df.at[idx, "top2_contract_1"] = top1_contract
-            df.at[idx, "top2_count_1"] = top1_count
-            df.at[idx, "top2_contract_2"] = top2_contract
-            df.at[idx, "top2_count_2"] = top2_count
-            df.at[idx, "Board_Type"] = board_type
-            df.at[idx, "expected_pct"] = expected_pct_val
-
-        if group_idx % 50 == 0:
-            print(f"  ... behandlet {group_idx}/{len(unique_groups)} grupper")
-
-    # === STEP 7: Beregn competitive_flag ===
-    df["competitive_flag"] = df["Board_Type"] == "Split"
-
-    # === STEP 8: Statistik ===
-    board_type_counts = df["Board_Type"].value_counts().to_dict()
-    print(f"\n✓ Phase 2.1 færdig:")
-    print(f"  Dominant boards: {board_type_counts.get('Dominant', 0)}")
-    print(f"  Split boards (competitive): {board_type_counts.get('Split', 0)}")
-    print(f"  Wild boards: {board_type_counts.get('Wild', 0)}")
-    print(f"  LOW_SAMPLE boards: {board_type_counts.get('LOW_SAMPLE', 0)}")
-
-    return df
+    return _phase21_fields(df, n_min=n_min, verbose=True)
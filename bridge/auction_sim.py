@@ -0,0 +1,116 @@
+"""
+bridge/auction_sim.py
+
+Batch bidding simulation: the opening_bid auction (suggest_first_round_for_row)
+for every row of a result DataFrame.
+
+- rows are reduced to distinct deals first (four hands, dealer, vul): a
+  board is played at 10+ tables, so each board is simulated once, not
+  once per table
+- finished auctions are kept per deal in `cache`; pass the same dict to
+  later calls to skip deals that were already simulated
+- the deals run on a process pool in chunks; each worker compiles the
+  YAML bundle once
+
+Usage:
+    sim = suggest_auctions(df)
+    df_cmp = df.join(sim)
+    same_contract = df_cmp["contract"] == df_cmp["sim_contract"]
+
+The sim_* columns follow the conventions of the scraped columns
+(contract "4♥", strain "♠"/"NT", decl "N"/"Ø"/"S"/"V", "" when the deal
+is passed out), so they compare directly with contract / strain / decl.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, MutableMapping, Optional, Sequence
+
+import pandas as pd
+
+from bridge.opening_bid import final_contract_from_calls, suggest_first_round_for_row
+
+DEAL_COLUMNS: tuple[str, ...] = ("N_hand", "Ø_hand", "S_hand", "V_hand", "dealer", "vul")
+SIM_COLUMNS: tuple[str, ...] = (
+    "sim_calls", "sim_rule_ids", "sim_n_calls",
+    "sim_contract", "sim_level", "sim_strain", "sim_decl", "sim_doubled",
+)
+DEFAULT_CHUNK_DEALS = 200
+
+DealKey = tuple[Optional[str], ...]
+
+
+def _deal_value(value: Any) -> Optional[str]:
+    return None if pd.isna(value) else str(value)
+
+
+def deal_keys(df: pd.DataFrame) -> list[DealKey]:
+    """One DEAL_COLUMNS key per row of df (missing values as None)."""
+    values = df[list(DEAL_COLUMNS)].astype(object)
+    return [tuple(_deal_value(v) for v in rec) for rec in values.itertuples(index=False, name=None)]
+
+
+def simulate_deal(key: DealKey) -> dict[str, Any]:
+    """The simulated auction of one deal as a SIM_COLUMNS record."""
+    result = suggest_first_round_for_row(dict(zip(DEAL_COLUMNS, key)))
+    calls = result.get("call_sequence") or []
+    final = final_contract_from_calls(calls)
+    return {
+        "sim_calls": " ".join(str(c.get("display_bid") or "") for c in calls),
+        "sim_rule_ids": " ".join(str(c.get("rule_id") or "-") for c in calls),
+        "sim_n_calls": len(calls),
+        "sim_contract": final["contract"] or "",
+        "sim_level": final["level"],
+        "sim_strain": final["strain"] or "",
+        "sim_decl": final["declarer"] or "",
+        "sim_doubled": final["doubled"],
+    }
+
+
+def _simulate_chunk(keys: Sequence[DealKey]) -> list[dict[str, Any]]:
+    return [simulate_deal(key) for key in keys]
+
+
+def _simulate(keys: Sequence[DealKey], max_workers: Optional[int], chunk_deals: int) -> list[dict[str, Any]]:
+    if not keys:
+        return []
+    workers = max_workers or os.cpu_count() or 1
+    size = max(1, min(int(chunk_deals), -(-len(keys) // workers)))
+    chunks = [keys[i:i + size] for i in range(0, len(keys), size)]
+    workers = min(workers, len(chunks))
+    if workers <= 1:
+        return [record for chunk in chunks for record in _simulate_chunk(chunk)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return [record for records in executor.map(_simulate_chunk, chunks) for record in records]
+
+
+def suggest_auctions(
+    df: pd.DataFrame,
+    max_workers: Optional[int] = None,
+    cache: Optional[MutableMapping[DealKey, dict[str, Any]]] = None,
+    chunk_deals: int = DEFAULT_CHUNK_DEALS,
+) -> pd.DataFrame:
+    """
+    Simulated auction for every row of df: SIM_COLUMNS on df's index.
+
+    sim_calls / sim_rule_ids are the calls (display form) and their rule
+    ids, space separated ("-" for a call without a rule id).  Rows of the
+    same deal share one simulation; deals found in cache are not re-run
+    and new ones are added to it.  max_workers defaults to the CPU count;
+    with one worker (or one chunk) everything runs in-process.
+    """
+    cache = {} if cache is None else cache
+    keys = deal_keys(df)
+    distinct = list(dict.fromkeys(keys))
+
+    todo = [key for key in distinct if key not in cache]
+    for key, record in zip(todo, _simulate(todo, max_workers, chunk_deals)):
+        cache[key] = record
+
+    position = {key: i for i, key in enumerate(distinct)}
+    per_deal = pd.DataFrame([cache[key] for key in distinct], columns=list(SIM_COLUMNS))
+    out = per_deal.take([position[key] for key in keys]).set_axis(df.index)
+    return out.astype({"sim_n_calls": "int16", "sim_level": "Int8"})
@@ -8,14 +8,11 @@ Design rule:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 import re
-from typing import Mapping
+from typing import Callable, Mapping
 
-from bridge.hand_eval import controls as calc_controls
-from bridge.hand_eval import hcp as calc_hcp
-from bridge.hand_eval import ltc_adjusted
-from bridge.hand_eval import parse_hand
+from bridge.hand_eval import evaluate_hand_cached
 
 
 SEATS = ("N", "Ø", "S", "V")
@@ -187,6 +184,44 @@ class AuctionState:
     fit_estimates: dict[tuple[str, str], FitEstimate] = field(default_factory=dict)
     highest_contract: str | None = None
     assumptions: list[str] = field(default_factory=list)
+    # Seats whose SeatEstimate may also be referenced by a fork (copy before mutating)
+    shared_seats: set[str] = field(default_factory=set, repr=False, compare=False)
+
+
+def fork_auction_state(state: AuctionState) -> AuctionState:
+    """Copy-on-write fork for "what-if" branches.
+
+    Seat estimates (with their evidence logs) are shared between parent and
+    fork until apply_bid_evidence changes one of them in either state; fit
+    estimates are replaced, never mutated, so the dict is copied shallowly.
+    """
+    state.shared_seats.update(state.seats)
+    return replace(
+        state,
+        seats=dict(state.seats),
+        calls=list(state.calls),
+        fit_estimates=dict(state.fit_estimates),
+        assumptions=list(state.assumptions),
+        shared_seats=set(state.seats),
+    )
+
+
+def _copy_seat(seat_state: SeatEstimate) -> SeatEstimate:
+    return replace(
+        seat_state,
+        suit_min=dict(seat_state.suit_min),
+        suit_max=dict(seat_state.suit_max),
+        shown_natural_suits=set(seat_state.shown_natural_suits),
+        evidence_log=list(seat_state.evidence_log),
+    )
+
+
+def _own_seat(state: AuctionState, seat: str) -> SeatEstimate:
+    """state.seats[seat], copied first if a fork still shares it."""
+    if seat in state.shared_seats:
+        state.seats[seat] = _copy_seat(state.seats[seat])
+        state.shared_seats.discard(seat)
+    return state.seats[seat]
 
 
 def create_auction_state(
@@ -226,10 +261,10 @@ def create_auction_state(
 
 
 def _load_exact_hand(state: AuctionState, seat: str, hand_dot: str) -> None:
-    parsed = parse_hand(hand_dot)
-    hcp_val = float(calc_hcp(parsed))
-    ltc_val = float(ltc_adjusted(parsed))
-    ctr_val = float(calc_controls(parsed).get("controls", 0))
+    ev = evaluate_hand_cached(hand_dot)
+    hcp_val = float(ev.hcp)
+    ltc_val = float(ev.ltc_adj)
+    ctr_val = float(ev.controls)
 
     s = state.seats[seat]
     s.known_hand = True
@@ -237,7 +272,7 @@ def _load_exact_hand(state: AuctionState, seat: str, hand_dot: str) -> None:
     s.ltc_range = ValueRange(ltc_val, ltc_val)
     s.controls_range = ValueRange(ctr_val, ctr_val)
     for suit in SUITS:
-        ln = int(parsed.lengths[suit])
+        ln = int(ev.length(suit))
         s.suit_min[suit] = ln
         s.suit_max[suit] = ln
     s.evidence_log.append("Exact hand loaded for perspective seat.")
@@ -358,7 +393,7 @@ def apply_bid_evidence(
     if _is_higher_contract(str(bid), state.highest_contract):
         state.highest_contract = str(bid)
 
-    _apply_evidence_to_seat(state.seats[seat_norm], evidence)
+    _apply_evidence_to_seat(_own_seat(state, seat_norm), evidence)
 
     natural = _normalize_strain(evidence.natural_strain)
     if natural in SUITS:
@@ -372,6 +407,61 @@ def apply_bid_evidence(
     return state
 
 
+EvidenceFn = Callable[[AuctionState, str, str], BidEvidence]
+
+
+class AuctionTimeline:
+    """The public calls of one auction plus one state per perspective seat.
+
+    Rebuilding a fresh state and replaying every prior call for each decision
+    is quadratic in auction length.  Here each perspective state is created
+    once and advanced only over the calls it has not seen yet, and the
+    evidence of each call is inferred once: it depends only on the public
+    auction (calls so far, highest contract), not on the perspective.
+
+    States returned by state_for() are live – treat them as read-only and
+    use fork_auction_state() for what-if branches.
+    """
+
+    def __init__(self, infer_evidence: EvidenceFn):
+        self._infer_evidence = infer_evidence
+        self._n_recorded = 0
+        self._calls: list[tuple[str, str]] = []
+        self._evidence: list[BidEvidence] = []
+        self._states: dict[str, AuctionState] = {}
+        self._applied: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self._n_recorded
+
+    def record(self, seat: object, bid: str) -> None:
+        """Append one call; calls without a valid seat are counted but not applied."""
+        self._n_recorded += 1
+        seat_norm = _normalize_seat(seat)
+        if seat_norm is not None:
+            self._calls.append((seat_norm, str(bid)))
+
+    def state_for(self, seat: str, create: Callable[[], AuctionState]) -> AuctionState:
+        """State from seat's perspective after every recorded call (create() on first use)."""
+        state = self._states.get(seat)
+        if state is None:
+            state = self._states[seat] = create()
+            self._applied[seat] = 0
+
+        try:
+            for i in range(self._applied[seat], len(self._calls)):
+                call_seat, bid = self._calls[i]
+                if i == len(self._evidence):
+                    self._evidence.append(self._infer_evidence(state, call_seat, bid))
+                apply_bid_evidence(state, call_seat, bid, self._evidence[i])
+                self._applied[seat] = i + 1
+        except Exception:
+            # half-advanced state: rebuild from scratch on the next request
+            del self._states[seat], self._applied[seat]
+            raise
+        return state
+
+
 def _fit_bonus(fit_cards: int) -> int:
     if fit_cards >= 10:
         return 2
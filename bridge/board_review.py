@@ -3,6 +3,7 @@ import re
 import pandas as pd
 import numpy as np
 
+from bridge.hand_eval import SUITS_ORDER, Hand
 from bridge.opening_bid import suggest_first_round_for_row
 
 
@@ -35,16 +36,18 @@ _VUL_DK = {
 _PARTNER_NAME = "Henrik Friis"
 
 
+def _is_null(value) -> bool:
+    """True for None, NaN and pd.NA (nullable Int8 / categorical cells from bridge.schema)."""
+    return value is None or value is pd.NA or (isinstance(value, float) and pd.isna(value))
+
+
 def _hand_suit_lines(hand_str) -> list:
     """Convert dot-format hand string (S.H.D.C) to 4 suit lines with symbols."""
-    if hand_str is None or (isinstance(hand_str, float) and pd.isna(hand_str)):
-        parts = ['-', '-', '-', '-']
-    else:
-        parts = str(hand_str).split('.')
-        while len(parts) < 4:
-            parts.append('-')
     suits = ['♠', '♥', '♦', '♣']
-    return [f"{s} {p}" for s, p in zip(suits, parts)]
+    if _is_null(hand_str):
+        return [f"{s} -" for s in suits]
+    hand = Hand.from_dot(str(hand_str))
+    return [f"{s} {hand.ranks(suit)}" for s, suit in zip(suits, SUITS_ORDER)]
 
 
 def _both_names_in_df(df_subset: pd.DataFrame, name1: str, name2: str) -> bool:
@@ -58,7 +61,7 @@ def _both_names_in_df(df_subset: pd.DataFrame, name1: str, name2: str) -> bool:
         if col not in df_subset.columns:
             continue
         for val in df_subset[col]:
-            if val is None or (isinstance(val, float) and pd.isna(val)):
+            if _is_null(val):
                 continue
             s = str(val).strip()
             if s == n1:
@@ -237,20 +240,19 @@ def write_board1_layout_sheet(
             dd_col = f'dd_{dir_code}_HCP'
             if dd_col in per_row.index:
                 val = per_row.get(dd_col)
-                if val is not None and not (isinstance(val, float) and pd.isna(val)):
+                if not _is_null(val):
                     return int(val)
         # 2) Regular per-direction HCP column
         col = _hcp_col_map.get(dir_code, '')
         if col and col in per_row.index:
             val = per_row.get(col)
-            if val is not None and not (isinstance(val, float) and pd.isna(val)):
+            if not _is_null(val):
                 return int(val)
         # 3) Fallback: compute from hand string
         hand = dir_to_hand.get(dir_code)
-        if hand is not None and not (isinstance(hand, float) and pd.isna(hand)):
+        if not _is_null(hand):
             try:
-                from bridge.hand_eval import parse_hand, hcp as _calc_hcp
-                return _calc_hcp(parse_hand(str(hand)))
+                return Hand.from_dot(str(hand)).hcp
             except Exception:
                 pass
         return '?'
@@ -277,7 +279,7 @@ def write_board1_layout_sheet(
         for c in candidates:
             if c in row.index:
                 val = row.get(c)
-                if val is not None and not (isinstance(val, float) and pd.isna(val)):
+                if not _is_null(val):
                     return val
         return None
 
@@ -345,7 +347,7 @@ def write_board1_layout_sheet(
     _bh_w = dir_to_hand.get('V')
     _bsol_url = None
     if all(
-        h and not (isinstance(h, float) and pd.isna(h))
+        not _is_null(h) and h
         for h in [_bh_n, _bh_s, _bh_e, _bh_w]
     ):
         _bsol_dealer_val = _get_field(per_row, 'dealer', 'Dealer')
@@ -356,9 +358,7 @@ def write_board1_layout_sheet(
         _tid = per_row.get('tournament_id')
         _event = (
             f"{int(_mcn)}_{int(_tid)}"
-            if _mcn is not None and _tid is not None
-            and not (isinstance(_mcn, float) and pd.isna(_mcn))
-            and not (isinstance(_tid, float) and pd.isna(_tid))
+            if not _is_null(_mcn) and not _is_null(_tid)
             else 'bridge_dk'
         )
         _bsol_url = (
@@ -396,8 +396,7 @@ def write_board1_layout_sheet(
         if per_row.get('dd_valid'):
             dd1 = per_row.get(f'dd_{dir1}_HCP')
             dd2 = per_row.get(f'dd_{dir2}_HCP')
-            if (dd1 is not None and not (isinstance(dd1, float) and pd.isna(dd1)) and
-                    dd2 is not None and not (isinstance(dd2, float) and pd.isna(dd2))):
+            if not _is_null(dd1) and not _is_null(dd2):
                 try:
                     return int(dd1) + int(dd2)
                 except (ValueError, TypeError):
@@ -749,7 +748,7 @@ def write_board1_layout_sheet(
 
     def _pct_or_unknown(val):
         """Return pct value or 'ukendt' when unavailable."""
-        if val is None or (isinstance(val, float) and pd.isna(val)):
+        if _is_null(val):
             return 'ukendt'
         return val
 
@@ -762,7 +761,7 @@ def write_board1_layout_sheet(
 
     def _to_number_or_none(val):
         """Try parse a numeric value; return None when unavailable/non-numeric."""
-        if val is None or (isinstance(val, float) and pd.isna(val)):
+        if _is_null(val):
             return None
         if isinstance(val, (int, float, np.integer, np.floating)):
             if pd.isna(val):
@@ -837,7 +836,7 @@ def write_board1_layout_sheet(
         o_hand = _get_field(row_obj, 'Ø_hand')
         v_hand = _get_field(row_obj, 'V_hand')
         parts = [n_hand, s_hand, o_hand, v_hand]
-        if any(p is None or (isinstance(p, float) and pd.isna(p)) for p in parts):
+        if any(_is_null(p) for p in parts):
             return None
         out = [str(p).strip() for p in parts]
         if any(not p for p in out):
@@ -1012,7 +1011,7 @@ def write_board1_layout_sheet(
     _DD_START_COL = 5  # E
 
     dd_valid = per_row.get('dd_valid')
-    if dd_valid is None or (isinstance(dd_valid, float) and pd.isna(dd_valid)):
+    if _is_null(dd_valid):
         dd_valid = False
 
     if not dd_valid:
@@ -1078,7 +1077,7 @@ def write_board1_layout_sheet(
             for j, strain_key in enumerate(_DD_STRAIN_KEYS):
                 col_name = f'dd_{dir_code}_{strain_key}'
                 val = per_row.get(col_name)
-                if val is not None and not (isinstance(val, float) and pd.isna(val)):
+                if not _is_null(val):
                     try:
                         val = int(val)
                     except (ValueError, TypeError):
@@ -1091,7 +1090,7 @@ def write_board1_layout_sheet(
             # HCP column (M = index 5)
             hcp_col = f'dd_{dir_code}_HCP'
             hcp_val = per_row.get(hcp_col)
-            if hcp_val is not None and not (isinstance(hcp_val, float) and pd.isna(hcp_val)):
+            if not _is_null(hcp_val):
                 try:
                     hcp_val = int(hcp_val)
                 except (ValueError, TypeError):
@@ -1170,13 +1169,13 @@ def write_board1_layout_sheet(
     lead_udspil_col_rel = lead_header_pos.get('Udspil')
 
     def _normalize_lead_token(value) -> str | None:
-        if value is None or (isinstance(value, float) and pd.isna(value)):
+        if _is_null(value):
             return None
         s = str(value).replace('\xa0', '').replace(' ', '').strip().upper()
         return s if s else None
 
     def _normalize_contract_color_token(value) -> str | None:
-        if value is None or (isinstance(value, float) and pd.isna(value)):
+        if _is_null(value):
             return None
         s = str(value).strip().upper().replace('UT', 'NT')
         if not s or s == 'UKENDT':
@@ -1382,10 +1381,9 @@ def write_board1_layout_sheet(
             _override = dict(row_dict)
             _override["strain"] = _STRAIN_KEY_TO_SYM2.get(strain_key, strain_key)
             _override["decl"] = decl_dir
-            _tbl = _compute_lt_fn(_override)
-            if _tbl:
-                _scl_fn(_dh, strain_key, decl_dir, _tbl)
-            return _tbl or {}
+            _tbl = _compute_lt_fn(_override) or {}
+            _scl_fn(_dh, strain_key, decl_dir, _tbl)   # {} is cached as unsolvable
+            return _tbl
         except Exception:
             return {}
 
@@ -1572,7 +1570,7 @@ def write_board1_layout_sheet(
         o_hand = _get_field(row_obj, 'Ø_hand')
         v_hand = _get_field(row_obj, 'V_hand')
         parts = [n_hand, s_hand, o_hand, v_hand]
-        if any(p is None or (isinstance(p, float) and pd.isna(p)) for p in parts):
+        if any(_is_null(p) for p in parts):
             return None
         out = [str(p).strip() for p in parts]
         if any(not p for p in out):
@@ -1757,7 +1755,7 @@ def write_board1_layout_sheet(
 
                 # Dato
                 _date_val = getattr(trow, _date_col) if _date_col else None
-                if _date_val is not None and not (isinstance(_date_val, float) and pd.isna(_date_val)):
+                if not _is_null(_date_val):
                     _date_str = str(_date_val)[:10]
                 else:
                     _date_str = '(ukendt)'
@@ -1768,7 +1766,7 @@ def write_board1_layout_sheet(
                 # Række
                 if _row_col:
                     _row_val = getattr(trow, _row_col, None)
-                    _row_str = str(_row_val).strip() if _row_val is not None and not (isinstance(_row_val, float) and pd.isna(_row_val)) else '(ukendt)'
+                    _row_str = str(_row_val).strip() if not _is_null(_row_val) else '(ukendt)'
                 else:
                     _row_str = '(ukendt)'
 
@@ -2137,6 +2135,8 @@ def write_last_tournament_board_layout_sheets(
     if start > end:
         start, end = end, start
 
+    _precompute_latest_lead_tables(df, start, end)
+
     for board_no in range(start, end + 1):
         sheet_name = (
             "Board1_LastTournament"
@@ -2152,6 +2152,28 @@ def write_last_tournament_board_layout_sheets(
         )
 
 
+def _precompute_latest_lead_tables(df: pd.DataFrame, board_start: int, board_end: int) -> None:
+    """Solve the DD lead tables of the latest tournament's boards up front.
+
+    The per-board layout sheets then find their contract-group lead tables
+    in dd_cache instead of solving them one by one (best-effort: skipped
+    silently without endplay or on data issues).
+    """
+    if df is None or df.empty or 'tournament_date' not in df.columns or 'board_no' not in df.columns:
+        return
+    try:
+        from bridge.dd_enrich import precompute_lead_tables
+    except ImportError:
+        return
+
+    df_latest = df[df['tournament_date'] == df['tournament_date'].max()]
+    board_int = pd.to_numeric(df_latest['board_no'], errors='coerce')
+    try:
+        precompute_lead_tables(df_latest[board_int.between(board_start, board_end)])
+    except Exception:
+        pass
+
+
 def _resolve_row_column(df: pd.DataFrame) -> str | None:
     """Return preferred row/section column name, or None if unavailable."""
     if 'row' in df.columns:
@@ -2163,9 +2185,7 @@ def _resolve_row_column(df: pd.DataFrame) -> str | None:
 
 def _normalize_row_code(value) -> str | None:
     """Normalize row code to uppercase string (A/B/C), or None for missing."""
-    if value is None:
-        return None
-    if isinstance(value, float) and pd.isna(value):
+    if _is_null(value):
         return None
     s = str(value).strip().upper()
     return s if s else None
@@ -2173,7 +2193,7 @@ def _normalize_row_code(value) -> str | None:
 
 def _normalize_compass(value) -> str | None:
     """Normalize compass value to N/S/Ø/V (accepts E/W aliases)."""
-    if value is None or (isinstance(value, float) and pd.isna(value)):
+    if _is_null(value):
         return None
     s = str(value).strip().upper()
     if s == 'E':
@@ -2205,7 +2225,7 @@ def _defense_side_from_decl(value) -> str | None:
 
 def _to_float_or_none(value) -> float | None:
     """Convert value to float when possible, else None."""
-    if value is None or (isinstance(value, float) and pd.isna(value)):
+    if _is_null(value):
         return None
     try:
         return float(value)
@@ -2243,7 +2263,7 @@ def _to_int_or_none(value) -> int | None:
 
 def _normalize_strain_key(value) -> str | None:
     """Normalize strain text/symbol to canonical key (NT/S/H/D/C)."""
-    if value is None or (isinstance(value, float) and pd.isna(value)):
+    if _is_null(value):
         return None
     s = str(value).strip().upper()
     if not s:
@@ -2295,7 +2315,7 @@ def _contract_pool_from_row(row: pd.Series) -> str:
 
 def _contract_pool_to_color_symbol(value) -> str:
     """Convert contract-pool text to a strain symbol (or NT)."""
-    if value is None or (isinstance(value, float) and pd.isna(value)):
+    if _is_null(value):
         return 'ukendt'
 
     s = str(value).strip().upper()
@@ -2333,7 +2353,7 @@ def _collect_concrete_leads(values: pd.Series) -> str | None:
     """Return unique concrete lead values as comma-separated text."""
     seen: list[str] = []
     for val in values:
-        if val is None or (isinstance(val, float) and pd.isna(val)):
+        if _is_null(val):
             continue
         txt = str(val).strip()
         if not txt or txt.lower() == 'nan':
@@ -2386,7 +2406,7 @@ def _pct_decl_from_row(row: pd.Series) -> float | None:
 
 def _lead_bool(value) -> bool | None:
     """Convert mixed bool-like values to bool/None."""
-    if value is None or (isinstance(value, float) and pd.isna(value)):
+    if _is_null(value):
         return None
     if isinstance(value, str):
         s = value.strip().lower()
@@ -2406,7 +2426,7 @@ def _row_nonnull(row: pd.Series, *candidates):
         if c not in row.index:
             continue
         val = row.get(c)
-        if val is not None and not (isinstance(val, float) and pd.isna(val)):
+        if not _is_null(val):
             return val
     return None
 
@@ -2852,8 +2872,8 @@ def make_latest_tournament_board_consistency_check(
     for row_code in target_rows:
         summary[f'{row_code}_result_rows'] = int(counts.get(row_code, 0))
 
-    # Canonical hand signature per result
-    latest['_hand_signature'] = latest[hand_cols].fillna('').astype(str).agg('|'.join, axis=1)
+    # Canonical hand signature per result (hand columns may be categorical: no fillna('') on those)
+    latest['_hand_signature'] = latest[hand_cols].astype(object).fillna('').astype(str).agg('|'.join, axis=1)
 
     def _mode_or_first(series: pd.Series):
         if series.empty:
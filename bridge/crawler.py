@@ -1,9 +1,10 @@
-import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from datetime import datetime
 import re
 
+from bridge.http_fetch import fetch_page, map_ordered
+
 BASE = "https://resultater.bridge.dk/template/"
 DEFAULT_MAINCLUBNO = 2183
 DEFAULT_CLUBNO = 2
@@ -35,10 +36,7 @@ def clean(text):
     return re.sub(r"\s+", " ", text.replace("\xa0", " ")).strip()
 
 def get_soup(url):
-    r = requests.get(url, timeout=30)
-    r.raise_for_status()
-    r.encoding = "utf-8"
-    return BeautifulSoup(r.text, "lxml")
+    return BeautifulSoup(fetch_page(url).text, "lxml")
 
 def parse_date_from_title(title):
     """
@@ -195,6 +193,16 @@ def get_recent_tournaments(cutoff_date, mainclubno: int = DEFAULT_MAINCLUBNO, cl
     old_streak = 0
     reached_cutoff_during_discovery = False
 
+    # Turneringssider hentes samtidigt (http_fetch) men behandles i
+    # overview-rækkefølge; kun sider der ikke springes over på overview-dato.
+    pages = map_ordered(
+        lambda e: get_soup(e["url"]),
+        (
+            e for e in tournament_entries
+            if e["overview_date"] is None or e["overview_date"].date() >= cutoff_date
+        ),
+    )
+
     for entry in tournament_entries:
         turl = entry["url"]
         overview_date = entry["overview_date"]
@@ -216,7 +224,9 @@ def get_recent_tournaments(cutoff_date, mainclubno: int = DEFAULT_MAINCLUBNO, cl
 
         print(f"  Parsing: {turl}")
         try:
-            tsoup = get_soup(turl)
+            _, tsoup = next(pages)
+            if isinstance(tsoup, Exception):
+                raise tsoup
             h1 = tsoup.find("h1")
             if not h1 and overview_date is None:
                 continue
@@ -272,6 +282,8 @@ def get_recent_tournaments(cutoff_date, mainclubno: int = DEFAULT_MAINCLUBNO, cl
             print(f"    ⚠️ Fejl parsing turnering: {e}")
             continue
 
+    pages.close()
+
     # ✅ STEP 2: Sorter efter dato (NYESTE FØRST)
     sorted_tournament_ids = sorted(
         tournaments.keys(),
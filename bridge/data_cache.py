@@ -5,6 +5,10 @@ from pathlib import Path
 from typing import Optional, Tuple, List, Dict
 import shutil
 
+import pandas as pd
+
+from bridge.result_store import ResultStore, concat_batches, rows_to_batch
+
 class DataCache:
     """
     Smart cache system for bridge tournament data
@@ -19,6 +23,11 @@ class DataCache:
     - Default: sidste 7 dage
     - Custom cutoff: --cutoff=DATO
     - Interval: --from=DATO --to=DATO
+
+    LAGRING:
+    - manifest: cache_manifest.json (metadata pr. turnering)
+    - rækker: results.db (ResultStore, typed kolonner, clustered på dato/club)
+    - ældre tournaments/*.json læses stadig og flyttes med migrate_json_to_store()
     """
     
     def __init__(self, data_dir: str = "data"):
@@ -30,6 +39,7 @@ class DataCache:
         self.tournaments_dir.mkdir(exist_ok=True)
         
         self.manifest = self._load_manifest()
+        self.store = ResultStore(self.data_dir / "results.db")
     
     # ==================== MANIFEST MANAGEMENT ====================
     
@@ -197,8 +207,8 @@ class DataCache:
         keys = self._cache_keys_for_lookup(tournament_id, clubno=clubno)
         return any(key in self.manifest["tournaments"] for key in keys)
     
-    def get_cached_tournament(self, tournament_id: int, clubno: Optional[int] = None) -> Optional[Dict]:
-        """Hent cachet turnerings-data fra JSON"""
+    def _stored_key_candidates(self, tournament_id: int, clubno: Optional[int] = None) -> List[str]:
+        """Manifest-nøglen for turneringen (club-nøgle før legacy), plus legacy-nøglen."""
         keys = self._cache_keys_for_lookup(tournament_id, clubno=clubno)
         selected_key = None
         for key in keys:
@@ -207,29 +217,89 @@ class DataCache:
                 break
 
         if selected_key is None:
-            return None
+            return []
 
-        file_candidates: List[Path] = [self._cache_file_from_key(selected_key)]
-        legacy_file = self._cache_file_from_key(self._cache_key(tournament_id, clubno=None))
-        if legacy_file not in file_candidates:
-            file_candidates.append(legacy_file)
+        key_candidates: List[str] = [selected_key]
+        legacy_key = self._cache_key(tournament_id, clubno=None)
+        if legacy_key not in key_candidates:
+            key_candidates.append(legacy_key)
+        return key_candidates
 
-        tournament_file = None
-        for candidate in file_candidates:
-            if candidate.exists():
-                tournament_file = candidate
-                break
+    def get_cached_tournament(self, tournament_id: int, clubno: Optional[int] = None) -> Optional[Dict]:
+        """Hent cachet turnerings-data (result store, ellers ældre JSON-fil)"""
+        key_candidates = self._stored_key_candidates(tournament_id, clubno=clubno)
+
+        for key in key_candidates:
+            data = self.store.get_tournament(key)
+            if data is not None:
+                return data
+
+        for key in key_candidates:
+            data = self._read_json_tournament(key)
+            if data is not None:
+                return data
+        return None
+
+    def get_cached_tournament_batch(
+        self, tournament_id: int, clubno: Optional[int] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Cachede rækker for én turnering som typed batch (rows_to_batch-format).
+
+        Læses direkte fra result store uden row-dicts; ældre JSON-filer
+        konverteres med section / club / turnerings-id udfyldt som i store.
+        """
+        key_candidates = self._stored_key_candidates(tournament_id, clubno=clubno)
+
+        for key in key_candidates:
+            if self.store.has_tournament(key):
+                return concat_batches(self.store.iter_batches(cache_keys=[key]))
 
-        if tournament_file is None:
+        for key in key_candidates:
+            data = self._read_json_tournament(key)
+            if data is None:
+                continue
+            defaults = {k: data.get(k) for k in ("clubno", "mainclubno", "tournament_id")}
+            return rows_to_batch(
+                {**row, **{k: row.get(k, v) for k, v in defaults.items()},
+                 "section": row.get("section") or section_name}
+                for section_name, rows in (data.get("sections") or {}).items()
+                for row in rows or []
+                if isinstance(row, dict)
+            )
+        return None
+
+    def _read_json_tournament(self, cache_key: str) -> Optional[Dict]:
+        """Læs en ældre tournaments/*.json fil (før result store)."""
+        tournament_file = self._cache_file_from_key(cache_key)
+        if not tournament_file.exists():
             return None
-        
         try:
             with open(tournament_file, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except Exception as e:
-            print(f"Fejl ved laesning af tournament {tournament_id}: {e}")
+            print(f"Fejl ved laesning af {tournament_file.name}: {e}")
             return None
 
+    def migrate_json_to_store(self) -> int:
+        """
+        Engangs-migrering: flyt turneringer fra tournaments/*.json til result store.
+
+        Kun manifest-nøgler der mangler i store importeres; JSON-filerne
+        bliver liggende (kan slettes manuelt). Returnerer antal importerede.
+        """
+        stored = self.store.tournament_keys()
+        migrated = 0
+        for cache_key, tmeta in self.manifest.get("tournaments", {}).items():
+            if cache_key in stored or not isinstance(tmeta, dict):
+                continue
+            data = self._read_json_tournament(cache_key)
+            if data is None:
+                continue
+            self.store.save_tournament(cache_key, tmeta.get("date") or data.get("date"), data)
+            migrated += 1
+        return migrated
+
     def get_cached_tournaments_in_range(
         self,
         start_date,
@@ -322,14 +392,12 @@ class DataCache:
 
         cache_key = self._cache_key(tournament_id, clubno=clubno)
         
-        # Gem turnerings-data
-        tournament_file = self._cache_file_from_key(cache_key)
-        with open(tournament_file, 'w', encoding='utf-8') as f:
-            json.dump(data_to_save, f, indent=2, ensure_ascii=False)
-        
         # Opdater manifest
         if isinstance(tournament_date, datetime):
             tournament_date = tournament_date.date()
+
+        # Gem turnerings-data i result store
+        row_count = self.store.save_tournament(cache_key, tournament_date, data_to_save)
         
         self.manifest["tournaments"][cache_key] = {
             "cache_key": cache_key,
@@ -348,7 +416,7 @@ class DataCache:
         self.manifest["last_sync"] = datetime.now().isoformat()
         self._save_manifest()
         
-        print(f"    Gemt i cache: {tournament_file.name}")
+        print(f"    Gemt i cache: {cache_key} ({row_count} rækker)")
     
     # ==================== BACKUP OPERATIONS ====================
     
@@ -412,7 +480,10 @@ class DataCache:
             print("Bekraeftelse paakraevet. Brug clear_cache(confirm=True)")
             return
         
+        self.store.close()
         shutil.rmtree(self.data_dir)
         self.data_dir.mkdir(exist_ok=True)
+        self.tournaments_dir.mkdir(exist_ok=True)
         self.manifest = self._create_empty_manifest()
+        self.store = ResultStore(self.data_dir / "results.db")
         print("Cache slettet")
\ No newline at end of file
@@ -22,11 +22,22 @@ dd_lead_tables
     deal_hash TEXT
     contract_strain TEXT  (field-name strain: NT/S/H/D/C)
     declarer_dir TEXT     (Danish direction: N/Ø/S/V)
-    lead_card TEXT        (canonical: "H5", "SA", …)
+    lead_card TEXT        (canonical: "H5", "SA", …; "" marks an unsolvable table)
     declarer_tricks INTEGER
     created_at TEXT
     PRIMARY KEY (deal_hash, contract_strain, declarer_dir, lead_card)
 
+    A lead table that could not be solved is stored as one "" row, so it
+    reads back as an empty table instead of a miss and is not re-solved.
+
+Access
+------
+DDCache owns one long-lived connection (rollback journal, tuned pragmas) and
+offers bulk lookups/saves.  DDFrontCache is a bounded in-process LRU in
+front of it.  The module-level get_*/save_* functions for DD and lead tables
+go through the shared front cache (get_front_cache()); par goes straight to
+get_cache().
+
 Deal hash
 ---------
 SHA-256 of the canonical string  "N:{n}|E:{e}|S:{s}|W:{w}"
@@ -37,9 +48,11 @@ from __future__ import annotations
 import hashlib
 import json
 import sqlite3
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 # ---------------------------------------------------------------------------
 # Database path (relative to this file's package root)
@@ -88,24 +101,29 @@ CREATE TABLE IF NOT EXISTS dd_lead_tables (
 """
 
 
-def _connect() -> sqlite3.Connection:
-    _DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(_DB_PATH))
-    conn.row_factory = sqlite3.Row
-    return conn
+# Pragmas applied once per connection.  Data/dd_cache.db is tracked in git,
+# so it keeps the rollback journal: WAL is recorded in the file header and
+# leaves fresh solves in a -wal file until a checkpoint.  journal_mode=DELETE
+# also converts a file that an earlier version switched to WAL back.
+_PRAGMAS = (
+    "PRAGMA journal_mode=DELETE",
+    "PRAGMA cache_size=-65536",      # 64 MiB page cache
+    "PRAGMA mmap_size=268435456",    # 256 MiB memory-mapped I/O
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Keep IN (...) lists below SQLite's host-parameter limit (999 on old builds)
+_IN_CHUNK = 500
 
+LeadTableKey = tuple[str, str, str]  # (deal_hash, contract_strain, declarer_dir)
 
-def _ensure_schema(conn: sqlite3.Connection) -> None:
-    conn.execute(_CREATE_DD_DEALS)
-    conn.execute(_CREATE_DD_PAR)
-    conn.execute(_CREATE_DD_LEAD_TABLES)
-    conn.commit()
+# lead_card of the placeholder row stored for an empty (unsolvable) lead table
+_NO_LEAD_CARD = ""
 
 
-def _get_connection() -> sqlite3.Connection:
-    conn = _connect()
-    _ensure_schema(conn)
-    return conn
+def _chunks(items: list):
+    for start in range(0, len(items), _IN_CHUNK):
+        yield items[start:start + _IN_CHUNK]
 
 
 # ---------------------------------------------------------------------------
@@ -134,6 +152,312 @@ def get_deal_hash(row: dict) -> Optional[str]:
     return hashlib.sha256(canonical.encode()).hexdigest()
 
 
+# ---------------------------------------------------------------------------
+# Connection-owning cache object
+# ---------------------------------------------------------------------------
+
+
+class DDCache:
+    """Double-dummy cache backed by one long-lived SQLite connection.
+
+    The schema check and pragmas run once in __init__; every accessor reuses
+    the same connection.  Bulk methods (get_dd_tables, get_lead_tables,
+    save_dd_tables, save_lead_tables) batch lookups into IN (...) queries and
+    writes into a single executemany transaction.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path is not None else _DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            self._conn.execute(pragma)
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(_CREATE_DD_DEALS)
+            self._conn.execute(_CREATE_DD_PAR)
+            self._conn.execute(_CREATE_DD_LEAD_TABLES)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # DD tables
+    # ------------------------------------------------------------------
+
+    def get_dd_table(self, deal_hash: str) -> Optional[dict]:
+        return self.get_dd_tables([deal_hash]).get(deal_hash)
+
+    def get_dd_tables(self, deal_hashes: Iterable[str]) -> dict[str, dict]:
+        """Return {deal_hash: dd table} for every hash found in the cache."""
+        hashes = list(dict.fromkeys(deal_hashes))
+        out: dict[str, dict] = {}
+        with self._lock:
+            for chunk in _chunks(hashes):
+                rows = self._conn.execute(
+                    f"SELECT deal_hash, {', '.join(_DD_COLS)} FROM dd_deals "
+                    f"WHERE deal_hash IN ({', '.join('?' for _ in chunk)})",
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    out[row["deal_hash"]] = {col: row[col] for col in _DD_COLS}
+        return out
+
+    def save_dd_table(self, deal_hash: str, data: dict) -> None:
+        self.save_dd_tables({deal_hash: data})
+
+    def save_dd_tables(self, batch: dict[str, dict]) -> None:
+        """Persist {deal_hash: dd table} in one transaction."""
+        now = datetime.now(timezone.utc).isoformat()
+        cols = ["deal_hash"] + _DD_COLS + ["created_at"]
+        sql = (
+            f"INSERT OR REPLACE INTO dd_deals ({', '.join(cols)}) "
+            f"VALUES ({', '.join('?' for _ in cols)})"
+        )
+        values = [
+            [deal_hash] + [data.get(col) for col in _DD_COLS] + [now]
+            for deal_hash, data in batch.items()
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(sql, values)
+
+    # ------------------------------------------------------------------
+    # Par
+    # ------------------------------------------------------------------
+
+    def get_par(self, deal_hash: str, vul: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT par_score, par_contract, par_side FROM dd_par "
+                "WHERE deal_hash = ? AND vul = ?",
+                (deal_hash, vul),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "par_score": row["par_score"],
+            "par_contract": row["par_contract"],
+            "par_side": row["par_side"],
+        }
+
+    def save_par(self, deal_hash: str, vul: str, data: dict) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO dd_par "
+                "(deal_hash, vul, par_score, par_contract, par_side, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (deal_hash, vul, data.get("par_score"), data.get("par_contract"),
+                 data.get("par_side"), now),
+            )
+
+    # ------------------------------------------------------------------
+    # Lead tables
+    # ------------------------------------------------------------------
+
+    def get_lead_table(
+        self, deal_hash: str, contract_strain: str, declarer_dir: str
+    ) -> Optional[dict]:
+        key = (deal_hash, contract_strain, declarer_dir)
+        return self.get_lead_tables([key]).get(key)
+
+    def get_lead_tables(self, keys: Iterable[LeadTableKey]) -> dict[LeadTableKey, dict]:
+        """Return {(deal_hash, strain, decl): lead table} for every cached key.
+
+        Looks the deals up with deal_hash IN (...) and keeps only the
+        requested (strain, declarer) combinations.
+        """
+        wanted = set(keys)
+        hashes = list(dict.fromkeys(k[0] for k in wanted))
+        out: dict[LeadTableKey, dict] = {}
+        with self._lock:
+            for chunk in _chunks(hashes):
+                rows = self._conn.execute(
+                    "SELECT deal_hash, contract_strain, declarer_dir, lead_card, "
+                    "declarer_tricks FROM dd_lead_tables "
+                    f"WHERE deal_hash IN ({', '.join('?' for _ in chunk)})",
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    key = (row["deal_hash"], row["contract_strain"], row["declarer_dir"])
+                    if key in wanted:
+                        table = out.setdefault(key, {})
+                        if row["lead_card"] != _NO_LEAD_CARD:
+                            table[row["lead_card"]] = row["declarer_tricks"]
+        return out
+
+    def save_lead_table(
+        self, deal_hash: str, contract_strain: str, declarer_dir: str, data: dict
+    ) -> None:
+        self.save_lead_tables({(deal_hash, contract_strain, declarer_dir): data})
+
+    def save_lead_tables(self, batch: dict[LeadTableKey, dict]) -> None:
+        """Persist {(deal_hash, strain, decl): lead table} in one transaction.
+
+        An empty table is stored as a placeholder row (see _NO_LEAD_CARD).
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        values = [
+            (deal_hash, contract_strain, declarer_dir, card, tricks, now)
+            for (deal_hash, contract_strain, declarer_dir), data in batch.items()
+            for card, tricks in (data.items() if data else [(_NO_LEAD_CARD, -1)])
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO dd_lead_tables "
+                "(deal_hash, contract_strain, declarer_dir, lead_card, declarer_tricks, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                values,
+            )
+
+
+_shared_cache: Optional[DDCache] = None
+
+
+def get_cache() -> DDCache:
+    """Return the process-wide DDCache for the current _DB_PATH.
+
+    The instance is reopened if _DB_PATH has been changed (e.g. by tests).
+    """
+    global _shared_cache
+    if _shared_cache is None or _shared_cache.db_path != _DB_PATH:
+        if _shared_cache is not None:
+            _shared_cache.close()
+        _shared_cache = DDCache(_DB_PATH)
+    return _shared_cache
+
+
+# ---------------------------------------------------------------------------
+# In-process LRU front cache
+# ---------------------------------------------------------------------------
+
+_FRONT_MAX_DD_TABLES = 8192
+_FRONT_MAX_LEAD_TABLES = 32768
+
+
+class DDFrontCache:
+    """Bounded in-memory LRU layer in front of a DDCache.
+
+    DD tables are keyed by deal_hash and lead tables by
+    (deal_hash, contract_strain, declarer_dir).  Lookups are served from
+    memory when possible and only the misses go to SQLite; saves write
+    through to SQLite and populate the LRU.  SQLite misses are not cached,
+    so a table solved later is picked up on the next lookup.  The LRU keeps
+    its own copy of every table and hands out fresh dicts, so callers may
+    modify what they get back.
+
+    Counters (hits / misses / evictions) are available via stats().
+    """
+
+    def __init__(
+        self,
+        store: DDCache,
+        max_dd_tables: int = _FRONT_MAX_DD_TABLES,
+        max_lead_tables: int = _FRONT_MAX_LEAD_TABLES,
+    ):
+        self.store = store
+        self.max_dd_tables = max_dd_tables
+        self.max_lead_tables = max_lead_tables
+        self._dd: OrderedDict[str, dict] = OrderedDict()
+        self._lead: OrderedDict[LeadTableKey, dict] = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _lookup(self, lru: OrderedDict, keys: Iterable, fetch) -> dict:
+        out: dict = {}
+        missing: list = []
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                if key in lru:
+                    lru.move_to_end(key)
+                    out[key] = dict(lru[key])
+                    self.hits += 1
+                else:
+                    missing.append(key)
+                    self.misses += 1
+        if missing:
+            fetched = fetch(missing)
+            self._store(lru, fetched)
+            out.update(fetched)
+        return out
+
+    def _store(self, lru: OrderedDict, items: dict) -> None:
+        limit = self.max_dd_tables if lru is self._dd else self.max_lead_tables
+        with self._lock:
+            for key, value in items.items():
+                lru[key] = dict(value)
+                lru.move_to_end(key)
+            while len(lru) > limit:
+                lru.popitem(last=False)
+                self.evictions += 1
+
+    def get_dd_tables(self, deal_hashes: Iterable[str]) -> dict[str, dict]:
+        return self._lookup(self._dd, deal_hashes, self.store.get_dd_tables)
+
+    def get_dd_table(self, deal_hash: str) -> Optional[dict]:
+        return self.get_dd_tables([deal_hash]).get(deal_hash)
+
+    def save_dd_tables(self, batch: dict[str, dict]) -> None:
+        self.store.save_dd_tables(batch)
+        self._store(self._dd, {h: {col: data.get(col) for col in _DD_COLS}
+                               for h, data in batch.items()})
+
+    def get_lead_tables(self, keys: Iterable[LeadTableKey]) -> dict[LeadTableKey, dict]:
+        return self._lookup(self._lead, keys, self.store.get_lead_tables)
+
+    def get_lead_table(
+        self, deal_hash: str, contract_strain: str, declarer_dir: str
+    ) -> Optional[dict]:
+        key = (deal_hash, contract_strain, declarer_dir)
+        return self.get_lead_tables([key]).get(key)
+
+    def save_lead_tables(self, batch: dict[LeadTableKey, dict]) -> None:
+        self.store.save_lead_tables(batch)
+        self._store(self._lead, batch)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dd.clear()
+            self._lead.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "dd_tables": len(self._dd),
+                "lead_tables": len(self._lead),
+            }
+
+
+_front_cache: Optional[DDFrontCache] = None
+
+
+def get_front_cache() -> DDFrontCache:
+    """Return the process-wide LRU front cache over get_cache().
+
+    dd_enrich and board_review both read through this instance, so each
+    deal is fetched from SQLite at most once per process (as long as it
+    stays within the LRU bounds).
+    """
+    global _front_cache
+    store = get_cache()
+    if _front_cache is None or _front_cache.store is not store:
+        _front_cache = DDFrontCache(store)
+    return _front_cache
+
+
 # ---------------------------------------------------------------------------
 # DD table CRUD
 # ---------------------------------------------------------------------------
@@ -144,13 +468,12 @@ def get_dd_table(deal_hash: str) -> Optional[dict]:
 
     Dict has keys dd_{dir}_{strain} for all 20 combinations.
     """
-    with _get_connection() as conn:
-        row = conn.execute(
-            "SELECT * FROM dd_deals WHERE deal_hash = ?", (deal_hash,)
-        ).fetchone()
-    if row is None:
-        return None
-    return {col: row[col] for col in _DD_COLS}
+    return get_front_cache().get_dd_table(deal_hash)
+
+
+def get_dd_tables(deal_hashes: Iterable[str]) -> dict[str, dict]:
+    """Return {deal_hash: DD table dict} for all cached hashes (misses omitted)."""
+    return get_front_cache().get_dd_tables(deal_hashes)
 
 
 def save_dd_table(deal_hash: str, data: dict) -> None:
@@ -158,15 +481,12 @@ def save_dd_table(deal_hash: str, data: dict) -> None:
 
     data must contain all 20 dd_{dir}_{strain} keys.
     """
-    now = datetime.now(timezone.utc).isoformat()
-    row_data = {col: data.get(col) for col in _DD_COLS}
-    cols = ["deal_hash"] + _DD_COLS + ["created_at"]
-    placeholders = ", ".join("?" for _ in cols)
-    values = [deal_hash] + [row_data[c] for c in _DD_COLS] + [now]
-    sql = f"INSERT OR REPLACE INTO dd_deals ({', '.join(cols)}) VALUES ({placeholders})"
-    with _get_connection() as conn:
-        conn.execute(sql, values)
-        conn.commit()
+    get_front_cache().save_dd_tables({deal_hash: data})
+
+
+def save_dd_tables(batch: dict[str, dict]) -> None:
+    """Persist several DD tables ({deal_hash: data}) in one transaction."""
+    get_front_cache().save_dd_tables(batch)
 
 
 # ---------------------------------------------------------------------------
@@ -179,33 +499,12 @@ def get_par(deal_hash: str, vul: str) -> Optional[dict]:
 
     Returns dict with keys: par_score, par_contract, par_side.
     """
-    with _get_connection() as conn:
-        row = conn.execute(
-            "SELECT par_score, par_contract, par_side FROM dd_par "
-            "WHERE deal_hash = ? AND vul = ?",
-            (deal_hash, vul),
-        ).fetchone()
-    if row is None:
-        return None
-    return {
-        "par_score": row["par_score"],
-        "par_contract": row["par_contract"],
-        "par_side": row["par_side"],
-    }
+    return get_cache().get_par(deal_hash, vul)
 
 
 def save_par(deal_hash: str, vul: str, data: dict) -> None:
     """Persist par result to cache."""
-    now = datetime.now(timezone.utc).isoformat()
-    with _get_connection() as conn:
-        conn.execute(
-            "INSERT OR REPLACE INTO dd_par "
-            "(deal_hash, vul, par_score, par_contract, par_side, created_at) "
-            "VALUES (?, ?, ?, ?, ?, ?)",
-            (deal_hash, vul, data.get("par_score"), data.get("par_contract"),
-             data.get("par_side"), now),
-        )
-        conn.commit()
+    get_cache().save_par(deal_hash, vul, data)
 
 
 # ---------------------------------------------------------------------------
@@ -217,31 +516,24 @@ def get_lead_table(deal_hash: str, contract_strain: str, declarer_dir: str) -> O
     """Return cached lead table or None.
 
     Returns dict mapping canonical card key → declarer tricks.
-    E.g. {"H5": 9, "C3": 7, …}
+    E.g. {"H5": 9, "C3": 7, …}; {} for a table cached as unsolvable.
     """
-    with _get_connection() as conn:
-        rows = conn.execute(
-            "SELECT lead_card, declarer_tricks FROM dd_lead_tables "
-            "WHERE deal_hash = ? AND contract_strain = ? AND declarer_dir = ?",
-            (deal_hash, contract_strain, declarer_dir),
-        ).fetchall()
-    if not rows:
-        return None
-    return {r["lead_card"]: r["declarer_tricks"] for r in rows}
+    return get_front_cache().get_lead_table(deal_hash, contract_strain, declarer_dir)
+
+
+def get_lead_tables(keys: Iterable[LeadTableKey]) -> dict[LeadTableKey, dict]:
+    """Return {(deal_hash, strain, decl): lead table} for all cached keys."""
+    return get_front_cache().get_lead_tables(keys)
 
 
 def save_lead_table(deal_hash: str, contract_strain: str, declarer_dir: str, data: dict) -> None:
     """Persist a lead table to the cache.
 
-    data: {card_canonical: declarer_tricks}
+    data: {card_canonical: declarer_tricks}; {} records an unsolvable table.
     """
-    now = datetime.now(timezone.utc).isoformat()
-    with _get_connection() as conn:
-        for card, tricks in data.items():
-            conn.execute(
-                "INSERT OR REPLACE INTO dd_lead_tables "
-                "(deal_hash, contract_strain, declarer_dir, lead_card, declarer_tricks, created_at) "
-                "VALUES (?, ?, ?, ?, ?, ?)",
-                (deal_hash, contract_strain, declarer_dir, card, tricks, now),
-            )
-        conn.commit()
+    get_front_cache().save_lead_tables({(deal_hash, contract_strain, declarer_dir): data})
+
+
+def save_lead_tables(batch: dict[LeadTableKey, dict]) -> None:
+    """Persist several lead tables ({(deal_hash, strain, decl): data}) at once."""
+    get_front_cache().save_lead_tables(batch)
@@ -1,7 +1,7 @@
 """Double Dummy computation via endplay/DDS.
 
 Wraps the endplay library to compute:
-- Full DD trick tables (all 4 directions × 5 strains)
+- Full DD trick tables (all 4 directions × 5 strains), singly or batched
 - Par contracts and scores
 - Lead-dependent trick tables for opening lead analysis
 
@@ -21,10 +21,15 @@ Card canonical format (lead table keys): "<suit_letter><rank>"
 """
 from __future__ import annotations
 
-from typing import Optional
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Optional
 
 from endplay.types import Card, Deal, Denom, Player, Vul
-from endplay.dds import calc_dd_table, solve_board, par
+from endplay.dds import calc_all_tables, calc_dd_table, solve_board, par
+
+from bridge.dd_cache import get_deal_hash
 
 # ---------------------------------------------------------------------------
 # Direction adapters
@@ -132,7 +137,17 @@ def compute_dd_table(row: dict) -> dict:
     Also sets dd_valid=True.
     """
     deal = build_deal(row)
-    table = calc_dd_table(deal)
+    return _dd_table_to_dict(calc_dd_table(deal))
+
+
+# DDS caps CalcAllTables at MAXNOOFBOARDS (200) strain-solves per call,
+# i.e. 40 deals when all 5 strains are requested.
+_CALC_ALL_TABLES_MAX_DEALS = 40
+
+_HAND_KEYS = ["N_hand", "Ø_hand", "S_hand", "V_hand"]
+
+
+def _dd_table_to_dict(table) -> dict:
     result: dict = {"dd_valid": True}
     for dir_dk in _DD_DIRS:
         player = _DIR_DK_TO_PLAYER[dir_dk]
@@ -141,6 +156,36 @@ def compute_dd_table(row: dict) -> dict:
     return result
 
 
+def compute_dd_tables_batch(rows: Iterable[dict]) -> dict[str, dict]:
+    """Compute DD trick tables for many boards in as few DDS calls as possible.
+
+    Rows are deduplicated by get_deal_hash() (rows without all four hands are
+    skipped) and the unique deals are solved through calc_all_tables in
+    chunks of at most _CALC_ALL_TABLES_MAX_DEALS, letting DDS spread the work
+    over its own thread pool.
+
+    Returns a dict mapping deal_hash → table, where each table has the same
+    shape as compute_dd_table() (dd_{dir}_{strain} keys plus dd_valid=True).
+    """
+    deals: dict[str, Deal] = {}
+    for row in rows:
+        if not all(isinstance(row.get(c), str) and row.get(c) for c in _HAND_KEYS):
+            continue
+        deal_hash = get_deal_hash(row)
+        if deal_hash is None or deal_hash in deals:
+            continue
+        deals[deal_hash] = build_deal(row)
+
+    hashes = list(deals)
+    out: dict[str, dict] = {}
+    for start in range(0, len(hashes), _CALC_ALL_TABLES_MAX_DEALS):
+        chunk = hashes[start:start + _CALC_ALL_TABLES_MAX_DEALS]
+        tables = calc_all_tables([deals[h] for h in chunk])
+        for i, deal_hash in enumerate(chunk):
+            out[deal_hash] = _dd_table_to_dict(tables[i])
+    return out
+
+
 # ---------------------------------------------------------------------------
 # Par contract
 # ---------------------------------------------------------------------------
@@ -231,7 +276,10 @@ def compute_lead_table(row: dict) -> dict[str, int]:
     declarer_player = _DIR_DK_TO_PLAYER.get(decl)
     if declarer_player is None:
         return {}
+    return _solve_lead_table(row, denom, declarer_player)
+
 
+def _solve_lead_table(row: dict, denom: Denom, declarer_player: Player) -> dict[str, int]:
     # Leader is LHO of declarer
     leader = Player((declarer_player.value + 1) % 4)
 
@@ -246,3 +294,76 @@ def compute_lead_table(row: dict) -> dict[str, int]:
         # defense_tricks = tricks for the leader's side; declarer gets the rest
         out[key] = 13 - defense_tricks
     return out
+
+
+# ---------------------------------------------------------------------------
+# Parallel lead-table engine
+# ---------------------------------------------------------------------------
+
+# Lead-table key: (deal_hash, contract_strain, declarer_dir) — the same
+# triple dd_cache uses, with contract_strain as field-name key NT/S/H/D/C.
+LeadTableKey = tuple[str, str, str]
+
+# The pool can be started from one of main's pipeline threads; forking a
+# multi-threaded process is unsafe, so workers come from a forkserver
+# (spawn where that does not exist).
+_POOL_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def _solve_deal_lead_tables(
+    job: tuple[str, dict, list[tuple[str, str]]],
+) -> list[tuple[LeadTableKey, dict[str, int]]]:
+    """Worker: solve every requested (strain, declarer) lead table for one deal.
+
+    Runs in a pool process, so it only takes and returns plain picklable data.
+    Combinations that fail to solve come back as an empty table.
+    """
+    deal_hash, hands, contracts = job
+    out: list[tuple[LeadTableKey, dict[str, int]]] = []
+    for strain_key, decl in contracts:
+        denom = _FIELD_STRAIN_TO_DENOM.get(strain_key)
+        declarer_player = _DIR_DK_TO_PLAYER.get(decl)
+        table: dict[str, int] = {}
+        if denom is not None and declarer_player is not None:
+            try:
+                table = _solve_lead_table(hands, denom, declarer_player)
+            except Exception:
+                table = {}
+        out.append(((deal_hash, strain_key, decl), table))
+    return out
+
+
+def compute_lead_tables_parallel(
+    jobs: dict[str, tuple[dict, Iterable[tuple[str, str]]]],
+    max_workers: Optional[int] = None,
+) -> Iterable[tuple[LeadTableKey, dict[str, int]]]:
+    """Solve many lead tables across a process pool, one task per deal.
+
+    jobs maps deal_hash → (row with the four *_hand keys,
+    iterable of (contract_strain, declarer_dir) pairs to solve).
+
+    Yields (key, lead_table) pairs as deals complete, so the caller can act
+    as the single writer to dd_cache.  max_workers defaults to the CPU count;
+    with one worker (or one deal) everything runs in-process.  Pool workers
+    are started with _POOL_START_METHOD, never by forking the caller.
+    """
+    tasks = [
+        (deal_hash, {c: row[c] for c in _HAND_KEYS}, list(contracts))
+        for deal_hash, (row, contracts) in jobs.items()
+    ]
+    if not tasks:
+        return
+
+    workers = max_workers or os.cpu_count() or 1
+    workers = min(workers, len(tasks))
+    if workers <= 1:
+        for task in tasks:
+            yield from _solve_deal_lead_tables(task)
+        return
+
+    context = multiprocessing.get_context(_POOL_START_METHOD)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        for results in executor.map(_solve_deal_lead_tables, tasks):
+            yield from results
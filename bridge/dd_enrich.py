@@ -22,21 +22,22 @@ dd_valid is False but the four hands are present.
 """
 from __future__ import annotations
 
+import threading
 from typing import Optional
 
 import pandas as pd
 
 from bridge.dd_compute import (
-    compute_dd_table,
-    compute_lead_table,
+    compute_dd_tables_batch,
+    compute_lead_tables_parallel,
     parse_lead_card,
 )
 from bridge.dd_cache import (
     get_deal_hash,
-    get_dd_table,
-    save_dd_table,
-    get_lead_table,
-    save_lead_table,
+    get_dd_tables,
+    save_dd_tables,
+    get_lead_tables,
+    save_lead_tables,
 )
 
 # ---------------------------------------------------------------------------
@@ -57,6 +58,14 @@ _STRAIN_SYM_TO_KEY: dict[str, str] = {
 
 _HAND_COLS = ["N_hand", "Ø_hand", "S_hand", "V_hand"]
 
+# Solved lead tables are written to dd_cache in transactions of this many
+_SAVE_BATCH = 64
+
+# main enriches the period and the history on two threads; one precompute at
+# a time, so the second finds the first one's tables in dd_cache instead of
+# solving them again.
+_PRECOMPUTE_LOCK = threading.Lock()
+
 
 def _has_hands(row: pd.Series) -> bool:
     return all(
@@ -65,36 +74,52 @@ def _has_hands(row: pd.Series) -> bool:
     )
 
 
-def _get_or_compute_lead_table(
-    row: pd.Series,
-) -> Optional[dict[str, int]]:
-    """Return (possibly cached) lead table for the row's contract/declarer.
+_KEY_COLS = ["deal_hash", "strain_key", "decl"]
+
+
+def _deal_hashes(df: pd.DataFrame) -> pd.Series:
+    """Return deal_hash per row (None without all four hands).
 
-    Returns None if key information is missing.
+    Each distinct hand set is hashed once and mapped back to its rows.
     """
-    strain_sym = row.get("strain")
-    decl = row.get("decl")
-    if not strain_sym or not decl or not _has_hands(row):
-        return None
+    out = pd.Series(None, index=df.index, dtype=object)
+    if df.empty or not all(c in df.columns for c in _HAND_COLS):
+        return out
 
-    strain_key = _STRAIN_SYM_TO_KEY.get(str(strain_sym))
-    if strain_key is None:
-        return None
+    has_hands = pd.Series(True, index=df.index)
+    for col in _HAND_COLS:
+        has_hands &= df[col].map(lambda v: isinstance(v, str) and bool(v))
+    hands = df.loc[has_hands, _HAND_COLS]
+    if hands.empty:
+        return out
 
-    deal_hash = get_deal_hash(row.to_dict())
-    if deal_hash is None:
-        return None
+    distinct = hands.drop_duplicates().reset_index(drop=True)
+    distinct["deal_hash"] = [get_deal_hash(r) for r in distinct.to_dict("records")]
+    merged = hands.merge(distinct, on=_HAND_COLS, how="left")
+    out.loc[hands.index] = merged["deal_hash"].to_numpy()
+    return out
 
-    # Cache hit
-    cached = get_lead_table(deal_hash, strain_key, str(decl))
-    if cached is not None:
-        return cached
 
-    # Cache miss — compute and store
-    lead_table = compute_lead_table(row.to_dict())
-    if lead_table:
-        save_lead_table(deal_hash, strain_key, str(decl), lead_table)
-    return lead_table or None
+def _lead_table_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the (deal_hash, strain_key, decl) cache key of every row.
+
+    The result is index-aligned with *df*; rows that cannot be keyed
+    (missing hands, unknown strain, no declarer) are dropped.
+    """
+    if df.empty or "strain" not in df.columns or "decl" not in df.columns:
+        return pd.DataFrame(columns=_KEY_COLS, dtype=object)
+
+    decl = df["decl"]
+    decl_ok = decl.notna() & decl.map(bool)
+    keys = pd.DataFrame(
+        {
+            "deal_hash": _deal_hashes(df),
+            "strain_key": df["strain"].map(_STRAIN_SYM_TO_KEY),
+            "decl": decl.where(decl_ok).map(str, na_action="ignore"),
+        },
+        index=df.index,
+    )
+    return keys.dropna()
 
 
 # ---------------------------------------------------------------------------
@@ -105,7 +130,9 @@ def _get_or_compute_lead_table(
 def enrich_dd_fallback(df: pd.DataFrame) -> pd.DataFrame:
     """Fill in DD trick table for rows where dd_valid is False.
 
-    Rows without all four hands are skipped.  Computed results are cached.
+    Rows without all four hands are skipped.  Each unique deal is looked up
+    in the cache once; all cache misses are solved together through
+    compute_dd_tables_batch() and stored.
     Modifies a copy of the DataFrame in-place and returns it.
     """
     out = df.copy()
@@ -117,28 +144,42 @@ def enrich_dd_fallback(df: pd.DataFrame) -> pd.DataFrame:
     if candidates.empty:
         return out
 
-    _DD_COLS = [f"dd_{d}_{s}"
-                for d in ["N", "Ø", "S", "V"]
-                for s in ["NT", "S", "H", "D", "C"]]
-
+    row_hashes: dict = {}
+    deal_rows: dict[str, dict] = {}
     for idx, row in candidates.iterrows():
         if not _has_hands(row):
             continue
 
-        deal_hash = get_deal_hash(row.to_dict())
+        row_dict = row.to_dict()
+        deal_hash = get_deal_hash(row_dict)
         if deal_hash is None:
             continue
-
-        # Check cache first
-        cached = get_dd_table(deal_hash) if deal_hash else None
-        if cached is None:
-            try:
-                cached = compute_dd_table(row.to_dict())
-                save_dd_table(deal_hash, cached)
-            except Exception:
-                continue
-
-        for col, val in cached.items():
+        row_hashes[idx] = deal_hash
+        deal_rows.setdefault(deal_hash, row_dict)
+
+    # Check cache first (one bulk lookup)
+    tables = get_dd_tables(deal_rows)
+    unsolved = {h: r for h, r in deal_rows.items() if h not in tables}
+
+    if unsolved:
+        try:
+            computed = compute_dd_tables_batch(unsolved.values())
+        except Exception:
+            # One malformed deal fails the whole DDS call — retry one by one
+            computed = {}
+            for row_dict in unsolved.values():
+                try:
+                    computed.update(compute_dd_tables_batch([row_dict]))
+                except Exception:
+                    continue
+        save_dd_tables(computed)
+        tables.update(computed)
+
+    for idx, deal_hash in row_hashes.items():
+        table = tables.get(deal_hash)
+        if table is None:
+            continue
+        for col, val in table.items():
             if col in out.columns:
                 out.at[idx, col] = val
         out.at[idx, "dd_valid"] = True
@@ -146,9 +187,74 @@ def enrich_dd_fallback(df: pd.DataFrame) -> pd.DataFrame:
     return out
 
 
-def enrich_lead_tables(df: pd.DataFrame) -> pd.DataFrame:
+def precompute_lead_tables(
+    df: pd.DataFrame,
+    max_workers: Optional[int] = 1,
+) -> int:
+    """Solve and cache every lead table *df* needs that is not cached yet.
+
+    Collects all missing (deal, strain, declarer) keys up front, solves them
+    via compute_lead_tables_parallel() and writes the results to dd_cache
+    from this (single) process.  The default solves in-process; pass
+    max_workers (None = CPU count) to use a process pool, as
+    enriched_store.enrich_incremental does once per run.  Tables that cannot
+    be solved are cached as empty, so they are not retried on the next run.
+
+    Returns the number of lead tables solved.
+    """
+    if df.empty:
+        return 0
+
+    df = df.reset_index(drop=True)
+    keys = _lead_table_keys(df)
+    if keys.empty:
+        return 0
+    unique_keys = list(dict.fromkeys(keys.itertuples(index=False, name=None)))
+
+    with _PRECOMPUTE_LOCK:
+        cached = get_lead_tables(unique_keys)
+
+        # One job per deal: the hands of its first row plus all missing contracts
+        deal_first_idx = keys["deal_hash"].drop_duplicates()
+        deal_rows = dict(zip(
+            deal_first_idx.to_numpy(),
+            df.loc[deal_first_idx.index, _HAND_COLS].to_dict("records"),
+        ))
+        jobs: dict[str, tuple[dict, list[tuple[str, str]]]] = {}
+        for key in unique_keys:
+            if key in cached:
+                continue
+            deal_hash, strain_key, decl = key
+            if deal_hash not in jobs:
+                jobs[deal_hash] = (deal_rows[deal_hash], [])
+            jobs[deal_hash][1].append((strain_key, decl))
+
+        if not jobs:
+            return 0
+
+        solved = 0
+        pending: dict[tuple[str, str, str], dict[str, int]] = {}
+        for key, lead_table in compute_lead_tables_parallel(jobs, max_workers=max_workers):
+            pending[key] = lead_table
+            solved += 1
+            if len(pending) >= _SAVE_BATCH:
+                save_lead_tables(pending)
+                pending = {}
+        if pending:
+            save_lead_tables(pending)
+        return solved
+
+
+def enrich_lead_tables(
+    df: pd.DataFrame,
+    max_workers: Optional[int] = 1,
+) -> pd.DataFrame:
     """Add lead-dependent DD columns to a results DataFrame.
 
+    Works per distinct deal rather than per row: each hand set is hashed
+    once, each (deal, strain, declarer) lead table is resolved once and the
+    best lead / actual-lead tricks are joined back onto the rows.
+
     For each row that has:
     - all four hands
     - a valid strain and declarer direction
@@ -161,8 +267,10 @@ def enrich_lead_tables(df: pd.DataFrame) -> pd.DataFrame:
     - lead_cost
 
     Rows that cannot be solved (missing data, endplay errors) get NaN / None.
-    Results are cached in SQLite so each unique (deal, strain, declarer) triple
-    is solved only once.
+    Missing lead tables are first solved by precompute_lead_tables() (in this
+    process unless max_workers asks for a pool); the rows are then filled
+    from the SQLite cache only, so each unique (deal, strain, declarer)
+    triple is solved only once.
     """
     out = df.copy()
 
@@ -171,26 +279,72 @@ def enrich_lead_tables(df: pd.DataFrame) -> pd.DataFrame:
         if col not in out.columns:
             out[col] = None
 
-    for idx, row in out.iterrows():
-        if not _has_hands(row):
-            continue
+    precompute_lead_tables(out, max_workers=max_workers)
 
-        lead_table = _get_or_compute_lead_table(row)
+    # Work on positional labels so the joins below are safe for any index
+    original_index = out.index
+    out = out.reset_index(drop=True)
+    out = _join_lead_results(out)
+    out.index = original_index
+    return out
+
+
+def _join_lead_results(out: pd.DataFrame) -> pd.DataFrame:
+    """Fill the lead columns of *out* (unique index) from cached lead tables."""
+    keys = _lead_table_keys(out)
+    if keys.empty:
+        return out
+
+    # Best defensive lead per distinct (deal, strain, declarer)
+    unique_keys = keys.drop_duplicates()
+    lead_tables = get_lead_tables(unique_keys.itertuples(index=False, name=None))
+    best_rows = []
+    for key, lead_table in lead_tables.items():
         if not lead_table:
             continue
-
         # Best defensive lead = card giving minimum declarer tricks (tie-break: key order)
         best_card = min(lead_table, key=lambda k: (lead_table[k], k))
-        best_tricks = lead_table[best_card]
-        out.at[idx, "dd_best_lead"] = best_card
-        out.at[idx, "dd_best_lead_tricks"] = best_tricks
-
-        # Tricks after the actual lead
-        lead_raw = row.get("lead")
-        lead_key = parse_lead_card(lead_raw) if lead_raw else None
-        if lead_key and lead_key in lead_table:
-            actual_tricks = lead_table[lead_key]
-            out.at[idx, "lead_dd_tricks"] = actual_tricks
-            out.at[idx, "lead_cost"] = actual_tricks - best_tricks
+        best_rows.append((*key, best_card, lead_table[best_card]))
+    if not best_rows:
+        return out
+    best = pd.DataFrame(best_rows, columns=_KEY_COLS + ["dd_best_lead", "dd_best_lead_tricks"])
+
+    # Tricks after the actual lead, per distinct (deal, strain, declarer, lead card)
+    if "lead" in out.columns:
+        leads = out.loc[keys.index, "lead"]
+        lead_keys = leads.map(
+            {v: parse_lead_card(v) for v in leads.dropna().unique()}
+        )
+    else:
+        lead_keys = pd.Series(None, index=keys.index, dtype=object)
+    keyed = keys.assign(lead_key=lead_keys)
+    played = keyed.dropna(subset=["lead_key"]).drop_duplicates()
+    played["lead_dd_tricks"] = [
+        lead_tables.get((h, sk, d), {}).get(card)
+        for h, sk, d, card in played.itertuples(index=False, name=None)
+    ]
+    played = played.dropna(subset=["lead_dd_tricks"])
+
+    merged = (
+        keyed.rename_axis("_row").reset_index()
+        .merge(best, on=_KEY_COLS, how="left")
+        .merge(played, on=_KEY_COLS + ["lead_key"], how="left")
+        .set_index("_row")
+    )
+    merged["lead_cost"] = merged["lead_dd_tricks"] - merged["dd_best_lead_tricks"]
+
+    solved = merged["dd_best_lead"].notna()
+    with_lead = solved & merged["lead_dd_tricks"].notna()
+    for col, mask in [
+        ("dd_best_lead", solved),
+        ("dd_best_lead_tricks", solved),
+        ("lead_dd_tricks", with_lead),
+        ("lead_cost", with_lead),
+    ]:
+        if mask.any():
+            values = merged.loc[mask, col]
+            if col != "dd_best_lead":
+                values = values.astype(int)
+            out.loc[values.index, col] = values.astype(object)
 
     return out
@@ -0,0 +1,62 @@
+"""
+bridge/dd_matrix.py
+
+The 20 scraped double-dummy columns dd_{N|Ø|S|V}_{NT|S|H|D|C} as one
+(n_rows × 4 × 5) int8 array, so per-row DD questions (declarer tricks,
+best makeable zone, max minor tricks) become fancy indexing and
+reductions instead of per-row column lookups.
+
+Axis 1 is the seat (DD_SEATS order), axis 2 the strain (DD_STRAINS
+order).  Unknown cells hold MISSING (-1).
+
+Usage:
+    dd = dd_matrix(df)                          # rows with falsy dd_valid → MISSING
+    tricks = dd[np.arange(len(df)), seat_idx, strain_idx]
+    ns_best = dd[:, SIDE_SEATS["NS"], :].max(axis=(1, 2))
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+DD_SEATS: tuple[str, ...] = ("N", "Ø", "S", "V")
+DD_STRAINS: tuple[str, ...] = ("NT", "S", "H", "D", "C")
+DD_COLUMNS: tuple[str, ...] = tuple(f"dd_{seat}_{strain}" for seat in DD_SEATS for strain in DD_STRAINS)
+
+# Seat positions (axis 1) per side
+SIDE_SEATS: dict[str, list[int]] = {"NS": [0, 2], "ØV": [1, 3]}
+
+MISSING = -1
+
+
+def dd_valid_mask(df: pd.DataFrame) -> np.ndarray:
+    """Truthiness of dd_valid per row (missing column → all False; NaN counts as valid)."""
+    if "dd_valid" not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    return df["dd_valid"].to_numpy(dtype=object).astype(bool)
+
+
+def _as_tricks(values) -> np.ndarray:
+    """Numeric trick counts truncated like int(); anything else → MISSING."""
+    num = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype=float)
+    return np.where(np.isnan(num), MISSING, np.trunc(num)).astype(np.int8)
+
+
+def dd_matrix(df: pd.DataFrame) -> np.ndarray:
+    """(len(df), 4, 5) int8 DD trick table per row; rows whose dd_valid is falsy are MISSING."""
+    n = len(df)
+    out = np.full((n, len(DD_SEATS) * len(DD_STRAINS)), MISSING, dtype=np.int8)
+    for k, col in enumerate(DD_COLUMNS):
+        if col in df.columns:
+            out[:, k] = _as_tricks(df[col].to_numpy(dtype=object))
+    out[~dd_valid_mask(df)] = MISSING
+    return out.reshape(n, len(DD_SEATS), len(DD_STRAINS))
+
+
+def optional_ints(values: np.ndarray, missing: np.ndarray, index: pd.Index) -> pd.Series:
+    """values as a nullable Int8 Series (the schema dtype for DD trick counts), <NA> where missing."""
+    ints = pd.arrays.IntegerArray(
+        np.asarray(values).astype(np.int8), np.asarray(missing, dtype=bool),
+    )
+    return pd.Series(ints, index=index)
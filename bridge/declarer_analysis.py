@@ -2,6 +2,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 
+from bridge.player_index import PlayerIndex
+
 # ✅ ROLLE-TABEL: Hvis declarer er position X, så er:
 DECLARER_ROLES = {
     'N': {'dummy': 'S', 'leader': 'Ø', 'defender': 'V'},
@@ -26,10 +28,13 @@ def find_position(row, player_name):
         return 'V'
     return None
 
-def assign_roles(row, henrik, per):
+def assign_roles(row, henrik, per, positions=None):
     """
     Bestem roller for Henrik og Per baseret på declarer + deres positioner
-    
+
+    positions: (henrik_pos, per_pos) hvis de allerede er slået op
+    (fx via PlayerIndex.seat_of); ellers findes de med find_position.
+
     Returns: dict med henrik_role, per_role, is_henrik_leader, is_per_leader
     """
     declarer_pos = row.get('decl')
@@ -44,8 +49,11 @@ def assign_roles(row, henrik, per):
         }
     
     # Find deres positioner
-    henrik_pos = find_position(row, henrik)
-    per_pos = find_position(row, per)
+    if positions is not None:
+        henrik_pos, per_pos = positions
+    else:
+        henrik_pos = find_position(row, henrik)
+        per_pos = find_position(row, per)
     
     # Hent rolle-info fra tabel
     roles_info = DECLARER_ROLES[declarer_pos]
@@ -105,10 +113,15 @@ def make_declarer_analysis(df_pair, henrik="Henrik Friis", per="Per Føge Jensen
     """
     
     rows = []
-    
-    for _, row in df_pair.iterrows():
+
+    # Positioner for hele tabellen på én gang via spillerindekset
+    index = PlayerIndex.from_frame(df_pair)
+    henrik_seats = index.seat_of(henrik)
+    per_seats = index.seat_of(per)
+
+    for i, (_, row) in enumerate(df_pair.iterrows()):
         # Assign roller
-        role_info = assign_roles(row, henrik, per)
+        role_info = assign_roles(row, henrik, per, positions=(henrik_seats[i], per_seats[i]))
         
         # Kontrakt info
         contract = row.get('contract', '')
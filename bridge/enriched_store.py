@@ -0,0 +1,400 @@
+"""Materialized, incrementally maintained enriched history.
+
+Database location: <data_dir>/enriched.db (main opens one next to results.db).
+
+main.py enriches the whole cached history on every run
+(add_hand_features → add_phase21_fields → add_mvp_metrics → hole-analysis
+features) although normally only the newest tournament changed.  This
+module stores the output of every stage per partition and only recomputes
+partitions whose input rows or stage code changed.
+
+Partitions are play dates (tournament_date), not single tournaments:
+Phase 2.1 compares all rows of a board played on the same date across
+clubs/sections, so a date is the smallest unit whose enrichment does not
+depend on other rows.  Concatenating the partitions gives the same frame as
+enriching the whole history at once.
+
+Tables
+------
+enriched_partitions  (PRIMARY KEY (namespace, partition, stage))
+    namespace TEXT       (which dataset: "history", "period", ...)
+    partition TEXT       (tournament_date as text)
+    stage TEXT           (stage name, see HISTORY_STAGES)
+    input_hash TEXT      (hash of the partition's raw input rows)
+    version TEXT         (hash of stage code + YAML config + package
+                          versions, chained over the preceding stages)
+    row_count INTEGER
+    frame BLOB           (zlib-compressed pickle of the stage output)
+    saved_at TEXT
+
+A partition is reused from the deepest stage whose (input_hash, version)
+still match; the remaining stages are run on that stored frame.
+"""
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import pickle
+import sqlite3
+import threading
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+import pandas as pd
+
+from bridge.schema import apply_schema, union_categories
+
+_BRIDGE_DIR = Path(__file__).resolve().parent
+
+# Bump when the stored frame layout changes
+_FORMAT_VERSION = "2"   # 2: canonical dtypes (bridge/schema.py)
+
+_CREATE_PARTITIONS = """
+CREATE TABLE IF NOT EXISTS enriched_partitions (
+    namespace TEXT NOT NULL,
+    partition TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    version TEXT NOT NULL,
+    row_count INTEGER NOT NULL,
+    frame BLOB NOT NULL,
+    saved_at TEXT NOT NULL,
+    PRIMARY KEY (namespace, partition, stage)
+);
+"""
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+)
+
+
+# ---------------------------------------------------------------------------
+# Stages
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class EnrichStage:
+    """One enrichment step: fn(frame) -> frame, versioned by its sources.
+
+    sources are file names under bridge/ (code and YAML config) whose
+    content determines the stage output, including every module the stage
+    imports; params are the keyword arguments passed to fn and are part of
+    the version too.  packages are installed distributions whose version
+    (or absence) changes the output, e.g. the DD solver.
+    """
+    name: str
+    fn: Callable[..., pd.DataFrame]
+    sources: tuple[str, ...]
+    params: tuple[tuple[str, object], ...] = field(default=())
+    packages: tuple[str, ...] = field(default=())
+
+    def run(self, df: pd.DataFrame) -> pd.DataFrame:
+        return self.fn(df, **dict(self.params))
+
+
+def _hand_features(df: pd.DataFrame) -> pd.DataFrame:
+    from bridge.features import add_hand_features
+    return add_hand_features(df)
+
+
+def _phase21(df: pd.DataFrame, n_min: int = 12) -> pd.DataFrame:
+    from bridge.phase21_reference import add_phase21_fields
+    return add_phase21_fields(df, n_min=n_min)
+
+
+def _mvp(df: pd.DataFrame) -> pd.DataFrame:
+    from bridge.mvp_metrics import add_mvp_metrics
+    return add_mvp_metrics(df)
+
+
+def _hole_inputs(df: pd.DataFrame) -> pd.DataFrame:
+    from bridge.hole_analysis import add_hole_analysis_features, filter_pair_boards
+    df_pair = filter_pair_boards(df)
+    if df_pair.empty:
+        return df_pair
+    return add_hole_analysis_features(df_pair)
+
+
+# The DD lead columns come from dd_cache, which is a memo of endplay solves
+# keyed by the deal: a table's content is fixed by the deal and the solver,
+# and unsolvable tables are cached as empty.  So the stage output depends on
+# the dd_* modules and the endplay version, not on what else is in the cache.
+FEATURES_STAGE = EnrichStage(
+    "features", _hand_features,
+    (
+        "features.py", "hand_eval.py", "lead_analysis.py", "lead_analysis_spec.yaml",
+        "dd_enrich.py", "dd_compute.py", "dd_cache.py",
+    ),
+    packages=("endplay",),
+)
+PHASE21_STAGE = EnrichStage(
+    "phase21", _phase21, ("phase21_reference.py", "phase21_fields.py"), (("n_min", 12),),
+)
+MVP_STAGE = EnrichStage("mvp", _mvp, ("mvp_metrics.py", "dd_matrix.py"))
+HOLE_STAGE = EnrichStage("hole", _hole_inputs, ("hole_analysis.py", "dd_matrix.py", "player_index.py"))
+
+# add_hand_features → add_phase21_fields → add_mvp_metrics
+ENRICH_STAGES: tuple[EnrichStage, ...] = (FEATURES_STAGE, PHASE21_STAGE, MVP_STAGE)
+# ... → H+P pair rows with hole-analysis features (input to make_hole_reports)
+HISTORY_STAGES: tuple[EnrichStage, ...] = (*ENRICH_STAGES, HOLE_STAGE)
+
+
+def _file_digest(name: str) -> str:
+    path = _BRIDGE_DIR / name
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return "missing"
+
+
+def _package_version(name: str) -> str:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return "missing"
+
+
+def stage_versions(stages: Sequence[EnrichStage]) -> list[str]:
+    """Version stamp of each stage, chained so a change upstream invalidates
+    everything after it."""
+    versions = []
+    prev = f"format={_FORMAT_VERSION};pandas={pd.__version__}"
+    for stage in stages:
+        h = hashlib.sha256(prev.encode("utf-8"))
+        h.update(stage.name.encode("utf-8"))
+        h.update(repr(stage.params).encode("utf-8"))
+        for name in stage.sources:
+            h.update(f"{name}={_file_digest(name)}".encode("utf-8"))
+        for name in stage.packages:
+            h.update(f"pkg:{name}={_package_version(name)}".encode("utf-8"))
+        prev = h.hexdigest()
+        versions.append(prev)
+    return versions
+
+
+def frame_hash(df: pd.DataFrame) -> str:
+    """Content hash of a frame's columns and values (index labels ignored)."""
+    h = hashlib.sha256("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    if len(df):
+        h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+
+class EnrichedStore:
+    """Per-partition stage outputs in one SQLite file."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        for pragma in _PRAGMAS:
+            self._conn.execute(pragma)
+        with self._lock, self._conn:
+            self._conn.execute(_CREATE_PARTITIONS)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def get(
+        self, namespace: str, partition: str, stage: str, input_hash: str, version: str,
+    ) -> Optional[pd.DataFrame]:
+        """Stored stage output, or None when missing or stale."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT frame FROM enriched_partitions "
+                "WHERE namespace = ? AND partition = ? AND stage = ? "
+                "AND input_hash = ? AND version = ?",
+                (namespace, partition, stage, input_hash, version),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return pickle.loads(zlib.decompress(row[0]))
+        except Exception:
+            return None   # unreadable blob: recompute
+
+    def save(
+        self, namespace: str, partition: str, stage: str, input_hash: str, version: str,
+        frame: pd.DataFrame,
+    ) -> None:
+        blob = zlib.compress(pickle.dumps(frame, protocol=pickle.HIGHEST_PROTOCOL), 1)
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO enriched_partitions "
+                "(namespace, partition, stage, input_hash, version, row_count, frame, saved_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (namespace, partition, stage, input_hash, version, len(frame), blob, now),
+            )
+
+    def partitions(self, namespace: str) -> set[str]:
+        with self._lock:
+            return {
+                r[0] for r in self._conn.execute(
+                    "SELECT DISTINCT partition FROM enriched_partitions WHERE namespace = ?",
+                    (namespace,),
+                )
+            }
+
+    def prune(self, namespace: str, keep: set[str]) -> int:
+        """Drop partitions of namespace that are not in keep; returns the count."""
+        stale = self.partitions(namespace) - set(keep)
+        if stale:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "DELETE FROM enriched_partitions WHERE namespace = ? AND partition = ?",
+                    [(namespace, p) for p in stale],
+                )
+        return len(stale)
+
+
+# ---------------------------------------------------------------------------
+# Incremental enrichment
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class EnrichStats:
+    partitions: int = 0
+    reused: int = 0       # all stages served from the store
+    recomputed: int = 0   # at least one stage re-run
+    stages_run: int = 0
+    pruned: int = 0
+
+
+def _run_quietly(stage: EnrichStage, df: pd.DataFrame) -> pd.DataFrame:
+    # Stages print per call; per-date output would drown the run log.
+    # capture_output (not redirect_stdout): main runs stages concurrently.
+    from bridge.pipeline import capture_output
+    with capture_output():
+        return stage.run(df)
+
+
+def _concat_partitions(parts: list[pd.DataFrame]) -> pd.DataFrame:
+    """pd.concat, re-inferring columns whose dtype differs between partitions.
+
+    A column built row by row (apply) gets its dtype from the values it
+    holds, so a partition where it is all missing (object) and one where it
+    is float/str would concat to object.  Re-inferring from the combined
+    values gives the dtype the history gets when enriched in one go.
+    """
+    if not parts:
+        return pd.DataFrame()
+    non_empty = [p for p in parts if len(p)]
+    if len(non_empty) <= 1:
+        return non_empty[0] if non_empty else parts[0]
+    non_empty = union_categories(non_empty)
+    out = pd.concat(non_empty)
+    for col in out.columns:
+        dtypes = {p[col].dtype for p in non_empty if col in p.columns}
+        if len(dtypes) > 1:
+            out[col] = pd.Series(out[col].tolist(), index=out.index, name=col)
+    return out
+
+
+def _precompute_lead_tables(frames: list[pd.DataFrame], max_workers: Optional[int]) -> None:
+    """
+    Solve the DD lead tables of every partition the features stage will run
+    on in one go (one process pool per run, not one per date); the stage
+    itself then finds them in dd_cache.  Best-effort, like the stage: on
+    errors (or without endplay) the stage solves what is missing itself.
+    """
+    if not frames:
+        return
+    try:
+        from bridge.dd_enrich import precompute_lead_tables  # noqa: PLC0415
+        precompute_lead_tables(pd.concat(frames, ignore_index=True), max_workers=max_workers)
+    except Exception:  # noqa: BLE001 — endplay unavailable or data issue
+        pass
+
+
+def enrich_incremental(
+    df: pd.DataFrame,
+    store: EnrichedStore,
+    namespace: str = "history",
+    stages: Sequence[EnrichStage] = HISTORY_STAGES,
+    partition_col: str = "tournament_date",
+    prune: bool = False,
+    lead_workers: Optional[int] = None,
+) -> tuple[pd.DataFrame, EnrichStats]:
+    """
+    Run stages over df one partition (play date) at a time, reusing stored
+    outputs for partitions whose input rows and stage versions are unchanged.
+
+    Returns the concatenated output in df's row order (with df's index
+    labels) and an EnrichStats.  prune=True drops stored partitions of
+    namespace that no longer occur in df.  Missing DD lead tables of the
+    partitions that re-run FEATURES_STAGE are solved first, on lead_workers
+    processes (None = CPU count).
+    """
+    stats = EnrichStats()
+    if df.empty or partition_col not in df.columns:
+        out = df
+        for stage in stages:
+            out = _run_quietly(stage, out)
+        return apply_schema(out), stats
+
+    if not df.index.is_unique:
+        df = df.reset_index(drop=True)
+    versions = stage_versions(stages)
+    keys = df[partition_col].map(lambda v: "" if pd.isna(v) else str(v))
+
+    plan = []
+    seen: set[str] = set()
+    for key, positions in keys.groupby(keys, sort=False).indices.items():
+        seen.add(key)
+        stats.partitions += 1
+        raw = df.iloc[positions]
+        labels = raw.index
+        # Stored frames are indexed by position within the partition, so
+        # they stay valid when the history index shifts between runs.
+        raw = raw.reset_index(drop=True)
+        input_hash = frame_hash(raw)
+
+        start, frame = 0, raw
+        for i in range(len(stages) - 1, -1, -1):
+            cached = store.get(namespace, key, stages[i].name, input_hash, versions[i])
+            if cached is not None:
+                start, frame = i + 1, cached
+                break
+        plan.append((key, labels, input_hash, start, frame))
+
+    _precompute_lead_tables(
+        [frame for _, _, _, start, frame in plan if FEATURES_STAGE in stages[start:]],
+        lead_workers,
+    )
+
+    parts: list[pd.DataFrame] = []
+    for key, labels, input_hash, start, frame in plan:
+        for i in range(start, len(stages)):
+            frame = _run_quietly(stages[i], frame)
+            store.save(namespace, key, stages[i].name, input_hash, versions[i], frame)
+            stats.stages_run += 1
+        if start == len(stages):
+            stats.reused += 1
+        else:
+            stats.recomputed += 1
+
+        frame = frame.copy()
+        frame.index = labels[frame.index.to_numpy()]
+        parts.append(frame)
+
+    if prune:
+        stats.pruned = store.prune(namespace, seen)
+
+    out = _concat_partitions(parts)
+    if len(out):
+        out = out.loc[df.index[df.index.isin(out.index)]]
+    return apply_schema(out), stats
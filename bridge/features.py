@@ -24,69 +24,34 @@ Usage (in main.py after df_all is created):
 
 from __future__ import annotations
 
-from typing import Optional
+import numpy as np
 import pandas as pd
 
-from bridge.hand_eval import evaluate_hand
+from bridge.hand_eval import evaluate_hands
 from bridge.lead_analysis import add_lead_analysis_features
 
 
-def _safe_eval(dot_hand: object) -> dict:
-    """
-    Evaluate a dot-hand safely. Returns None-like defaults if missing or invalid.
-    """
-    if dot_hand is None or (isinstance(dot_hand, float) and pd.isna(dot_hand)):
-        return {
-            "hcp": None,
-            "shape": None,
-            "shape_shdc": None,
-            "balanced": None,
-            "dist_pts_shortage": None,
-            "ltc_adj": None,
-            "controls": None,
-            "aces": None,
-            "kings": None,
-        }
-
-    s = str(dot_hand).strip()
-    if not s or s == "None":
-        return {
-            "hcp": None,
-            "shape": None,
-            "shape_shdc": None,
-            "balanced": None,
-            "dist_pts_shortage": None,
-            "ltc_adj": None,
-            "controls": None,
-            "aces": None,
-            "kings": None,
-        }
-
-    try:
-        out = evaluate_hand(s)
-        return {
-            "hcp": out.get("hcp"),
-            "shape": out.get("shape"),
-            "shape_shdc": out.get("shape_shdc"),
-            "balanced": out.get("balanced"),
-            "dist_pts_shortage": out.get("dist_pts_shortage"),
-            "ltc_adj": out.get("ltc_adj"),
-            "controls": out.get("controls"),
-            "aces": out.get("aces"),
-            "kings": out.get("kings"),
-        }
-    except Exception:
-        return {
-            "hcp": None,
-            "shape": None,
-            "shape_shdc": None,
-            "balanced": None,
-            "dist_pts_shortage": None,
-            "ltc_adj": None,
-            "controls": None,
-            "aces": None,
-            "kings": None,
-        }
+_SEAT_COLS = {
+    "N": "N_hand",
+    "S": "S_hand",
+    "Ø": "Ø_hand",
+    "V": "V_hand",
+}
+
+# evaluate_hands() key -> per-seat column suffix
+_SEAT_METRICS = {
+    "hcp": "HCP",
+    "shape": "shape",
+    "shape_shdc": "shape_SHDC",
+    "balanced": "balanced",
+    "dist_pts_shortage": "dist_pts_shortage",
+    "ltc_adj": "LTC_adj",
+    "controls": "controls",
+    "aces": "aces",
+    "kings": "kings",
+}
+
+_SIDE_METRICS = ["HCP", "LTC_adj", "controls", "aces", "kings"]
 
 
 def _seat_side(seat: str) -> str:
@@ -98,113 +63,105 @@ def _seat_side(seat: str) -> str:
     return "NS" if seat in ("N", "S") else "ØV"
 
 
+def _seat_features(hands: pd.Series) -> dict[str, pd.Series]:
+    """
+    Evaluate one hand column.  Each distinct hand string is evaluated once
+    (columnar, via evaluate_hands) and mapped back to the rows.
+
+    Missing / blank / "None" hands give None-like values: numeric columns
+    become float with NaN, 'balanced' becomes object with None.
+    """
+    codes, uniques = pd.factorize(hands, use_na_sentinel=True)
+    uniq_str = [str(u).strip() for u in uniques]
+    uniq_ok = np.array([bool(u) and u != "None" for u in uniq_str], dtype=bool)
+
+    evals = evaluate_hands(uniq_str)
+    row_ok = codes >= 0
+    row_ok[row_ok] = uniq_ok[codes[row_ok]]
+    take = np.where(row_ok, codes, 0)
+    all_ok = bool(row_ok.all())
+
+    out: dict[str, pd.Series] = {}
+    for key, arr in evals.items():
+        values = arr[take] if len(arr) else np.zeros(len(hands), dtype=arr.dtype)
+        if arr.dtype == object:
+            values = np.where(row_ok, values, None)
+        elif arr.dtype == bool:
+            if not all_ok:
+                values = np.where(row_ok, values, None).astype(object)
+        elif not all_ok:
+            values = np.where(row_ok, values, np.nan)
+        out[key] = pd.Series(values, index=hands.index)
+    return out
+
+
 def add_hand_features(df: pd.DataFrame) -> pd.DataFrame:
     """
     Adds hand and derived features to df.
     Returns a copy (does not mutate input).
+
+    All metrics are computed column-wise: the hand columns are parsed into
+    a NumPy rank-count matrix (see hand_eval.evaluate_hands) and side /
+    declarer aggregates are array operations.
     """
     out = df.copy()
+    new_cols: dict[str, pd.Series] = {}
 
     # --- Individual seat metrics ---
-    seat_map = {
-        "N": "N_hand",
-        "S": "S_hand",
-        "Ø": "Ø_hand",
-        "V": "V_hand",
-    }
-
-    for seat, col in seat_map.items():
-        evals = out[col].apply(_safe_eval)
-
-        out[f"{seat}_HCP"] = evals.apply(lambda d: d["hcp"])
-        out[f"{seat}_shape"] = evals.apply(lambda d: d["shape"])
-        out[f"{seat}_shape_SHDC"] = evals.apply(lambda d: d["shape_shdc"])
-        out[f"{seat}_balanced"] = evals.apply(lambda d: d["balanced"])
-        out[f"{seat}_dist_pts_shortage"] = evals.apply(lambda d: d["dist_pts_shortage"])
-        out[f"{seat}_LTC_adj"] = evals.apply(lambda d: d["ltc_adj"])
-        out[f"{seat}_controls"] = evals.apply(lambda d: d["controls"])
-        out[f"{seat}_aces"] = evals.apply(lambda d: d["aces"])
-        out[f"{seat}_kings"] = evals.apply(lambda d: d["kings"])
+    for seat, col in _SEAT_COLS.items():
+        hands = out[col] if col in out.columns else pd.Series(None, index=out.index, dtype=object)
+        for key, values in _seat_features(hands).items():
+            new_cols[f"{seat}_{_SEAT_METRICS[key]}"] = values
 
     # --- Side totals (NS and ØV) ---
-    def _sum2(a, b):
-        if a is None or b is None:
-            return None
-        if (isinstance(a, float) and pd.isna(a)) or (isinstance(b, float) and pd.isna(b)):
-            return None
-        return float(a) + float(b)
-
-    out["NS_HCP"] = out.apply(lambda r: _sum2(r["N_HCP"], r["S_HCP"]), axis=1)
-    out["ØV_HCP"] = out.apply(lambda r: _sum2(r["Ø_HCP"], r["V_HCP"]), axis=1)
-
-    out["NS_LTC_adj"] = out.apply(lambda r: _sum2(r["N_LTC_adj"], r["S_LTC_adj"]), axis=1)
-    out["ØV_LTC_adj"] = out.apply(lambda r: _sum2(r["Ø_LTC_adj"], r["V_LTC_adj"]), axis=1)
-
-    out["NS_controls"] = out.apply(lambda r: _sum2(r["N_controls"], r["S_controls"]), axis=1)
-    out["ØV_controls"] = out.apply(lambda r: _sum2(r["Ø_controls"], r["V_controls"]), axis=1)
-
-    out["NS_aces"] = out.apply(lambda r: _sum2(r["N_aces"], r["S_aces"]), axis=1)
-    out["ØV_aces"] = out.apply(lambda r: _sum2(r["Ø_aces"], r["V_aces"]), axis=1)
+    def _float(name: str) -> np.ndarray:
+        return pd.to_numeric(new_cols[name], errors="coerce").to_numpy(dtype=float)
 
-    out["NS_kings"] = out.apply(lambda r: _sum2(r["N_kings"], r["S_kings"]), axis=1)
-    out["ØV_kings"] = out.apply(lambda r: _sum2(r["Ø_kings"], r["V_kings"]), axis=1)
+    for metric in _SIDE_METRICS:
+        new_cols[f"NS_{metric}"] = pd.Series(
+            _float(f"N_{metric}") + _float(f"S_{metric}"), index=out.index
+        )
+        new_cols[f"ØV_{metric}"] = pd.Series(
+            _float(f"Ø_{metric}") + _float(f"V_{metric}"), index=out.index
+        )
 
     # --- Declarer/Defense side derived metrics ---
-    def _decl_side(decl: object) -> Optional[str]:
-        if decl is None or (isinstance(decl, float) and pd.isna(decl)):
-            return None
-        d = str(decl).strip()
-        if d not in ("N", "S", "Ø", "V"):
-            return None
-        return _seat_side(d)
-
-    out["Declarer_Side"] = out["decl"].apply(_decl_side)
-
-    def _pick_side(row, side: str, metric: str):
-        if side == "NS":
-            return row.get(f"NS_{metric}")
-        if side == "ØV":
-            return row.get(f"ØV_{metric}")
-        return None
-
-    def _other_side(side: Optional[str]) -> Optional[str]:
-        if side == "NS":
-            return "ØV"
-        if side == "ØV":
-            return "NS"
-        return None
-
-    def _calc_row(row):
-        ds = row.get("Declarer_Side")
-        os = _other_side(ds) if ds else None
-
-        decl_hcp = _pick_side(row, ds, "HCP") if ds else None
-        def_hcp = _pick_side(row, os, "HCP") if os else None
-
-        decl_ltc = _pick_side(row, ds, "LTC_adj") if ds else None
-        def_ltc = _pick_side(row, os, "LTC_adj") if os else None
-
-        hcp_diff = (decl_hcp - def_hcp) if (decl_hcp is not None and def_hcp is not None) else None
-        ltc_diff = (def_ltc - decl_ltc) if (decl_ltc is not None and def_ltc is not None) else None
-
-        suit_index = (24.0 - decl_ltc) if (decl_ltc is not None) else None
-        nt_index = decl_hcp  # v1
-
-        return pd.Series({
-            "Declarer_HCP": decl_hcp,
-            "Defense_HCP": def_hcp,
-            "HCP_diff": hcp_diff,
-
-            "Declarer_LTC_adj": decl_ltc,
-            "Defense_LTC_adj": def_ltc,
-            "LTC_diff": ltc_diff,
-
-            "Suit_Index": suit_index,
-            "NT_Index": nt_index,
-        })
-
-    derived = out.apply(_calc_row, axis=1)
-    out = pd.concat([out, derived], axis=1)
+    decl = out["decl"] if "decl" in out.columns else pd.Series(None, index=out.index, dtype=object)
+    decl_txt = decl.map(lambda d: str(d).strip(), na_action="ignore")
+    is_ns = decl_txt.isin(["N", "S"]).to_numpy()
+    is_ov = decl_txt.isin(["Ø", "V"]).to_numpy()
+    new_cols["Declarer_Side"] = pd.Series(
+        np.select([is_ns, is_ov], ["NS", "ØV"], default=None), index=out.index
+    )
+
+    def _by_side(metric: str, declaring: bool) -> np.ndarray:
+        ns = new_cols[f"NS_{metric}"].to_numpy()
+        ov = new_cols[f"ØV_{metric}"].to_numpy()
+        if not declaring:
+            ns, ov = ov, ns
+        return np.select([is_ns, is_ov], [ns, ov], default=np.nan)
+
+    decl_hcp = _by_side("HCP", True)
+    def_hcp = _by_side("HCP", False)
+    decl_ltc = _by_side("LTC_adj", True)
+    def_ltc = _by_side("LTC_adj", False)
+
+    for name, values in {
+        "Declarer_HCP": decl_hcp,
+        "Defense_HCP": def_hcp,
+        "HCP_diff": decl_hcp - def_hcp,
+
+        "Declarer_LTC_adj": decl_ltc,
+        "Defense_LTC_adj": def_ltc,
+        "LTC_diff": def_ltc - decl_ltc,
+
+        "Suit_Index": 24.0 - decl_ltc,
+        "NT_Index": decl_hcp,  # v1
+    }.items():
+        new_cols[name] = pd.Series(values, index=out.index)
+
+    out = out.drop(columns=[c for c in new_cols if c in out.columns])
+    out = pd.concat([out, pd.DataFrame(new_cols, index=out.index)], axis=1)
 
     out = add_lead_analysis_features(out)
 
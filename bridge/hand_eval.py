@@ -8,7 +8,9 @@ Input hand format (dot-format):
 = Spades.Hearts.Diamonds.Clubs
 
 This module provides:
-- parsing of dot hands
+- parsing of dot hands (single hands, or many at once into a NumPy rank-count matrix)
+- a compact, hashable bitboard Hand (52-bit card mask) with table lookups
+- a shared, bounded memo of per-hand evaluations (evaluate_hand_cached)
 - HCP (High Card Points)
 - shape (e.g., "5-3-3-2" and tuple)
 - distribution points (simple)
@@ -24,7 +26,10 @@ Design goals:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple, Optional
+
+import numpy as np
 
 
 # ----------------------------
@@ -106,8 +111,10 @@ def parse_hand(dot_hand: str) -> ParsedHand:
 # Basic metrics
 # ----------------------------
 
-def hcp(hand: ParsedHand) -> int:
+def hcp(hand: ParsedHand | Hand) -> int:
     """High Card Points: A=4, K=3, Q=2, J=1."""
+    if isinstance(hand, Hand):
+        return hand.hcp
     total = 0
     for suit in SUITS_ORDER:
         for r in hand.suits[suit]:
@@ -115,7 +122,7 @@ def hcp(hand: ParsedHand) -> int:
     return total
 
 
-def controls(hand: ParsedHand) -> Dict[str, int]:
+def controls(hand: ParsedHand | Hand) -> Dict[str, int]:
     """
     Controls:
       A = 2
@@ -123,6 +130,10 @@ def controls(hand: ParsedHand) -> Dict[str, int]:
     Returns dict with:
       controls, aces, kings
     """
+    if isinstance(hand, Hand):
+        aces = sum(1 for m in hand.suit_masks() if m & _RANK_BIT["A"])
+        kings = sum(1 for m in hand.suit_masks() if m & _RANK_BIT["K"])
+        return {"controls": 2 * aces + kings, "aces": aces, "kings": kings}
     aces = 0
     kings = 0
     ctrl = 0
@@ -231,11 +242,13 @@ def ltc_adjusted_suit(ranks: str, length: int) -> float:
     return losers
 
 
-def ltc_adjusted(hand: ParsedHand) -> float:
+def ltc_adjusted(hand: ParsedHand | Hand) -> float:
     """
     Adjusted LTC for the whole hand (sum over suits).
     Returns float because we allow half-losers (singleton K, Qx).
     """
+    if isinstance(hand, Hand):
+        return float(sum(_SUIT_LTC[m] for m in hand.suit_masks()))
     total = 0.0
     for suit in SUITS_ORDER:
         ranks = hand.suits[suit]
@@ -268,6 +281,316 @@ def evaluate_hand(dot_hand: str) -> Dict[str, object]:
     }
 
 
+# ----------------------------
+# Bitboard hands
+# ----------------------------
+
+# Bit b of a 13-bit suit mask is rank _BIT_RANKS[b] (bit 0 = deuce, bit 12 = ace).
+# In a 52-bit Hand mask suit i (S, H, D, C order) occupies bits 13*i .. 13*i+12.
+_BIT_RANKS = "23456789TJQKA"
+_RANK_BIT = {r: 1 << b for b, r in enumerate(_BIT_RANKS)}
+_SUIT_INDEX = {suit: i for i, suit in enumerate(SUITS_ORDER)}
+_SUIT_FULL = (1 << 13) - 1
+
+
+def _suit_ranks(mask: int) -> str:
+    return "".join(_BIT_RANKS[b] for b in range(12, -1, -1) if mask >> b & 1)
+
+
+def _suit_stopper(ranks: str, length: int) -> bool:
+    # Same rule as opening_bid's natural-NT stopper test
+    if "A" in ranks:
+        return True
+    if "K" in ranks and length >= 2:
+        return True
+    if "Q" in ranks and "J" in ranks and length >= 3:
+        return True
+    return "Q" in ranks and "T" in ranks and length >= 4
+
+
+# Per-suit lookup tables indexed by the 13-bit suit mask
+_SUIT_RANKS_STR = tuple(_suit_ranks(m) for m in range(1 << 13))
+_SUIT_LEN = tuple(m.bit_count() for m in range(1 << 13))
+_SUIT_HCP = tuple(sum(HCP_MAP.get(r, 0) for r in _SUIT_RANKS_STR[m]) for m in range(1 << 13))
+_SUIT_LTC = tuple(ltc_adjusted_suit(_SUIT_RANKS_STR[m], _SUIT_LEN[m]) for m in range(1 << 13))
+_SUIT_STOPPER = tuple(_suit_stopper(_SUIT_RANKS_STR[m], _SUIT_LEN[m]) for m in range(1 << 13))
+# Mask of the top-n honours (A, AK, AKQ, AKQJ, AKQJT) for n = 0..5
+_TOP_HONOURS = tuple(sum(1 << (12 - i) for i in range(n)) for n in range(6))
+
+
+@dataclass(frozen=True, slots=True)
+class Hand:
+    """
+    Compact hand: one bit per card in a 52-bit integer (see _BIT_RANKS).
+
+    Hashable and immutable.  Per-suit HCP / length / LTC / stopper queries are
+    single table lookups on the 13-bit suit mask.  Build with from_dot() or
+    from_endplay(); hcp(), controls() and ltc_adjusted() accept it directly.
+    """
+    mask: int
+
+    @classmethod
+    def from_dot(cls, dot_hand: str) -> "Hand":
+        """Build from a dot-hand, with the same tolerance as parse_hand()."""
+        return _hand_from_dot("" if dot_hand is None else str(dot_hand).strip())
+
+    @classmethod
+    def from_suit_masks(cls, masks: Iterable[int]) -> "Hand":
+        """Build from four 13-bit suit masks in S, H, D, C order."""
+        mask = 0
+        for i, m in enumerate(masks):
+            mask |= (int(m) & _SUIT_FULL) << (13 * i)
+        return cls(mask)
+
+    @classmethod
+    def from_endplay(cls, hand) -> "Hand":
+        """Build from an endplay Hand (e.g. deal.north); no endplay import needed."""
+        holdings = (hand.spades, hand.hearts, hand.diamonds, hand.clubs)
+        # endplay encodes rank r as 1 << r with the deuce at bit 2
+        return cls.from_suit_masks(sum(int(r) for r in h) >> 2 for h in holdings)
+
+    def suit_mask(self, suit: str) -> int:
+        return self.mask >> (13 * _SUIT_INDEX[suit]) & _SUIT_FULL
+
+    def suit_masks(self) -> Tuple[int, int, int, int]:
+        m = self.mask
+        return (m & _SUIT_FULL, m >> 13 & _SUIT_FULL, m >> 26 & _SUIT_FULL, m >> 39 & _SUIT_FULL)
+
+    def ranks(self, suit: str) -> str:
+        """Ranks held in suit, highest first (e.g. "KT4")."""
+        return _SUIT_RANKS_STR[self.suit_mask(suit)]
+
+    def length(self, suit: str) -> int:
+        return _SUIT_LEN[self.suit_mask(suit)]
+
+    def lengths(self) -> Tuple[int, int, int, int]:
+        return tuple(_SUIT_LEN[m] for m in self.suit_masks())
+
+    def has(self, suit: str, rank: str) -> bool:
+        return bool(self.suit_mask(suit) & _RANK_BIT[rank])
+
+    def suit_hcp(self, suit: str) -> int:
+        return _SUIT_HCP[self.suit_mask(suit)]
+
+    def honours(self, suit: str, top: int = 4) -> int:
+        """Number of the top *top* honours held (4 = AKQJ, 5 = AKQJT)."""
+        return (self.suit_mask(suit) & _TOP_HONOURS[top]).bit_count()
+
+    def stopper(self, suit: str) -> bool:
+        """A, Kx, QJx or QTxx in suit."""
+        return _SUIT_STOPPER[self.suit_mask(suit)]
+
+    @property
+    def hcp(self) -> int:
+        return sum(_SUIT_HCP[m] for m in self.suit_masks())
+
+    def dot(self) -> str:
+        return ".".join(_SUIT_RANKS_STR[m] for m in self.suit_masks())
+
+    def __repr__(self) -> str:
+        return f"Hand({self.dot()!r})"
+
+
+@lru_cache(maxsize=16384)
+def _hand_from_dot(dot_hand: str) -> Hand:
+    parts = (dot_hand.split(".") + ["", "", "", ""])[:4]
+    masks = []
+    for part in parts:
+        m = 0
+        for ch in part:
+            m |= _RANK_BIT.get(ch, 0)
+        masks.append(m)
+    return Hand.from_suit_masks(masks)
+
+
+# ----------------------------
+# Memoized evaluation (shared across modules)
+# ----------------------------
+
+# Distinct hands kept in the memo.  A club evening has ~24 boards x 4 hands
+# played at ~10 tables; a full cache history stays well below this bound.
+_HAND_MEMO_SIZE = 16384
+
+
+@dataclass(frozen=True, slots=True)
+class HandEvaluation:
+    """
+    Immutable evaluation of one dot-hand, as returned by evaluate_hand_cached().
+
+    Carries the evaluate_hand() features plus the parsed suits/lengths
+    (tuples in S, H, D, C order) so callers never need to re-parse.
+    """
+    dot: str
+    suits: Tuple[str, str, str, str]
+    lengths: Tuple[int, int, int, int]
+    suit_hcp: Tuple[int, int, int, int]
+    hcp: int
+    shape: str
+    shape_shdc: str
+    balanced: bool
+    dist_pts_shortage: int
+    ltc_adj: float
+    controls: int
+    aces: int
+    kings: int
+
+    def suit(self, suit: str) -> str:
+        """Ranks held in suit ("S"/"H"/"D"/"C")."""
+        return self.suits[SUITS_ORDER.index(suit)]
+
+    def length(self, suit: str) -> int:
+        """Length of suit ("S"/"H"/"D"/"C")."""
+        return self.lengths[SUITS_ORDER.index(suit)]
+
+    def as_dict(self) -> Dict[str, object]:
+        """Same dict as evaluate_hand()."""
+        return {
+            "dot": self.dot,
+            "hcp": self.hcp,
+            "shape": self.shape,
+            "shape_shdc": self.shape_shdc,
+            "balanced": self.balanced,
+            "dist_pts_shortage": self.dist_pts_shortage,
+            "ltc_adj": self.ltc_adj,
+            "controls": self.controls,
+            "aces": self.aces,
+            "kings": self.kings,
+        }
+
+
+@lru_cache(maxsize=_HAND_MEMO_SIZE)
+def _evaluate_hand_memo(dot_hand: str) -> HandEvaluation:
+    ph = parse_hand(dot_hand)
+    ctrl = controls(ph)
+    return HandEvaluation(
+        dot=ph.dot(),
+        suits=tuple(ph.suits[s] for s in SUITS_ORDER),
+        lengths=shape_tuple(ph),
+        suit_hcp=tuple(sum(HCP_MAP.get(r, 0) for r in ph.suits[s]) for s in SUITS_ORDER),
+        hcp=hcp(ph),
+        shape=shape_str(ph, sort_desc=True),
+        shape_shdc="-".join(str(x) for x in shape_tuple(ph)),
+        balanced=is_balanced(ph),
+        dist_pts_shortage=distribution_points(ph, method="shortage"),
+        ltc_adj=ltc_adjusted(ph),
+        controls=ctrl["controls"],
+        aces=ctrl["aces"],
+        kings=ctrl["kings"],
+    )
+
+
+def evaluate_hand_cached(dot_hand: str) -> HandEvaluation:
+    """
+    Memoized evaluate_hand(): every table playing a board holds the same four
+    hands, so each distinct dot-string is parsed and evaluated once per
+    process (bounded LRU, see hand_eval_cache_stats()).
+    """
+    return _evaluate_hand_memo("" if dot_hand is None else str(dot_hand).strip())
+
+
+def hand_eval_cache_stats() -> Dict[str, float]:
+    """Hits, misses, current size and hit rate of the evaluate_hand_cached() memo."""
+    info = _evaluate_hand_memo.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+        "hit_rate": (info.hits / lookups) if lookups else 0.0,
+    }
+
+
+def clear_hand_eval_cache() -> None:
+    """Empty the evaluate_hand_cached() memo and reset its statistics."""
+    _evaluate_hand_memo.cache_clear()
+
+
+# ----------------------------
+# Columnar evaluation (many hands at once)
+# ----------------------------
+
+# Rank order of the last axis of hand_rank_counts(): A K Q J T 9 ... 2
+RANKS_ORDER = "AKQJT98765432"
+
+_RANK_LOOKUP = np.full(128, -1, dtype=np.int8)
+for _i, _r in enumerate(RANKS_ORDER):
+    _RANK_LOOKUP[ord(_r)] = _i
+
+_BALANCED_SORTED = np.array([[4, 3, 3, 3], [4, 4, 3, 2], [5, 3, 3, 2]])
+# Shortage points indexed by suit length (void=3, singleton=2, doubleton=1)
+_SHORTAGE_PTS = np.array([3, 2, 1] + [0] * 11, dtype=np.int64)
+
+
+def hand_rank_counts(dot_hands: Iterable[str]) -> np.ndarray:
+    """
+    Parse many dot-hands into an (n, 4, 13) uint8 matrix of card counts,
+    axes (hand, suit S/H/D/C, rank A..2).
+
+    Follows parse_hand(): text after a 4th '.' is ignored and any
+    character outside ALLOWED_RANKS (spaces, "-", "—") is skipped.
+    """
+    arr = np.asarray(list(dot_hands), dtype=str)
+    n = len(arr)
+    counts = np.zeros((n, 4, 13), dtype=np.uint8)
+    if n == 0 or arr.dtype.itemsize == 0:
+        return counts
+
+    codes = arr.view(np.uint32).reshape(n, arr.dtype.itemsize // 4)
+    suit_idx = np.cumsum(codes == ord("."), axis=1)
+    rank_idx = np.where(codes < 128, _RANK_LOOKUP[np.minimum(codes, 127)], -1)
+    rows, cols = np.nonzero((rank_idx >= 0) & (suit_idx < 4))
+    np.add.at(counts, (rows, suit_idx[rows, cols], rank_idx[rows, cols]), 1)
+    return counts
+
+
+def evaluate_hands(dot_hands: Iterable[str]) -> Dict[str, np.ndarray]:
+    """
+    Columnar counterpart of evaluate_hand(): evaluates many dot-hands with
+    array operations and returns one array per feature (same keys as
+    evaluate_hand() minus "dot"), aligned with the input order.
+    """
+    counts = hand_rank_counts(dot_hands).astype(np.int64)
+    lengths = counts.sum(axis=2)                       # (n, 4) S,H,D,C
+    has = counts[:, :, :3] > 0                         # A, K, Q present per suit
+    has_a, has_k, has_q = has[:, :, 0], has[:, :, 1], has[:, :, 2]
+
+    hcp_arr = (counts[:, :, :4] * np.array([4, 3, 2, 1])).sum(axis=(1, 2))
+    aces = has_a.sum(axis=1)
+    kings = has_k.sum(axis=1)
+
+    # Adjusted LTC per suit (see ltc_adjusted_suit)
+    losers = np.minimum(lengths, 3).astype(float)
+    losers -= has_a
+    losers -= np.where(has_k, np.where(lengths >= 2, 1.0, 0.5), 0.0)
+    losers -= np.where(has_q, np.where(lengths >= 3, 1.0, np.where(lengths == 2, 0.5, 0.0)), 0.0)
+    losers = np.where(lengths <= 0, 0.0, np.clip(losers, 0.0, 3.0))
+
+    sorted_lengths = -np.sort(-lengths, axis=1)
+    balanced = (sorted_lengths[:, None, :] == _BALANCED_SORTED[None, :, :]).all(axis=2).any(axis=1)
+
+    # Shape strings: build once per distinct S-H-D-C length pattern
+    patterns, inverse = np.unique(lengths, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    shape_desc = np.array(
+        ["-".join(str(x) for x in sorted(p, reverse=True)) for p in patterns.tolist()],
+        dtype=object,
+    )
+    shape_shdc = np.array(["-".join(str(x) for x in p) for p in patterns.tolist()], dtype=object)
+
+    return {
+        "hcp": hcp_arr,
+        "shape": shape_desc[inverse],
+        "shape_shdc": shape_shdc[inverse],
+        "balanced": balanced,
+        "dist_pts_shortage": _SHORTAGE_PTS[np.minimum(lengths, 13)].sum(axis=1),
+        "ltc_adj": losers.sum(axis=1),
+        "controls": 2 * aces + kings,
+        "aces": aces,
+        "kings": kings,
+    }
+
+
 # ----------------------------
 # Side evaluation helpers
 # ----------------------------
@@ -47,6 +47,9 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 
+from bridge.dd_matrix import DD_STRAINS, MISSING, SIDE_SEATS, dd_matrix, optional_ints
+from bridge.player_index import pair_boards
+
 HENRIK = "Henrik Friis"
 PER = "Per Føge Jensen"
 
@@ -151,17 +154,17 @@ def _parse_contract_str(c: object) -> tuple[Optional[int], Optional[str]]:
 # Pair-side helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _pair_side(row) -> Optional[str]:
-    """Return 'NS' or 'ØV' depending on which side Henrik+Per sit."""
-    if HENRIK in (row.get("ns1"), row.get("ns2")):
+def _pair_side(row, player: str = HENRIK) -> Optional[str]:
+    """Return 'NS' or 'ØV' depending on which side the pair (player) sits."""
+    if player in (row.get("ns1"), row.get("ns2")):
         return "NS"
-    if HENRIK in (row.get("ew1"), row.get("ew2")):
+    if player in (row.get("ew1"), row.get("ew2")):
         return "ØV"
     return None
 
 
-def _pair_pct(row) -> Optional[float]:
-    side = _pair_side(row)
+def _pair_pct(row, player: str = HENRIK) -> Optional[float]:
+    side = _pair_side(row, player)
     if side == "NS":
         v = row.get("pct_NS")
     elif side == "ØV":
@@ -174,9 +177,9 @@ def _pair_pct(row) -> Optional[float]:
         return None
 
 
-def _pair_hcp(row) -> Optional[float]:
+def _pair_hcp(row, player: str = HENRIK) -> Optional[float]:
     """HCP of the pair's side (N+S or Ø+V)."""
-    side = _pair_side(row)
+    side = _pair_side(row, player)
     if side == "NS":
         v = row.get("NS_HCP")
     elif side == "ØV":
@@ -189,9 +192,9 @@ def _pair_hcp(row) -> Optional[float]:
         return None
 
 
-def _pair_ltc(row) -> Optional[float]:
+def _pair_ltc(row, player: str = HENRIK) -> Optional[float]:
     """Adjusted LTC of the pair's side."""
-    side = _pair_side(row)
+    side = _pair_side(row, player)
     if side == "NS":
         v = row.get("NS_LTC_adj")
     elif side == "ØV":
@@ -204,9 +207,9 @@ def _pair_ltc(row) -> Optional[float]:
         return None
 
 
-def _pair_dist_pts(row) -> Optional[float]:
+def _pair_dist_pts(row, player: str = HENRIK) -> Optional[float]:
     """Distribution points (shortage) of the pair's side – sum of 2 hands."""
-    side = _pair_side(row)
+    side = _pair_side(row, player)
     if side == "NS":
         seats = ("N", "S")
     elif side == "ØV":
@@ -223,9 +226,9 @@ def _pair_dist_pts(row) -> Optional[float]:
     return total
 
 
-def _pair_controls(row) -> Optional[float]:
+def _pair_controls(row, player: str = HENRIK) -> Optional[float]:
     """Controls (A=2, K=1) of the pair's side – sum of 2 hands."""
-    side = _pair_side(row)
+    side = _pair_side(row, player)
     if side == "NS":
         seats = ("N", "S")
     elif side == "ØV":
@@ -246,16 +249,9 @@ def _pair_controls(row) -> Optional[float]:
 # Filter
 # ─────────────────────────────────────────────────────────────────────────────
 
-def filter_pair_boards(df: pd.DataFrame) -> pd.DataFrame:
-    """Return rows where both Henrik and Per appear at the table."""
-    names = {HENRIK, PER}
-    mask = df.apply(
-        lambda r: names.issubset(
-            {r.get("ns1"), r.get("ns2"), r.get("ew1"), r.get("ew2")}
-        ),
-        axis=1,
-    )
-    return df[mask].copy()
+def filter_pair_boards(df: pd.DataFrame, players: tuple[str, str] = (HENRIK, PER)) -> pd.DataFrame:
+    """Return rows where both players (default Henrik and Per) appear at the table."""
+    return pair_boards(df, *players)
 
 
 def _is_played(row) -> bool:
@@ -267,74 +263,56 @@ def _is_played(row) -> bool:
 # DD best zone for a given side
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _dd_best_zone_for_side(row, side: str) -> Optional[str]:
-    """
-    Inspect the full DD table and return the best *makeable* zone for the side.
+def _zone_rank(zone: str) -> int:
+    return ZONE_ORDER.index(zone) if zone in ZONE_ORDER else -1
 
-    "Best" = highest zone in ZONE_ORDER that is achievable by at least one
-    declarer from that side in at least one strain.
 
-    Returns None when dd_valid is False/missing.
-    """
-    if not row.get("dd_valid", False):
-        return None
+# ZONE_ORDER rank of the zone a DD trick count makes, per (tricks, strain);
+# -1 below level 1.  Rows: tricks 0..13, columns: DD_STRAINS.
+_DD_ZONE_RANK = np.array([
+    [_zone_rank(classify_zone(tricks - 6, strain)) if tricks >= 7 else -1 for strain in DD_STRAINS]
+    for tricks in range(14)
+])
 
-    decls = ["N", "S"] if side == "NS" else ["Ø", "V"]
-    best_rank = -1
-    best_zone = None
 
-    for decl in decls:
-        for strain in ["NT", "S", "H", "D", "C"]:
-            col = f"dd_{decl}_{strain}"
-            val = row.get(col)
-            if val is None or (isinstance(val, float) and math.isnan(val)):
-                continue
-            try:
-                tricks = int(val)
-            except (TypeError, ValueError):
-                continue
-            level = tricks - 6
-            if level < 1:
-                continue
-            zone = classify_zone(level, strain)
-            if zone in ZONE_ORDER:
-                rank = ZONE_ORDER.index(zone)
-                if rank > best_rank:
-                    best_rank = rank
-                    best_zone = zone
+def _zone_ranks(values) -> np.ndarray:
+    """ZONE_ORDER rank per value; -1 for None/NaN/unknown zones."""
+    return pd.Categorical(np.asarray(values, dtype=object), categories=ZONE_ORDER).codes.astype(np.int64)
 
-    return best_zone
 
+def _dd_side_features(df: pd.DataFrame, sides_ns: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Best makeable zone rank and max minor-suit tricks per row, from the DD
+    table of the row's side (sides_ns True → N/S, else Ø/V).
 
-def _dd_max_tricks_minor_for_side(row, side: str) -> Optional[int]:
-    """Max tricks in any minor suit for the given side."""
-    if not row.get("dd_valid", False):
-        return None
-    decls = ["N", "S"] if side == "NS" else ["Ø", "V"]
-    best = None
-    for decl in decls:
-        for ms in ("D", "C"):
-            col = f"dd_{decl}_{ms}"
-            val = row.get(col)
-            if val is None or (isinstance(val, float) and math.isnan(val)):
-                continue
-            try:
-                t = int(val)
-                if best is None or t > best:
-                    best = t
-            except (TypeError, ValueError):
-                pass
-    return best
+    "Best" = highest zone in ZONE_ORDER achievable by at least one declarer
+    from that side in at least one strain.  Both are -1 when dd_valid is
+    False/missing or the side has no usable DD cells.
+    """
+    dd = dd_matrix(df)
+    seats = np.where(sides_ns[:, None], SIDE_SEATS["NS"], SIDE_SEATS["ØV"])
+    side_dd = dd[np.arange(len(df))[:, None], seats].astype(np.int64)          # (n, 2, 5)
+
+    in_table = (side_dd >= 0) & (side_dd < len(_DD_ZONE_RANK))
+    ranks = np.where(
+        in_table,
+        _DD_ZONE_RANK[np.where(in_table, side_dd, 0), np.arange(len(DD_STRAINS))],
+        -1,
+    )
+    minors = [DD_STRAINS.index("D"), DD_STRAINS.index("C")]
+    return ranks.max(axis=(1, 2), initial=-1), side_dd[:, :, minors].max(axis=(1, 2), initial=MISSING)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Feature enrichment
 # ─────────────────────────────────────────────────────────────────────────────
 
-def add_hole_analysis_features(df: pd.DataFrame) -> pd.DataFrame:
+def add_hole_analysis_features(df: pd.DataFrame, player: str = HENRIK) -> pd.DataFrame:
     """
     Adds hole-analysis columns to a *pair-filtered* DataFrame.
 
+    player: one of the pair's players (default Henrik); decides the pair side.
+
     New columns
     -----------
     pair_side          : 'NS' or 'ØV'
@@ -358,12 +336,12 @@ def add_hole_analysis_features(df: pd.DataFrame) -> pd.DataFrame:
     out = df.copy()
 
     # --- Core pair metrics ---
-    out["pair_side"]     = out.apply(_pair_side,     axis=1)
-    out["pair_pct"]      = out.apply(_pair_pct,      axis=1)
-    out["pair_hcp"]      = out.apply(_pair_hcp,      axis=1)
-    out["pair_ltc"]      = out.apply(_pair_ltc,      axis=1)
-    out["pair_dist_pts"] = out.apply(_pair_dist_pts, axis=1)
-    out["pair_controls"] = out.apply(_pair_controls, axis=1)
+    out["pair_side"]     = out.apply(_pair_side,     axis=1, player=player)
+    out["pair_pct"]      = out.apply(_pair_pct,      axis=1, player=player)
+    out["pair_hcp"]      = out.apply(_pair_hcp,      axis=1, player=player)
+    out["pair_ltc"]      = out.apply(_pair_ltc,      axis=1, player=player)
+    out["pair_dist_pts"] = out.apply(_pair_dist_pts, axis=1, player=player)
+    out["pair_controls"] = out.apply(_pair_controls, axis=1, player=player)
 
     # --- Contract zone for H+P ---
     out["pair_zone"] = out.apply(
@@ -382,87 +360,50 @@ def add_hole_analysis_features(df: pd.DataFrame) -> pd.DataFrame:
     else:
         out["field_zone"] = None
 
-    # --- DD best zone for H+P's side ---
-    out["dd_best_zone"] = out.apply(
-        lambda r: _dd_best_zone_for_side(r, r.get("pair_side") or "NS"), axis=1
-    )
-
-    # --- DD max tricks in minor for H+P's side ---
-    out["dd_minor_max_tricks"] = out.apply(
-        lambda r: _dd_max_tricks_minor_for_side(r, r.get("pair_side") or "NS"), axis=1
-    )
+    # --- DD best zone and max minor tricks for H+P's side ---
+    side = out["pair_side"].to_numpy(dtype=object)
+    sides_ns = (side == "NS") | ~side.astype(bool)      # falsy pair_side → NS
+    dd_rank, minor_max = _dd_side_features(out, sides_ns)
+    zones = np.asarray(ZONE_ORDER + [None], dtype=object)    # rank -1 → None
+    out["dd_best_zone"] = pd.Series(zones[dd_rank].tolist(), index=out.index)
+    out["dd_minor_max_tricks"] = optional_ints(minor_max, minor_max == MISSING, out.index)
 
     # --- zone_vs_field and zone_vs_dd ---
-    def _zone_gap(pair_z, ref_z) -> Optional[str]:
-        if not pair_z or not ref_z:
-            return None
-        if pair_z not in ZONE_ORDER or ref_z not in ZONE_ORDER:
-            return None
-        d = ZONE_ORDER.index(pair_z) - ZONE_ORDER.index(ref_z)
-        if d < 0:
-            return "underbid"
-        if d > 0:
-            return "overbid"
-        return "ok"
-
-    out["zone_vs_field"] = out.apply(
-        lambda r: _zone_gap(r.get("pair_zone"), r.get("field_zone")), axis=1
-    )
-    out["zone_vs_dd"] = out.apply(
-        lambda r: _zone_gap(r.get("pair_zone"), r.get("dd_best_zone")), axis=1
-    )
+    pair_rank = _zone_ranks(out["pair_zone"])
+    field_rank = _zone_ranks(out["field_zone"])
 
-    # --- Binary diagnosis flags ---
+    def _zone_gap(ref_rank: np.ndarray) -> pd.Series:
+        gap = np.select(
+            [pair_rank < ref_rank, pair_rank > ref_rank], ["underbid", "overbid"], default="ok"
+        ).astype(object)
+        gap[(pair_rank < 0) | (ref_rank < 0)] = None
+        return pd.Series(gap.tolist(), index=out.index)
 
-    def _is_game_miss(r) -> bool:
-        pz = r.get("pair_zone")
-        fz = r.get("field_zone")
-        return (
-            pz == "Partscore"
-            and fz in {"3NT", "Game_Major", "Game_Minor"}
-        )
+    out["zone_vs_field"] = _zone_gap(field_rank)
+    out["zone_vs_dd"] = _zone_gap(dd_rank)
 
-    def _is_slam_miss(r) -> bool:
-        pz = r.get("pair_zone")
-        if pz in {"Lilleslem", "Storeslem"}:
-            return False
-        fz = r.get("field_zone")
-        ddz = r.get("dd_best_zone")
-        return (
-            (fz in {"Lilleslem", "Storeslem"} if fz else False)
-            or (ddz in {"Lilleslem", "Storeslem"} if ddz else False)
-        )
+    # --- Binary diagnosis flags ---
+    game_ranks = [_zone_rank(z) for z in ("3NT", "Game_Major", "Game_Minor")]
+    slam_rank = _zone_rank("Lilleslem")
+
+    # field in game while H+P stop in partscore
+    is_game_miss = (pair_rank == _zone_rank("Partscore")) & np.isin(field_rank, game_ranks)
+    # field or DD has slam while H+P stay below slam
+    is_slam_miss = (pair_rank < slam_rank) & ((field_rank >= slam_rank) | (dd_rank >= slam_rank))
+    # H+P's zone above their DD maximum
+    is_overcontract = (pair_rank >= 0) & (dd_rank >= 0) & (pair_rank > dd_rank)
+    # plays 3NT while DD shows minor slam (12+ tricks in D or C) for their side
+    nt_instead_of_minor_slam = (pair_rank == _zone_rank("3NT")) & (minor_max >= 12)
+    # plays 5M while DD maximum is only 4M level or lower for their side (avoidable)
+    five_major_avoidable = (
+        (pair_rank == _zone_rank("5_Major")) & (dd_rank >= 0) & (dd_rank <= _zone_rank("Game_Major"))
+    )
 
-    def _is_overcontract(r) -> bool:
-        pz = r.get("pair_zone")
-        ddz = r.get("dd_best_zone")
-        if not pz or not ddz:
-            return False
-        if pz not in ZONE_ORDER or ddz not in ZONE_ORDER:
-            return False
-        return ZONE_ORDER.index(pz) > ZONE_ORDER.index(ddz)
-
-    def _nt_instead_of_minor_slam(r) -> bool:
-        """Plays 3NT while DD shows minor slam (12+ tricks in D or C) for their side."""
-        if r.get("pair_zone") != "3NT":
-            return False
-        mt = r.get("dd_minor_max_tricks")
-        return mt is not None and mt >= 12
-
-    def _five_major_avoidable(r) -> bool:
-        """Plays 5M while DD maximum is only 4M level or lower for their side (avoidable)."""
-        if r.get("pair_zone") != "5_Major":
-            return False
-        ddz = r.get("dd_best_zone")
-        if not ddz or ddz not in ZONE_ORDER:
-            return False
-        return ZONE_ORDER.index(ddz) <= ZONE_ORDER.index("Game_Major")
-
-    out["is_game_miss"]              = out.apply(_is_game_miss,              axis=1)
-    out["is_slam_miss"]              = out.apply(_is_slam_miss,              axis=1)
-    out["is_overcontract"]           = out.apply(_is_overcontract,           axis=1)
-    out["nt_instead_of_minor_slam"]  = out.apply(_nt_instead_of_minor_slam,  axis=1)
-    out["five_major_avoidable"]      = out.apply(_five_major_avoidable,      axis=1)
+    out["is_game_miss"]              = pd.Series(is_game_miss,             index=out.index)
+    out["is_slam_miss"]              = pd.Series(is_slam_miss,             index=out.index)
+    out["is_overcontract"]           = pd.Series(is_overcontract,          index=out.index)
+    out["nt_instead_of_minor_slam"]  = pd.Series(nt_instead_of_minor_slam, index=out.index)
+    out["five_major_avoidable"]      = pd.Series(five_major_avoidable,     index=out.index)
 
     return out
 
@@ -1308,9 +1249,9 @@ def get_pair_metadata(df_pair: pd.DataFrame) -> dict:
 # Main entry point
 # ─────────────────────────────────────────────────────────────────────────────
 
-def make_hole_analysis(df: pd.DataFrame) -> dict:
+def make_hole_analysis(df: pd.DataFrame, players: tuple[str, str] = (HENRIK, PER)) -> dict:
     """
-    Komplet hulanalyse for Henrik Friis & PerFøge Jensen.
+    Komplet hulanalyse for et par (default Henrik Friis & Per Føge Jensen).
 
     Input:
       Fuldt beriget DataFrame efter pipeline:
@@ -1331,6 +1272,25 @@ def make_hole_analysis(df: pd.DataFrame) -> dict:
       "five_major"           – 5-major boards
       "_metadata"            – dict med n_boards, n_tournaments, date_from, date_to
     """
+    # 1. Filter to boards where both players appear
+    df_pair = filter_pair_boards(df, players)
+    if df_pair.empty:
+        return make_hole_reports(df_pair)
+
+    # 2. Enrich with hole-analysis features
+    df_pair = add_hole_analysis_features(df_pair, player=players[0])
+
+    # 3. Generate all reports
+    return make_hole_reports(df_pair)
+
+
+def make_hole_reports(df_pair: pd.DataFrame) -> dict:
+    """
+    Hulanalyse-rapporter fra færdigberigede H+P-rækker.
+
+    Input: filter_pair_boards → add_hole_analysis_features (fx materialiseret
+    af enriched_store.HISTORY_STAGES).  Output som make_hole_analysis().
+    """
     _empty: dict = {
         k: pd.DataFrame()
         for k in [
@@ -1341,16 +1301,9 @@ def make_hole_analysis(df: pd.DataFrame) -> dict:
         ]
     }
     _empty["_metadata"] = {"n_boards": 0, "n_tournaments": 0, "date_from": "?", "date_to": "?"}
-
-    # 1. Filter to boards where both H+P appear
-    df_pair = filter_pair_boards(df)
     if df_pair.empty:
         return _empty
 
-    # 2. Enrich with hole-analysis features
-    df_pair = add_hole_analysis_features(df_pair)
-
-    # 3. Generate all reports
     return {
         "zone_summary":          make_zone_summary(df_pair),
         "zone_vs_field":         make_zone_vs_field(df_pair),
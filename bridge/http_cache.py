@@ -0,0 +1,166 @@
+"""SQLite cache of raw HTTP responses from bridge.dk.
+
+Database location: Data/http_cache.db (relative to project root).
+
+Tables
+------
+http_responses
+    url TEXT PRIMARY KEY
+    body BLOB             (zlib-compressed UTF-8 text)
+    etag TEXT             (ETag response header, if any)
+    last_modified TEXT    (Last-Modified response header, if any)
+    content_hash TEXT     (SHA-256 of the body text)
+    fetched_at TEXT       (last time the body changed)
+    checked_at TEXT       (last time the URL was requested)
+
+Used by http_fetch.fetch_page(): the stored ETag / Last-Modified are sent
+as If-None-Match / If-Modified-Since, a 304 answer is served from the
+stored body, and the content hash tells callers whether the page changed
+since the previous fetch so they can skip re-parsing it.
+"""
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+# ---------------------------------------------------------------------------
+# Database path (relative to this file's package root)
+# ---------------------------------------------------------------------------
+
+_DB_PATH = Path(__file__).parent.parent / "Data" / "http_cache.db"
+
+_CREATE_HTTP_RESPONSES = """
+CREATE TABLE IF NOT EXISTS http_responses (
+    url TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    checked_at TEXT NOT NULL
+);
+"""
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+)
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest of a response body."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    url: str
+    text: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_hash: str
+
+
+# ---------------------------------------------------------------------------
+# Connection-owning cache object
+# ---------------------------------------------------------------------------
+
+
+class HTTPCache:
+    """Raw response cache backed by one long-lived SQLite connection.
+
+    Safe to share between the fetch threads of http_fetch.map_ordered():
+    every access holds the instance lock.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path is not None else _DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            self._conn.execute(pragma)
+        with self._lock, self._conn:
+            self._conn.execute(_CREATE_HTTP_RESPONSES)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, body, etag, last_modified, content_hash "
+                "FROM http_responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(
+            url=row["url"],
+            text=zlib.decompress(row["body"]).decode("utf-8"),
+            etag=row["etag"],
+            last_modified=row["last_modified"],
+            content_hash=row["content_hash"],
+        )
+
+    def save(
+        self,
+        url: str,
+        text: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        digest: Optional[str] = None,
+    ) -> CachedResponse:
+        """Store a (changed) response body and its validators."""
+        now = datetime.now(timezone.utc).isoformat()
+        digest = digest or content_hash(text)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_responses "
+                "(url, body, etag, last_modified, content_hash, fetched_at, checked_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, zlib.compress(text.encode("utf-8")), etag, last_modified, digest, now, now),
+            )
+        return CachedResponse(url, text, etag, last_modified, digest)
+
+    def touch(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Record an unchanged response; refresh validators the server re-sent."""
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE http_responses SET checked_at = ?, "
+                "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) "
+                "WHERE url = ?",
+                (now, etag, last_modified, url),
+            )
+
+
+_shared_cache: Optional[HTTPCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_cache() -> HTTPCache:
+    """Return the process-wide HTTPCache for the current _DB_PATH.
+
+    The instance is reopened if _DB_PATH has been changed (e.g. by tests).
+    """
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None or _shared_cache.db_path != _DB_PATH:
+            if _shared_cache is not None:
+                _shared_cache.close()
+            _shared_cache = HTTPCache(_DB_PATH)
+        return _shared_cache
@@ -0,0 +1,227 @@
+"""
+bridge/http_fetch.py
+
+Shared HTTP fetch layer for the bridge.dk crawler and scraper.
+
+- one pooled requests.Session (keep-alive) for all requests
+- retry with exponential backoff on connection errors, 429 and 5xx
+- a politeness delay between request starts (across all threads)
+- map_ordered(): run a fetch over many URLs on a small thread pool and
+  yield the results in input order, so output stays deterministic
+- fetch_page(): conditional GET against the raw response cache
+  (http_cache); Page.changed tells whether the body differs from last time
+
+Usage:
+    from bridge.http_fetch import configure, fetch_page, map_ordered
+    configure(concurrency=4, delay=0.25)
+    for url, page in map_ordered(fetch_page, urls):
+        ...  # page is a Page, or the exception raised for url
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, Optional, TypeVar, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from bridge import http_cache
+
+
+# ----------------------------
+# Settings
+# ----------------------------
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_DELAY = 0.25        # seconds between two request starts
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5       # urllib3 backoff_factor: 0.5s, 1s, 2s, ...
+REQUEST_TIMEOUT = 30
+
+_RETRY_STATUS = (429, 500, 502, 503, 504)
+
+_settings = {
+    "concurrency": DEFAULT_CONCURRENCY,
+    "delay": DEFAULT_DELAY,
+    "retries": DEFAULT_RETRIES,
+    "backoff": DEFAULT_BACKOFF,
+}
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+_pace_lock = threading.Lock()
+_next_start = 0.0
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def configure(
+    concurrency: Optional[int] = None,
+    delay: Optional[float] = None,
+    retries: Optional[int] = None,
+    backoff: Optional[float] = None,
+) -> None:
+    """Change fetch settings; None keeps the current value."""
+    global _session
+    if concurrency is not None:
+        _settings["concurrency"] = max(1, int(concurrency))
+    if delay is not None:
+        _settings["delay"] = max(0.0, float(delay))
+    if retries is not None:
+        _settings["retries"] = max(0, int(retries))
+    if backoff is not None:
+        _settings["backoff"] = max(0.0, float(backoff))
+    # Pool size / retry policy are fixed per session: rebuild on next use
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+def get_session() -> requests.Session:
+    """Return the shared session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=_settings["retries"],
+                backoff_factor=_settings["backoff"],
+                status_forcelist=_RETRY_STATUS,
+                allowed_methods=frozenset({"GET"}),
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=_settings["concurrency"],
+                pool_maxsize=_settings["concurrency"],
+                max_retries=retry,
+            )
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+# ----------------------------
+# Fetching
+# ----------------------------
+
+def _wait_politely() -> None:
+    """Space request starts at least the configured delay apart."""
+    global _next_start
+    with _pace_lock:
+        now = time.monotonic()
+        start = max(now, _next_start)
+        _next_start = start + _settings["delay"]
+    if start > now:
+        time.sleep(start - now)
+
+
+def fetch_response(url: str, headers: Optional[dict] = None, timeout: int = REQUEST_TIMEOUT) -> requests.Response:
+    """GET url on the shared session (polite, retried); raises on HTTP errors."""
+    _wait_politely()
+    r = get_session().get(url, headers=headers, timeout=timeout)
+    r.raise_for_status()
+    r.encoding = "utf-8"
+    return r
+
+
+def fetch_text(url: str, timeout: int = REQUEST_TIMEOUT) -> str:
+    """GET url and return the body decoded as UTF-8."""
+    return fetch_response(url, timeout=timeout).text
+
+
+@dataclass(frozen=True)
+class Page:
+    """A fetched page body plus whether it changed since the previous fetch."""
+    url: str
+    text: str
+    content_hash: str
+    changed: bool
+    not_modified: bool = False   # server answered 304
+
+
+def fetch_page(url: str, timeout: int = REQUEST_TIMEOUT) -> Page:
+    """
+    Conditional GET of url through the raw response cache.
+
+    Sends the cached ETag / Last-Modified as If-None-Match /
+    If-Modified-Since.  A 304 answer (or an identical body) gives
+    changed=False.  The cache entry is stored before the caller has parsed
+    or saved anything, so "unchanged" is relative to the last fetch only;
+    callers that reuse parsed results compare content_hash against the hash
+    they saved alongside those results.
+    """
+    cache = http_cache.get_cache()
+    cached = cache.get(url)
+    headers = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+    r = fetch_response(url, headers=headers or None, timeout=timeout)
+    etag = r.headers.get("ETag")
+    last_modified = r.headers.get("Last-Modified")
+
+    if r.status_code == 304 and cached is not None:
+        cache.touch(url, etag=etag, last_modified=last_modified)
+        return Page(url, cached.text, cached.content_hash, changed=False, not_modified=True)
+
+    text = r.text
+    digest = http_cache.content_hash(text)
+    if cached is not None and cached.content_hash == digest:
+        cache.touch(url, etag=etag, last_modified=last_modified)
+        return Page(url, cached.text, digest, changed=False)
+
+    cache.save(url, text, etag=etag, last_modified=last_modified, digest=digest)
+    return Page(url, text, digest, changed=True)
+
+
+def map_ordered(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: Optional[int] = None,
+) -> Iterator[tuple[T, Union[R, Exception]]]:
+    """
+    Apply fn to items on a thread pool and yield (item, result) in input order.
+
+    An exception raised by fn is yielded as the result instead of being
+    raised, so one failing page does not stop the others.  At most
+    max_workers calls (default: configured concurrency) are in flight, and
+    items are consumed lazily: a caller that stops iterating early only
+    pays for the pages already in flight.
+    """
+    workers = _settings["concurrency"] if max_workers is None else max(1, int(max_workers))
+    if workers <= 1:
+        for item in items:
+            try:
+                yield item, fn(item)
+            except Exception as exc:
+                yield item, exc
+        return
+
+    def _result(item, future):
+        exc = future.exception()
+        return item, (exc if exc is not None else future.result())
+
+    pool = ThreadPoolExecutor(max_workers=workers)
+    pending: deque = deque()
+    try:
+        for item in items:
+            pending.append((item, pool.submit(fn, item)))
+            if len(pending) >= workers:
+                yield _result(*pending.popleft())
+        while pending:
+            yield _result(*pending.popleft())
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -7,6 +7,8 @@ from typing import Optional
 
 import pandas as pd
 
+from bridge.hand_eval import Hand
+
 
 _SPEC_FILE = Path(__file__).resolve().with_name("lead_analysis_spec.yaml")
 
@@ -114,6 +116,8 @@ _RANK_VALUE = {r: i for i, r in enumerate(_RANK_ORDER[::-1])}
 _RANK_TRANSLATE = {"E": "A", "K": "K", "D": "Q", "B": "J", "T": "T"}
 _HCP_VALUE = {"A": 4, "K": 3, "Q": 2, "J": 1}
 _HONOR_SET = {"A", "K", "Q", "J"}
+# Characters of an already-normalised dot hand (see hand_eval.parse_hand)
+_CANONICAL_DOT_CHARS = frozenset("AKQJT98765432.-—")
 
 _SEAT_HAND_COL = {
     "N": "N_hand",
@@ -215,16 +219,18 @@ def _parse_lead_components(lead: object) -> tuple[Optional[str], Optional[str]]:
     return suit, rank
 
 
-def _split_dot_hand(dot_hand: object) -> list[str]:
+def _dot_key(dot_hand: object) -> Optional[str]:
+    """Canonical dot-string of *dot_hand* (None when missing or all suits empty)."""
     if dot_hand is None or (isinstance(dot_hand, float) and pd.isna(dot_hand)):
-        return ["", "", "", ""]
-    s = str(dot_hand).strip()
-    if not s:
-        return ["", "", "", ""]
-    parts = s.split(".")
-    while len(parts) < 4:
-        parts.append("")
-    return parts[:4]
+        return None
+    key = str(dot_hand).strip()
+    parts = (key.split(".") + ["", "", "", ""])[:4]
+    if not any(parts):
+        return None
+    if not _CANONICAL_DOT_CHARS.issuperset(key):
+        # Danish ranks / "10" / lower case: normalise before the shared Hand memo
+        key = ".".join("".join(_normalize_hand_part(part)) for part in parts)
+    return key
 
 
 def _normalize_hand_part(part: str) -> list[str]:
@@ -250,20 +256,13 @@ def _normalize_hand_part(part: str) -> list[str]:
 def _cards_in_suit(dot_hand: object, suit: Optional[str]) -> list[str]:
     if suit is None or suit not in _SUIT_TO_DOT_INDEX:
         return []
-    parts = _split_dot_hand(dot_hand)
-    idx = _SUIT_TO_DOT_INDEX[suit]
-    return _normalize_hand_part(parts[idx])
+    key = _dot_key(dot_hand)
+    return list(Hand.from_dot(key).ranks(suit)) if key is not None else []
 
 
 def _hand_hcp(dot_hand: object) -> Optional[float]:
-    parts = _split_dot_hand(dot_hand)
-    if not any(parts):
-        return None
-    total = 0
-    for part in parts:
-        for rank in _normalize_hand_part(part):
-            total += _HCP_VALUE.get(rank, 0)
-    return float(total)
+    key = _dot_key(dot_hand)
+    return float(Hand.from_dot(key).hcp) if key is not None else None
 
 
 def _seat_hcp(row: pd.Series, seat: str) -> Optional[float]:
@@ -23,6 +23,8 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 
+from bridge.dd_matrix import DD_SEATS, DD_STRAINS, MISSING, dd_matrix, optional_ints
+
 # ---------------------------------------------------------------------------
 # DD column helpers
 # ---------------------------------------------------------------------------
@@ -44,36 +46,6 @@ _STRAIN_TO_DD_KEY: dict[str, str] = {
 _VALID_DECL = {"N", "S", "Ø", "V"}
 
 
-def _dd_tricks_for_decl(row: pd.Series) -> Optional[int]:
-    """
-    Return the double-dummy trick count for the actual declarer + strain.
-
-    Returns None when dd_valid is False/missing, decl or strain is unknown,
-    or the specific dd column is missing/null.
-    """
-    if not row.get("dd_valid", False):
-        return None
-
-    decl = row.get("decl")
-    strain = row.get("strain")
-
-    if not decl or decl not in _VALID_DECL:
-        return None
-
-    strain_key = _STRAIN_TO_DD_KEY.get(str(strain).upper() if strain else "")
-    if strain_key is None:
-        return None
-
-    col = f"dd_{decl}_{strain_key}"
-    val = row.get(col)
-    if val is None or (isinstance(val, float) and math.isnan(val)):
-        return None
-    try:
-        return int(val)
-    except (TypeError, ValueError):
-        return None
-
-
 # ---------------------------------------------------------------------------
 # A. Contract quality helpers
 # ---------------------------------------------------------------------------
@@ -341,39 +313,40 @@ def add_mvp_metrics(df: pd.DataFrame) -> pd.DataFrame:
     # ------------------------------------------------------------------
     # B1. Trick delta vs DD
     # ------------------------------------------------------------------
-    out["dd_tricks_declarer"] = out.apply(_dd_tricks_for_decl, axis=1)
-
-    tricks_numeric = pd.to_numeric(out.get("tricks", pd.Series(dtype=float)), errors="coerce")
-
-    def _play_precision_dd(row):
-        dd = row.get("dd_tricks_declarer")
-        if dd is None:
-            return None
-        t = row.get("tricks")
-        if t is None or (isinstance(t, float) and math.isnan(t)):
-            return None
-        try:
-            return int(t) - int(dd)
-        except (TypeError, ValueError):
-            return None
-
-    out["play_precision_dd"] = out.apply(_play_precision_dd, axis=1)
+    dd = dd_matrix(out)  # (n, 4, 5), decl × strain picked below
+    n = len(out)
+
+    decl = out.get("decl", pd.Series(None, index=out.index, dtype=object)).to_numpy(dtype=object)
+    seat_idx = np.select([decl == seat for seat in DD_SEATS], range(len(DD_SEATS)), default=-1)
+    strain_up = out.get("strain", pd.Series(None, index=out.index, dtype=object)).astype(str).str.upper()
+    strain_idx = np.select(
+        [(strain_up == key).to_numpy(dtype=bool) for key in _STRAIN_TO_DD_KEY],
+        [DD_STRAINS.index(dd_key) for dd_key in _STRAIN_TO_DD_KEY.values()],
+        default=-1,
+    )
+    known = (seat_idx >= 0) & (strain_idx >= 0)
+    dd_tricks = np.full(n, MISSING, dtype=np.int16)
+    dd_tricks[known] = dd[np.flatnonzero(known), seat_idx[known], strain_idx[known]]
+    dd_missing = dd_tricks == MISSING
+    out["dd_tricks_declarer"] = optional_ints(dd_tricks, dd_missing, out.index)
+
+    tricks_numeric = pd.to_numeric(out.get("tricks", pd.Series(np.nan, index=out.index)), errors="coerce")
+    tricks = np.trunc(tricks_numeric.to_numpy(dtype=float))
+    tricks_missing = np.isnan(tricks)
+    out["play_precision_dd"] = optional_ints(
+        np.where(tricks_missing, 0, tricks).astype(np.int64) - dd_tricks,
+        dd_missing | tricks_missing, out.index,
+    )
 
     # ------------------------------------------------------------------
     # B2. Contract hardness vs DD
     # ------------------------------------------------------------------
-    def _contract_hardness_dd(row):
-        dd = row.get("dd_tricks_declarer")
-        req = row.get("contract_required_tricks")
-        if dd is None or req is None:
-            return None
-        if isinstance(dd, float) and math.isnan(dd):  # ← TILFØJ DENNE
-            return None
-        if isinstance(req, float) and math.isnan(req):
-            return None
-        return int(dd) - int(req)
-        
-    out["contract_hardness_dd"] = out.apply(_contract_hardness_dd, axis=1)
+    required = pd.to_numeric(out["contract_required_tricks"], errors="coerce").to_numpy(dtype=float)
+    required_missing = np.isnan(required)
+    out["contract_hardness_dd"] = optional_ints(
+        dd_tricks - np.where(required_missing, 0, np.trunc(required)).astype(np.int64),
+        dd_missing | required_missing, out.index,
+    )
 
     # ------------------------------------------------------------------
     # C. Lead & defence
@@ -4,25 +4,41 @@ MVP scope:
 - Suggest only the dealer's first call from a fresh auction.
 - Return one bid (e.g., PASS, 1NT, 1S, 1H, 1D, 1C).
 - Keep YAML declarative; Python evaluates and selects.
+
+The YAML bundle is compiled once per load (_load_bundle): each side's
+profile and system definition are resolved into a _SeatSystem with a
+flattened opening flow, suit-opening rule tables with pre-compiled
+conditions, the legacy-shaped competitive_bidding block and the per-seat
+parameters (_SeatParams).  Decisions read those tables instead of walking
+the YAML mappings per call.  _load_bundle reloads the bundle when a YAML
+file is edited and keeps the parsed bundle in a binary cache keyed by the
+YAML contents, so a fresh process does not parse YAML.
 """
 
 from __future__ import annotations
 
-from functools import lru_cache
+from dataclasses import dataclass
+import hashlib
+import os
 from pathlib import Path
+import pickle
 import re
+import threading
+import time
+from types import CodeType
 from typing import Any, Mapping
 
 from bridge.auction_state import (
+    AuctionTimeline,
     BidEvidence,
     ValueRange,
-    apply_bid_evidence,
     create_auction_state,
     estimate_side_potential,
     explain_partner_knowledge,
 )
-from bridge.hand_eval import hcp as calc_hcp
-from bridge.hand_eval import parse_hand
+from bridge.hand_eval import Hand
+from bridge.hand_eval import SUITS_ORDER
+from bridge.hand_eval import evaluate_hand_cached
 
 
 def _normalize_seat(value: Any) -> str | None:
@@ -171,9 +187,23 @@ def _active_systemdefinition_from_bundle(bundle: Mapping[str, Any]) -> dict[str,
     return _mapping_dict(bundle.get("systemdefinition"))
 
 
-@lru_cache(maxsize=1)
-def _load_bundle() -> dict[str, Any]:
-    base = Path(__file__).resolve().parent
+_BUNDLE_DIR = Path(__file__).resolve().parent
+_BUNDLE_FILES = (
+    "systemdefinition.yaml",
+    "systemdefinition_v2.yaml",
+    "system_profiles.yaml",
+    "match_config.yaml",
+    "pair_registry.yaml",
+)
+# Parsed + merged + validated bundle of the last YAML contents seen (None: disabled)
+_BUNDLE_CACHE_FILE: Path | None = Path(__file__).parent.parent / "Data" / "opening_bundle.pickle"
+# Bump when the cached bundle layout changes
+_BUNDLE_CACHE_FORMAT = "1"
+# A running process looks for edited YAML files at most this often
+_BUNDLE_CHECK_SECONDS = 2.0
+
+
+def _parse_bundle(base: Path) -> dict[str, Any]:
     raw_systemdefinition = _load_yaml_file(base / "systemdefinition.yaml")
     raw_systemdefinition_v2 = _load_yaml_file(base / "systemdefinition_v2.yaml")
     merged_systemdefinition_v2 = _deep_merge_dicts(raw_systemdefinition, raw_systemdefinition_v2)
@@ -202,6 +232,119 @@ def _load_bundle() -> dict[str, Any]:
     return out
 
 
+def _bundle_file_stats(base: Path) -> tuple[tuple[str, int | None, int | None], ...]:
+    out = []
+    for name in _BUNDLE_FILES:
+        try:
+            st = (base / name).stat()
+            out.append((name, st.st_mtime_ns, st.st_size))
+        except OSError:
+            out.append((name, None, None))
+    return tuple(out)
+
+
+def _bundle_cache_key(base: Path) -> str:
+    """Hash of the YAML contents, this module's source and the YAML parser version."""
+    try:
+        import yaml  # type: ignore
+        parser = str(getattr(yaml, "__version__", "yaml"))
+    except Exception:
+        parser = "none"
+
+    h = hashlib.sha256(f"{_BUNDLE_CACHE_FORMAT}\0{parser}\0".encode())
+    h.update(Path(__file__).read_bytes())
+    for name in _BUNDLE_FILES:
+        path = base / name
+        h.update(f"\0{name}\0".encode())
+        h.update(path.read_bytes() if path.exists() else b"<missing>")
+    return h.hexdigest()
+
+
+def _read_bundle_cache(key: str) -> dict[str, Any] | None:
+    if _BUNDLE_CACHE_FILE is None:
+        return None
+    try:
+        with _BUNDLE_CACHE_FILE.open("rb") as f:
+            stored = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(stored, dict) or stored.get("key") != key:
+        return None
+    bundle = stored.get("bundle")
+    return bundle if isinstance(bundle, dict) else None
+
+
+def _write_bundle_cache(key: str, bundle: dict[str, Any]) -> None:
+    if _BUNDLE_CACHE_FILE is None:
+        return
+    tmp = _BUNDLE_CACHE_FILE.with_name(f"{_BUNDLE_CACHE_FILE.name}.{os.getpid()}.tmp")
+    try:
+        _BUNDLE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("wb") as f:
+            pickle.dump({"key": key, "bundle": bundle}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, _BUNDLE_CACHE_FILE)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+
+
+class _BundleLoader:
+    """
+    _load_bundle(): the compiled YAML bundle, reloaded when a YAML file changes.
+
+    The file mtimes/sizes are compared at most every _BUNDLE_CHECK_SECONDS,
+    so a long-running process picks up edits without a restart.  A (re)load
+    first looks in _BUNDLE_CACHE_FILE, keyed by the YAML contents, and only
+    parses, merges and validates the YAML on a miss; the seat systems are
+    compiled from the bundle either way (code objects are not picklable).
+
+    cache_clear() drops the loaded bundle; the next load parses the YAML
+    through _load_yaml_file without reading or writing the binary cache.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._bundle: dict[str, Any] | None = None
+        self._stats: tuple[tuple[str, int | None, int | None], ...] | None = None
+        self._checked_at = 0.0
+        self._bypass_file_cache = False
+
+    def __call__(self) -> dict[str, Any]:
+        bundle = self._bundle
+        if bundle is not None and time.monotonic() - self._checked_at < _BUNDLE_CHECK_SECONDS:
+            return bundle
+
+        with self._lock:
+            base = _BUNDLE_DIR
+            stats = _bundle_file_stats(base)
+            if self._bundle is None or stats != self._stats:
+                self._bundle = self._build(base)
+                self._stats = stats
+            self._checked_at = time.monotonic()
+            return self._bundle
+
+    def _build(self, base: Path) -> dict[str, Any]:
+        if self._bypass_file_cache:
+            self._bypass_file_cache = False
+            bundle = _parse_bundle(base)
+        else:
+            key = _bundle_cache_key(base)
+            bundle = _read_bundle_cache(key)
+            if bundle is None:
+                bundle = _parse_bundle(base)
+                _write_bundle_cache(key, bundle)
+        bundle["seat_systems"] = _compile_seat_systems(bundle)
+        return bundle
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._bundle = None
+            self._stats = None
+            self._bypass_file_cache = True
+
+
+_load_bundle = _BundleLoader()
+
+
 def _shape_matches(shape_shdc: tuple[int, int, int, int], allowed_shapes: list[Any]) -> bool:
     target = sorted(shape_shdc, reverse=True)
     for shp in allowed_shapes or []:
@@ -217,16 +360,12 @@ def _shape_matches(shape_shdc: tuple[int, int, int, int], allowed_shapes: list[A
 
 
 def _build_context(hand_dot: str) -> dict[str, Any]:
-    ph = parse_hand(str(hand_dot))
-    spades = ph.lengths["S"]
-    hearts = ph.lengths["H"]
-    diamonds = ph.lengths["D"]
-    clubs = ph.lengths["C"]
-    lengths_sorted = sorted([spades, hearts, diamonds, clubs], reverse=True)
-
-    _hcp_values = {"A": 4, "K": 3, "Q": 2, "J": 1}
+    ev = evaluate_hand_cached(str(hand_dot))
+    spades, hearts, diamonds, clubs = ev.lengths
+    lengths_sorted = sorted(ev.lengths, reverse=True)
+
     return {
-        "hcp": int(calc_hcp(ph)),
+        "hcp": int(ev.hcp),
         "spades": int(spades),
         "hearts": int(hearts),
         "diamonds": int(diamonds),
@@ -234,10 +373,10 @@ def _build_context(hand_dot: str) -> dict[str, Any]:
         "longest_1": int(lengths_sorted[0]),
         "longest_2": int(lengths_sorted[1]),
         "shape_shdc": (int(spades), int(hearts), int(diamonds), int(clubs)),
-        "clubs_honors_AKQJ": sum(1 for ch in ph.suits["C"] if ch in "AKQJ"),
-        "diamonds_honors_AKQJ": sum(1 for ch in ph.suits["D"] if ch in "AKQJ"),
-        "spades_hcp": sum(_hcp_values.get(ch, 0) for ch in ph.suits["S"]),
-        "hearts_hcp": sum(_hcp_values.get(ch, 0) for ch in ph.suits["H"]),
+        "clubs_honors_AKQJ": sum(1 for ch in ev.suit("C") if ch in "AKQJ"),
+        "diamonds_honors_AKQJ": sum(1 for ch in ev.suit("D") if ch in "AKQJ"),
+        "spades_hcp": int(ev.suit_hcp[0]),
+        "hearts_hcp": int(ev.suit_hcp[1]),
     }
 
 
@@ -285,6 +424,209 @@ def _pick_system_def(profile_cfg: dict[str, Any], bundle: dict[str, Any]) -> dic
     return sys_lib.get(first_name, {}) or {}
 
 
+@dataclass(frozen=True)
+class _OpeningRule:
+    """One major/minor_opening_logic rule with its condition compiled."""
+
+    rule_id: Any
+    condition: CodeType | None
+    open_bid: str | None
+    default_open: str | None
+    exception_if: Mapping[str, Any]
+    exception_open: str | None
+
+
+@dataclass(frozen=True)
+class _SuitOpeningTable:
+    """Rules of every logic block whose `when` matches the profile style, in order."""
+
+    style: Any
+    block_found: bool
+    rules: tuple[_OpeningRule, ...]
+
+
+@dataclass(frozen=True)
+class _SeatParams:
+    """Every per-seat bidding parameter, with its defaults applied, as plain attributes."""
+
+    fourth_suit_forcing: bool
+    two_over_one_gf: bool
+    nt_overcall_convention: str
+    balanced_shapes: list[Any]
+    takeout_double_min_hcp: int
+    responses_to_takeout_double: dict[str, Any]
+    one_nt_overcall: dict[str, Any]
+    negative_double: dict[str, Any]
+    lead_directing_double: bool
+    one_nt_response_style: str
+    one_nt_response_style_block: dict[str, Any]
+    one_nt_stayman: dict[str, Any]
+    hand_strength_model: dict[str, Any]
+    opener_buckets: tuple[int, int, int, int, int]
+    responder_buckets: tuple[int, int, int, int, int]
+    fit_playing_points: dict[str, Any]
+    fit_points_enabled: bool
+    fit_points_shortness_weights: dict[str, dict[str, int]]
+    fit_points_trump_per_card: int
+    sequence_rules: dict[str, Any]
+    one_nt_over_minor: tuple[int, int, str, bool]
+    one_nt_over_major: tuple[int, int, str, bool]
+    one_diamond_one_spade: tuple[int, str, bool]
+    one_major_two_level_new_suit: tuple[int, str, bool]
+    one_major_two_level_new_suit_then_major_rebid: tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class _SeatSystem:
+    """Profile and system definition resolved for one side at bundle load."""
+
+    profile_name: str | None
+    profile_cfg: dict[str, Any]
+    sys_def: dict[str, Any]
+    flow: tuple[str, ...]
+    major_opening: _SuitOpeningTable
+    minor_opening: _SuitOpeningTable
+    competitive_bidding: dict[str, Any]
+    params: _SeatParams
+
+
+def _compile_condition(expr: str) -> CodeType | None:
+    if not expr:
+        return None
+    try:
+        return compile(expr, "<systemdefinition condition>", "eval")
+    except Exception:
+        return None
+
+
+def _compile_suit_opening(
+    profile_cfg: Mapping[str, Any],
+    sys_def: Mapping[str, Any],
+    logic_key: str,
+    style_key: str,
+) -> _SuitOpeningTable:
+    style = profile_cfg.get(style_key)
+    block_found = False
+    rules: list[_OpeningRule] = []
+
+    for block in sys_def.get(logic_key, []) or []:
+        when = block.get("when", {}) or {}
+        if when.get(style_key) != style:
+            continue
+        block_found = True
+
+        for rule in (block.get("rules", []) or []):
+            open_bid = rule.get("open")
+            default_open = rule.get("default_open")
+            exception_if: Mapping[str, Any] = {}
+            exception_open = None
+            if not isinstance(open_bid, str) and isinstance(default_open, str):
+                exc = rule.get("exception", {}) or {}
+                exception_if = exc.get("if", {}) or {}
+                exception_open = exc.get("open")
+            rules.append(
+                _OpeningRule(
+                    rule_id=rule.get("id"),
+                    condition=_compile_condition(str(rule.get("condition") or "").strip()),
+                    open_bid=open_bid if isinstance(open_bid, str) else None,
+                    default_open=default_open if isinstance(default_open, str) else None,
+                    exception_if=exception_if,
+                    exception_open=exception_open if isinstance(exception_open, str) else None,
+                )
+            )
+
+    return _SuitOpeningTable(style=style, block_found=block_found, rules=tuple(rules))
+
+
+def _resolve_balanced_shapes(sys_def: Mapping[str, Any]) -> list[Any]:
+    shape_defs = (sys_def.get("shape_definitions", {}) or {}) if isinstance(sys_def, Mapping) else {}
+    if not isinstance(shape_defs, Mapping):
+        shape_defs = {}
+    balanced_shapes = shape_defs.get("balanced_shapes")
+    if not isinstance(balanced_shapes, list):
+        balanced_shapes = [[4, 3, 3, 3], [4, 4, 3, 2], [5, 3, 3, 2]]
+    return balanced_shapes
+
+
+def _resolve_seat_params(
+    profile_cfg: Mapping[str, Any],
+    sys_def: Mapping[str, Any],
+    comp: Mapping[str, Any],
+) -> _SeatParams:
+    profile_cfg = profile_cfg or {}
+    two_over_one = _profile_bool_flag(profile_cfg, "two_over_one_game_force", False)
+    one_nt_style = _resolve_one_nt_response_style(profile_cfg)
+    one_nt_style_block = _resolve_one_nt_response_style_block(sys_def, one_nt_style)
+    model = _resolve_hand_strength_model(sys_def)
+    fit_rules = _resolve_fit_playing_points_rules(model)
+    shortness_cfg = fit_rules.get("shortness_bonus", {})
+    trump_cfg = fit_rules.get("trump_length_bonus", {})
+    if not isinstance(trump_cfg, Mapping):
+        trump_cfg = {}
+    sequence_rules = _resolve_sequence_rules(model)
+
+    return _SeatParams(
+        fourth_suit_forcing=_profile_bool_flag(profile_cfg, "fourth_suit_forcing", True),
+        two_over_one_gf=two_over_one,
+        nt_overcall_convention=str(profile_cfg.get("nt_overcall_convention") or "natural").strip().lower(),
+        balanced_shapes=_resolve_balanced_shapes(sys_def),
+        takeout_double_min_hcp=_resolve_takeout_double_min_hcp(comp),
+        responses_to_takeout_double=_resolve_responses_to_takeout_double(comp),
+        one_nt_overcall=_resolve_one_nt_overcall_params(comp),
+        negative_double=_resolve_negative_double_params(comp),
+        lead_directing_double=_resolve_lead_directing_double_enabled(comp, profile_cfg),
+        one_nt_response_style=one_nt_style,
+        one_nt_response_style_block=one_nt_style_block,
+        one_nt_stayman=_resolve_one_nt_stayman_params(one_nt_style, one_nt_style_block),
+        hand_strength_model=model,
+        opener_buckets=_resolve_strength_buckets(
+            model, "opener_strength_buckets", (("weak", 12, 14), ("medium", 15, 17), ("strong", 18, 37))
+        ),
+        responder_buckets=_resolve_strength_buckets(
+            model, "responder_strength_buckets", (("weak", 6, 9), ("invitational", 10, 12), ("forcing_plus", 13, 37))
+        ),
+        fit_playing_points=fit_rules,
+        fit_points_enabled=_bool_or_default(fit_rules.get("enabled"), True),
+        fit_points_shortness_weights=_resolve_shortness_weights(
+            shortness_cfg if isinstance(shortness_cfg, Mapping) else {}
+        ),
+        fit_points_trump_per_card=max(0, _int_or_default(trump_cfg.get("per_card_above_five"), 1)),
+        sequence_rules=sequence_rules,
+        one_nt_over_minor=_resolve_one_nt_response_params(sequence_rules, "one_minor_one_nt", 6, 10, two_over_one),
+        one_nt_over_major=_resolve_one_nt_response_params(sequence_rules, "one_major_one_nt", 6, 9, two_over_one),
+        one_diamond_one_spade=_resolve_one_diamond_one_spade_forcing_rule(sequence_rules),
+        one_major_two_level_new_suit=_resolve_one_major_two_level_new_suit_rule(sequence_rules, two_over_one),
+        one_major_two_level_new_suit_then_major_rebid=_resolve_one_major_two_level_new_suit_then_major_rebid_params(
+            sequence_rules, two_over_one
+        ),
+    )
+
+
+def _compile_seat_system(seat: str, bundle: dict[str, Any]) -> _SeatSystem:
+    profile_name, profile_cfg = _pick_profile(seat, bundle)
+    sys_def = _pick_system_def(profile_cfg, bundle)
+    competitive_bidding = _competitive_bidding_from_sys_def(sys_def)
+    return _SeatSystem(
+        profile_name=profile_name,
+        profile_cfg=profile_cfg,
+        sys_def=sys_def,
+        flow=tuple(str(step).strip().lower() for step in _opening_decision_flow_steps(sys_def)),
+        major_opening=_compile_suit_opening(profile_cfg, sys_def, "major_opening_logic", "major_style"),
+        minor_opening=_compile_suit_opening(profile_cfg, sys_def, "minor_opening_logic", "minor_style"),
+        competitive_bidding=competitive_bidding,
+        params=_resolve_seat_params(profile_cfg, sys_def, competitive_bidding),
+    )
+
+
+def _compile_seat_systems(bundle: dict[str, Any]) -> dict[str, _SeatSystem]:
+    """Per-side compiled systems; profile choice only depends on the side."""
+    return {side: _compile_seat_system(seat, bundle) for side, seat in (("NS", "N"), ("ØV", "Ø"))}
+
+
+def _seat_system(seat: str | None) -> _SeatSystem:
+    return _load_bundle()["seat_systems"][_seat_side(seat)]
+
+
 def _evaluate_opening_threshold(
     ctx: dict[str, Any],
     profile_cfg: dict[str, Any],
@@ -375,10 +717,8 @@ def _evaluate_one_nt(
     return None, None, "1NT-check: afvist under fallback-policy."
 
 
-def _safe_eval_condition(expr: str, ctx: Mapping[str, Any]) -> bool:
-    if not expr:
-        return False
-    safe_locals = {
+def _condition_locals(ctx: Mapping[str, Any]) -> dict[str, int]:
+    return {
         "hcp": int(ctx["hcp"]),
         "spades": int(ctx["spades"]),
         "hearts": int(ctx["hearts"]),
@@ -387,8 +727,13 @@ def _safe_eval_condition(expr: str, ctx: Mapping[str, Any]) -> bool:
         "clubs_honors_AKQJ": int(ctx["clubs_honors_AKQJ"]),
         "diamonds_honors_AKQJ": int(ctx["diamonds_honors_AKQJ"]),
     }
+
+
+def _safe_eval_condition(condition: CodeType | None, safe_locals: dict[str, int]) -> bool:
+    if condition is None:
+        return False
     try:
-        return bool(eval(expr, {"__builtins__": {}}, safe_locals))
+        return bool(eval(condition, {"__builtins__": {}}, safe_locals))
     except Exception:
         return False
 
@@ -412,43 +757,25 @@ def _exception_matches(exception_if: Mapping[str, Any], ctx: Mapping[str, Any])
 
 def _evaluate_suit_opening(
     ctx: dict[str, Any],
-    profile_cfg: dict[str, Any],
-    sys_def: dict[str, Any],
-    logic_key: str,
-    style_key: str,
+    table: _SuitOpeningTable,
+    label: str,
 ) -> tuple[str | None, str | None, str]:
-    style = profile_cfg.get(style_key)
-    logic = sys_def.get(logic_key, []) or []
-    label = "Major" if style_key == "major_style" else "Minor"
-    style_block_found = False
+    if not table.block_found:
+        return None, None, f"{label}-check: ingen regelblok for style '{table.style}'."
 
-    for block in logic:
-        when = block.get("when", {}) or {}
-        if when.get(style_key) != style:
+    safe_locals = _condition_locals(ctx)
+    for rule in table.rules:
+        if not _safe_eval_condition(rule.condition, safe_locals):
             continue
-        style_block_found = True
 
-        for rule in (block.get("rules", []) or []):
-            cond = str(rule.get("condition") or "").strip()
-            if not _safe_eval_condition(cond, ctx):
-                continue
+        if rule.open_bid is not None:
+            return rule.open_bid, rule.rule_id, f"{label}-check: match {rule.rule_id} -> {_to_display_bid(rule.open_bid)}."
 
-            open_bid = rule.get("open")
-            if isinstance(open_bid, str):
-                return open_bid, rule.get("id"), f"{label}-check: match {rule.get('id')} -> {_to_display_bid(open_bid)}."
+        if rule.default_open is not None:
+            if _exception_matches(rule.exception_if, ctx) and rule.exception_open is not None:
+                return rule.exception_open, rule.rule_id, f"{label}-check: exception i {rule.rule_id} -> {_to_display_bid(rule.exception_open)}."
+            return rule.default_open, rule.rule_id, f"{label}-check: default i {rule.rule_id} -> {_to_display_bid(rule.default_open)}."
 
-            default_open = rule.get("default_open")
-            if isinstance(default_open, str):
-                exc = rule.get("exception", {}) or {}
-                exc_if = exc.get("if", {}) or {}
-                if _exception_matches(exc_if, ctx):
-                    exc_open = exc.get("open")
-                    if isinstance(exc_open, str):
-                        return exc_open, rule.get("id"), f"{label}-check: exception i {rule.get('id')} -> {_to_display_bid(exc_open)}."
-                return default_open, rule.get("id"), f"{label}-check: default i {rule.get('id')} -> {_to_display_bid(default_open)}."
-
-    if not style_block_found:
-        return None, None, f"{label}-check: ingen regelblok for style '{style}'."
     return None, None, f"{label}-check: ingen regel matchede."
 
 
@@ -652,9 +979,10 @@ def suggest_opening_for_row(row: Mapping[str, Any]) -> dict[str, Any]:
         }
 
     ctx = _build_context(str(hand_dot))
-    bundle = _load_bundle()
-    profile_name, profile_cfg = _pick_profile(dealer, bundle)
-    sys_def = _pick_system_def(profile_cfg, bundle)
+    seat_system = _seat_system(dealer)
+    profile_name = seat_system.profile_name
+    profile_cfg = seat_system.profile_cfg
+    sys_def = seat_system.sys_def
 
     log_lines = [
         f"Kontekst: dealer={dealer}, profil={profile_name if profile_name else '(ukendt)'}.",
@@ -676,9 +1004,7 @@ def suggest_opening_for_row(row: Mapping[str, Any]) -> dict[str, Any]:
             ],
         }
 
-    for flow_step in _opening_decision_flow_steps(sys_def):
-        step = str(flow_step).strip().lower()
-
+    for step in seat_system.flow:
         if step == "evaluate_opening_threshold":
             threshold_ok, threshold_line = _evaluate_opening_threshold(ctx, profile_cfg, sys_def)
             log_lines.append(threshold_line)
@@ -721,13 +1047,7 @@ def suggest_opening_for_row(row: Mapping[str, Any]) -> dict[str, Any]:
             continue
 
         if step == "evaluate_major_opening":
-            major_bid, major_rule, major_line = _evaluate_suit_opening(
-                ctx,
-                profile_cfg,
-                sys_def,
-                logic_key="major_opening_logic",
-                style_key="major_style",
-            )
+            major_bid, major_rule, major_line = _evaluate_suit_opening(ctx, seat_system.major_opening, "Major")
             log_lines.append(major_line)
             if major_bid:
                 display = _to_display_bid(major_bid)
@@ -748,13 +1068,7 @@ def suggest_opening_for_row(row: Mapping[str, Any]) -> dict[str, Any]:
             continue
 
         if step == "evaluate_minor_opening":
-            minor_bid, minor_rule, minor_line = _evaluate_suit_opening(
-                ctx,
-                profile_cfg,
-                sys_def,
-                logic_key="minor_opening_logic",
-                style_key="minor_style",
-            )
+            minor_bid, minor_rule, minor_line = _evaluate_suit_opening(ctx, seat_system.minor_opening, "Minor")
             log_lines.append(minor_line)
             if minor_bid:
                 display = _to_display_bid(minor_bid)
@@ -860,22 +1174,28 @@ def _profile_bool_flag(profile_cfg: Mapping[str, Any], key: str, default: bool)
 
 
 def _profile_for_seat(seat: str) -> tuple[str | None, dict[str, Any]]:
-    bundle = _load_bundle()
-    return _pick_profile(seat, bundle)
+    seat_system = _seat_system(seat)
+    return seat_system.profile_name, seat_system.profile_cfg
+
+
+def _seat_params(seat: str | None) -> _SeatParams:
+    return _seat_system(seat).params
 
 
 def _is_fourth_suit_forcing_enabled_for_seat(seat: str) -> bool:
-    _, profile_cfg = _profile_for_seat(seat)
-    return _profile_bool_flag(profile_cfg, "fourth_suit_forcing", True)
+    return _seat_params(seat).fourth_suit_forcing
 
 
 def _is_two_over_one_gf_enabled_for_seat(seat: str) -> bool:
-    _, profile_cfg = _profile_for_seat(seat)
-    return _profile_bool_flag(profile_cfg, "two_over_one_game_force", False)
+    return _seat_params(seat).two_over_one_gf
 
 
 def _competitive_bidding_for_seat(seat: str) -> dict[str, Any]:
-    sys_def = _system_def_for_seat(seat)
+    return _seat_system(seat).competitive_bidding
+
+
+def _competitive_bidding_from_sys_def(sys_def: Mapping[str, Any]) -> dict[str, Any]:
+    """competitive_bidding in the legacy shape; v2 context/node blocks are mapped back."""
     raw = (sys_def.get("competitive_bidding", {}) or {}) if isinstance(sys_def, Mapping) else {}
     out = _mapping_dict(raw)
     contexts = _mapping_dict(out.get("contexts"))
@@ -952,7 +1272,10 @@ def _competitive_bidding_for_seat(seat: str) -> dict[str, Any]:
 
 
 def _takeout_double_min_hcp_for_seat(seat: str) -> int:
-    comp = _competitive_bidding_for_seat(seat)
+    return _seat_params(seat).takeout_double_min_hcp
+
+
+def _resolve_takeout_double_min_hcp(comp: Mapping[str, Any]) -> int:
     tko = (comp.get("takeout_double", {}) or {}) if isinstance(comp, Mapping) else {}
     minimum = (tko.get("minimum_strength", {}) or {}) if isinstance(tko, Mapping) else {}
     try:
@@ -962,13 +1285,19 @@ def _takeout_double_min_hcp_for_seat(seat: str) -> int:
 
 
 def _responses_to_takeout_double_for_seat(seat: str) -> dict[str, Any]:
-    comp = _competitive_bidding_for_seat(seat)
+    return _seat_params(seat).responses_to_takeout_double
+
+
+def _resolve_responses_to_takeout_double(comp: Mapping[str, Any]) -> dict[str, Any]:
     out = (comp.get("responses_to_takeout_double", {}) or {}) if isinstance(comp, Mapping) else {}
     return out if isinstance(out, Mapping) else {}
 
 
 def _one_nt_overcall_params_for_seat(seat: str) -> dict[str, Any]:
-    comp = _competitive_bidding_for_seat(seat)
+    return _seat_params(seat).one_nt_overcall
+
+
+def _resolve_one_nt_overcall_params(comp: Mapping[str, Any]) -> dict[str, Any]:
     overcalls = (comp.get("overcalls", {}) or {}) if isinstance(comp, Mapping) else {}
     one_nt = (overcalls.get("one_nt_overcall", {}) or {}) if isinstance(overcalls, Mapping) else {}
 
@@ -993,18 +1322,23 @@ def _one_nt_overcall_params_for_seat(seat: str) -> dict[str, Any]:
 
 
 def _one_nt_response_style_for_seat(seat: str) -> str:
-    _, profile_cfg = _profile_for_seat(seat)
+    return _seat_params(seat).one_nt_response_style
+
+
+def _resolve_one_nt_response_style(profile_cfg: Mapping[str, Any]) -> str:
     style = str((profile_cfg or {}).get("one_nt_response_style") or "standard_stayman_jacoby").strip()
     return style or "standard_stayman_jacoby"
 
 
 def _one_nt_response_style_block_for_seat(seat: str) -> dict[str, Any]:
-    sys_def = _system_def_for_seat(seat)
+    return _seat_params(seat).one_nt_response_style_block
+
+
+def _resolve_one_nt_response_style_block(sys_def: Mapping[str, Any], style: str) -> dict[str, Any]:
     one_nt_resp = (sys_def.get("one_nt_response_system", {}) or {}) if isinstance(sys_def, Mapping) else {}
     if not isinstance(one_nt_resp, Mapping):
         return {}
 
-    style = _one_nt_response_style_for_seat(seat)
     block = one_nt_resp.get(style, {})
     return block if isinstance(block, Mapping) else {}
 
@@ -1016,9 +1350,10 @@ def _one_nt_stayman_continuation_block_for_seat(seat: str, section_key: str) ->
 
 
 def _one_nt_stayman_params_for_seat(seat: str) -> dict[str, Any]:
-    style = _one_nt_response_style_for_seat(seat)
-    style_cfg = _one_nt_response_style_block_for_seat(seat)
+    return _seat_params(seat).one_nt_stayman
+
 
+def _resolve_one_nt_stayman_params(style: str, style_cfg: Mapping[str, Any]) -> dict[str, Any]:
     responses = (style_cfg.get("responses", {}) or {}) if isinstance(style_cfg, Mapping) else {}
     if not isinstance(responses, Mapping):
         responses = {}
@@ -1111,7 +1446,10 @@ def _has_opponent_contract_after_partner_last_contract(
 
 
 def _negative_double_params_for_seat(seat: str) -> dict[str, Any]:
-    comp = _competitive_bidding_for_seat(seat)
+    return _seat_params(seat).negative_double
+
+
+def _resolve_negative_double_params(comp: Mapping[str, Any]) -> dict[str, Any]:
     neg = (comp.get("negative_double_system", {}) or {}) if isinstance(comp, Mapping) else {}
 
     enabled = _bool_or_default(neg.get("enabled"), True)
@@ -1135,29 +1473,30 @@ def _negative_double_params_for_seat(seat: str) -> dict[str, Any]:
 
 
 def _is_lead_directing_double_enabled_for_seat(seat: str) -> bool:
-    comp = _competitive_bidding_for_seat(seat)
+    return _seat_params(seat).lead_directing_double
+
+
+def _resolve_lead_directing_double_enabled(comp: Mapping[str, Any], profile_cfg: Mapping[str, Any]) -> bool:
     ldd = (comp.get("lead_directing_double_system", {}) or {}) if isinstance(comp, Mapping) else {}
     by_profile = _bool_or_default(ldd.get("enabled_by_profile_flag"), True)
     if by_profile:
-        _, profile_cfg = _profile_for_seat(seat)
         return _profile_bool_flag(profile_cfg, "lead_directing_doubles", True)
     return _bool_or_default(ldd.get("enabled"), True)
 
 
 def _system_def_for_seat(seat: str) -> dict[str, Any]:
-    bundle = _load_bundle()
-    _, profile_cfg = _pick_profile(seat, bundle)
-    return _pick_system_def(profile_cfg, bundle)
+    return _seat_system(seat).sys_def
 
 
 def _profile_cfg_for_seat(seat: str) -> dict[str, Any]:
-    bundle = _load_bundle()
-    _, profile_cfg = _pick_profile(seat, bundle)
-    return profile_cfg or {}
+    return _seat_system(seat).profile_cfg or {}
 
 
 def _hand_strength_model_for_seat(seat: str) -> dict[str, Any]:
-    sys_def = _system_def_for_seat(seat)
+    return _seat_params(seat).hand_strength_model
+
+
+def _resolve_hand_strength_model(sys_def: Mapping[str, Any]) -> dict[str, Any]:
     return (sys_def.get("hand_strength_model", {}) or {}) if isinstance(sys_def, Mapping) else {}
 
 
@@ -1180,13 +1519,22 @@ def _hcp_bounds_from_spec(spec: Mapping[str, Any] | None, default_low: int, defa
         return default_low, default_high
 
 
-def _opener_strength_bucket_for_hcp(seat: str, hcp: int) -> str:
-    model = _hand_strength_model_for_seat(seat)
-    buckets = (model.get("opener_strength_buckets", {}) or {}) if isinstance(model, Mapping) else {}
+def _resolve_strength_buckets(
+    model: Mapping[str, Any],
+    key: str,
+    defaults: tuple[tuple[str, int, int], tuple[str, int, int], tuple[str, int, int]],
+) -> tuple[int, int, int, int, int]:
+    """(low_1, high_1, low_2, high_2, low_3) HCP bounds of a three-bucket strength scale."""
+    buckets = (model.get(key, {}) or {}) if isinstance(model, Mapping) else {}
+    (name_1, low_1, high_1), (name_2, low_2, high_2), (name_3, low_3, high_3) = defaults
+    low_1, high_1 = _hcp_bounds_from_spec(buckets.get(name_1), low_1, high_1)
+    low_2, high_2 = _hcp_bounds_from_spec(buckets.get(name_2), low_2, high_2)
+    low_3, _ = _hcp_bounds_from_spec(buckets.get(name_3), low_3, high_3)
+    return low_1, high_1, low_2, high_2, low_3
 
-    weak_low, weak_high = _hcp_bounds_from_spec(buckets.get("weak"), 12, 14)
-    med_low, med_high = _hcp_bounds_from_spec(buckets.get("medium"), 15, 17)
-    strong_low, _ = _hcp_bounds_from_spec(buckets.get("strong"), 18, 37)
+
+def _opener_strength_bucket_for_hcp(seat: str, hcp: int) -> str:
+    weak_low, weak_high, med_low, med_high, strong_low = _seat_params(seat).opener_buckets
 
     if weak_low <= int(hcp) <= weak_high:
         return "weak"
@@ -1216,7 +1564,10 @@ def _bool_or_default(raw: Any, default: bool) -> bool:
 
 
 def _fit_playing_points_rules_for_seat(seat: str) -> dict[str, Any]:
-    model = _hand_strength_model_for_seat(seat)
+    return _seat_params(seat).fit_playing_points
+
+
+def _resolve_fit_playing_points_rules(model: Mapping[str, Any]) -> dict[str, Any]:
     if not isinstance(model, Mapping):
         return {}
 
@@ -1258,12 +1609,7 @@ def _vulnerability_relation_for_side(vulnerability: Any, side: str) -> str:
     return "favorable" if (not own_vul and opp_vul) else "unfavorable"
 
 
-def _shortness_points_with_fit(
-    suit_lengths: Mapping[str, int],
-    trump_strain: str,
-    relation: str,
-    shortness_bonus_cfg: Mapping[str, Any] | None = None,
-) -> int:
+def _resolve_shortness_weights(shortness_bonus_cfg: Mapping[str, Any] | None) -> dict[str, dict[str, int]]:
     defaults = {
         "favorable": {"void": 5, "singleton": 3, "doubleton": 0},
         "equal": {"void": 4, "singleton": 2, "doubleton": 0},
@@ -1282,11 +1628,19 @@ def _shortness_points_with_fit(
             "doubleton": max(0, _int_or_default(rel_raw.get("doubleton"), int(fallback["doubleton"]))),
         }
 
-    weights = {
+    return {
         "favorable": _relation_weights("favorable_vulnerability", defaults["favorable"]),
         "equal": _relation_weights("equal_vulnerability", defaults["equal"]),
         "unfavorable": _relation_weights("unfavorable_vulnerability", defaults["unfavorable"]),
     }
+
+
+def _shortness_points_with_fit(
+    suit_lengths: Mapping[str, int],
+    trump_strain: str,
+    relation: str,
+    weights: Mapping[str, Mapping[str, int]],
+) -> int:
     w = weights.get(str(relation), weights["equal"])
 
     out = 0
@@ -1309,17 +1663,9 @@ def _playing_points_after_fit(
     trump_strain: str,
     vulnerability: Any,
 ) -> tuple[int, str, int, int, int]:
-    rules = _fit_playing_points_rules_for_seat(seat)
-    enabled = _bool_or_default(rules.get("enabled"), True)
-
-    shortness_bonus_cfg = rules.get("shortness_bonus", {})
-    if not isinstance(shortness_bonus_cfg, Mapping):
-        shortness_bonus_cfg = {}
-
-    trump_cfg = rules.get("trump_length_bonus", {})
-    if not isinstance(trump_cfg, Mapping):
-        trump_cfg = {}
-    trump_per_card = max(0, _int_or_default(trump_cfg.get("per_card_above_five"), 1))
+    params = _seat_params(seat)
+    enabled = params.fit_points_enabled
+    trump_per_card = params.fit_points_trump_per_card
 
     suit_lengths = {
         "S": int(ctx.get("spades", 0)),
@@ -1335,7 +1681,7 @@ def _playing_points_after_fit(
             suit_lengths,
             trump_strain,
             relation,
-            shortness_bonus_cfg,
+            params.fit_points_shortness_weights,
         )
         trump_len_bonus = max(0, trump_len - 5) * trump_per_card
     else:
@@ -1347,12 +1693,7 @@ def _playing_points_after_fit(
 
 
 def _responder_strength_bucket_for_hcp(seat: str, hcp: int) -> str:
-    model = _hand_strength_model_for_seat(seat)
-    buckets = (model.get("responder_strength_buckets", {}) or {}) if isinstance(model, Mapping) else {}
-
-    weak_low, weak_high = _hcp_bounds_from_spec(buckets.get("weak"), 6, 9)
-    inv_low, inv_high = _hcp_bounds_from_spec(buckets.get("invitational"), 10, 12)
-    forcing_low, _ = _hcp_bounds_from_spec(buckets.get("forcing_plus"), 13, 37)
+    weak_low, weak_high, inv_low, inv_high, forcing_low = _seat_params(seat).responder_buckets
 
     if weak_low <= int(hcp) <= weak_high:
         return "weak"
@@ -1364,7 +1705,10 @@ def _responder_strength_bucket_for_hcp(seat: str, hcp: int) -> str:
 
 
 def _sequence_rules_for_seat(seat: str) -> dict[str, Any]:
-    model = _hand_strength_model_for_seat(seat)
+    return _seat_params(seat).sequence_rules
+
+
+def _resolve_sequence_rules(model: Mapping[str, Any]) -> dict[str, Any]:
     if not isinstance(model, Mapping):
         return {}
     rules = model.get("responder_sequence_rules", {}) or {}
@@ -1372,29 +1716,26 @@ def _sequence_rules_for_seat(seat: str) -> dict[str, Any]:
 
 
 def _one_nt_over_minor_params_for_seat(seat: str) -> tuple[int, int, str, bool]:
-    rules = _sequence_rules_for_seat(seat)
-    spec = (rules.get("one_minor_one_nt", {}) or {}) if isinstance(rules, Mapping) else {}
-    low, high = _hcp_bounds_from_spec(spec, 6, 10)
-    forcing = str(spec.get("forcing") or "non_forcing")
-    limited = bool(spec.get("responder_limited", True))
-
-    if _is_two_over_one_gf_enabled_for_seat(seat):
-        alt = spec.get("if_two_over_one_game_force", {}) or {}
-        alt_low, alt_high = _hcp_bounds_from_spec(alt, low, high)
-        low, high = alt_low, alt_high
-        if alt.get("forcing"):
-            forcing = str(alt.get("forcing"))
-    return low, high, forcing, limited
+    return _seat_params(seat).one_nt_over_minor
 
 
 def _one_nt_over_major_params_for_seat(seat: str) -> tuple[int, int, str, bool]:
-    rules = _sequence_rules_for_seat(seat)
-    spec = (rules.get("one_major_one_nt", {}) or {}) if isinstance(rules, Mapping) else {}
-    low, high = _hcp_bounds_from_spec(spec, 6, 9)
+    return _seat_params(seat).one_nt_over_major
+
+
+def _resolve_one_nt_response_params(
+    rules: Mapping[str, Any],
+    key: str,
+    default_low: int,
+    default_high: int,
+    two_over_one: bool,
+) -> tuple[int, int, str, bool]:
+    spec = (rules.get(key, {}) or {}) if isinstance(rules, Mapping) else {}
+    low, high = _hcp_bounds_from_spec(spec, default_low, default_high)
     forcing = str(spec.get("forcing") or "non_forcing")
     limited = bool(spec.get("responder_limited", True))
 
-    if _is_two_over_one_gf_enabled_for_seat(seat):
+    if two_over_one:
         alt = spec.get("if_two_over_one_game_force", {}) or {}
         alt_low, alt_high = _hcp_bounds_from_spec(alt, low, high)
         low, high = alt_low, alt_high
@@ -1404,7 +1745,10 @@ def _one_nt_over_major_params_for_seat(seat: str) -> tuple[int, int, str, bool]:
 
 
 def _one_diamond_one_spade_forcing_rule_for_seat(seat: str) -> tuple[int, str, bool]:
-    rules = _sequence_rules_for_seat(seat)
+    return _seat_params(seat).one_diamond_one_spade
+
+
+def _resolve_one_diamond_one_spade_forcing_rule(rules: Mapping[str, Any]) -> tuple[int, str, bool]:
     spec = (rules.get("one_diamond_one_spade", {}) or {}) if isinstance(rules, Mapping) else {}
     try:
         hcp_min = int(spec.get("hcp_min", 6))
@@ -1416,7 +1760,10 @@ def _one_diamond_one_spade_forcing_rule_for_seat(seat: str) -> tuple[int, str, b
 
 
 def _one_major_two_level_new_suit_rule_for_seat(seat: str) -> tuple[int, str, bool]:
-    rules = _sequence_rules_for_seat(seat)
+    return _seat_params(seat).one_major_two_level_new_suit
+
+
+def _resolve_one_major_two_level_new_suit_rule(rules: Mapping[str, Any], two_over_one: bool) -> tuple[int, str, bool]:
     spec_raw = (rules.get("one_major_two_level_new_suit", {}) or {}) if isinstance(rules, Mapping) else {}
     spec = spec_raw if isinstance(spec_raw, Mapping) else {}
 
@@ -1424,7 +1771,7 @@ def _one_major_two_level_new_suit_rule_for_seat(seat: str) -> tuple[int, str, bo
     forcing = str(spec.get("forcing") or "one_round")
     opener_may_pass = _bool_or_default(spec.get("opener_may_pass"), False)
 
-    if _is_two_over_one_gf_enabled_for_seat(seat):
+    if two_over_one:
         alt_raw = spec.get("if_two_over_one_game_force", {}) or {}
         alt = alt_raw if isinstance(alt_raw, Mapping) else {}
         if "hcp_min" in alt:
@@ -1440,7 +1787,13 @@ def _one_major_two_level_new_suit_rule_for_seat(seat: str) -> tuple[int, str, bo
 
 
 def _one_major_two_level_new_suit_then_major_rebid_params_for_seat(seat: str) -> tuple[int, int, int]:
-    rules = _sequence_rules_for_seat(seat)
+    return _seat_params(seat).one_major_two_level_new_suit_then_major_rebid
+
+
+def _resolve_one_major_two_level_new_suit_then_major_rebid_params(
+    rules: Mapping[str, Any],
+    two_over_one: bool,
+) -> tuple[int, int, int]:
     spec_raw = (rules.get("one_major_two_level_new_suit_then_major_rebid", {}) or {}) if isinstance(rules, Mapping) else {}
     spec = spec_raw if isinstance(spec_raw, Mapping) else {}
 
@@ -1448,7 +1801,7 @@ def _one_major_two_level_new_suit_then_major_rebid_params_for_seat(seat: str) ->
     game_hcp_min = max(0, _int_or_default(spec.get("game_hcp_min", 12), 12))
     game_playing_points_min = max(0, _int_or_default(spec.get("game_playing_points_min", 14), 14))
 
-    if _is_two_over_one_gf_enabled_for_seat(seat):
+    if two_over_one:
         alt_raw = spec.get("if_two_over_one_game_force", {}) or {}
         alt = alt_raw if isinstance(alt_raw, Mapping) else {}
         support_min = max(1, _int_or_default(alt.get("support_min", support_min), support_min))
@@ -1543,29 +1896,18 @@ def _overcall_suit_quality(hand_dot: str, strain: str) -> tuple[int, int]:
     SQT >= 6 suffices.  A biddable suit must have at least one top honor
     (A, K, or Q) — T7432 with zero top honors is not overcallable.
     """
-    parsed = parse_hand(str(hand_dot))
-    ranks = list(parsed.suits.get(strain, ""))
-    length = int(parsed.lengths.get(strain, 0))
-    honor_ranks = set("AKQJT")
-    top_honors = sum(1 for r in ranks if r in honor_ranks)
-    sqt = length + top_honors
+    if strain not in SUITS_ORDER:
+        return 0, 0
+    hand = Hand.from_dot(str(hand_dot))
+    top_honors = hand.honours(strain, top=5)
+    sqt = hand.length(strain) + top_honors
     return sqt, top_honors
 
 
 def _has_stopper_in_suit(hand_dot: str, strain: str) -> bool:
-    parsed = parse_hand(str(hand_dot))
-    ranks = parsed.suits.get(strain, "")
-    length = int(parsed.lengths.get(strain, 0))
-
-    if "A" in ranks:
-        return True
-    if "K" in ranks and length >= 2:
-        return True
-    if "Q" in ranks and "J" in ranks and length >= 3:
-        return True
-    if "Q" in ranks and "T" in ranks and length >= 4:
-        return True
-    return False
+    if strain not in SUITS_ORDER:
+        return False
+    return Hand.from_dot(str(hand_dot)).stopper(strain)
 
 
 def _latest_partner_contract_call(
@@ -2190,8 +2532,7 @@ def _evaluate_michaels_cuebid(
 
 def _nt_overcall_convention_for_seat(seat: str) -> str:
     """Return NT overcall convention for seat's profile: landy / cappelletti / natural."""
-    _, profile_cfg = _profile_for_seat(seat)
-    return str((profile_cfg or {}).get("nt_overcall_convention") or "natural").strip().lower()
+    return _seat_params(seat).nt_overcall_convention
 
 
 def _evaluate_landy_over_nt(
@@ -2465,14 +2806,8 @@ def _suggest_second_hand_competitive(
     log_lines.append(double_reason)
 
     nt_params = _one_nt_overcall_params_for_seat(second_seat)
-    sys_def = _system_def_for_seat(second_seat)
     profile_cfg_seat = _profile_cfg_for_seat(second_seat)
-    shape_defs = (sys_def.get("shape_definitions", {}) or {}) if isinstance(sys_def, Mapping) else {}
-    if not isinstance(shape_defs, Mapping):
-        shape_defs = {}
-    balanced_shapes = shape_defs.get("balanced_shapes")
-    if not isinstance(balanced_shapes, list):
-        balanced_shapes = [[4, 3, 3, 3], [4, 4, 3, 2], [5, 3, 3, 2]]
+    balanced_shapes = _seat_params(second_seat).balanced_shapes
 
     is_balanced = _shape_matches(tuple(ctx.get("shape_shdc", (0, 0, 0, 0))), list(balanced_shapes))
     stopper_in_opening = first_strain in ("S", "H", "D", "C") and _has_stopper_in_suit(str(hand_dot), first_strain)
@@ -2990,13 +3325,7 @@ def _suggest_response_after_partner_takeout_double(
         simple_low, simple_high = 5, 10
         jump_low, jump_high = 11, 12
 
-    sys_def = _system_def_for_seat(seat)
-    shape_defs = (sys_def.get("shape_definitions", {}) or {}) if isinstance(sys_def, Mapping) else {}
-    if not isinstance(shape_defs, Mapping):
-        shape_defs = {}
-    balanced_shapes = shape_defs.get("balanced_shapes")
-    if not isinstance(balanced_shapes, list):
-        balanced_shapes = [[4, 3, 3, 3], [4, 4, 3, 2], [5, 3, 3, 2]]
+    balanced_shapes = _seat_params(seat).balanced_shapes
 
     is_balanced = _shape_matches(tuple(ctx.get("shape_shdc", (0, 0, 0, 0))), list(balanced_shapes))
     stopper_in_opp = _has_stopper_in_suit(str(hand_dot), str(opp_strain))
@@ -4868,34 +5197,38 @@ def _build_actor_state_for_decision(
     row: Mapping[str, Any],
     actor_seat: str,
     prior_calls: list[dict[str, Any]],
+    timeline: AuctionTimeline | None = None,
 ) -> Any:
-    dealer = _normalize_seat(row.get("dealer"))
-    if dealer is None and prior_calls:
-        dealer = _normalize_seat(prior_calls[0].get("dealer"))
-    if dealer is None:
-        dealer = actor_seat
-
-    own_hand = row.get(f"{actor_seat}_hand")
-    own_hand_dot = None
-    if own_hand is not None and str(own_hand).strip() not in ("", "None"):
-        own_hand_dot = str(own_hand)
-
-    state = create_auction_state(
-        perspective_seat=actor_seat,
-        dealer=dealer,
-        vulnerability=str(row.get("vul") or row.get("zone") or ""),
-        own_hand_dot=own_hand_dot,
-    )
+    """actor_seat's auction state after prior_calls.
 
-    for prev in prior_calls:
-        p_seat = _normalize_seat(prev.get("dealer"))
-        if p_seat is None:
-            continue
-        p_bid = str(prev.get("bid") or "PASS").upper()
-        evidence = _infer_public_bid_evidence(state, p_seat, p_bid)
-        apply_bid_evidence(state, p_seat, p_bid, evidence)
+    With a timeline (one per simulated auction, prior_calls growing between
+    calls) only the calls added since the last decision are applied;
+    without one the state is built from scratch.
+    """
+    def _create() -> Any:
+        dealer = _normalize_seat(row.get("dealer"))
+        if dealer is None and prior_calls:
+            dealer = _normalize_seat(prior_calls[0].get("dealer"))
+        if dealer is None:
+            dealer = actor_seat
+
+        own_hand = row.get(f"{actor_seat}_hand")
+        own_hand_dot = None
+        if own_hand is not None and str(own_hand).strip() not in ("", "None"):
+            own_hand_dot = str(own_hand)
+
+        return create_auction_state(
+            perspective_seat=actor_seat,
+            dealer=dealer,
+            vulnerability=str(row.get("vul") or row.get("zone") or ""),
+            own_hand_dot=own_hand_dot,
+        )
 
-    return state
+    if timeline is None:
+        timeline = AuctionTimeline(_infer_public_bid_evidence)
+    for prev in prior_calls[len(timeline):]:
+        timeline.record(prev.get("dealer"), str(prev.get("bid") or "PASS").upper())
+    return timeline.state_for(actor_seat, _create)
 
 
 def _display_strain(strain: str) -> str:
@@ -4910,6 +5243,7 @@ def _apply_state_ceiling_to_call(
     seat: str,
     call: dict[str, Any],
     hand_tag: str,
+    timeline: AuctionTimeline | None = None,
 ) -> dict[str, Any]:
     """Attach range-based explanation and enforce a stop ceiling for contracts."""
     out = dict(call)
@@ -4917,7 +5251,7 @@ def _apply_state_ceiling_to_call(
     parsed_bid = _parse_contract_bid(bid_txt)
 
     try:
-        state = _build_actor_state_for_decision(row, seat, prior_calls)
+        state = _build_actor_state_for_decision(row, seat, prior_calls, timeline)
 
         eval_strain = None
         if parsed_bid is not None:
@@ -5060,8 +5394,10 @@ def suggest_first_round_for_row(row: Mapping[str, Any]) -> dict[str, Any]:
         if len(order) < 4:
             order = ["N", "Ø", "S", "V"]
 
+    # One timeline per auction: each seat's state advances call by call
+    timeline = AuctionTimeline(_infer_public_bid_evidence)
     first_actor = _normalize_seat(first.get("dealer")) or order[0]
-    first = _apply_state_ceiling_to_call(row, [], first_actor, first, "1H")
+    first = _apply_state_ceiling_to_call(row, [], first_actor, first, "1H", timeline)
 
     call_sequence: list[dict[str, Any]] = [first]
     max_calls = 20
@@ -5111,7 +5447,7 @@ def suggest_first_round_for_row(row: Mapping[str, Any]) -> dict[str, Any]:
                 seat,
                 f"{hand_tag} situation: ingen kontrakt endnu -> åbningssituation.",
             )
-            call = _apply_state_ceiling_to_call(row, call_sequence, seat, call, hand_tag)
+            call = _apply_state_ceiling_to_call(row, call_sequence, seat, call, hand_tag, timeline)
             call_sequence.append(call)
             continue
 
@@ -5134,7 +5470,7 @@ def suggest_first_round_for_row(row: Mapping[str, Any]) -> dict[str, Any]:
                     hand_tag=hand_tag,
                 )
                 call = _legalize_competitive_contract(call, highest_contract, hand_tag, prior_calls=call_sequence)
-                call = _apply_state_ceiling_to_call(row, call_sequence, seat, call, hand_tag)
+                call = _apply_state_ceiling_to_call(row, call_sequence, seat, call, hand_tag, timeline)
                 call_sequence.append(call)
                 continue
 
@@ -5148,7 +5484,7 @@ def suggest_first_round_for_row(row: Mapping[str, Any]) -> dict[str, Any]:
                 prior_calls=call_sequence,
             )
             call = _legalize_competitive_contract(call, highest_contract, hand_tag, prior_calls=call_sequence)
-            call = _apply_state_ceiling_to_call(row, call_sequence, seat, call, hand_tag)
+            call = _apply_state_ceiling_to_call(row, call_sequence, seat, call, hand_tag, timeline)
             call_sequence.append(call)
             continue
 
@@ -5167,7 +5503,7 @@ def suggest_first_round_for_row(row: Mapping[str, Any]) -> dict[str, Any]:
                 prior_calls=call_sequence,
             )
             call = _legalize_competitive_contract(call, highest_contract, hand_tag, prior_calls=call_sequence)
-            call = _apply_state_ceiling_to_call(row, call_sequence, seat, call, hand_tag)
+            call = _apply_state_ceiling_to_call(row, call_sequence, seat, call, hand_tag, timeline)
             call_sequence.append(call)
             continue
 
@@ -5179,7 +5515,7 @@ def suggest_first_round_for_row(row: Mapping[str, Any]) -> dict[str, Any]:
             prior_calls=call_sequence,
         )
         call = _legalize_competitive_contract(call, highest_contract, hand_tag, prior_calls=call_sequence)
-        call = _apply_state_ceiling_to_call(row, call_sequence, seat, call, hand_tag)
+        call = _apply_state_ceiling_to_call(row, call_sequence, seat, call, hand_tag, timeline)
         call_sequence.append(call)
 
     # Attach per-seat call number to each call for requested log format.
@@ -5216,3 +5552,37 @@ def suggest_first_round_for_row(row: Mapping[str, Any]) -> dict[str, Any]:
         result[key] = call_sequence[i] if i < len(call_sequence) else None
 
     return result
+
+
+def final_contract_from_calls(call_sequence: list[Mapping[str, Any]]) -> dict[str, Any]:
+    """Final contract of a suggested auction: display contract, level, strain, declarer and X/XX."""
+    last: tuple[int, str, str] | None = None
+    doubled = ""
+    first_to_name: dict[tuple[str, str], str] = {}
+
+    for call in call_sequence:
+        seat = _normalize_seat(call.get("dealer"))
+        bid = str(call.get("bid") or "PASS").strip().upper()
+        parsed = _parse_contract_bid(bid)
+        if parsed is not None and seat is not None:
+            side = _seat_side(seat)
+            first_to_name.setdefault((side, parsed[1]), seat)
+            last = (parsed[0], parsed[1], side)
+            doubled = ""
+        elif last is not None and bid in ("XX", "RDBL", "REDOUBLE"):
+            doubled = "XX"
+        elif last is not None and bid in ("X", "DBL", "DOUBLE"):
+            doubled = "X"
+
+    if last is None:
+        return {"contract": None, "level": None, "strain": None, "declarer": None, "doubled": ""}
+
+    level, strain, side = last
+    contract = _to_display_bid(f"{level}{strain}")
+    return {
+        "contract": contract,
+        "level": level,
+        "strain": contract[len(str(level)):],
+        "declarer": first_to_name[(side, strain)],
+        "doubled": doubled,
+    }
@@ -0,0 +1,260 @@
+"""
+bridge/pair_reports.py
+
+Field-wide batch reports: the Henrik/Per report set (roller/pct, declarer
+analysis, klassiske rapporter, hulanalyse) for any number of pairs, from
+one shared enriched DataFrame.
+
+- pairs come from pair_registry.yaml (load_pair_registry) or from the
+  data: every partnership with at least N boards (pairs_with_min_boards)
+- the shared frame is indexed once (PlayerIndex); each worker only gets
+  the rows of its own pair, so 40 pairs cost 40 small slices, not 40
+  pipeline runs
+- the per-pair work (reports + workbook) runs on a process pool, one
+  workbook per pair
+
+Usage:
+    pairs = load_pair_registry()
+    results = run_pair_reports(df_enriched, pairs, Path("pair_reports"))
+
+The report functions keep their Henrik_/Per_ column slots internally;
+the workbook relabels them with the pair's player names.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from bridge.player_index import PlayerIndex
+
+REGISTRY_FILE = Path(__file__).resolve().with_name("pair_registry.yaml")
+
+
+@dataclass(frozen=True)
+class PairSpec:
+    """A partnership; player1 takes the Henrik_ slot, player2 the Per_ slot."""
+    pair_id: str
+    player1: str
+    player2: str
+
+    @property
+    def players(self) -> tuple[str, str]:
+        return self.player1, self.player2
+
+
+@dataclass(frozen=True)
+class PairReportResult:
+    pair_id: str
+    boards: int
+    path: Optional[Path]      # None when the pair has no boards
+    seconds: float
+
+
+# ----------------------------
+# Pair selection
+# ----------------------------
+
+def _slug(text: str) -> str:
+    slug = re.sub(r"[^0-9a-zæøå]+", "_", str(text).lower()).strip("_")
+    return slug or "pair"
+
+
+def load_pair_registry(path: Path = REGISTRY_FILE) -> list[PairSpec]:
+    """Pairs listed in pair_registry.yaml (empty if missing/unreadable)."""
+    try:
+        import yaml  # type: ignore
+        with Path(path).open("r", encoding="utf-8") as f:
+            raw = yaml.safe_load(f) or {}
+    except Exception:
+        return []
+
+    pairs = []
+    for entry in (raw.get("pair_registry") or []) if isinstance(raw, dict) else []:
+        players = (entry or {}).get("players") or {}
+        p1, p2 = players.get("north_or_east"), players.get("south_or_west")
+        if not p1 or not p2:
+            continue
+        pair_id = entry.get("pair_id") or _slug(f"{p1}_{p2}")
+        pairs.append(PairSpec(str(pair_id), str(p1), str(p2)))
+    return pairs
+
+
+def pairs_with_min_boards(df: pd.DataFrame, min_boards: int) -> list[PairSpec]:
+    """
+    Every partnership (same side of the table) with at least min_boards
+    boards, most boards first.  Oversidder rows are ignored.
+    """
+    sides = []
+    for a, b in (("ns1", "ns2"), ("ew1", "ew2")):
+        if a not in df.columns or b not in df.columns:
+            continue
+        side = pd.DataFrame({"a": df[a].to_numpy(dtype=object), "b": df[b].to_numpy(dtype=object)}).dropna()
+        sides.append(side)
+    if not sides:
+        return []
+
+    d = pd.concat(sides, ignore_index=True)
+    d = d[(d["a"] != "") & (d["b"] != "") & (d["a"] != d["b"])]
+    d = d[~(d["a"].astype(str).str.contains("Oversidder") | d["b"].astype(str).str.contains("Oversidder"))]
+    swap = d["a"].astype(str) > d["b"].astype(str)
+    first = np.where(swap, d["b"], d["a"])
+    second = np.where(swap, d["a"], d["b"])
+    counts = (
+        pd.DataFrame({"p1": first, "p2": second})
+        .groupby(["p1", "p2"]).size().reset_index(name="boards")
+    )
+    counts = counts[counts["boards"] >= int(min_boards)]
+    counts = counts.sort_values(["boards", "p1", "p2"], ascending=[False, True, True])
+    return [PairSpec(_slug(f"{p1}_{p2}"), p1, p2) for p1, p2 in zip(counts["p1"], counts["p2"])]
+
+
+# ----------------------------
+# Report set for one pair
+# ----------------------------
+
+HOLE_SHEETS = {
+    "Hul_Zone_Overblik": "zone_summary",
+    "Hul_Zone_vs_Felt": "zone_vs_field",
+    "Hul_HCP_Profil": "hcp_profile",
+    "Hul_HCP_Zone_Fordeling": "hcp_zone_distribution",
+    "Hul_Aggression": "aggression_summary",
+    "Hul_Udgange_Misset": "game_misses",
+    "Hul_Slem_Misset": "slam_misses",
+    "Hul_Slembud": "slam_attempts",
+    "Hul_Slem_Kvalitet": "slam_quality",
+    "Hul_3NT_vs_MinorSlem": "nt_vs_minor_slam",
+    "Hul_Overbud": "overbids",
+    "Hul_5Major": "five_major",
+}
+
+
+def make_pair_report_set(df_pair: pd.DataFrame, pair: PairSpec) -> dict[str, pd.DataFrame]:
+    """
+    All per-pair reports (sheet name → DataFrame) from the pair's rows.
+
+    df_pair must already be limited to boards where both players sit.
+    """
+    from bridge.analysis import (
+        add_roles_and_pct,
+        make_declarer_list,
+        make_evening_role_matrix,
+        make_quarterly_summary_with_ci,
+        make_role_summary,
+        make_tournament_summary,
+    )
+    from bridge.declarer_analysis import make_declarer_analysis
+    from bridge.hole_analysis import add_hole_analysis_features, make_hole_reports
+
+    if df_pair.empty:
+        return {}
+
+    p1, p2 = pair.players
+    df_roles = add_roles_and_pct(df_pair, henrik=p1, per=p2)
+    reports = {
+        "Declarer_Analysis": make_declarer_analysis(df_roles, henrik=p1, per=p2),
+        "Declarer_List": make_declarer_list(df_roles, henrik=p1, per=p2),
+        "Role_Summary": make_role_summary(df_roles, henrik=p1, per=p2),
+        "Tournament_Summary": make_tournament_summary(df_roles),
+        "Rapport - Aften": make_evening_role_matrix(df_roles, henrik=p1, per=p2),
+        "Rapport - Kvartal": make_quarterly_summary_with_ci(df_roles),
+    }
+
+    hole_reports = make_hole_reports(add_hole_analysis_features(df_pair, player=p1))
+    for sheet_name, key in HOLE_SHEETS.items():
+        reports[sheet_name] = hole_reports.get(key, pd.DataFrame())
+
+    return {name: _relabel(df, pair) for name, df in reports.items()}
+
+
+def _relabel(df: pd.DataFrame, pair: PairSpec) -> pd.DataFrame:
+    """Henrik_/Per_ (HF_/PF_) slot names → the pair's player names."""
+    if df is None or df.empty:
+        return df
+    p1, p2 = pair.players
+    prefixes = (("Henrik_", f"{p1}_"), ("Per_", f"{p2}_"), ("HF_", f"{p1}_"), ("PF_", f"{p2}_"))
+
+    def _name(col):
+        for old, new in prefixes:
+            if isinstance(col, str) and col.startswith(old):
+                return new + col[len(old):]
+        return col
+
+    out = df.rename(columns=_name)
+    if "Player" in out.columns:
+        out["Player"] = out["Player"].replace({"Henrik": p1, "Per": p2})
+    return out
+
+
+def write_pair_workbook(path: Path, reports: dict[str, pd.DataFrame]) -> Path:
+    """One sheet per non-empty report (sheet names cut to Excel's 31 chars)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        written = 0
+        for sheet_name, df in reports.items():
+            if df is None or df.empty:
+                continue
+            df.to_excel(writer, sheet_name=sheet_name[:31], index=False)
+            written += 1
+        if not written:
+            pd.DataFrame({"Info": ["Ingen boards for parret"]}).to_excel(
+                writer, sheet_name="Info", index=False
+            )
+    return path
+
+
+def _pair_task(task: tuple[PairSpec, pd.DataFrame, Path]) -> PairReportResult:
+    pair, df_pair, out_dir = task
+    t0 = time.perf_counter()
+    if df_pair.empty:
+        return PairReportResult(pair.pair_id, 0, None, time.perf_counter() - t0)
+    reports = make_pair_report_set(df_pair, pair)
+    path = write_pair_workbook(Path(out_dir) / f"{pair.pair_id}.xlsx", reports)
+    return PairReportResult(pair.pair_id, len(df_pair), path, time.perf_counter() - t0)
+
+
+# ----------------------------
+# Batch runner
+# ----------------------------
+
+def run_pair_reports(
+    df: pd.DataFrame,
+    pairs: Sequence[PairSpec],
+    out_dir: Path,
+    max_workers: Optional[int] = None,
+    index: Optional[PlayerIndex] = None,
+) -> Iterable[PairReportResult]:
+    """
+    Report set + workbook for every pair, fanned out over a process pool.
+
+    df is the shared enriched frame; each task gets only its pair's rows
+    (selected through index, built once when not given).  Yields results
+    as pairs complete.  max_workers defaults to the CPU count; with one
+    worker (or one pair) everything runs in-process.
+    """
+    index = index if index is not None else PlayerIndex.from_frame(df)
+    tasks = [
+        (pair, df.iloc[index.pair_rows(pair.player1, pair.player2)].copy(), Path(out_dir))
+        for pair in pairs
+    ]
+    if not tasks:
+        return
+
+    workers = max_workers or os.cpu_count() or 1
+    workers = min(workers, len(tasks))
+    if workers <= 1:
+        for task in tasks:
+            yield _pair_task(task)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_pair_task, tasks)
@@ -1,14 +1,73 @@
 import pandas as pd
 import numpy as np
-from typing import Tuple, Optional
 
+# Gruppe-nøgler: sektion (turnering+board+sektion) og klub (turnering+board)
+SECTION_KEYS = ["tournament_date", "board_no", "section"]
+CLUB_KEYS = ["tournament_date", "board_no"]
 
-def add_phase21_fields(df: pd.DataFrame, n_min: int = 12) -> pd.DataFrame:
+REQUIRED_COLUMNS = ["tournament_date", "board_no", "section", "contract", "result_status_code", "pct"]
+
+
+def split_double_state(contract: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """Kontrakt → (contract_norm uden X/XX, double_state "", "X" eller "XX")."""
+    text = contract.map(str)
+    redoubled = text.str.endswith("XX").to_numpy(dtype=bool)
+    doubled = text.str.endswith("X").to_numpy(dtype=bool) & ~redoubled
+    norm = np.where(redoubled, text.str[:-2], np.where(doubled, text.str[:-1], text))
+    state = np.select([redoubled, doubled], ["XX", "X"], default="")
+    return (
+        pd.Series(norm, index=contract.index).astype(str),
+        pd.Series(state, index=contract.index).astype(str),
+    )
+
+
+def _reference_table(played: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    """
+    Pr. referencegruppe (keys): mode- og top2-kontrakt med antal og
+    expected_pct (snit for mode-kontrakten hvis ≥3, ellers hele gruppen).
+
+    Lige mange: kontrakten der optræder først i gruppen vinder (som
+    value_counts).
+    """
+    counts = (
+        played.groupby(keys + ["contract_norm"], sort=False)
+        .agg(count=("pct", "size"), first=("pos", "min"), mean_pct=("pct", "mean"))
+        .reset_index()
+        .sort_values(keys + ["count", "first"], ascending=[True] * len(keys) + [False, True], kind="stable")
+    )
+    rank = counts.groupby(keys, sort=False).cumcount().to_numpy()
+    top1 = counts[rank == 0].set_index(keys)
+    top2 = counts[rank == 1].set_index(keys)
+    group_mean = played.groupby(keys)["pct"].mean()
+
+    table = pd.DataFrame({
+        "top1_contract": top1["contract_norm"],
+        "top1_count": top1["count"],
+        "top1_mean": top1["mean_pct"],
+        "group_mean": group_mean.reindex(top1.index),
+    })
+    table["top2_contract"] = top2["contract_norm"].reindex(top1.index)
+    table["top2_count"] = top2["count"].reindex(top1.index)
+    return table
+
+
+def _objects(values, missing: np.ndarray, index: pd.Index, cast=None) -> pd.Series:
+    """Object-kolonne med None hvor missing (som de tidligere .at-tildelinger)."""
+    out = np.full(len(missing), None, dtype=object)
+    keep = ~missing
+    vals = np.asarray(values, dtype=object)[keep]
+    out[keep] = [cast(v) for v in vals] if cast is not None else vals
+    return pd.Series(out, index=index, dtype=object)
+
+
+def add_phase21_fields(df: pd.DataFrame, n_min: int = 12, verbose: bool = False) -> pd.DataFrame:
     """
     Berigelse af DataFrame med Phase 2.1 reference-lag.
     
     Tilføjer stabil reference-logik, board-klassifikation, og expected_pct
-    til support Board Review-analyse.
+    til support Board Review-analyse.  Vektoriseret: N-tal via
+    groupby().transform, mode/top2 via én grupperet optælling pr.
+    referenceniveau, flettet tilbage på rækkerne.
     
     Parameters:
     -----------
@@ -24,6 +83,9 @@ def add_phase21_fields(df: pd.DataFrame, n_min: int = 12) -> pd.DataFrame:
     n_min : int
         Minimum antal "PLAYED" resultater for at vælge SECTION/CLUB.
         Default: 12
+
+    verbose : bool
+        Print fremdrift og Board_Type-statistik.
     
     Returns:
     --------
@@ -49,11 +111,11 @@ def add_phase21_fields(df: pd.DataFrame, n_min: int = 12) -> pd.DataFrame:
     
     # === STEP 1: Input-validering ===
     if df.empty:
+        if verbose:
+            print("⚠️ Phase 2.1: Input DataFrame er tom")
         return df
     
-    required_cols = ['tournament_date', 'board_no', 'section', 'contract', 
-                     'result_status_code', 'pct']
-    missing = [col for col in required_cols if col not in df.columns]
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
     if missing:
         raise ValueError(f"Manglende kolonner: {missing}")
     
@@ -61,173 +123,113 @@ def add_phase21_fields(df: pd.DataFrame, n_min: int = 12) -> pd.DataFrame:
     df = df.copy()
     
     # === STEP 2: Normaliser kontrakter ===
-    df['contract_norm'] = df['contract'].astype(str)
-    df['double_state'] = ''
-    
-    for idx, row in df.iterrows():
-        contract = str(row['contract'])
-        
-        if contract.endswith('XX'):
-            df.at[idx, 'contract_norm'] = contract[:-2]
-            df.at[idx, 'double_state'] = 'XX'
-        elif contract.endswith('X'):
-            df.at[idx, 'contract_norm'] = contract[:-1]
-            df.at[idx, 'double_state'] = 'X'
-        else:
-            df.at[idx, 'contract_norm'] = contract
-            df.at[idx, 'double_state'] = ''
+    df['contract_norm'], df['double_state'] = split_double_state(df['contract'])
     
     # === STEP 3: Initialiser output-kolonner ===
     df['reference_scope'] = None
     df['N_section_played'] = 0
     df['N_club_played'] = 0
     df['reference_n_played'] = 0
-    df['field_mode_contract'] = None
-    df['field_mode_count'] = None
-    df['field_mode_freq'] = None
-    df['top2_contract_1'] = None
-    df['top2_contract_2'] = None
-    df['top2_count_1'] = None
-    df['top2_count_2'] = None
+    for col in ('field_mode_contract', 'field_mode_count', 'field_mode_freq',
+                'top2_contract_1', 'top2_contract_2', 'top2_count_1', 'top2_count_2'):
+        df[col] = None
     df['Board_Type'] = 'LOW_SAMPLE'
     df['competitive_flag'] = False
     df['expected_pct'] = None
     
     # === STEP 4: Filter kun "PLAYED" rækker ===
-    played_df = df[(df['result_status_code'] == 'PLAYED') & 
-                   (pd.to_numeric(df['pct'], errors='coerce').notna())].copy()
+    pct = pd.to_numeric(df['pct'], errors='coerce')
+    is_played = ((df['result_status_code'] == 'PLAYED') & pct.notna()).to_numpy(dtype=bool)
     
-    if played_df.empty:
+    if not is_played.any():
+        if verbose:
+            print("⚠️ Phase 2.1: Ingen PLAYED rækker med gyldig pct")
         return df
     
-    # === STEP 5: Pre-compute gruppering ===
-    # Gruppering per SECTION
-    section_groups = played_df.groupby(['tournament_date', 'board_no', 'section']).size()
-    
-    # Gruppering per CLUB (hele klubben, samme dato + board)
-    club_groups = played_df.groupby(['tournament_date', 'board_no']).size()
-    
-    # === STEP 6: Beregn N_section_played og N_club_played for alle rækker ===
-    for idx, row in df.iterrows():
-        date = row['tournament_date']
-        board = row['board_no']
-        sec = row['section']
-        
-        # N_section_played
-        section_key = (date, board, sec)
-        df.at[idx, 'N_section_played'] = section_groups.get(section_key, 0)
-        
-        # N_club_played
-        club_key = (date, board)
-        df.at[idx, 'N_club_played'] = club_groups.get(club_key, 0)
-    
-    # === STEP 7: Vælg reference_scope for hver gruppe ===
-    for idx, row in df.iterrows():
-        n_section = df.at[idx, 'N_section_played']
-        n_club = df.at[idx, 'N_club_played']
-        
-        if n_section >= n_min:
-            df.at[idx, 'reference_scope'] = 'SECTION'
-            df.at[idx, 'reference_n_played'] = n_section
-        elif n_club >= n_min:
-            df.at[idx, 'reference_scope'] = 'CLUB'
-            df.at[idx, 'reference_n_played'] = n_club
-        else:
-            df.at[idx, 'reference_scope'] = 'LOW_SAMPLE'
-            df.at[idx, 'reference_n_played'] = n_club
-    
-    # === STEP 8: MAIN LOOP - Per (tournament_date, board_no, section) ===
-    unique_groups = df[['tournament_date', 'board_no', 'section']].drop_duplicates()
-    
-    for _, group_row in unique_groups.iterrows():
-        date = group_row['tournament_date']
-        board = group_row['board_no']
-        sec = group_row['section']
-        
-        # Filtrer rækker for denne gruppe
-        group_mask = (df['tournament_date'] == date) & \
-                     (df['board_no'] == board) & \
-                     (df['section'] == sec)
-        group_indices = df[group_mask].index
-        
-        if len(group_indices) == 0:
-            continue
-        
-        # Hent reference_scope for denne gruppe
-        ref_scope = df.at[group_indices[0], 'reference_scope']
-        ref_n = df.at[group_indices[0], 'reference_n_played']
-        
-        # === STEP 8a: Bestem referencegruppe ===
-        if ref_scope == 'SECTION':
-            # Kun denne sektion
-            ref_mask = (played_df['tournament_date'] == date) & \
-                       (played_df['board_no'] == board) & \
-                       (played_df['section'] == sec)
-        else:
-            # CLUB eller LOW_SAMPLE: hele klubben samme dag + board
-            ref_mask = (played_df['tournament_date'] == date) & \
-                       (played_df['board_no'] == board)
-        
-        ref_group = played_df[ref_mask]
-        
-        if ref_group.empty:
-            continue
-        
-        # === STEP 8b: Tæl kontrakt-frekvenser ===
-        contract_counts = ref_group['contract_norm'].value_counts().to_dict()
-        
-        if not contract_counts:
-            continue
-        
-        # Sorter efter hyppighed (faldende)
-        sorted_contracts = sorted(contract_counts.items(), key=lambda x: x[1], reverse=True)
-        
-        # === STEP 8c: Gem top 2 kontrakter ===
-        top1_contract, top1_count = sorted_contracts[0]
-        top1_freq = top1_count / ref_n if ref_n > 0 else 0.0
-        
-        top2_contract = sorted_contracts[1][0] if len(sorted_contracts) > 1 else None
-        top2_count = sorted_contracts[1][1] if len(sorted_contracts) > 1 else None
-        
-        # === STEP 8d: Klassificér Board_Type ===
-        if ref_scope == 'LOW_SAMPLE':
-            board_type = 'LOW_SAMPLE'
-        else:
-            p1 = top1_count / ref_n if ref_n > 0 else 0.0
-            p2 = (top2_count / ref_n) if (top2_count is not None and ref_n > 0) else 0.0
-            
-            if p1 >= 0.70:
-                board_type = 'Dominant'
-            elif (p1 + p2) >= 0.80 and p2 >= 0.25:
-                board_type = 'Split'
-            else:
-                board_type = 'Wild'
-        
-        # === STEP 8e: Beregn expected_pct ===
-        if top1_count >= 3:
-            # Brug mode-kontrakt
-            mode_mask = ref_mask & (played_df['contract_norm'] == top1_contract)
-            mode_pcts = played_df[mode_mask]['pct']
-            expected_pct_val = mode_pcts.mean() if len(mode_pcts) > 0 else None
-        else:
-            # Fallback til hele referencegruppen
-            expected_pct_val = ref_group['pct'].mean() if len(ref_group) > 0 else None
-        
-        # === STEP 8f: Gem alle værdier tilbage i gruppe-rækker ===
-        for idx in group_indices:
-            df.at[idx, 'field_mode_contract'] = top1_contract
-            df.at[idx, 'field_mode_count'] = top1_count
-            df.at[idx, 'field_mode_freq'] = top1_freq
-            df.at[idx, 'top2_contract_1'] = top1_contract
-            df.at[idx, 'top2_count_1'] = top1_count
-            df.at[idx, 'top2_contract_2'] = top2_contract
-            df.at[idx, 'top2_count_2'] = top2_count
-            df.at[idx, 'Board_Type'] = board_type
-            df.at[idx, 'expected_pct'] = expected_pct_val
-    
-    # === STEP 9: Beregn competitive_flag ===
+    if verbose:
+        print(f"✓ Phase 2.1: {int(is_played.sum())} PLAYED rækker fundet")
+    
+    # === STEP 5: N_section_played og N_club_played for alle rækker ===
+    played_count = pd.Series(is_played.astype(np.int64), index=df.index)
+    n_section = (
+        played_count.groupby([df[k] for k in SECTION_KEYS]).transform('sum')
+        .fillna(0).to_numpy(dtype=np.int64)
+    )
+    n_club = (
+        played_count.groupby([df[k] for k in CLUB_KEYS]).transform('sum')
+        .fillna(0).to_numpy(dtype=np.int64)
+    )
+    df['N_section_played'] = n_section
+    df['N_club_played'] = n_club
+    
+    # === STEP 6: Vælg reference_scope ===
+    use_section = n_section >= n_min
+    use_club = ~use_section & (n_club >= n_min)
+    scope = np.select([use_section, use_club], ['SECTION', 'CLUB'], default='LOW_SAMPLE')
+    ref_n = np.where(use_section, n_section, n_club)
+    df['reference_scope'] = pd.Series(scope, index=df.index, dtype=object)
+    df['reference_n_played'] = ref_n
+    
+    if verbose:
+        n_groups = len(df[SECTION_KEYS].drop_duplicates())
+        print(f"✓ Phase 2.1: Behandler {n_groups} unikke grupper (turnering+board+sektion)")
+    
+    # === STEP 7: Mode/top2/expected_pct pr. referencegruppe ===
+    played = df.loc[is_played, SECTION_KEYS + ['contract_norm']].copy()
+    played['pct'] = pct[is_played].to_numpy()
+    played['pos'] = np.flatnonzero(is_played)
+    
+    # SECTION-rækker bruger sektionens tabel, CLUB/LOW_SAMPLE hele klubben
+    by_section = _reference_table(played, SECTION_KEYS).reindex(pd.MultiIndex.from_frame(df[SECTION_KEYS]))
+    by_club = _reference_table(played, CLUB_KEYS).reindex(pd.MultiIndex.from_frame(df[CLUB_KEYS]))
+    ref = {
+        col: np.where(use_section, by_section[col].to_numpy(dtype=object), by_club[col].to_numpy(dtype=object))
+        for col in by_section.columns
+    }
+    
+    no_ref = pd.isna(ref['top1_contract'])
+    top1_count = ref['top1_count'].astype(float)
+    top2_count = ref['top2_count'].astype(float)
+    no_top2 = np.isnan(top2_count)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p1 = np.where(ref_n > 0, top1_count / ref_n, 0.0)
+        p2 = np.where(~no_top2 & (ref_n > 0), top2_count / ref_n, 0.0)
+    
+    # === STEP 8: Klassificér Board_Type ===
+    board_type = np.select(
+        [scope == 'LOW_SAMPLE', p1 >= 0.70, ((p1 + p2) >= 0.80) & (p2 >= 0.25)],
+        ['LOW_SAMPLE', 'Dominant', 'Split'],
+        default='Wild',
+    )
+    board_type = np.where(no_ref, 'LOW_SAMPLE', board_type)
+    
+    # === STEP 9: expected_pct (mode-kontrakt hvis ≥3, ellers hele gruppen) ===
+    expected = np.where(top1_count >= 3, ref['top1_mean'].astype(float), ref['group_mean'].astype(float))
+    
+    # === STEP 10: Gem værdier (None hvor der ikke er nogen referencegruppe) ===
+    df['field_mode_contract'] = _objects(ref['top1_contract'], no_ref, df.index)
+    df['field_mode_count'] = _objects(top1_count, no_ref, df.index, int)
+    df['field_mode_freq'] = _objects(p1, no_ref, df.index, float)
+    df['top2_contract_1'] = _objects(ref['top1_contract'], no_ref, df.index)
+    df['top2_count_1'] = _objects(top1_count, no_ref, df.index, int)
+    df['top2_contract_2'] = _objects(ref['top2_contract'], no_ref | no_top2, df.index)
+    df['top2_count_2'] = _objects(top2_count, no_ref | no_top2, df.index, int)
+    df['Board_Type'] = pd.Series(board_type, index=df.index).astype(str)
+    df['expected_pct'] = _objects(expected, no_ref | np.isnan(expected), df.index, np.float64)
+    
+    # === STEP 11: Beregn competitive_flag ===
     df['competitive_flag'] = df['Board_Type'] == 'Split'
     
+    # === STEP 12: Statistik ===
+    if verbose:
+        board_type_counts = df['Board_Type'].value_counts().to_dict()
+        print("\n✓ Phase 2.1 færdig:")
+        print(f"  Dominant boards: {board_type_counts.get('Dominant', 0)}")
+        print(f"  Split boards (competitive): {board_type_counts.get('Split', 0)}")
+        print(f"  Wild boards: {board_type_counts.get('Wild', 0)}")
+        print(f"  LOW_SAMPLE boards: {board_type_counts.get('LOW_SAMPLE', 0)}")
+    
     return df
 
 
@@ -0,0 +1,506 @@
+"""
+bridge/pipeline.py
+
+Small stage-DAG runner for the main.py analysis pipeline.
+
+- Stage: a function with named inputs and named outputs; the DAG is
+  derived from which stage produces which name
+- independent stages run concurrently on a thread pool (fx hulanalyse,
+  board review og field reports efter berigelsen)
+- each stage's outputs are stored in a StageStore (SQLite); a stage with
+  cache=True is skipped when the fingerprint of its inputs and code is
+  unchanged since the stored run
+- Pipeline.run(rerun={"name"}) re-runs only that stage and the stages
+  that depend on it, with all other inputs loaded from the store
+- print_report(): wall time, output size and peak RSS per stage
+
+Usage:
+    pipeline = Pipeline([
+        Stage("load", load_rows, inputs=("cache",), outputs=("rows",)),
+        Stage("report", make_report, inputs=("rows",), outputs=("report",), cache=True),
+    ])
+    result = pipeline.run({"cache": cache}, store=StageStore(path))
+    print_report(result)
+
+A stage function is called with its inputs as keyword arguments and
+returns a dict with (at least) its outputs.  Raising PipelineStop ends the
+run early with a message (no data, nothing to do) instead of an error.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import inspect
+import io
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+import pandas as pd
+
+try:  # POSIX only
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+
+_PROJECT_DIR = Path(__file__).resolve().parent.parent
+_FILE_SOURCE_SUFFIXES = (".py", ".yaml", ".yml")
+
+
+class PipelineError(RuntimeError):
+    """Invalid DAG, missing input or a failing stage."""
+
+
+class PipelineStop(Exception):
+    """Raised by a stage to end the run early (message is printed)."""
+
+
+# ----------------------------
+# Stages
+# ----------------------------
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One pipeline step.
+
+    sources are extra modules (dotted names) or files (paths relative to
+    the project root, fx "main.py" or the YAML config a module reads) whose
+    content determines the output; together with the stage function's own
+    source they make up the code part of the cache fingerprint.
+
+    handles are inputs passed to the function but left out of the
+    fingerprint: open caches and stores, which do not hash by content.
+    Another input must stand for what the stage reads through them (fx a
+    fingerprint of the store's contents).
+    """
+    name: str
+    fn: Callable[..., dict]
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    cache: bool = False
+    sources: tuple[str, ...] = ()
+    handles: tuple[str, ...] = ()
+
+
+def _module_digest(module: str) -> str:
+    try:
+        spec = importlib.util.find_spec(module)
+        origin = spec.origin if spec is not None else None
+        return hashlib.sha256(Path(origin).read_bytes()).hexdigest() if origin else "missing"
+    except (ImportError, OSError, ValueError):
+        return "missing"
+
+
+def is_file_source(source: str) -> bool:
+    """True for a Stage.sources entry naming a file rather than a module."""
+    return "/" in source or source.endswith(_FILE_SOURCE_SUFFIXES)
+
+
+def _source_digest(source: str) -> str:
+    if not is_file_source(source):
+        return _module_digest(source)
+    try:
+        return hashlib.sha256((_PROJECT_DIR / source).read_bytes()).hexdigest()
+    except OSError:
+        return "missing"
+
+
+def stage_code_version(stage: Stage) -> str:
+    h = hashlib.sha256(stage.name.encode("utf-8"))
+    try:
+        h.update(inspect.getsource(stage.fn).encode("utf-8"))
+    except (OSError, TypeError):
+        h.update(repr(stage.fn).encode("utf-8"))
+    for source in stage.sources:
+        h.update(f"{source}={_source_digest(source)}".encode("utf-8"))
+    return h.hexdigest()
+
+
+def fingerprint(value) -> str:
+    """Content hash of a stage input (DataFrames hashed by value)."""
+    if isinstance(value, pd.DataFrame):
+        try:
+            from bridge.enriched_store import frame_hash
+            return "df:" + frame_hash(value)
+        except TypeError:   # unhashable cells (lists, dicts)
+            pass
+    try:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        payload = repr(value).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _output_bytes(value) -> int:
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, dict):
+        return sum(_output_bytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(sys.getsizeof(v) for v in value) + sys.getsizeof(value)
+    return sys.getsizeof(value)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+# ----------------------------
+# Per-thread stdout capture
+# ----------------------------
+
+class _ThreadStdout(io.TextIOBase):
+    """sys.stdout proxy that routes writes of capturing threads to their buffer."""
+
+    def __init__(self, real):
+        self.real = real
+        self.local = threading.local()
+
+    def write(self, s):
+        buf = getattr(self.local, "buf", None)
+        return (buf if buf is not None else self.real).write(s)
+
+    def flush(self):
+        buf = getattr(self.local, "buf", None)
+        (buf if buf is not None else self.real).flush()
+
+
+_proxy: Optional[_ThreadStdout] = None
+_proxy_users = 0
+_proxy_lock = threading.Lock()
+
+
+@contextmanager
+def capture_output() -> Iterator[io.StringIO]:
+    """
+    Collect what the current thread prints; other threads print as usual.
+
+    Unlike contextlib.redirect_stdout this is safe while stages run
+    concurrently.
+    """
+    global _proxy, _proxy_users
+    with _proxy_lock:
+        if _proxy_users == 0:
+            _proxy = _ThreadStdout(sys.stdout)
+            sys.stdout = _proxy
+        _proxy_users += 1
+        proxy = _proxy
+    previous = getattr(proxy.local, "buf", None)
+    buf = io.StringIO()
+    proxy.local.buf = buf
+    try:
+        yield buf
+    finally:
+        proxy.local.buf = previous
+        with _proxy_lock:
+            _proxy_users -= 1
+            if _proxy_users == 0:
+                sys.stdout = proxy.real
+                _proxy = None
+
+
+# ----------------------------
+# Output store
+# ----------------------------
+
+_CREATE_STAGE_OUTPUTS = """
+CREATE TABLE IF NOT EXISTS stage_outputs (
+    stage TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    outputs BLOB NOT NULL,
+    saved_at TEXT NOT NULL
+);
+"""
+
+
+class StageStore:
+    """Latest outputs of every stage (zlib-compressed pickle) in one SQLite file."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self._conn:
+            self._conn.execute(_CREATE_STAGE_OUTPUTS)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def load(self, stage: str, fingerprint: Optional[str] = None) -> Optional[dict]:
+        """Stored outputs of stage (only if fingerprint matches, when given)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint, outputs FROM stage_outputs WHERE stage = ?", (stage,)
+            ).fetchone()
+        if row is None or (fingerprint is not None and row[0] != fingerprint):
+            return None
+        try:
+            return pickle.loads(zlib.decompress(row[1]))
+        except Exception:
+            return None
+
+    def save(self, stage: str, fingerprint: str, outputs: dict) -> bool:
+        """Store outputs; returns False when they cannot be pickled."""
+        try:
+            blob = zlib.compress(pickle.dumps(outputs, protocol=pickle.HIGHEST_PROTOCOL), 1)
+        except Exception:
+            return False
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO stage_outputs (stage, fingerprint, outputs, saved_at) "
+                "VALUES (?, ?, ?, ?)",
+                (stage, fingerprint, blob, now),
+            )
+        return True
+
+    def stages(self) -> set[str]:
+        with self._lock:
+            return {r[0] for r in self._conn.execute("SELECT stage FROM stage_outputs")}
+
+
+# ----------------------------
+# Runner
+# ----------------------------
+
+@dataclass
+class StageRecord:
+    name: str
+    status: str              # "run", "cache" (fingerprint hit), "stored" (loaded for rerun), "stop"
+    seconds: float = 0.0
+    output_mb: float = 0.0
+    peak_rss_mb: Optional[float] = None
+
+
+@dataclass
+class PipelineResult:
+    values: dict
+    records: list[StageRecord] = field(default_factory=list)
+    stopped: Optional[str] = None   # PipelineStop message
+    seconds: float = 0.0
+
+
+class Pipeline:
+    """A validated DAG of stages."""
+
+    def __init__(self, stages: Iterable[Stage]):
+        self.stages: dict[str, Stage] = {}
+        self.producer: dict[str, str] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise PipelineError(f"Stage '{stage.name}' er defineret to gange")
+            self.stages[stage.name] = stage
+            stray = set(stage.handles) - set(stage.inputs)
+            if stray:
+                raise PipelineError(
+                    f"Stage '{stage.name}' har handles der ikke er inputs: {', '.join(sorted(stray))}"
+                )
+            for out in stage.outputs:
+                if out in self.producer:
+                    raise PipelineError(
+                        f"'{out}' produceres af både '{self.producer[out]}' og '{stage.name}'"
+                    )
+                self.producer[out] = stage.name
+        self.order = self._topological_order()
+
+    def upstream(self, name: str) -> set[str]:
+        """Stages that name reads outputs from (direct parents)."""
+        return {self.producer[i] for i in self.stages[name].inputs if i in self.producer}
+
+    def _topological_order(self) -> list[str]:
+        order: list[str] = []
+        state: dict[str, int] = {}   # 1 = visiting, 2 = done
+
+        def visit(name: str, path: tuple[str, ...]) -> None:
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise PipelineError("Cyklus i pipeline: " + " → ".join(path + (name,)))
+            state[name] = 1
+            for parent in sorted(self.upstream(name)):
+                visit(parent, path + (name,))
+            state[name] = 2
+            order.append(name)
+
+        for name in self.stages:
+            visit(name, ())
+        return order
+
+    def downstream(self, names: Iterable[str]) -> set[str]:
+        """names plus every stage that (transitively) depends on them."""
+        selected = set(names)
+        for name in self.order:
+            if self.upstream(name) & selected:
+                selected.add(name)
+        return selected
+
+    def run(
+        self,
+        values: dict,
+        store: Optional[StageStore] = None,
+        rerun: Optional[Iterable[str]] = None,
+        max_workers: int = 4,
+    ) -> PipelineResult:
+        """
+        Run the DAG starting from the given input values.
+
+        rerun: only run these stages (always, ignoring the fingerprint
+        cache) and their dependents; outputs of the other stages are loaded
+        from store (PipelineError if missing).
+        Stages run as soon as their inputs exist, up to max_workers at a
+        time; a stage that starts while others may run gets its printed
+        output collected and printed in one block when it finishes.
+        """
+        t0 = time.perf_counter()
+        values = dict(values)
+        result = PipelineResult(values=values)
+        unknown = set(rerun or ()) - set(self.stages)
+        if unknown:
+            raise PipelineError(f"Ukendte stages: {', '.join(sorted(unknown))}")
+
+        forced = set(rerun or ())
+        todo = self.downstream(forced) if forced else set(self.stages)
+        if rerun:
+            needed = {p for name in todo for p in self.upstream(name)} - todo
+            for name in sorted(needed, key=self.order.index):
+                stored = store.load(name) if store is not None else None
+                if stored is None:
+                    raise PipelineError(
+                        f"Ingen gemt output for '{name}' – kør hele pipelinen først"
+                    )
+                values.update(stored)
+                result.records.append(StageRecord(name, "stored"))
+
+        for name in todo:
+            missing = [
+                i for i in self.stages[name].inputs
+                if i not in values and i not in self.producer
+            ]
+            if missing:
+                raise PipelineError(f"Stage '{name}' mangler input: {', '.join(missing)}")
+
+        workers = max(1, int(max_workers))
+        pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        running: dict = {}
+        try:
+            while todo or running:
+                ready = [
+                    n for n in self.order
+                    if n in todo and all(i in values for i in self.stages[n].inputs)
+                ]
+                if result.stopped is None:
+                    for name in ready[: max(0, workers - len(running))]:
+                        todo.discard(name)
+                        # Alone on the pool with nothing else ready: print live
+                        live = pool is None or (not running and len(ready) == 1)
+                        kwargs = {i: values[i] for i in self.stages[name].inputs}
+                        force = name in forced
+                        if pool is None:
+                            self._finish(name, self._execute(name, kwargs, store, live, force), values, result)
+                        else:
+                            running[pool.submit(self._execute, name, kwargs, store, live, force)] = name
+                else:
+                    todo.clear()
+                if not running:
+                    if todo and not ready and result.stopped is None:
+                        raise PipelineError(f"Stages kan ikke køre: {', '.join(sorted(todo))}")
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    self._finish(name, future.result(), values, result)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+        result.seconds = time.perf_counter() - t0
+        return result
+
+    def _execute(
+        self, name: str, kwargs: dict, store: Optional[StageStore], live: bool, force: bool = False,
+    ):
+        stage = self.stages[name]
+        t0 = time.perf_counter()
+
+        fp = None
+        if stage.cache and store is not None:
+            h = hashlib.sha256(stage_code_version(stage).encode("utf-8"))
+            for key in stage.inputs:
+                if key not in stage.handles:
+                    h.update(f"{key}={fingerprint(kwargs[key])}".encode("utf-8"))
+            fp = h.hexdigest()
+            cached = None if force else store.load(name, fp)
+            if cached is not None and all(o in cached for o in stage.outputs):
+                return "cache", cached, "", time.perf_counter() - t0, None
+
+        buf = io.StringIO()
+        status, outputs, stop = "run", {}, None
+        try:
+            if live:
+                outputs = stage.fn(**kwargs)
+            else:
+                with capture_output() as buf:
+                    outputs = stage.fn(**kwargs)
+        except PipelineStop as exc:
+            status, stop = "stop", str(exc)
+        except Exception as exc:
+            raise PipelineError(f"Stage '{name}' fejlede: {exc}") from exc
+
+        if status == "run":
+            outputs = dict(outputs or {})
+            missing = [o for o in stage.outputs if o not in outputs]
+            if missing:
+                raise PipelineError(f"Stage '{name}' returnerede ikke: {', '.join(missing)}")
+            if store is not None:
+                store.save(name, fp or "", outputs)
+        return status, outputs, buf.getvalue(), time.perf_counter() - t0, stop
+
+    @staticmethod
+    def _finish(name: str, outcome, values: dict, result: PipelineResult) -> None:
+        status, outputs, printed, seconds, stop = outcome
+        if printed:
+            sys.stdout.write(printed)
+        if status == "cache":
+            print(f"  ↺ {name}: uændret input – genbrugt fra stage-cache")
+        if status == "stop":
+            print(stop)
+            if result.stopped is None:
+                result.stopped = stop
+        values.update(outputs)
+        result.records.append(StageRecord(
+            name, status, seconds,
+            output_mb=_output_bytes(outputs) / (1024 * 1024),
+            peak_rss_mb=_peak_rss_mb(),
+        ))
+
+
+def print_report(result: PipelineResult) -> None:
+    """Per-stage wall time / output size / peak RSS table."""
+    print("\n⏱ Pipeline-rapport:")
+    print(f"  {'Stage':<22} {'Status':<7} {'Tid (s)':>8} {'Output (MB)':>12} {'Peak RSS (MB)':>14}")
+    for rec in result.records:
+        rss = f"{rec.peak_rss_mb:.0f}" if rec.peak_rss_mb is not None else "-"
+        print(
+            f"  {rec.name:<22} {rec.status:<7} {rec.seconds:>8.2f} "
+            f"{rec.output_mb:>12.1f} {rss:>14}"
+        )
+    print(f"  {'I alt':<22} {'':<7} {result.seconds:>8.2f}")
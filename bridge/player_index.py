@@ -0,0 +1,125 @@
+"""
+bridge/player_index.py
+
+Player index over a results frame: player names are interned to integer
+IDs once, and an inverted index maps each ID to the (row, seat) entries
+where that player sits.  Pair / player queries are then set operations on
+small sorted position arrays instead of per-row name scans.
+
+Usage:
+    index = PlayerIndex.from_frame(df)
+    df_pair = df.iloc[index.pair_rows("Henrik Friis", "Per Føge Jensen")]
+    seats = index.seat_of("Henrik Friis")       # "N"/"S"/"Ø"/"V" or None per row
+    declared = index.declarer_rows("Henrik Friis")
+
+Positions are row positions (iloc) in the frame the index was built from.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+# Seat columns in lookup order (declarer_analysis.find_position order)
+SEAT_COLUMNS: tuple[tuple[str, str], ...] = (("ns1", "N"), ("ns2", "S"), ("ew1", "Ø"), ("ew2", "V"))
+SEATS: tuple[str, ...] = tuple(seat for _, seat in SEAT_COLUMNS)
+
+_EMPTY = np.zeros(0, dtype=np.int64)
+
+
+class PlayerIndex:
+    """Interned player IDs per (row, seat) plus an inverted ID → entries index."""
+
+    __slots__ = ("names", "seat_ids", "decl_seats", "_ids", "_entries", "_offsets", "_decl_rows")
+
+    def __init__(self, seat_ids: np.ndarray, names: Iterable[str], decl_seats: np.ndarray):
+        self.names: tuple = tuple(names)
+        self.seat_ids = np.asarray(seat_ids, dtype=np.int32).reshape(-1, len(SEATS))
+        self.decl_seats = np.asarray(decl_seats, dtype=np.int8)
+        self._ids = {name: i for i, name in enumerate(self.names)}
+
+        # Entries are flat (row * 4 + seat) positions, grouped by player ID
+        flat = self.seat_ids.ravel()
+        valid = np.flatnonzero(flat >= 0)
+        order = np.argsort(flat[valid], kind="stable")
+        self._entries = valid[order]
+        self._offsets = np.searchsorted(flat[valid][order], np.arange(len(self.names) + 1))
+        self._decl_rows = [np.flatnonzero(self.decl_seats == k) for k in range(len(SEATS))]
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "PlayerIndex":
+        n = len(df)
+        columns = [
+            df[col].to_numpy(dtype=object) if col in df.columns else np.full(n, None, dtype=object)
+            for col, _ in SEAT_COLUMNS
+        ]
+        codes, uniques = pd.factorize(np.concatenate(columns) if n else np.zeros(0, dtype=object))
+        seat_ids = codes.reshape(len(SEATS), n).T
+
+        if "decl" in df.columns:
+            decl = df["decl"].to_numpy(dtype=object)
+            decl_seats = np.select([decl == seat for seat in SEATS], range(len(SEATS)), default=-1)
+        else:
+            decl_seats = np.full(n, -1)
+        return cls(seat_ids, list(uniques), decl_seats)
+
+    def __len__(self) -> int:
+        return len(self.seat_ids)
+
+    def id_of(self, name) -> Optional[int]:
+        return self._ids.get(name)
+
+    def _player_entries(self, name) -> np.ndarray:
+        pid = self._ids.get(name)
+        if pid is None:
+            return _EMPTY
+        return self._entries[self._offsets[pid]:self._offsets[pid + 1]]
+
+    def rows(self, name, seats: Optional[Iterable[str]] = None) -> np.ndarray:
+        """Sorted row positions where name sits (optionally only in these seats)."""
+        entries = self._player_entries(name)
+        if seats is not None:
+            wanted = [SEATS.index(s) for s in seats]
+            entries = entries[np.isin(entries % len(SEATS), wanted)]
+        return np.unique(entries // len(SEATS))
+
+    def pair_rows(self, a, b) -> np.ndarray:
+        """Sorted row positions where both a and b are at the table."""
+        return np.intersect1d(self.rows(a), self.rows(b), assume_unique=True)
+
+    def declarer_rows(self, name) -> np.ndarray:
+        """Sorted row positions where name is declarer."""
+        hits = [
+            np.intersect1d(self.rows(name, seats=(seat,)), self._decl_rows[k], assume_unique=True)
+            for k, seat in enumerate(SEATS)
+        ]
+        return np.unique(np.concatenate(hits)) if hits else _EMPTY
+
+    def seat_of(self, name) -> np.ndarray:
+        """
+        Seat of name per row, None where absent.
+
+        First match in ns1, ns2, ew1, ew2 order, like find_position().
+        """
+        out = np.full(len(self), None, dtype=object)
+        pid = self._ids.get(name)
+        if pid is None:
+            return out
+        hit = self.seat_ids == pid
+        rows = np.flatnonzero(hit.any(axis=1))
+        out[rows] = np.asarray(SEATS, dtype=object)[hit[rows].argmax(axis=1)]
+        return out
+
+    def mask(self, positions: np.ndarray) -> np.ndarray:
+        """Boolean row mask from positions."""
+        m = np.zeros(len(self), dtype=bool)
+        m[positions] = True
+        return m
+
+
+def pair_boards(df: pd.DataFrame, a, b, index: Optional[PlayerIndex] = None) -> pd.DataFrame:
+    """Copy of the rows of df where both a and b sit at the table."""
+    index = index if index is not None else PlayerIndex.from_frame(df)
+    return df.iloc[index.pair_rows(a, b)].copy()
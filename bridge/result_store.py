@@ -0,0 +1,578 @@
+"""SQLite result store for scraped tournament rows.
+
+Database location: <data_dir>/results.db (DataCache owns one instance).
+
+Replaces the per-tournament JSON files under tournaments/: rows are kept in
+one typed table, physically clustered by (date, club) so a period/club
+query only touches its own pages, and read back with column projection and
+WHERE-clause predicates instead of parsing every JSON file.
+
+Tables
+------
+tournaments
+    cache_key TEXT PRIMARY KEY    (DataCache key: "clubno:tournament_id" or legacy "tournament_id")
+    p_date TEXT                   (YYYY-MM-DD)
+    p_clubno INTEGER              (-1 for legacy keys without club)
+    tournament_id INTEGER
+    clubno INTEGER
+    mainclubno INTEGER
+    meta TEXT                     (JSON: the tournament data dict minus "sections")
+    sections TEXT                 (JSON list of section names, in saved order)
+    row_count INTEGER
+    content_hash TEXT             (SHA-256 of the saved rows)
+    saved_at TEXT
+
+results  (WITHOUT ROWID, PRIMARY KEY (p_date, p_clubno, cache_key, seq))
+    p_date, p_clubno, cache_key, seq, p_section
+    one typed column per scraper row field (see ROW_SCHEMA)
+    extra TEXT                    (JSON of any row keys outside ROW_SCHEMA)
+
+Rows are returned as dicts in ROW_SCHEMA order (then extra keys), with
+tournament_id / clubno / mainclubno / section filled from the tournament
+when the stored row lacks them.
+
+Bulk reads stream as typed batches (iter_batches / rows_to_batch): text
+columns are categoricals, so a multi-year load holds one copy of each
+distinct name, hand and URL instead of one dict per row.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence
+
+import pandas as pd
+
+from bridge.schema import union_categories
+
+# ---------------------------------------------------------------------------
+# Row schema (scraper.scrape_spilresultater + main's section/club fields)
+# ---------------------------------------------------------------------------
+
+_TEXT = "TEXT"
+_INT = "INTEGER"
+_REAL = "REAL"
+_BOOL = "BOOL"   # stored as INTEGER 0/1, returned as bool
+
+_DD_DIRS = ["N", "S", "Ø", "V"]
+_DD_STRAINS = ["NT", "S", "H", "D", "C"]
+
+ROW_SCHEMA: tuple[tuple[str, str], ...] = (
+    ("tournament_date", _TEXT),
+    ("board", _INT),
+    ("board_no", _INT),
+    ("row", _TEXT),
+    ("ns1", _TEXT),
+    ("ns2", _TEXT),
+    ("ew1", _TEXT),
+    ("ew2", _TEXT),
+    ("ns_pair", _TEXT),
+    ("ew_pair", _TEXT),
+    ("decl", _TEXT),
+    ("level", _INT),
+    ("strain", _TEXT),
+    ("contract", _TEXT),
+    ("contract_raw", _TEXT),
+    ("lead", _TEXT),
+    ("tricks", _INT),
+    ("score_NS", _INT),
+    ("score_ØV", _INT),
+    ("point_NS", _REAL),
+    ("point_ØV", _REAL),
+    ("pct_NS", _REAL),
+    ("pct_ØV", _REAL),
+    ("spil_url", _TEXT),
+    ("N_hand", _TEXT),
+    ("Ø_hand", _TEXT),
+    ("S_hand", _TEXT),
+    ("V_hand", _TEXT),
+    ("dealer", _TEXT),
+    ("vul", _TEXT),
+    ("dd_valid", _BOOL),
+    ("par_score", _INT),
+    ("par_contract", _TEXT),
+    ("par_side", _TEXT),
+    *((f"dd_{d}_{s}", _INT) for d in _DD_DIRS for s in _DD_STRAINS),
+    *((f"dd_{d}_HCP", _INT) for d in _DD_DIRS),
+    ("section", _TEXT),
+    ("clubno", _INT),
+    ("mainclubno", _INT),
+    ("tournament_id", _INT),
+)
+
+ROW_COLUMNS: tuple[str, ...] = tuple(name for name, _ in ROW_SCHEMA)
+_COLUMN_TYPE = dict(ROW_SCHEMA)
+
+# Partition value for legacy cache keys without a club
+_NO_CLUB = -1
+
+# Pragmas applied once per connection.  Data/results.db holds the rows that
+# used to live in the tracked tournaments/*.json, so it keeps the rollback
+# journal like dd_cache.db: under WAL, saved tournaments would sit in an
+# untracked -wal file until a checkpoint.  journal_mode=DELETE also converts
+# a file that an earlier version switched to WAL back.
+_PRAGMAS = (
+    "PRAGMA journal_mode=DELETE",
+    "PRAGMA cache_size=-65536",      # 64 MiB page cache
+    "PRAGMA mmap_size=268435456",    # 256 MiB memory-mapped I/O
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _q(name: str) -> str:
+    """Quote a column name (several contain 'Ø')."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+_CREATE_TOURNAMENTS = """
+CREATE TABLE IF NOT EXISTS tournaments (
+    cache_key TEXT PRIMARY KEY,
+    p_date TEXT NOT NULL,
+    p_clubno INTEGER NOT NULL,
+    tournament_id INTEGER,
+    clubno INTEGER,
+    mainclubno INTEGER,
+    meta TEXT NOT NULL,
+    sections TEXT NOT NULL,
+    row_count INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    saved_at TEXT NOT NULL
+);
+"""
+
+_CREATE_RESULTS = f"""
+CREATE TABLE IF NOT EXISTS results (
+    p_date TEXT NOT NULL,
+    p_clubno INTEGER NOT NULL,
+    cache_key TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    p_section TEXT NOT NULL,
+    {', '.join(f'{_q(n)} {"INTEGER" if t == _BOOL else t}' for n, t in ROW_SCHEMA)},
+    extra TEXT,
+    PRIMARY KEY (p_date, p_clubno, cache_key, seq)
+) WITHOUT ROWID;
+"""
+
+_CREATE_RESULTS_KEY_INDEX = (
+    "CREATE INDEX IF NOT EXISTS results_cache_key ON results (cache_key, seq)"
+)
+
+
+def _date_text(value) -> Optional[str]:
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value) if value is not None else None
+
+
+def _encode(value, col_type: str):
+    if value is None:
+        return None
+    if isinstance(value, float) and value != value:   # NaN
+        return None
+    if col_type == _BOOL:
+        return int(bool(value))
+    if col_type == _INT:
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return value   # keep odd legacy values rather than drop them
+    if col_type == _REAL:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return value
+    return _date_text(value) if isinstance(value, (date, datetime)) else str(value)
+
+
+def _encode_row(row: dict) -> tuple[list, dict]:
+    """ROW_SCHEMA-ordered typed values of one row, plus its keys outside the schema."""
+    encoded = [_encode(row.get(n), t) for n, t in ROW_SCHEMA]
+    return encoded, {k: v for k, v in row.items() if k not in _COLUMN_TYPE}
+
+
+def rows_content_hash(sections: dict) -> str:
+    """Stable SHA-256 of a tournament's {section: rows} payload."""
+    payload = json.dumps(sections, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Row batches (typed, dictionary-encoded DataFrames)
+# ---------------------------------------------------------------------------
+
+# Text columns repeat per board (hands, spil_url) or per pair (names), so
+# batches keep them as categoricals: one string object per distinct value.
+_CATEGORY_COLUMNS = tuple(name for name, t in ROW_SCHEMA if t == _TEXT)
+
+DEFAULT_BATCH_ROWS = 20_000
+
+
+def _frame_from_records(records: Sequence[tuple], cols: Sequence[str], extras: Sequence) -> pd.DataFrame:
+    """DataFrame of (*cols) records plus the decoded extra-key dicts as columns."""
+    df = pd.DataFrame.from_records(list(records), columns=list(cols), coerce_float=False)
+    for c in cols:
+        if _COLUMN_TYPE[c] == _BOOL:
+            df[c] = df[c].map(bool, na_action="ignore").astype(object)
+
+    if any(extras):
+        extra_df = pd.DataFrame.from_records([e or {} for e in extras], index=df.index)
+        df = pd.concat([df, extra_df], axis=1)
+    return df
+
+
+def _compact(df: pd.DataFrame) -> pd.DataFrame:
+    """Dictionary-encode the text columns."""
+    for c in df.columns:
+        if _COLUMN_TYPE.get(c) == _TEXT:
+            df[c] = df[c].astype("category")
+    return df
+
+
+def rows_to_batch(rows: Iterable[dict]) -> pd.DataFrame:
+    """
+    One typed columnar batch from scraper row dicts.
+
+    Values are encoded exactly as save_tournament stores them, so a batch
+    built from freshly scraped rows matches one read back by iter_batches().
+    """
+    records, extras = [], []
+    for row in rows:
+        encoded, extra = _encode_row(row)
+        records.append(encoded)
+        extras.append(extra or None)
+    return _compact(_frame_from_records(records, ROW_COLUMNS, extras))
+
+
+def concat_batches(batches: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate row batches into one frame.
+
+    Categorical columns are unioned across batches first (pd.concat would
+    otherwise fall back to object); they stay categorical – see
+    decode_categories() for plain string columns.
+    """
+    batches = [b for b in batches if len(b.columns)]
+    if not batches:
+        return pd.DataFrame()
+    # A numeric column that is all-missing in one batch is object there; cast
+    # it so the concat infers what one whole-frame load would (float64 + NaN).
+    for c in {c for b in batches for c in b.columns if _COLUMN_TYPE.get(c) in (_INT, _REAL)}:
+        kinds = {b[c].dtype.kind for b in batches if c in b.columns and b[c].notna().any()}
+        if kinds and kinds <= {"i", "f"}:
+            batches = [
+                b.assign(**{c: b[c].astype("float64")})
+                if c in b.columns and b[c].dtype == object and b[c].isna().all() else b
+                for b in batches
+            ]
+    return pd.concat(union_categories(batches), ignore_index=True)
+
+
+def decode_categories(df: pd.DataFrame, keep: Iterable[str] = ()) -> pd.DataFrame:
+    """
+    Categorical columns (except keep) back to the string dtype load_frame()
+    returns; the string objects are shared with the categories, not copied.
+    """
+    keep = set(keep)
+    for c in df.columns:
+        if c in keep or not isinstance(df[c].dtype, pd.CategoricalDtype):
+            continue
+        if len(df[c].cat.categories):
+            df[c] = df[c].astype("str").where(df[c].notna())
+        else:
+            df[c] = pd.Series([None] * len(df), index=df.index, dtype=object)
+    return df
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+
+class ResultStore:
+    """Typed, (date, club)-clustered store of scraped rows in one SQLite file."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        for pragma in _PRAGMAS:
+            self._conn.execute(pragma)
+        with self._lock, self._conn:
+            self._conn.execute(_CREATE_TOURNAMENTS)
+            self._conn.execute(_CREATE_RESULTS)
+            self._conn.execute(_CREATE_RESULTS_KEY_INDEX)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def save_tournament(self, cache_key: str, tournament_date, data: dict) -> int:
+        """Replace all rows of one tournament (data = {"sections": {name: rows}, ...}).
+
+        Returns the number of rows stored.
+        """
+        sections = data.get("sections", {}) or {}
+        p_date = _date_text(tournament_date)
+        clubno = data.get("clubno")
+        if clubno is None and ":" in str(cache_key):
+            clubno = str(cache_key).split(":", 1)[0]
+        clubno = _encode(clubno, _INT)
+        p_clubno = clubno if isinstance(clubno, int) else _NO_CLUB
+        meta = {k: v for k, v in data.items() if k != "sections"}
+
+        values = []
+        seq = 0
+        for section_name, rows in sections.items():
+            for row in rows or []:
+                if not isinstance(row, dict):
+                    continue
+                encoded, extra = _encode_row(row)
+                values.append(
+                    [p_date, p_clubno, cache_key, seq, str(section_name)]
+                    + encoded
+                    + [json.dumps(extra, ensure_ascii=False, default=str) if extra else None]
+                )
+                seq += 1
+
+        cols = ["p_date", "p_clubno", "cache_key", "seq", "p_section", *ROW_COLUMNS, "extra"]
+        insert_sql = (
+            f"INSERT INTO results ({', '.join(_q(c) for c in cols)}) "
+            f"VALUES ({', '.join('?' for _ in cols)})"
+        )
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results WHERE cache_key = ?", (cache_key,))
+            self._conn.executemany(insert_sql, values)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tournaments "
+                "(cache_key, p_date, p_clubno, tournament_id, clubno, mainclubno, "
+                "meta, sections, row_count, content_hash, saved_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    cache_key, p_date, p_clubno,
+                    _encode(meta.get("tournament_id"), _INT),
+                    clubno,
+                    _encode(meta.get("mainclubno"), _INT),
+                    json.dumps(meta, ensure_ascii=False, default=str),
+                    json.dumps([str(s) for s in sections], ensure_ascii=False),
+                    len(values),
+                    rows_content_hash(sections),
+                    now,
+                ),
+            )
+        return len(values)
+
+    def delete_tournament(self, cache_key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results WHERE cache_key = ?", (cache_key,))
+            self._conn.execute("DELETE FROM tournaments WHERE cache_key = ?", (cache_key,))
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def has_tournament(self, cache_key: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM tournaments WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+        return row is not None
+
+    def tournament_keys(self) -> set[str]:
+        with self._lock:
+            return {r[0] for r in self._conn.execute("SELECT cache_key FROM tournaments")}
+
+    def tournament_hashes(self) -> dict[str, str]:
+        """{cache_key: content_hash} of every stored tournament."""
+        with self._lock:
+            return dict(self._conn.execute("SELECT cache_key, content_hash FROM tournaments"))
+
+    def get_tournament(self, cache_key: str) -> Optional[dict]:
+        """Return the tournament as saved: its meta fields plus {"sections": {name: rows}}."""
+        with self._lock:
+            trow = self._conn.execute(
+                "SELECT meta, sections FROM tournaments WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+        if trow is None:
+            return None
+        data = json.loads(trow[0])
+        sections: dict[str, list] = {name: [] for name in json.loads(trow[1])}
+        for section_name, row in self._iter_rows(
+            where="r.cache_key = ?", params=[cache_key], order="r.seq", with_section=True,
+        ):
+            sections.setdefault(section_name, []).append(row)
+        data["sections"] = sections
+        return data
+
+    def _where(
+        self,
+        start_date=None,
+        end_date=None,
+        clubnos: Optional[Iterable[int]] = None,
+        sections: Optional[Iterable[str]] = None,
+        cache_keys: Optional[Iterable[str]] = None,
+    ) -> tuple[str, list]:
+        """Translate predicates into a WHERE clause on the partition columns."""
+        clauses: list[str] = []
+        params: list = []
+        if start_date is not None:
+            clauses.append("r.p_date >= ?")
+            params.append(_date_text(start_date))
+        if end_date is not None:
+            clauses.append("r.p_date <= ?")
+            params.append(_date_text(end_date))
+        for column, values in (
+            ("r.p_clubno", clubnos), ("r.p_section", sections), ("r.cache_key", cache_keys),
+        ):
+            if values is None:
+                continue
+            values = list(values)
+            if not values:
+                return "0", []
+            clauses.append(f"{column} IN ({', '.join('?' for _ in values)})")
+            params.extend(values)
+        return (" AND ".join(clauses) or "1"), params
+
+    def _select(
+        self,
+        where: str = "1",
+        params: Sequence = (),
+        columns: Optional[Sequence[str]] = None,
+        order: str = "r.cache_key, r.seq",
+    ) -> tuple[list[str], list[tuple]]:
+        """Run the projected query; records are (*columns, extra, p_section)."""
+        cols, sql = self._select_sql(where, columns, order)
+        with self._lock:
+            return cols, self._conn.execute(sql, list(params)).fetchall()
+
+    def _select_sql(
+        self,
+        where: str = "1",
+        columns: Optional[Sequence[str]] = None,
+        order: str = "r.cache_key, r.seq",
+    ) -> tuple[list[str], str]:
+        cols = list(ROW_COLUMNS if columns is None else columns)
+        unknown = [c for c in cols if c not in _COLUMN_TYPE]
+        if unknown:
+            raise KeyError(f"Unknown result column(s): {unknown}")
+        fill = {
+            "section": "r.p_section",
+            "tournament_id": "t.tournament_id",
+            "clubno": "t.clubno",
+            "mainclubno": "t.mainclubno",
+        }
+        select = [
+            f"COALESCE(r.{_q(c)}, {fill[c]})" if c in fill else f"r.{_q(c)}" for c in cols
+        ]
+        # extra keys only come with full rows (no projection)
+        select.append("r.extra" if columns is None else "NULL")
+        select.append("r.p_section")
+        sql = (
+            f"SELECT {', '.join(select)} FROM results r "
+            f"JOIN tournaments t ON t.cache_key = r.cache_key "
+            f"WHERE {where} ORDER BY {order}"
+        )
+        return cols, sql
+
+    def _iter_rows(
+        self,
+        where: str = "1",
+        params: Sequence = (),
+        columns: Optional[Sequence[str]] = None,
+        order: str = "r.cache_key, r.seq",
+        with_section: bool = False,
+    ) -> Iterator:
+        cols, fetched = self._select(where, params, columns, order)
+        n = len(cols)
+        bool_cols = [c for c in cols if _COLUMN_TYPE[c] == _BOOL]
+        for rec in fetched:
+            row = dict(zip(cols, rec))
+            for c in bool_cols:
+                if row[c] is not None:
+                    row[c] = bool(row[c])
+            if rec[n]:
+                row.update(json.loads(rec[n]))
+            yield (rec[-1], row) if with_section else row
+
+    def load_rows(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        start_date=None,
+        end_date=None,
+        clubnos: Optional[Iterable[int]] = None,
+        sections: Optional[Iterable[str]] = None,
+        cache_keys: Optional[Iterable[str]] = None,
+    ) -> list[dict]:
+        """Rows matching the predicates, ordered by (cache_key, saved order).
+
+        columns projects to a subset of ROW_COLUMNS (extra keys are only
+        returned when columns is None); the date / club / section / key
+        predicates are evaluated by SQLite on the partition columns.
+        """
+        where, params = self._where(start_date, end_date, clubnos, sections, cache_keys)
+        return list(self._iter_rows(where=where, params=params, columns=columns))
+
+    def load_frame(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        start_date=None,
+        end_date=None,
+        clubnos: Optional[Iterable[int]] = None,
+        sections: Optional[Iterable[str]] = None,
+        cache_keys: Optional[Iterable[str]] = None,
+    ) -> pd.DataFrame:
+        """Same rows as load_rows(), built column-wise into a DataFrame."""
+        where, params = self._where(start_date, end_date, clubnos, sections, cache_keys)
+        cols, fetched = self._select(where=where, params=params, columns=columns)
+        n = len(cols)
+        return _frame_from_records(
+            [rec[:n] for rec in fetched], cols,
+            [json.loads(rec[n]) if rec[n] else None for rec in fetched],
+        )
+
+    def iter_batches(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        start_date=None,
+        end_date=None,
+        clubnos: Optional[Iterable[int]] = None,
+        sections: Optional[Iterable[str]] = None,
+        cache_keys: Optional[Iterable[str]] = None,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Same rows as load_frame(), streamed as typed batches of ≤ batch_rows.
+
+        Text columns are categorical (see rows_to_batch), so peak memory while
+        loading is one batch of raw records plus the encoded batches so far;
+        join them with concat_batches().
+        """
+        where, params = self._where(start_date, end_date, clubnos, sections, cache_keys)
+        cols, sql = self._select_sql(where, columns)
+        n = len(cols)
+        cursor = self._conn.cursor()
+        with self._lock:
+            cursor.execute(sql, list(params))
+        try:
+            while True:
+                with self._lock:
+                    fetched = cursor.fetchmany(batch_rows)
+                if not fetched:
+                    break
+                yield _compact(_frame_from_records(
+                    [rec[:n] for rec in fetched], cols,
+                    [json.loads(rec[n]) if rec[n] else None for rec in fetched],
+                ))
+        finally:
+            cursor.close()
@@ -0,0 +1,93 @@
+"""
+bridge/schema.py
+
+Canonical column dtypes of the result DataFrame (df_all / df_history).
+
+Rows are duplicated 10+ times per board (one per table), so the player
+names, spil_url, contract/lead and the four hand strings are stored as
+categoricals: one string object per distinct value plus small integer
+codes.  DD trick counts and tricks fit a nullable Int8.  pct stays float64:
+expected_pct, pct_vs_expected and the report averages are computed from
+it, and float32 rounding shows up in those (and in report sort order).
+
+apply_schema() is run once after load (main._stage_identity_check /
+_load_all_cached_frame); enrich_incremental re-applies it to the enriched
+output, so columns a stage rebuilt keep their canonical dtype.
+
+Usage:
+    df = apply_schema(df)
+    frames = union_categories([df_a, df_b])     # before pd.concat
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import pandas as pd
+
+_DD_SEATS = ("N", "Ø", "S", "V")
+_DD_STRAINS = ("NT", "S", "H", "D", "C")
+
+CATEGORY_COLUMNS: tuple[str, ...] = (
+    "ns1", "ns2", "ew1", "ew2", "ns_pair", "ew_pair",
+    "spil_url", "contract", "contract_raw", "lead", "decl", "strain",
+    "vul", "dealer", "row", "section", "par_contract", "par_side",
+    "N_hand", "Ø_hand", "S_hand", "V_hand",
+)
+INT8_COLUMNS: tuple[str, ...] = (
+    "tricks",
+    *(f"dd_{seat}_{strain}" for seat in _DD_SEATS for strain in _DD_STRAINS),
+    *(f"dd_{seat}_HCP" for seat in _DD_SEATS),
+    # derived by mvp_metrics / hole_analysis (dd_matrix.optional_ints)
+    "dd_tricks_declarer", "play_precision_dd", "contract_hardness_dd", "dd_minor_max_tricks",
+)
+FLOAT_COLUMNS: tuple[str, ...] = ("pct_NS", "pct_ØV")
+
+COLUMN_DTYPES: dict[str, str] = {
+    **{c: "category" for c in CATEGORY_COLUMNS},
+    **{c: "Int8" for c in INT8_COLUMNS},
+    **{c: "float64" for c in FLOAT_COLUMNS},
+}
+
+
+def _to_int8(s: pd.Series) -> pd.Series:
+    num = pd.to_numeric(s, errors="coerce")
+    return num.where(num.isna(), num.round()).astype("Int8")
+
+
+def apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast the COLUMN_DTYPES columns present in df (in place; returns df).
+
+    Non-numeric leftovers in numeric columns become missing.  Columns
+    already in their canonical dtype are left alone, so re-applying is cheap.
+    """
+    for col, dtype in COLUMN_DTYPES.items():
+        if col not in df.columns:
+            continue
+        s = df[col]
+        if dtype == "category":
+            if not isinstance(s.dtype, pd.CategoricalDtype):
+                df[col] = s.astype("category")
+        elif s.dtype != dtype:
+            df[col] = _to_int8(s) if dtype == "Int8" else pd.to_numeric(s, errors="coerce").astype(dtype)
+    return df
+
+
+def union_categories(frames: Sequence[pd.DataFrame]) -> list[pd.DataFrame]:
+    """
+    frames with every categorical column recoded to the union of its
+    categories, so pd.concat keeps it categorical instead of falling back
+    to object.
+    """
+    frames = list(frames)
+    categorical = {
+        c for f in frames for c in f.columns if isinstance(f[c].dtype, pd.CategoricalDtype)
+    }
+    for c in categorical:
+        categories = pd.Index(list(dict.fromkeys(
+            v for f in frames if c in f.columns for v in f[c].astype("category").cat.categories
+        )))
+        dtype = pd.CategoricalDtype(categories)
+        frames = [f.assign(**{c: f[c].astype(dtype)}) if c in f.columns else f for f in frames]
+    return frames
@@ -1,7 +1,8 @@
-import requests
 from bs4 import BeautifulSoup
 import re
 
+from bridge.http_fetch import fetch_page
+
 # ----------------------------
 # Helpers / normalisering
 # ----------------------------
@@ -47,11 +48,11 @@ def clean(text: str) -> str:
     text = text.replace("\xa0", " ")
     return re.sub(r"\s+", " ", text).strip()
 
+def soup_from_html(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, "lxml")
+
 def get_soup(url: str) -> BeautifulSoup:
-    r = requests.get(url, timeout=30)
-    r.raise_for_status()
-    r.encoding = "utf-8"
-    return BeautifulSoup(r.text, "lxml")
+    return soup_from_html(fetch_page(url).text)
 
 def to_spilresultater_url(resultater_url: str) -> str:
     url = resultater_url.replace("resultater.php", "spilresultater.php")
@@ -310,7 +311,8 @@ def scrape_spilresultater(
     spil_url: str,
     tournament_date,
     include_hands: bool = True,
-    debug_hands: bool = False
+    debug_hands: bool = False,
+    soup=None,
 ):
     """
     Scrape spilresultater from URL.
@@ -321,8 +323,12 @@ def scrape_spilresultater(
     -----------
     debug_hands: bool
         If True, print HTML debugging info for first game
+    soup: BeautifulSoup, optional
+        Already fetched page for spil_url (e.g. from a concurrent
+        http_fetch.map_ordered(fetch_page, urls) prefetch); fetched if None.
     """
-    soup = get_soup(spil_url)
+    if soup is None:
+        soup = get_soup(spil_url)
     rows = []
     hands_by_board = {}
     board_meta = {}
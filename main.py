@@ -2,6 +2,8 @@ import sys
 import argparse
 import shutil
 from datetime import datetime, timedelta, date
+from pathlib import Path
+from typing import Optional
 import pandas as pd
 import requests
 
@@ -29,14 +31,24 @@ except ImportError:
     _RICH_TEXT_AVAILABLE = False
 
 from bridge.data_cache import DataCache
+from bridge.result_store import concat_batches, decode_categories, rows_to_batch
+from bridge.schema import CATEGORY_COLUMNS, apply_schema
 from bridge.crawler import get_recent_tournaments
-from bridge.scraper import scrape_spilresultater
+from bridge.scraper import scrape_spilresultater, soup_from_html
+from bridge.http_fetch import (
+    DEFAULT_CONCURRENCY as DEFAULT_HTTP_CONCURRENCY,
+    DEFAULT_DELAY as DEFAULT_HTTP_DELAY,
+    configure as configure_http,
+    fetch_page,
+    map_ordered,
+)
 from bridge.board_identity import (
     make_cross_club_board_identity_check,
     print_cross_club_board_identity_summary,
 )
 
-from bridge.features import add_hand_features
+from bridge.enriched_store import ENRICH_STAGES, EnrichedStore, enrich_incremental
+from bridge.hand_eval import hand_eval_cache_stats
 
 from bridge.analysis import (
     add_roles_and_pct,
@@ -49,9 +61,6 @@ from bridge.analysis import (
     make_pair_declarer_report,
 )
 
-# ✅ IMPORT PHASE 2.1 REFERENCE-LAG
-from bridge.phase21_reference import add_phase21_fields
-
 # ✅ IMPORT BOARD REVIEW
 from bridge.board_review import (
     make_board_review_all_hands,
@@ -70,11 +79,25 @@ from bridge.declarer_analysis import (
     print_declarer_analysis_highlights,
 )
 
-# ✅ IMPORT MVP METRICS
-from bridge.mvp_metrics import add_mvp_metrics
-
 # ✅ IMPORT HULANALYSE
-from bridge.hole_analysis import make_hole_analysis, REPORT_DESCRIPTIONS
+from bridge.hole_analysis import make_hole_analysis, make_hole_reports, REPORT_DESCRIPTIONS
+
+# ✅ PIPELINE (stage-DAG)
+from bridge.pipeline import (
+    Pipeline,
+    PipelineError,
+    PipelineStop,
+    Stage,
+    StageStore,
+    fingerprint,
+    print_report,
+)
+
+# ✅ SPILLERINDEKS
+from bridge.player_index import PlayerIndex, pair_boards
+
+# ✅ PAR-RAPPORTER (batch for alle par)
+from bridge.pair_reports import PairSpec, load_pair_registry, pairs_with_min_boards, run_pair_reports
 
 HENRIK = "Henrik Friis"
 PER = "Per Føge Jensen"
@@ -87,6 +110,7 @@ DEFAULT_CLUBNOS = (1, 2, 3)
 # Use unique filename to avoid Windows file-lock issues
 OUTPUT_FILE = f"Henrik_Per_ANALYSE_{datetime.now():%Y%m%d_%H%M}.xlsx"
 LATEST_OUTPUT_FILE = "Henrik_Per_ANALYSE_latest.xlsx"
+PAIR_REPORTS_DIR = Path("pair_reports")
 
 
 def _parse_clubnos(clubnos_text: str | None) -> list[int]:
@@ -467,133 +491,163 @@ def parse_arguments():
         action='store_false',
         help='Deaktivér test-mode og brug normal periode-udvælgelse'
     )
-    
-    return parser.parse_args()
 
+    parser.add_argument(
+        '--http-concurrency',
+        type=int,
+        default=DEFAULT_HTTP_CONCURRENCY,
+        help=f'Antal samtidige HTTP-forespørgsler mod bridge.dk (default: {DEFAULT_HTTP_CONCURRENCY})'
+    )
 
-def _load_all_cached_rows(cache: DataCache) -> list[dict]:
-    """Load all rows from cached tournaments, preserving/setting section labels."""
-    rows: list[dict] = []
-
-    tournaments = cache.manifest.get("tournaments", {})
-    entries: list[dict] = []
-    for cache_key, tmeta in tournaments.items():
-        if not isinstance(tmeta, dict):
-            continue
+    parser.add_argument(
+        '--http-delay',
+        type=float,
+        default=DEFAULT_HTTP_DELAY,
+        help=f'Mindste pause i sekunder mellem to forespørgsler (default: {DEFAULT_HTTP_DELAY})'
+    )
 
-        tid_val = tmeta.get("tournament_id")
-        try:
-            tid = int(tid_val)
-        except (TypeError, ValueError):
-            key_tail = str(cache_key).split(":")[-1]
-            try:
-                tid = int(key_tail)
-            except (TypeError, ValueError):
-                continue
+    parser.add_argument(
+        '--stage',
+        type=str,
+        default=None,
+        help='Kør kun disse stages (komma-separeret, fx hole_analysis) og dem der afhænger af dem; '
+             'resten indlæses fra sidste kørsel'
+    )
 
-        clubno_val = tmeta.get("clubno")
-        try:
-            clubno = int(clubno_val) if clubno_val is not None else None
-        except (TypeError, ValueError):
-            clubno = None
+    parser.add_argument(
+        '--pipeline-workers',
+        type=int,
+        default=4,
+        help='Antal stages der må køre samtidigt (default: 4, 1 = sekventielt)'
+    )
 
-        if clubno is None and ":" in str(cache_key):
-            key_head = str(cache_key).split(":", 1)[0]
-            try:
-                clubno = int(key_head)
-            except (TypeError, ValueError):
-                clubno = None
+    parser.add_argument(
+        '--pairs',
+        type=str,
+        default=None,
+        help='Batch: rapportsæt pr. par fra pair_registry.yaml (komma-separerede pair_id eller "all")'
+    )
 
-        mainclubno_val = tmeta.get("mainclubno")
-        try:
-            mainclubno = int(mainclubno_val) if mainclubno_val is not None else None
-        except (TypeError, ValueError):
-            mainclubno = None
+    parser.add_argument(
+        '--pairs-min-boards',
+        type=int,
+        default=None,
+        help='Batch: rapportsæt for alle par med mindst N boards i cache-historikken'
+    )
 
-        entries.append(
-            {
-                "cache_key": str(cache_key),
-                "tournament_id": tid,
-                "clubno": clubno,
-                "mainclubno": mainclubno,
-            }
-        )
+    parser.add_argument(
+        '--pair-workers',
+        type=int,
+        default=None,
+        help='Antal processer til par-rapporterne (default: antal CPU-kerner)'
+    )
 
-    for entry in sorted(entries, key=lambda e: e["cache_key"]):
-        tid = entry["tournament_id"]
-        clubno = entry["clubno"]
-        mainclubno = entry["mainclubno"]
+    return parser.parse_args()
 
-        cached_data = cache.get_cached_tournament(tid, clubno=clubno)
-        if not cached_data:
-            continue
 
-        sections = cached_data.get("sections", {})
-        if not isinstance(sections, dict):
-            continue
+def _load_all_cached_frame(cache: DataCache) -> pd.DataFrame:
+    """Load all rows from cached tournaments, preserving/setting section labels.
 
-        for section_name, section_rows in sections.items():
-            if not isinstance(section_rows, list):
-                continue
+    One streamed scan of the result store (ordered by cache key, then saved
+    order) in typed batches; section / club / tournament id are filled from
+    the tournament when a stored row lacks them.
+    """
+    tournaments = cache.manifest.get("tournaments", {})
+    df = decode_categories(
+        concat_batches(cache.store.iter_batches(cache_keys=[str(k) for k in tournaments])),
+        keep=CATEGORY_COLUMNS,
+    )
 
-            for raw_row in section_rows:
-                if not isinstance(raw_row, dict):
-                    continue
+    # Normalize date field name for downstream grouping.
+    if "date" in df.columns:
+        if "tournament_date" in df.columns:
+            df["tournament_date"] = df["tournament_date"].where(
+                df["tournament_date"].notna() & (df["tournament_date"] != ""), df["date"]
+            )
+        else:
+            df["tournament_date"] = df["date"]
 
-                row = dict(raw_row)
+    return apply_schema(df)
 
-                # Keep explicit section if already present, else use map key.
-                if not row.get("section"):
-                    row["section"] = section_name
 
-                if not row.get("clubno") and clubno is not None:
-                    row["clubno"] = clubno
+def _pair_rows(df: pd.DataFrame, index: Optional[PlayerIndex] = None) -> pd.DataFrame:
+    """Rows where both Henrik and Per sit at the table (index: prebuilt for df)."""
+    return pair_boards(df, HENRIK, PER, index)
 
-                if not row.get("mainclubno") and mainclubno is not None:
-                    row["mainclubno"] = mainclubno
 
-                if not row.get("tournament_id"):
-                    row["tournament_id"] = tid
+# ==================== PAR-RAPPORTER (BATCH) ====================
 
-                # Normalize date field name for downstream grouping.
-                if not row.get("tournament_date") and row.get("date"):
-                    row["tournament_date"] = row.get("date")
+def _select_pairs(args, df: pd.DataFrame) -> list[PairSpec]:
+    """--pairs-min-boards N → alle par med ≥N boards; ellers --pairs fra registry."""
+    if args.pairs_min_boards:
+        return pairs_with_min_boards(df, args.pairs_min_boards)
 
-                rows.append(row)
+    registry = load_pair_registry()
+    wanted = [p.strip() for p in (args.pairs or "").split(",") if p.strip()]
+    if not wanted or wanted == ["all"]:
+        return registry
+    known = {pair.pair_id: pair for pair in registry}
+    for pair_id in wanted:
+        if pair_id not in known:
+            print(f"  ⚠ Ukendt pair_id i pair_registry.yaml: {pair_id}")
+    return [known[p] for p in wanted if p in known]
 
-    return rows
 
+def run_pair_batch(args, cache: DataCache) -> None:
+    """
+    Rapportsæt (roller, declarer, klassiske rapporter, hulanalyse) for mange
+    par fra én fælles beriget historik – én Excel-fil pr. par.
+    """
+    print("\n👥 Par-rapporter (batch)...")
+    df_history = _load_all_cached_frame(cache)
+    if df_history.empty:
+        print("Ingen cache-historik fundet.")
+        return
 
-def main():
-    args = parse_arguments()
-    requested_clubs = _parse_clubnos(args.clubnos)
+    enriched_store = EnrichedStore(cache.data_dir / "enriched.db")
+    try:
+        df_enriched, enrich_stats = enrich_incremental(
+            df_history, enriched_store, namespace="history", stages=ENRICH_STAGES,
+        )
+    finally:
+        enriched_store.close()
+    print(
+        f"  ℹ Beriget historik: {len(df_enriched)} rækker, {enrich_stats.reused} datoer genbrugt, "
+        f"{enrich_stats.recomputed} genberegnet"
+    )
 
-    if not requested_clubs:
-        print("Ingen gyldige clubno værdier fundet. Brug fx --clubnos=1,2,3")
+    pairs = _select_pairs(args, df_enriched)
+    if not pairs:
+        print("  (Ingen par at lave rapporter for)")
         return
-    
-    # ==================== SETUP CACHE ====================
-    print("🚀 Initialiserer cache system...")
-    cache = DataCache(data_dir="data")
-    
-    # ==================== HANDLE SPECIAL FLAGS ====================
-    
-    # Show cache status
-    if args.cache_status:
-        cache.print_cache_status()
-        return
-    
-    # Clear cache
-    if args.clear_cache:
-        response = input("⚠️  Sikker på du vil slette hele cache? (ja/nej): ")
-        if response.lower() in ['ja', 'yes', 'y']:
-            cache.clear_cache(confirm=True)
-        return
-    
-    # Create backup
-    if args.backup:
-        cache.create_backup()
-    
+
+    print(f"  ℹ {len(pairs)} par → {PAIR_REPORTS_DIR}/")
+    for result in run_pair_reports(df_enriched, pairs, PAIR_REPORTS_DIR, max_workers=args.pair_workers):
+        if result.path is None:
+            print(f"  - {result.pair_id}: ingen boards")
+        else:
+            print(f"  ✓ {result.pair_id}: {result.boards} boards → {result.path} ({result.seconds:.1f}s)")
+
+
+# ==================== PIPELINE STAGES ====================
+#
+# Hver stage tager sine inputs som keyword-argumenter og returnerer en dict
+# med sine outputs; _build_pipeline() binder dem sammen til en DAG.
+
+def _unchanged_section_rows(saved: dict, section_name: str, content_hash: str) -> Optional[list]:
+    """Rækkerne for en section fra den gemte turnering, hvis siden har samme content hash
+    som da rækkerne blev gemt; ellers None (sektionen skal parses igen).
+
+    Sammenlignes mod den gemte turnering og ikke mod http-cachen: rå-cachen opdateres
+    allerede ved hentning, så en fejl før save ville ellers efterlade forældede rækker.
+    """
+    if not content_hash or (saved.get("page_hashes") or {}).get(section_name) != content_hash:
+        return None
+    return (saved.get("sections") or {}).get(section_name) or None
+
+
+def _stage_collect(args, cache: DataCache, requested_clubs: list[int]) -> dict:
+    """Crawl bridge.dk, scrape nye/ændrede turneringer og indlæs resten fra cache."""
     # ==================== PARSE DATE RANGE ====================
     print("Starter crawler + scraper + analyse...")
 
@@ -608,11 +662,11 @@ def main():
             from_date=args.from_date,
             to_date=args.to_date
         )
-    
+
     force_refresh = args.force_refresh
     if force_refresh:
         print("🔄 FORCE REFRESH MODE - Scraper alt på tværs af regler")
-    
+
     # ==================== CRAWL BRIDGE.DK ====================
     print(
         f"📡 Søger turneringer på bridge.dk fra {start_date} til {end_date} "
@@ -643,13 +697,11 @@ def main():
             if _club_matches_request(requested_clubs, t.get('clubno'))
         ]
         if not tournaments_in_range:
-            print("Ingen cachede turneringer fundet i perioden, og bridge.dk kunne ikke nås.")
-            return
+            raise PipelineStop("Ingen cachede turneringer fundet i perioden, og bridge.dk kunne ikke nås.")
         print(f"Antal cachede turneringer i periode [{start_date} - {end_date}]: {len(tournaments_in_range)}")
     else:
         if not all_tournaments_on_site:
-            print("Ingen turneringer fundet indenfor perioden.")
-            return
+            raise PipelineStop("Ingen turneringer fundet indenfor perioden.")
 
         print(f"Antal turneringer fundet på bridge.dk (alle clubs): {len(all_tournaments_on_site)}")
 
@@ -667,11 +719,11 @@ def main():
         key=lambda t: (t.get('date'), t.get('clubno') or -1, t.get('tournament_id')),
         reverse=True,
     )
-    
+
     # ==================== BESLUT OM SCRAPING ====================
     print("\n📋 Beslutter hvad skal skrabes...")
     print("="*70)
-    
+
     tournaments_to_scrape = []
     tournaments_to_use_cache = []
 
@@ -683,10 +735,10 @@ def main():
             tournament_id = tournament['tournament_id']
             tournament_date = tournament['date']
             clubno = tournament.get('clubno')
-            
+
             # Tjek om bruger specifikt bad om denne periode (hvis --from/--to er brugt)
             user_requested_older = bool(args.from_date and args.to_date)
-            
+
             should_scrape = cache.should_scrape_tournament(
                 tournament_id=tournament_id,
                 tournament_date=tournament_date,
@@ -694,59 +746,86 @@ def main():
                 force_refresh=force_refresh,
                 user_requested_older=user_requested_older
             )
-            
+
             if should_scrape:
                 tournaments_to_scrape.append(tournament)
             else:
                 tournaments_to_use_cache.append(tournament)
-    
+
     print("="*70)
     print(f"\n📊 Beslutninger:")
     print(f"  🔄 SCRAPE: {len(tournaments_to_scrape)} turneringer")
     print(f"  💾 CACHE: {len(tournaments_to_use_cache)} turneringer")
-    
+
     # ==================== SCRAPE & CACHE ====================
     print("\n🌐 Starter scraping...")
-    all_rows = []
+    # Hver section konverteres straks til en typed batch (kategoriske strenge);
+    # row-dicts lever kun til turneringen er gemt.
+    row_batches: list[pd.DataFrame] = []
     tournaments_scraped = 0
-    
+
+    # Alle section-sider hentes samtidigt (http_fetch), men behandles i fast rækkefølge.
+    # Betinget GET mod rå-cachen: uændrede sider parses ikke igen.
+    section_pages = map_ordered(
+        fetch_page,
+        [s['spilresultater_url'] for t in tournaments_to_scrape for s in t['sections']],
+    )
+
     for t_idx, tournament in enumerate(tournaments_to_scrape, 1):
         tournament_id = tournament['tournament_id']
         tdate = tournament['date']
         sections = tournament['sections']
         clubno = tournament.get('clubno')
         mainclubno = tournament.get('mainclubno', args.mainclubno)
-        
+
         print(
             f"\n({t_idx}/{len(tournaments_to_scrape)}) SCRAPE: {tdate.date()} – "
             f"Turnering {tournament_id} (club {clubno})"
         )
         print(f"  Sections: {', '.join([s['name'] for s in sections])}")
-        
-        tournament_rows = []
+
+        n_tournament_rows = 0
         tournament_data = {
             "tournament_id": tournament_id,
             "clubno": clubno,
             "mainclubno": mainclubno,
             "date": str(tdate.date()),
             "sections": {},
+            "page_hashes": {},
         }
-        
+
+        saved_tournament = None
+
         # Scrape hver section
         for section in sections:
             section_name = section['name']
             section_url = section['spilresultater_url']
-            
+
             print(f"  → Scraper section {section_name}: {section_url}")
-            
+
             try:
-                rows = scrape_spilresultater(
-                    section_url,
-                    tdate,
-                    include_hands=True,
-                    debug_hands=False,
-                )
-                
+                _, page = next(section_pages)
+                if isinstance(page, Exception):
+                    raise page
+
+                # Siden er uændret siden turneringen sidst blev gemt: genbrug gemte rækker
+                if saved_tournament is None:
+                    saved_tournament = cache.get_cached_tournament(tournament_id, clubno=clubno) or {}
+                rows = _unchanged_section_rows(saved_tournament, section_name, page.content_hash)
+                if rows:
+                    for row in rows:
+                        row['tournament_date'] = str(tdate.date())
+                    print("      = Uændret side (content hash) – parse sprunget over")
+
+                if rows is None:
+                    rows = scrape_spilresultater(
+                        section_url,
+                        tdate,
+                        include_hands=True,
+                        debug_hands=False,
+                        soup=soup_from_html(page.text),
+                    )
+
                 # Tilføj section kolonne og ret evt. forkert row-detektion.
                 # bridge.dk's section-navn fra crawl er autoritativt; scraper-
                 # detektionen kan fejle (fx "A-rækken" vises for alle sektioner).
@@ -756,16 +835,18 @@ def main():
                     row['clubno'] = clubno
                     row['mainclubno'] = mainclubno
                     row['tournament_id'] = tournament_id
-                
+
                 print(f"      ✓ {len(rows)} rækker")
-                tournament_rows.extend(rows)
+                row_batches.append(rows_to_batch(rows))
+                n_tournament_rows += len(rows)
                 tournament_data["sections"][section_name] = rows
-                
+                tournament_data["page_hashes"][section_name] = page.content_hash
+
             except Exception as e:
                 print(f"      !!! Fejl ved scraping: {e}")
-        
+
         # Gem i cache
-        if tournament_rows:
+        if n_tournament_rows:
             cache.save_tournament_data(
                 tournament_id=tournament_id,
                 tournament_date=tdate,
@@ -774,55 +855,62 @@ def main():
                 clubno=clubno,
                 mainclubno=mainclubno,
             )
-            all_rows.extend(tournament_rows)
             tournaments_scraped += 1
-    
-        # ==================== LOAD CACHED DATA ====================
+
+    section_pages.close()
+
+    # ==================== LOAD CACHED DATA ====================
     print(f"\n💾 Indlæser {len(tournaments_to_use_cache)} turneringer fra cache...")
-    
+
     for tournament in tournaments_to_use_cache:
         tournament_id = tournament['tournament_id']
         tdate = tournament['date']
         clubno = tournament.get('clubno')
-        mainclubno = tournament.get('mainclubno', args.mainclubno)
-        
-        cached_data = cache.get_cached_tournament(tournament_id, clubno=clubno)
-        
-        if cached_data:
+
+        # Section / club / turnerings-id udfyldes fra turneringen i store
+        cached_batch = cache.get_cached_tournament_batch(tournament_id, clubno=clubno)
+
+        if cached_batch is not None and len(cached_batch):
             print(f"  ✓ Turnering {tournament_id} ({tdate.date()}, club {clubno}) - fra cache")
-            
-            # ✅ KONVERTER strings tilbage til datetime
-            # Fordi JSON lagrer alt som strings
-            for section_name, rows in cached_data.get("sections", {}).items():
-                for row in rows:
-                    row['section'] = section_name
-                    row['clubno'] = row.get('clubno', clubno)
-                    row['mainclubno'] = row.get('mainclubno', mainclubno)
-                    row['tournament_id'] = row.get('tournament_id', tournament_id)
-                    
-                    # Konverter date strings tilbage til date objekter
-                    if 'date' in row and isinstance(row['date'], str):
-                        try:
-                            row['date'] = datetime.strptime(row['date'], '%Y-%m-%d').date()
-                        except:
-                            pass
-                    
-                    all_rows.append(row)
+            row_batches.append(cached_batch)
         else:
-            print(f"  ❌ Turnering {tournament_id} ({tdate.date()}, club {clubno}) - FEJL, cache findes ikke")# ==================== PROCESS DATA ====================
-    
-    if not all_rows:
-        print("Ingen data fundet.")
-        return
-    
-    df_all = pd.DataFrame(all_rows)
+            print(f"  ❌ Turnering {tournament_id} ({tdate.date()}, club {clubno}) - FEJL, cache findes ikke")
+
+    if not row_batches:
+        raise PipelineStop("Ingen data fundet.")
+
+    return {
+        "row_batches": row_batches,
+        "n_tournaments": len(tournaments_in_range),
+        "tournaments_scraped": tournaments_scraped,
+        "n_from_cache": len(tournaments_to_use_cache),
+        "start_date": start_date,
+        "end_date": end_date,
+        # Skifter når result store ændres: history-stagens cache-nøgle (og den
+        # venter derfor på at collect har gemt nye turneringer)
+        "store_fingerprint": fingerprint(sorted(cache.store.tournament_hashes().items())),
+    }
+
+
+def _stage_identity_check(
+    row_batches: list[pd.DataFrame],
+    n_tournaments: int,
+    tournaments_scraped: int,
+    n_from_cache: int,
+    requested_clubs: list[int],
+    start_date: date,
+    end_date: date,
+) -> dict:
+    """Byg df_all, check board-identitet på tværs af clubs og A/B/C-konsistens."""
+    # Kanoniske dtypes (bridge/schema.py): kategoriske strenge, Int8 DD/stik, float64 pct
+    df_all = apply_schema(decode_categories(concat_batches(row_batches), keep=CATEGORY_COLUMNS))
 
     if 'clubno' in df_all.columns:
         df_all['clubno'] = pd.to_numeric(df_all['clubno'], errors='coerce')
-    
-    print(f"\n✓ I alt {len(df_all)} rækker fra {len(tournaments_in_range)} turneringer")
+
+    print(f"\n✓ I alt {len(df_all)} rækker fra {n_tournaments} turneringer")
     print(f"  Sections: {df_all['section'].unique().tolist()}")
-    print(f"  Scraped: {tournaments_scraped}, fra Cache: {len(tournaments_to_use_cache)}")
+    print(f"  Scraped: {tournaments_scraped}, fra Cache: {n_from_cache}")
 
     # ✅ KLUB-IDENTITETSCHECK + FILTER AF MISMATCHED BOARDS
     print("\nChecker board-identitet på tværs af clubno + rækker (A/B/C)...")
@@ -885,8 +973,7 @@ def main():
         )
 
     if df_all.empty:
-        print("Ingen data tilbage efter board-identitetsfilter.")
-        return
+        raise PipelineStop("Ingen data tilbage efter board-identitetsfilter.")
 
     # ✅ CHECK BOARD-KONSISTENS A/B/C
     print("\nChecker board-konsistens på tværs af rækker A/B/C (seneste turnering)...")
@@ -898,36 +985,65 @@ def main():
     )
     print_latest_tournament_board_consistency_summary(board_abc_summary)
 
-    df_board_abc_summary = pd.DataFrame([board_abc_summary])
+    return {
+        "df_all": df_all,
+        "df_cross_club_board_check": df_cross_club_board_check,
+        "cross_club_summary": cross_club_summary,
+        "df_board_abc_check": df_board_abc_check,
+        "df_board_abc_summary": pd.DataFrame([board_abc_summary]),
+    }
+
 
-    print("\nTilføjer hånd-features...")
-    df_all = add_hand_features(df_all)
+def _stage_enrich(df_all: pd.DataFrame, data_dir) -> dict:
+    """hånd-features → Phase 2.1 reference-lag → MVP metrics for perioden."""
+    # (materialiseret pr. spilledato i enriched.db; uændrede datoer genbruges)
+    print("\nTilføjer hånd-features, Phase 2.1 reference-lag og MVP metrikker...")
+    enriched_store = EnrichedStore(data_dir / "enriched.db")
+    try:
+        df_enriched, enrich_stats = enrich_incremental(
+            df_all, enriched_store, namespace="period", stages=ENRICH_STAGES, prune=True,
+        )
+    finally:
+        enriched_store.close()
+    print(
+        f"  ✓ Beriget: {enrich_stats.reused} datoer genbrugt, "
+        f"{enrich_stats.recomputed} genberegnet"
+    )
+    print(f"    - Board Types fundet: {df_enriched['Board_Type'].value_counts().to_dict()}")
+    print(f"    - Split boards (competitive): {df_enriched['competitive_flag'].sum()}")
+    return {"df_enriched": df_enriched}
 
-    # ✅ TILFØJ PHASE 2.1 REFERENCE-LAG
-    print("Tilføjer Phase 2.1 reference-lag (fra alle sections A+B+C+D...)...")
-    df_all = add_phase21_fields(df_all, n_min=12)
-    print("  ✓ Phase 2.1 felt-data beregnet")
-    print(f"    - Board Types fundet: {df_all['Board_Type'].value_counts().to_dict()}")
-    print(f"    - Split boards (competitive): {df_all['competitive_flag'].sum()}")
 
-    # ✅ TILFØJ MVP METRICS
-    print("Tilføjer MVP analyse-metrikker (melding, spilleføring, udspil)...")
-    df_all = add_mvp_metrics(df_all)
-    print("  ✓ MVP metrikker beregnet")
+def _stage_history(cache: DataCache, store_fingerprint: str) -> dict:
+    """
+    Hele cache-historikken som én DataFrame plus dens spillerindeks.
 
-    # ✅ HULANALYSE (alle turneringer i cache, H+P som par)
+    store_fingerprint er stage-cachens nøgle: uændret result store → genbrugt.
+    """
+    df_history = _load_all_cached_frame(cache)
+    return {"df_history": df_history, "history_index": PlayerIndex.from_frame(df_history)}
+
+
+def _stage_hole_analysis(df_history: pd.DataFrame, df_enriched: pd.DataFrame, data_dir) -> dict:
+    """Hulanalyse (alle turneringer i cache, H+P som par)."""
     print("\nGenererer Hulanalyse (zone/HCP/LTC/DD/felt for H+P som par)...")
-    _all_cached_rows = _load_all_cached_rows(cache)
-    if _all_cached_rows:
-        df_all_cached = pd.DataFrame(_all_cached_rows)
-        if "tournament_date" not in df_all_cached.columns and "date" in df_all_cached.columns:
-            df_all_cached["tournament_date"] = df_all_cached["date"]
-        df_all_cached = add_hand_features(df_all_cached)
-        df_all_cached = add_phase21_fields(df_all_cached)
-        df_all_cached = add_mvp_metrics(df_all_cached)
-        hole_reports = make_hole_analysis(df_all_cached)
+    if not df_history.empty:
+        # Materialiseret berigelse pr. spilledato: kun nye/ændrede datoer
+        # (eller ændret kode/YAML) genberegnes.
+        enriched_store = EnrichedStore(data_dir / "enriched.db")
+        try:
+            df_hole_pair, enrich_stats = enrich_incremental(
+                df_history, enriched_store, namespace="history", prune=True,
+            )
+        finally:
+            enriched_store.close()
+        print(
+            f"  ℹ Beriget historik: {enrich_stats.reused} datoer genbrugt, "
+            f"{enrich_stats.recomputed} genberegnet ({enrich_stats.partitions} i alt)"
+        )
+        hole_reports = make_hole_reports(df_hole_pair)
     else:
-        hole_reports = make_hole_analysis(df_all)
+        hole_reports = make_hole_analysis(df_enriched)
     hole_metadata = hole_reports.get("_metadata", {})
     _hole_total = (
         hole_reports["zone_summary"]["Boards"].sum()
@@ -935,62 +1051,78 @@ def main():
         else 0
     )
     print(f"  ✓ Hulanalyse: {_hole_total} boards analyseret fra {hole_metadata.get('n_tournaments', '?')} turneringer")
+    return {"hole_reports": hole_reports}
 
-    # ✅ BOARD REVIEW ANALYSE (kun A-rækken)
-    print("\nGenererer Board Review rapporter (kun A-rækken)...")
-    df_a_only = df_all[df_all['section'] == 'A'].copy()
-    
+
+def _stage_section_a(df_enriched: pd.DataFrame) -> dict:
+    """Board review, declarer analysis og klassiske rapporter bruger kun A-rækken."""
+    df_a_only = df_enriched[df_enriched['section'] == 'A'].copy()
     if len(df_a_only) == 0:
-        print("Ingen data fra A-rækken!")
-        return
-    
+        raise PipelineStop("Ingen data fra A-rækken!")
+    return {"df_a_only": df_a_only}
+
+
+def _stage_board_review(df_a_only: pd.DataFrame) -> dict:
+    """Board Review rapporter (kun A-rækken)."""
+    print("\nGenererer Board Review rapporter (kun A-rækken)...")
     df_board_review_all = make_board_review_all_hands(df_a_only)
     df_board_review_summary = make_board_review_summary(df_a_only)
-    
+
     # Statistik
     review_stats = board_review_statistics(df_board_review_all, df_board_review_summary)
     print(f"  ✓ Board Review: {len(df_board_review_all)} boards med hand-records")
     print_board_review_stats(review_stats)
-    
-    # ✅ DECLARER ANALYSIS (kun A-rækken)
+    _memo = hand_eval_cache_stats()
+    print(
+        f"  ℹ Hånd-memo: {_memo['hits']} hits / {_memo['misses']} misses "
+        f"({_memo['hit_rate']:.0%} hit rate, {_memo['size']} hænder)"
+    )
+    return {
+        "df_board_review_all": df_board_review_all,
+        "df_board_review_summary": df_board_review_summary,
+    }
+
+
+def _stage_declarer_analysis(df_a_only: pd.DataFrame) -> dict:
+    """Declarer Analysis (kun A-rækken)."""
     print("\nGenererer Declarer Analysis...")
-    df_pair = df_a_only[
-        df_a_only.apply(
-            lambda r: (HENRIK in [r["ns1"], r["ns2"], r["ew1"], r["ew2"]]) and
-                      (PER in [r["ns1"], r["ns2"], r["ew1"], r["ew2"]]),
-            axis=1
-        )
-    ].copy()
-    
+    df_pair = _pair_rows(df_a_only)
+
     if len(df_pair) == 0:
         print("  (Ingen boards hvor Henrik og Per spiller sammen i A-rækken)")
         df_declarer_analysis = pd.DataFrame()
     else:
         # Tilføj roller + pct
         df_pair = add_roles_and_pct(df_pair, henrik=HENRIK, per=PER)
-        
+
         # Lav Declarer Analysis
         df_declarer_analysis = make_declarer_analysis(df_pair, henrik=HENRIK, per=PER)
-        
+
         print(f"  ✓ Declarer Analysis: {len(df_declarer_analysis)} boards")
-        
+
         # Print highlights
         print_declarer_analysis_highlights(df_declarer_analysis, top_n=5)
-    
-    # ✅ KLASSISKE RAPPORTER
+    return {"df_declarer_analysis": df_declarer_analysis}
+
+
+def _stage_classic_reports(
+    df_history: pd.DataFrame,
+    history_index: PlayerIndex,
+    df_a_only: pd.DataFrame,
+    last_tuesday_only: bool,
+) -> dict:
+    """Klassiske rapporter + Rapport - Aften / Rapport - Kvartal."""
     print("\nGenererer klassiske rapporter...")
 
     # Build classic reports from current filtered dataset in last-tuesday test mode.
-    use_cache_history_for_classic = not args.last_tuesday_only
+    use_cache_history_for_classic = not last_tuesday_only
 
     if use_cache_history_for_classic:
-        cached_rows_all = _load_all_cached_rows(cache)
-        if cached_rows_all:
-            df_classic_source = pd.DataFrame(cached_rows_all)
-            if "section" in df_classic_source.columns:
-                df_classic_source = df_classic_source[df_classic_source["section"] == "A"].copy()
-            if "tournament_date" not in df_classic_source.columns and "date" in df_classic_source.columns:
-                df_classic_source["tournament_date"] = df_classic_source["date"]
+        if not df_history.empty:
+            if "section" in df_history.columns:
+                df_classic_source = df_history[df_history["section"] == "A"].copy()
+            else:
+                df_classic_source = df_history.copy()
 
             unique_dates = (
                 df_classic_source["tournament_date"].nunique()
@@ -1009,30 +1141,13 @@ def main():
         print("  ℹ Klassiske rapporter bruger filtreret test-datasæt (sidste tirsdag).")
 
     # Filter til kun boards hvor de spiller sammen
-    df_pair_all = df_classic_source[
-        df_classic_source.apply(
-            lambda r: (HENRIK in [r["ns1"], r["ns2"], r["ew1"], r["ew2"]]) and
-                      (PER in [r["ns1"], r["ns2"], r["ew1"], r["ew2"]]),
-            axis=1
-        )
-    ].copy()
+    df_pair_all = _pair_rows(df_classic_source)
 
     # Rapport - Aften skal vise udvikling over tid fra hele database/cache
     # for turneringer hvor BÅDE Henrik og Per deltager.
     df_pair_history_evening = pd.DataFrame()
-    cached_rows_for_evening = _load_all_cached_rows(cache)
-    if cached_rows_for_evening:
-        df_pair_history_evening = pd.DataFrame(cached_rows_for_evening)
-        if "tournament_date" not in df_pair_history_evening.columns and "date" in df_pair_history_evening.columns:
-            df_pair_history_evening["tournament_date"] = df_pair_history_evening["date"]
-
-        df_pair_history_evening = df_pair_history_evening[
-            df_pair_history_evening.apply(
-                lambda r: (HENRIK in [r["ns1"], r["ns2"], r["ew1"], r["ew2"]]) and
-                          (PER in [r["ns1"], r["ns2"], r["ew1"], r["ew2"]]),
-                axis=1
-            )
-        ].copy()
+    if not df_history.empty:
+        df_pair_history_evening = _pair_rows(df_history, history_index)
 
         if not df_pair_history_evening.empty:
             evening_dates = (
@@ -1044,9 +1159,9 @@ def main():
                 f"  ℹ Rapport - Aften bruger fuld cache-historik: "
                 f"{len(df_pair_history_evening)} rækker på {evening_dates} spilledatoer"
             )
-    elif args.last_tuesday_only:
+    elif last_tuesday_only:
         print("  ⚠ Rapport - Aften: ingen cache-historik fundet; bruger valgt periode.")
-    
+
     # Rapport - Kvartal: always use full cache history filtered to Henrik+Per boards,
     # exactly like Rapport - Aften.  df_pair_history_evening already carries that data.
     if len(df_pair_history_evening) > 0:
@@ -1087,14 +1202,47 @@ def main():
             print("  (Ingen data til klassiske rapporter)")
         else:
             print("  ✓ Evening/Quarterly rapporter genereret fra historik")
-    
-    # ✅ FIELD REPORTS
+
+    return {
+        "df_declarer": df_declarer,
+        "df_summary": df_summary,
+        "df_tournament": df_tournament,
+        "df_evening_matrix": df_evening_matrix,
+        "df_quarterly": df_quarterly,
+    }
+
+
+def _stage_field_reports(df_enriched: pd.DataFrame) -> dict:
+    """Field Reports (alle par i perioden)."""
     print("\nGenererer Field Reports...")
-    df_field_defense = make_pair_field_report(df_all, min_boards=50)
-    df_field_declarer = make_pair_declarer_report(df_all, min_boards=50)
+    df_field_defense = make_pair_field_report(df_enriched, min_boards=50)
+    df_field_declarer = make_pair_declarer_report(df_enriched, min_boards=50)
     print(f"  ✓ Field Reports: {len(df_field_defense)} par i defense, {len(df_field_declarer)} par i declarer")
-    
-    # ✅ SKRIV EXCEL
+    return {"df_field_defense": df_field_defense, "df_field_declarer": df_field_declarer}
+
+
+def _stage_write_excel(
+    df_enriched: pd.DataFrame,
+    df_cross_club_board_check: pd.DataFrame,
+    cross_club_summary: dict,
+    df_board_abc_check: pd.DataFrame,
+    df_board_abc_summary: pd.DataFrame,
+    df_board_review_all: pd.DataFrame,
+    df_board_review_summary: pd.DataFrame,
+    df_declarer_analysis: pd.DataFrame,
+    df_declarer: pd.DataFrame,
+    df_summary: pd.DataFrame,
+    df_tournament: pd.DataFrame,
+    df_evening_matrix: pd.DataFrame,
+    df_quarterly: pd.DataFrame,
+    df_field_defense: pd.DataFrame,
+    df_field_declarer: pd.DataFrame,
+    hole_reports: dict,
+) -> dict:
+    """Skriv alle rapporter til Excel og opdatér den faste kopi."""
+    df_all = df_enriched
+    hole_metadata = hole_reports.get("_metadata", {})
+
     print(f"\nSkriver Excel: {OUTPUT_FILE}")
     with pd.ExcelWriter(OUTPUT_FILE, engine='openpyxl') as writer:
         if not df_cross_club_board_check.empty:
@@ -1115,11 +1263,11 @@ def main():
         # Board Review
         df_board_review_all.to_excel(writer, sheet_name='Board_Review_All', index=False)
         df_board_review_summary.to_excel(writer, sheet_name='Board_Review_Summary', index=False)
-        
+
         # Declarer Analysis
         if not df_declarer_analysis.empty:
             df_declarer_analysis.to_excel(writer, sheet_name='Declarer_Analysis', index=False)
-        
+
         # Klassiske rapporter
         if not df_declarer.empty:
             df_declarer.to_excel(writer, sheet_name='Declarer_List', index=False)
@@ -1149,7 +1297,7 @@ def main():
                 ws_quarter,
                 metrics=['Mean_pct', 'Count', 'Std', 'CI95_low', 'CI95_high']
             )
-        
+
         # Field Reports
         if not df_field_defense.empty:
             df_field_defense.to_excel(writer, sheet_name='Field_Defense', index=False)
@@ -1218,10 +1366,182 @@ def main():
         f"✅ Analyse færdig! Output: {OUTPUT_FILE} | "
         f"Fast kopi: {LATEST_OUTPUT_FILE} ({latest_status})"
     )
-    
+    return {"output_file": OUTPUT_FILE}
+
+
+# Kode og YAML bag de cachede rapport-stages (se Stage.sources).  Board
+# review kører meldemaskinen (opening_bid.suggest_first_round_for_row), som
+# læser systemdefinitionerne; declarer/classic bruger _pair_rows og HENRIK/PER
+# fra main.py selv.
+_BIDDING_SOURCES = (
+    "bridge.opening_bid", "bridge.auction_state",
+    "bridge/systemdefinition.yaml", "bridge/systemdefinition_v2.yaml",
+    "bridge/system_profiles.yaml", "bridge/match_config.yaml", "bridge/pair_registry.yaml",
+)
+_ANALYSIS_SOURCES = ("bridge.analysis", "bridge.phase21_fields", "bridge.player_index")
+
+
+def _build_pipeline() -> Pipeline:
+    """
+    Aftenens analyse som DAG:
+
+        collect → identity_check → enrich → section_a → board_review / declarer_analysis
+                └→ history ─────────────┴→ hole_analysis     classic_reports
+                                          └→ field_reports
+        ... → write_excel
+
+    Rapport-stages med cache=True springes over når deres input (og kode)
+    er uændret siden sidste kørsel; history genbruges så længe result store
+    er uændret.
+    """
+    return Pipeline([
+        Stage(
+            "collect", _stage_collect,
+            inputs=("args", "cache", "requested_clubs"),
+            outputs=(
+                "row_batches", "n_tournaments", "tournaments_scraped", "n_from_cache",
+                "start_date", "end_date", "store_fingerprint",
+            ),
+        ),
+        Stage(
+            "identity_check", _stage_identity_check,
+            inputs=(
+                "row_batches", "n_tournaments", "tournaments_scraped", "n_from_cache",
+                "requested_clubs", "start_date", "end_date",
+            ),
+            outputs=(
+                "df_all", "df_cross_club_board_check", "cross_club_summary",
+                "df_board_abc_check", "df_board_abc_summary",
+            ),
+        ),
+        Stage("enrich", _stage_enrich, inputs=("df_all", "data_dir"), outputs=("df_enriched",)),
+        Stage(
+            "history", _stage_history,
+            inputs=("cache", "store_fingerprint"), outputs=("df_history", "history_index"),
+            cache=True, handles=("cache",),
+            sources=(
+                "main.py", "bridge.data_cache", "bridge.result_store", "bridge.schema",
+                "bridge.player_index",
+            ),
+        ),
+        Stage(
+            "hole_analysis", _stage_hole_analysis,
+            inputs=("df_history", "df_enriched", "data_dir"), outputs=("hole_reports",),
+        ),
+        Stage("section_a", _stage_section_a, inputs=("df_enriched",), outputs=("df_a_only",)),
+        Stage(
+            "board_review", _stage_board_review,
+            inputs=("df_a_only",),
+            outputs=("df_board_review_all", "df_board_review_summary"),
+            cache=True,
+            sources=(
+                "bridge.board_review", "bridge.hand_eval", *_BIDDING_SOURCES,
+                "bridge.dd_enrich", "bridge.dd_compute", "bridge.dd_cache",
+            ),
+        ),
+        Stage(
+            "declarer_analysis", _stage_declarer_analysis,
+            inputs=("df_a_only",), outputs=("df_declarer_analysis",),
+            cache=True, sources=("bridge.declarer_analysis", *_ANALYSIS_SOURCES, "main.py"),
+        ),
+        Stage(
+            "classic_reports", _stage_classic_reports,
+            inputs=("df_history", "history_index", "df_a_only", "last_tuesday_only"),
+            outputs=("df_declarer", "df_summary", "df_tournament", "df_evening_matrix", "df_quarterly"),
+            cache=True, sources=(*_ANALYSIS_SOURCES, "main.py"),
+        ),
+        Stage(
+            "field_reports", _stage_field_reports,
+            inputs=("df_enriched",), outputs=("df_field_defense", "df_field_declarer"),
+            cache=True, sources=_ANALYSIS_SOURCES,
+        ),
+        Stage(
+            "write_excel", _stage_write_excel,
+            inputs=(
+                "df_enriched", "df_cross_club_board_check", "cross_club_summary",
+                "df_board_abc_check", "df_board_abc_summary",
+                "df_board_review_all", "df_board_review_summary", "df_declarer_analysis",
+                "df_declarer", "df_summary", "df_tournament", "df_evening_matrix", "df_quarterly",
+                "df_field_defense", "df_field_declarer", "hole_reports",
+            ),
+            outputs=("output_file",),
+        ),
+    ])
+
+
+def main():
+    args = parse_arguments()
+    requested_clubs = _parse_clubnos(args.clubnos)
+
+    if not requested_clubs:
+        print("Ingen gyldige clubno værdier fundet. Brug fx --clubnos=1,2,3")
+        return
+
+    configure_http(concurrency=args.http_concurrency, delay=args.http_delay)
+
+    # ==================== SETUP CACHE ====================
+    print("🚀 Initialiserer cache system...")
+    cache = DataCache(data_dir="data")
+    migrated = cache.migrate_json_to_store()
+    if migrated:
+        print(f"  ✓ Flyttede {migrated} turneringer fra JSON til result store")
+
+    # ==================== HANDLE SPECIAL FLAGS ====================
+
+    # Show cache status
+    if args.cache_status:
+        cache.print_cache_status()
+        return
+
+    # Clear cache
+    if args.clear_cache:
+        response = input("⚠️  Sikker på du vil slette hele cache? (ja/nej): ")
+        if response.lower() in ['ja', 'yes', 'y']:
+            cache.clear_cache(confirm=True)
+        return
+
+    # Create backup
+    if args.backup:
+        cache.create_backup()
+
+    # Par-rapporter for mange par (i stedet for aftenens analyse)
+    if args.pairs is not None or args.pairs_min_boards:
+        run_pair_batch(args, cache)
+        return
+
+    # ==================== PIPELINE ====================
+    pipeline = _build_pipeline()
+    rerun = [s.strip() for s in (args.stage or "").split(",") if s.strip()]
+    if rerun:
+        print(f"🔁 Kører kun: {', '.join(sorted(pipeline.downstream(rerun)))} (resten fra stage-cache)")
+
+    stage_store = StageStore(cache.data_dir / "pipeline_cache.db")
+    try:
+        result = pipeline.run(
+            {
+                "args": args,
+                "cache": cache,
+                "requested_clubs": requested_clubs,
+                "data_dir": cache.data_dir,
+                "last_tuesday_only": args.last_tuesday_only,
+            },
+            store=stage_store,
+            rerun=rerun or None,
+            max_workers=args.pipeline_workers,
+        )
+    except PipelineError as exc:
+        print(f"❌ {exc}")
+        return
+    finally:
+        stage_store.close()
+
+    print_report(result)
+    if result.stopped is not None:
+        return
+
     # ==================== SHOW CACHE STATUS ====================
     cache.print_cache_status()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
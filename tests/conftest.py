@@ -0,0 +1,11 @@
+"""Shared fixtures: keep the test run away from the tracked Data/dd_cache.db."""
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_dd_cache(tmp_path, monkeypatch):
+    """Point bridge.dd_cache at a per-test database under tmp_path."""
+    import bridge.dd_cache as cache_module
+
+    monkeypatch.setattr(cache_module, "_DB_PATH", tmp_path / "dd_cache.db")
+    yield
@@ -0,0 +1,58 @@
+"""Tests for bridge.analysis — vectorized roles/pct vs. the row-wise rules."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from bridge.analysis import HENRIK, PER, add_roles_and_pct, compute_result_status, pct_for, role
+
+
+def _rowwise(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    df["Henrik_role"] = df.apply(lambda r: role(r, HENRIK), axis=1)
+    df["Per_role"] = df.apply(lambda r: role(r, PER), axis=1)
+    df["Henrik_pct"] = df.apply(lambda r: pct_for(r, HENRIK), axis=1)
+    df["Per_pct"] = df.apply(lambda r: pct_for(r, PER), axis=1)
+    df[["result_status_code", "result_status_text"]] = df.apply(
+        lambda r: pd.Series(compute_result_status(r)), axis=1
+    )
+    return df
+
+
+def _boards() -> pd.DataFrame:
+    rows = []
+    for decl in ("N", "Ø", "S", "V", ""):
+        for seats in (
+            (HENRIK, PER, "A", "B"),
+            ("A", "B", PER, HENRIK),
+            ("A", "B", "C", "D"),
+            ("Oversidder", "B", HENRIK, PER),
+        ):
+            rows.append({
+                "ns1": seats[0], "ns2": seats[1], "ew1": seats[2], "ew2": seats[3],
+                "decl": decl, "contract_raw": "3NT" if decl else "",
+                "pct_NS": 50.0 if not decl else 62.5, "pct_ØV": 50.0 if not decl else 37.5,
+            })
+    return pd.DataFrame(rows)
+
+
+def test_matches_rowwise_rules():
+    df = _boards()
+    out = add_roles_and_pct(df)
+    pd.testing.assert_frame_equal(out, _rowwise(df))
+
+    first = out.iloc[0]   # Henrik N, Per S, N declares
+    assert (first["Henrik_role"], first["Per_role"]) == ("Declarer", "Dummy")
+    second = out.iloc[1]  # Per Ø, Henrik V, N declares → Ø (LHO) leads
+    assert (second["Per_role"], second["Henrik_role"]) == ("Defense_Leader", "Defense_Partner")
+    assert set(out["result_status_code"]) == {"PLAYED", "SITOUT", "NOT_PLAYED_AVERAGE"}
+
+
+def test_object_columns_and_missing_columns():
+    df = pd.DataFrame({
+        "ns1": [HENRIK, None, PER], "ns2": [PER, "", "X"],
+        "ew1": ["C", HENRIK, HENRIK], "ew2": ["D", PER, "Z"],
+        "decl": ["Ø", None, "S"], "pct_NS": [50, "50", None], "pct_ØV": [50.0, 50, 40],
+    }, dtype=object)
+    pd.testing.assert_frame_equal(add_roles_and_pct(df), _rowwise(df))
+    pd.testing.assert_frame_equal(add_roles_and_pct(df.drop(columns=["ew2"])), _rowwise(df.drop(columns=["ew2"])))
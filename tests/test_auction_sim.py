@@ -0,0 +1,65 @@
+"""Tests for bridge.auction_sim (batch auction simulation)."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from bridge.opening_bid import final_contract_from_calls, suggest_first_round_for_row
+
+_DEAL_A = {
+    "N_hand": "AKJ52.Q73.84.K62", "Ø_hand": "Q4.KJ98.AQ52.A73",
+    "S_hand": "T98.A52.K97.QJ94", "V_hand": "763.T64.JT63.T85",
+    "dealer": "N", "vul": "NS",
+}
+_DEAL_B = {
+    "N_hand": "7.AT86.876.KQ972", "Ø_hand": "KQJT62.K4.AQ3.84",
+    "S_hand": "A854.QJ97.KJ4.A5", "V_hand": "93.532.T952.JT63",
+    "dealer": "Ø", "vul": "Alle",
+}
+
+
+def _calls(*seat_bids):
+    return [{"dealer": seat, "bid": bid} for seat, bid in seat_bids]
+
+
+def test_final_contract_from_calls():
+    calls = _calls(("N", "1H"), ("Ø", "1S"), ("S", "2H"), ("V", "X"), ("N", "4H"),
+                   ("Ø", "PASS"), ("S", "PASS"), ("V", "X"), ("N", "PASS"), ("Ø", "PASS"), ("S", "PASS"))
+    assert final_contract_from_calls(calls) == {
+        "contract": "4♥", "level": 4, "strain": "♥", "declarer": "N", "doubled": "X",
+    }
+
+    # Declarer is the first of the side to name the strain, not the last bidder
+    calls = _calls(("N", "PASS"), ("Ø", "PASS"), ("S", "1NT"), ("V", "PASS"), ("N", "3NT"),
+                   ("Ø", "PASS"), ("S", "PASS"), ("V", "PASS"))
+    final = final_contract_from_calls(calls)
+    assert (final["contract"], final["strain"], final["declarer"], final["doubled"]) == ("3NT", "NT", "S", "")
+
+    assert final_contract_from_calls(_calls(("N", "PASS"), ("Ø", "PASS"), ("S", "PASS"), ("V", "PASS")))[
+        "contract"
+    ] is None
+
+
+def test_suggest_auctions_dedupes_deals_and_keeps_row_order():
+    from bridge.auction_sim import DEAL_COLUMNS, SIM_COLUMNS, suggest_auctions
+
+    df = pd.DataFrame([_DEAL_A, _DEAL_B, _DEAL_A, {**_DEAL_B, "vul": "-"}], index=[10, 11, 12, 13])
+    df = df.astype({c: "category" for c in DEAL_COLUMNS})
+
+    cache: dict = {}
+    sim = suggest_auctions(df, max_workers=1, cache=cache)
+
+    assert list(sim.columns) == list(SIM_COLUMNS)
+    assert list(sim.index) == [10, 11, 12, 13]
+    assert len(cache) == 3
+    pd.testing.assert_series_equal(sim.loc[10], sim.loc[12], check_names=False)
+
+    expected = suggest_first_round_for_row(_DEAL_B)["call_sequence"]
+    assert sim.loc[11, "sim_calls"].split() == [c["display_bid"] for c in expected]
+    assert sim.loc[11, "sim_n_calls"] == len(expected)
+    assert sim.loc[11, "sim_contract"] == (final_contract_from_calls(expected)["contract"] or "")
+
+    # Cached deals are not simulated again; a process pool gives the same frame
+    cache[next(iter(cache))]["sim_calls"] = "cached"
+    assert suggest_auctions(df, max_workers=1, cache=cache).loc[10, "sim_calls"] == "cached"
+    pd.testing.assert_frame_equal(suggest_auctions(df, max_workers=2, chunk_deals=1), sim)
@@ -84,3 +84,49 @@ def test_partner_explanation_and_side_potential_are_range_based():
     assert 0 <= est.tricks_range.low <= est.tricks_range.high <= 13
     assert est.side == "ØV"
     assert any("range" in line.lower() for line in est.reasoning)
+
+
+def test_fork_is_copy_on_write():
+    from bridge.auction_state import fork_auction_state
+
+    state = create_auction_state("Ø", "S", "Ingen i zonen", own_hand_dot="A7653.T65.KQ43.8")
+    apply_bid_evidence(state, "S", "1H", BidEvidence(source="S 1H", hcp_range=ValueRange(11, 21)))
+
+    branch = fork_auction_state(state)
+    assert branch.seats["N"] is state.seats["N"]
+    apply_bid_evidence(branch, "V", "1S", BidEvidence(source="V 1S", hcp_range=ValueRange(8, 15)))
+
+    assert branch.seats["V"].hcp_range == ValueRange(8, 15)
+    assert state.seats["V"].hcp_range == ValueRange(0, 37)
+    assert state.seats["V"].evidence_log == [] and len(state.calls) == 1
+    assert branch.seats["S"] is state.seats["S"]
+
+    # the parent copies too before it writes a shared seat
+    apply_bid_evidence(state, "S", "2H", BidEvidence(source="S 2H", suit_min={"H": 6}))
+    assert branch.seats["S"].suit_min["H"] == 0
+
+
+def test_timeline_matches_full_replay():
+    from bridge.auction_state import AuctionTimeline
+
+    def infer(state, seat, bid):
+        # evidence reads the public auction, like opening_bid's inference
+        low = 11.0 if state.highest_contract is None else 6.0
+        return BidEvidence(source=f"{seat}:{bid}:{len(state.calls)}", hcp_range=ValueRange(low, 20.0))
+
+    calls = [("S", "1H"), ("V", "1S"), (None, "PASS"), ("N", "2H"), ("Ø", "PASS")]
+
+    def replay(seat, n):
+        state = create_auction_state(seat, "S", "", own_hand_dot=None)
+        for call_seat, bid in calls[:n]:
+            if call_seat is not None:
+                apply_bid_evidence(state, call_seat, bid, infer(state, call_seat, bid))
+        return state
+
+    timeline = AuctionTimeline(infer)
+    for n, (call_seat, bid) in enumerate(calls, 1):
+        timeline.record(call_seat, bid)
+        for seat in ("N", "Ø", "S", "V"):
+            state = timeline.state_for(seat, lambda: create_auction_state(seat, "S", ""))
+            assert state == replay(seat, n)
+    assert len(timeline) == len(calls)
@@ -2,6 +2,7 @@
 Tests for write_board1_layout_sheet() in bridge/board_review.py.
 """
 
+import copy
 import io
 import pandas as pd
 import pytest
@@ -28,6 +29,28 @@ PER = "Per Føge Jensen"
 HENRIK = "Henrik Friis"
 
 
+def _patch_yaml(monkeypatch, file_name, edit):
+    """Run edit() on a copy of one YAML file as the bundle loads it; the bundle is rebuilt."""
+    original_load_yaml_file = opening_bid_module._load_yaml_file
+
+    def _patched_load_yaml_file(path):
+        data = original_load_yaml_file(path)
+        if path.name != file_name:
+            return data
+        data = copy.deepcopy(data)
+        edit(data)
+        return data
+
+    monkeypatch.setattr(opening_bid_module, '_load_yaml_file', _patched_load_yaml_file)
+    opening_bid_module._load_bundle.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_opening_bid_bundle():
+    yield
+    opening_bid_module._load_bundle.cache_clear()
+
+
 def _make_writer_mock():
     """Return a minimal pd.ExcelWriter-like mock with a real openpyxl workbook."""
     wb = Workbook()
@@ -1647,18 +1670,12 @@ def test_opener_rebid_after_single_major_raise_fit_upgrade_can_be_disabled_from_
         'V_hand': 'Q42.QJT97.KJ8.42',
     }
 
-    def _fake_system_def(_seat):
-        return {
-            'hand_strength_model': {
-                'fit_playing_points': {
-                    'after_one_major_two_major_raise': {
-                        'enabled': False,
-                    }
-                }
-            }
-        }
+    def _disable_fit_points(raw):
+        for system in raw['system_library'].values():
+            fit = system['hand_strength_model']['fit_playing_points']
+            fit['after_one_major_two_major_raise']['enabled'] = False
 
-    monkeypatch.setattr(opening_bid_module, '_system_def_for_seat', _fake_system_def)
+    _patch_yaml(monkeypatch, 'systemdefinition.yaml', _disable_fit_points)
 
     out = suggest_first_round_for_row(row)
     seq = out.get('call_sequence', [])
@@ -1728,7 +1745,11 @@ def test_fourth_suit_is_natural_when_two_over_one_game_force_is_active(monkeypat
         'V_hand': 'T94.QT5.QJ932.J2',
     }
 
-    monkeypatch.setattr(opening_bid_module, '_is_two_over_one_gf_enabled_for_seat', lambda _seat: True)
+    def _enable_two_over_one(raw):
+        for profile in raw['system_profiles'].values():
+            profile['two_over_one_game_force'] = 'enabled'
+
+    _patch_yaml(monkeypatch, 'system_profiles.yaml', _enable_two_over_one)
     monkeypatch.setattr(opening_bid_module, '_side_has_two_over_one_dhs', lambda _hist: True)
 
     out = suggest_first_round_for_row(row)
@@ -2159,6 +2180,32 @@ def _make_df_with_dd(**extra):
     return _make_df(**dd_data)
 
 
+def test_layout_sheets_from_schema_typed_frame():
+    """apply_schema'd rows (categorical hands, nullable Int8 tricks/DD) write without <NA> cells."""
+    from bridge.schema import apply_schema
+
+    df = pd.concat(
+        [
+            _make_df_with_dd(tricks=9, contract='3NT', decl='S', dd_V_C=None),
+            _make_df_with_dd(tricks=None, ns1='Other NS', ns2='Other NS2'),
+        ],
+        ignore_index=True,
+    )
+    df = apply_schema(df)
+    assert str(df['tricks'].dtype) == 'Int8' and isinstance(df['N_hand'].dtype, pd.CategoricalDtype)
+
+    writer, wb = _make_writer_mock()
+    write_last_tournament_board_layout_sheets(writer, df, PER, board_start=1, board_end=1)
+    ws = wb['Board1_LastTournament']
+
+    assert ws.cell(row=5, column=3).value == 'Resultat: 9'
+    tricks_cells = {ws.cell(row=r, column=10).value for r in (2, 3)}
+    assert tricks_cells == {9, None}
+    dd_start = next(r for r in range(1, ws.max_row + 1) if ws.cell(row=r, column=5).value == 'Double Dummy')
+    assert ws.cell(row=dd_start + 4, column=10).value is None   # dd_V_C missing (<NA>)
+    assert ws.cell(row=dd_start + 1, column=6).value == 9       # dd_N_NT
+
+
 def test_dd_table_title_when_valid():
     """Title cell E5 must read 'Double Dummy' when dd_valid is True."""
     df = _make_df_with_dd()
@@ -2,6 +2,7 @@
 
 import pandas as pd
 
+from bridge.board_identity import make_cross_club_board_identity_check
 from bridge.board_review import (
     get_latest_tournament_other_rows_results,
     make_latest_tournament_board_consistency_check,
@@ -119,3 +120,25 @@ def test_board_consistency_detects_internal_row_inconsistency():
     assert board10["status"] == "ROW_INTERNAL_MISMATCH"
     assert int(summary["boards_row_internal_mismatch"]) == 1
     assert bool(summary["is_consistent"]) is False
+
+
+def test_checks_run_on_schema_typed_frame():
+    """df_all reaches both checks via apply_schema: categorical hands, some missing."""
+    from bridge.schema import apply_schema
+
+    df = _make_evening_df()
+    df["clubno"] = 1
+    df["tricks"] = df["tricks"].astype(object)
+    df.loc[(df["row"] == "C") & (df["board_no"] == 3), ["N_hand", "tricks"]] = None
+    df = apply_schema(df)
+    assert isinstance(df["N_hand"].dtype, pd.CategoricalDtype)
+
+    report, summary = make_cross_club_board_identity_check(
+        df, clubs=(1,), rows=("A", "B", "C"), board_start=1, board_end=24,
+    )
+    assert summary["boards_ok"] == 23
+
+    report, summary = make_latest_tournament_board_consistency_check(df)
+
+    assert report.loc[report["board_no"] == 3, "status"].iloc[0] == "MISMATCH"
+    assert int(summary["boards_ok"]) == 23
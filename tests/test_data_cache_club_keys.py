@@ -40,9 +40,7 @@ def test_cache_uses_club_aware_keys_and_files(tmp_path):
     assert "1:999" in cache.manifest["tournaments"]
     assert "2:999" in cache.manifest["tournaments"]
 
-    tournaments_dir = tmp_path / "data" / "tournaments"
-    assert (tournaments_dir / "tournament_1_999.json").exists()
-    assert (tournaments_dir / "tournament_2_999.json").exists()
+    assert cache.store.tournament_keys() == {"1:999", "2:999"}
 
     c1 = cache.get_cached_tournament(999, clubno=1)
     c2 = cache.get_cached_tournament(999, clubno=2)
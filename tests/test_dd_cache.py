@@ -126,6 +126,13 @@ class TestLeadTableCRUD:
         assert result["H5"] == 9
         assert result["C3"] == 7
 
+    def test_empty_table_cached_as_unsolvable(self):
+        from bridge.dd_cache import get_lead_table, get_lead_tables, save_lead_tables
+
+        save_lead_tables({("h1", "D", "Ø"): {}, ("h1", "H", "Ø"): self._LEAD_DATA})
+        assert get_lead_table("h1", "D", "Ø") == {}
+        assert get_lead_tables([("h1", "H", "Ø")]) == {("h1", "H", "Ø"): self._LEAD_DATA}
+
     def test_different_strain_different_entry(self):
         from bridge.dd_cache import get_deal_hash, get_lead_table, save_lead_table
 
@@ -133,3 +140,139 @@ class TestLeadTableCRUD:
         save_lead_table(h, "D", "\u00d8", self._LEAD_DATA)
         # NT by same declarer should be empty
         assert get_lead_table(h, "NT", "\u00d8") is None
+
+
+class TestDDCacheObject:
+    def test_shared_instance_reused(self):
+        from bridge.dd_cache import get_cache
+
+        assert get_cache() is get_cache()
+
+    def test_rollback_journal(self, tmp_path):
+        import sqlite3
+
+        from bridge.dd_cache import DDCache
+
+        # A file left in WAL mode by an earlier version is converted back
+        path = tmp_path / "journal.db"
+        conn = sqlite3.connect(str(path))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.close()
+
+        cache = DDCache(path)
+        cache.save_dd_tables({"h1": _DD_TABLE})
+        mode = cache._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        cache.close()
+        assert mode.lower() == "delete"
+        assert not (tmp_path / "journal.db-wal").exists()
+        assert path.read_bytes()[18:20] == b"\x01\x01"   # legacy (non-WAL) header
+
+    def test_bulk_dd_tables(self):
+        from bridge.dd_cache import get_dd_tables, save_dd_tables
+
+        batch = {"h1": _DD_TABLE, "h2": {**_DD_TABLE, "dd_N_NT": 9}}
+        save_dd_tables(batch)
+        result = get_dd_tables(["h1", "h2", "missing"])
+        assert set(result) == {"h1", "h2"}
+        assert result["h2"]["dd_N_NT"] == 9
+
+    def test_bulk_lead_tables_only_requested_keys(self):
+        from bridge.dd_cache import get_lead_tables, save_lead_tables
+
+        save_lead_tables({
+            ("h1", "D", "Ø"): {"H5": 9, "C3": 7},
+            ("h1", "NT", "N"): {"SA": 8},
+            ("h2", "H", "S"): {"DQ": 10},
+        })
+        result = get_lead_tables([("h1", "D", "Ø"), ("h2", "H", "S"), ("h3", "S", "N")])
+        assert result == {
+            ("h1", "D", "Ø"): {"H5": 9, "C3": 7},
+            ("h2", "H", "S"): {"DQ": 10},
+        }
+
+    def test_bulk_lookup_beyond_in_chunk(self, monkeypatch):
+        import bridge.dd_cache as cache_module
+
+        monkeypatch.setattr(cache_module, "_IN_CHUNK", 2)
+        hashes = [f"h{i}" for i in range(5)]
+        cache_module.save_dd_tables({h: _DD_TABLE for h in hashes})
+        assert set(cache_module.get_dd_tables(hashes)) == set(hashes)
+
+
+class TestDDFrontCache:
+    def test_second_lookup_served_from_memory(self, tmp_path):
+        from bridge.dd_cache import DDCache, DDFrontCache
+
+        store = DDCache(tmp_path / "front.db")
+        store.save_dd_tables({"h1": _DD_TABLE})
+        front = DDFrontCache(store)
+
+        assert front.get_dd_table("h1") == _DD_TABLE
+        store.save_dd_tables({"h1": {**_DD_TABLE, "dd_N_NT": 1}})
+        # Still the in-memory copy: SQLite was not read again
+        assert front.get_dd_table("h1")["dd_N_NT"] == 5
+        assert front.stats()["hits"] == 1
+        assert front.stats()["misses"] == 1
+        store.close()
+
+    def test_misses_are_not_cached(self, tmp_path):
+        from bridge.dd_cache import DDCache, DDFrontCache
+
+        store = DDCache(tmp_path / "front.db")
+        front = DDFrontCache(store)
+        assert front.get_lead_table("h1", "D", "Ø") is None
+        store.save_lead_tables({("h1", "D", "Ø"): {"H5": 9}})
+        assert front.get_lead_table("h1", "D", "Ø") == {"H5": 9}
+        store.close()
+
+    def test_save_writes_through(self, tmp_path):
+        from bridge.dd_cache import DDCache, DDFrontCache
+
+        store = DDCache(tmp_path / "front.db")
+        front = DDFrontCache(store)
+        front.save_lead_tables({("h1", "D", "Ø"): {"H5": 9}})
+        assert store.get_lead_table("h1", "D", "Ø") == {"H5": 9}
+        assert front.get_lead_table("h1", "D", "Ø") == {"H5": 9}
+        assert front.stats()["hits"] == 1
+        store.close()
+
+    def test_returned_tables_are_copies(self, tmp_path):
+        from bridge.dd_cache import DDCache, DDFrontCache
+
+        store = DDCache(tmp_path / "front.db")
+        front = DDFrontCache(store)
+        lead = {"H5": 9}
+        front.save_lead_tables({("h1", "D", "Ø"): lead})
+        lead["H5"] = 1
+        front.get_lead_table("h1", "D", "Ø")["H5"] = 2
+        assert front.get_lead_table("h1", "D", "Ø") == {"H5": 9}
+
+        front.get_dd_table("missing")
+        store.save_dd_tables({"h2": _DD_TABLE})
+        front.get_dd_table("h2")["dd_N_NT"] = 0      # miss path, then hit path
+        front.get_dd_table("h2")["dd_N_NT"] = 0
+        assert front.get_dd_table("h2") == _DD_TABLE
+        store.close()
+
+    def test_lru_eviction(self, tmp_path):
+        from bridge.dd_cache import DDCache, DDFrontCache
+
+        store = DDCache(tmp_path / "front.db")
+        front = DDFrontCache(store, max_dd_tables=2)
+        front.save_dd_tables({"h1": _DD_TABLE, "h2": _DD_TABLE})
+        front.get_dd_table("h1")                     # h2 is now least recent
+        front.save_dd_tables({"h3": _DD_TABLE})
+        stats = front.stats()
+        assert stats["evictions"] == 1
+        assert stats["dd_tables"] == 2
+        front.get_dd_table("h2")                     # evicted → miss
+        assert front.stats()["misses"] == 1
+        store.close()
+
+    def test_module_functions_share_front_cache(self):
+        from bridge.dd_cache import get_dd_table, get_front_cache, save_dd_table
+
+        save_dd_table("h1", _DD_TABLE)
+        get_dd_table("h1")
+        get_dd_table("h1")
+        assert get_front_cache().stats()["hits"] == 2
@@ -130,3 +130,88 @@ class TestComputeLeadTable:
 
         row = {**_BOARD, "decl": None}
         assert compute_lead_table(row) == {}
+
+
+class TestComputeDDTablesBatch:
+    def test_matches_single_table(self):
+        from bridge.dd_cache import get_deal_hash
+        from bridge.dd_compute import compute_dd_table, compute_dd_tables_batch
+
+        result = compute_dd_tables_batch([_BOARD])
+        assert list(result) == [get_deal_hash(_BOARD)]
+        assert result[get_deal_hash(_BOARD)] == compute_dd_table(_BOARD)
+
+    def test_deduplicates_by_deal_hash(self):
+        from bridge.dd_compute import compute_dd_tables_batch
+
+        # Same deal at several tables with different contracts → one solve
+        rows = [_BOARD, _LEAD_BOARD, dict(_BOARD)]
+        assert len(compute_dd_tables_batch(rows)) == 1
+
+    def test_chunks_beyond_dds_batch_limit(self, monkeypatch):
+        import itertools
+
+        import bridge.dd_compute as dd_compute_module
+        from bridge.dd_cache import get_deal_hash
+
+        monkeypatch.setattr(dd_compute_module, "_CALC_ALL_TABLES_MAX_DEALS", 2)
+
+        # Permute the four hands around the table to get distinct deals
+        hands = [_BOARD["N_hand"], _BOARD["\u00d8_hand"], _BOARD["S_hand"], _BOARD["V_hand"]]
+        rows = [
+            dict(zip(["N_hand", "\u00d8_hand", "S_hand", "V_hand"], perm))
+            for perm in itertools.islice(itertools.permutations(hands), 5)
+        ]
+
+        result = dd_compute_module.compute_dd_tables_batch(rows)
+        assert len(result) == 5
+        for row in rows:
+            assert result[get_deal_hash(row)] == dd_compute_module.compute_dd_table(row)
+
+    def test_rows_without_hands_skipped(self):
+        from bridge.dd_compute import compute_dd_tables_batch
+
+        row = {**_BOARD, "S_hand": None}
+        assert compute_dd_tables_batch([row]) == {}
+
+
+class TestComputeLeadTablesParallel:
+    def test_matches_serial_lead_tables(self):
+        from bridge.dd_cache import get_deal_hash
+        from bridge.dd_compute import compute_lead_table, compute_lead_tables_parallel
+
+        h = get_deal_hash(_BOARD)
+        jobs = {h: (_BOARD, [("D", "Ø"), ("H", "N")])}
+        result = dict(compute_lead_tables_parallel(jobs, max_workers=2))
+
+        assert result[(h, "D", "Ø")] == compute_lead_table(_BOARD)
+        assert result[(h, "H", "N")] == compute_lead_table(_LEAD_BOARD)
+
+    def test_process_pool_over_several_deals(self):
+        from bridge.dd_cache import get_deal_hash
+        from bridge.dd_compute import compute_lead_table, compute_lead_tables_parallel
+
+        # Mirror the deal N↔S / Ø↔V to get a second, distinct deal
+        mirrored = {
+            **_BOARD,
+            "N_hand": _BOARD["S_hand"], "S_hand": _BOARD["N_hand"],
+            "Ø_hand": _BOARD["V_hand"], "V_hand": _BOARD["Ø_hand"],
+        }
+        jobs = {
+            get_deal_hash(_BOARD): (_BOARD, [("D", "Ø")]),
+            get_deal_hash(mirrored): (mirrored, [("D", "V")]),
+        }
+        result = dict(compute_lead_tables_parallel(jobs, max_workers=2))
+
+        assert len(result) == 2
+        assert result[(get_deal_hash(mirrored), "D", "V")] == compute_lead_table(
+            {**mirrored, "decl": "V"}
+        )
+
+    def test_invalid_contract_returns_empty_table(self):
+        from bridge.dd_cache import get_deal_hash
+        from bridge.dd_compute import compute_lead_tables_parallel
+
+        h = get_deal_hash(_BOARD)
+        result = dict(compute_lead_tables_parallel({h: (_BOARD, [("X", "N")])}))
+        assert result == {(h, "X", "N"): {}}
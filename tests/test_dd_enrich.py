@@ -118,3 +118,121 @@ class TestEnrichDDFallback:
         result = enrich_dd_fallback(df)
         assert result["dd_valid"].iloc[0] == True
         assert result["dd_N_NT"].iloc[0] == 5
+
+    def test_same_deal_rows_share_one_solve(self, monkeypatch):
+        import bridge.dd_enrich as enrich_module
+        from bridge.dd_enrich import enrich_dd_fallback
+
+        calls = []
+        real_batch = enrich_module.compute_dd_tables_batch
+
+        def _counting_batch(rows):
+            rows = list(rows)
+            calls.append(len(rows))
+            return real_batch(rows)
+
+        monkeypatch.setattr(enrich_module, "compute_dd_tables_batch", _counting_batch)
+
+        row_no_dd = {
+            k: (False if k == "dd_valid" else (None if k.startswith("dd_") else v))
+            for k, v in _ROW.items()
+        }
+        df = pd.DataFrame([row_no_dd, {**row_no_dd, "decl": "S"}])
+        result = enrich_dd_fallback(df)
+        assert calls == [1]
+        assert result["dd_N_NT"].tolist() == [5, 5]
+
+
+class TestPrecomputeLeadTables:
+    def test_fills_cache_then_enrich_reads_only_cache(self, monkeypatch):
+        import bridge.dd_enrich as enrich_module
+        from bridge.dd_cache import get_deal_hash, get_lead_table
+
+        df = pd.DataFrame([_ROW, {**_ROW, "decl": "S"}, _ROW])
+        assert enrich_module.precompute_lead_tables(df, max_workers=2) == 2
+
+        h = get_deal_hash(_ROW)
+        assert get_lead_table(h, "H", "N") is not None
+        assert get_lead_table(h, "H", "S") is not None
+
+        def _no_solve(*args, **kwargs):
+            raise AssertionError("cache should already hold every lead table")
+
+        monkeypatch.setattr(enrich_module, "compute_lead_tables_parallel", _no_solve)
+        result = enrich_module.enrich_lead_tables(df)
+        assert result["dd_best_lead_tricks"].tolist() == [4, 4, 4]
+
+    def test_second_precompute_solves_nothing(self):
+        from bridge.dd_enrich import precompute_lead_tables
+
+        df = pd.DataFrame([_ROW])
+        assert precompute_lead_tables(df) == 1
+        assert precompute_lead_tables(df) == 0
+
+    def test_unsolvable_tables_cached_and_solved_in_process_by_default(self, monkeypatch):
+        import bridge.dd_enrich as enrich_module
+        from bridge.dd_cache import get_deal_hash, get_lead_table
+
+        calls = []
+
+        def _failing_parallel(jobs, max_workers=None):
+            calls.append(max_workers)
+            for deal_hash, (_, contracts) in jobs.items():
+                for strain_key, decl in contracts:
+                    yield (deal_hash, strain_key, decl), {}
+
+        monkeypatch.setattr(enrich_module, "compute_lead_tables_parallel", _failing_parallel)
+        df = pd.DataFrame([_ROW])
+        assert enrich_module.precompute_lead_tables(df) == 1
+        assert get_lead_table(get_deal_hash(_ROW), "H", "N") == {}
+        assert enrich_module.precompute_lead_tables(df) == 0
+        assert calls == [1]
+
+
+class TestEnrichLeadTablesGrouped:
+    def _rows(self):
+        return [
+            _ROW,
+            {**_ROW, "lead": "♠ K"},                 # another lead, same contract
+            {**_ROW, "decl": "S", "lead": "♥ Q"},   # West leads against South
+            {**_ROW, "lead": None},                       # no lead recorded
+            _ROW,
+        ]
+
+    def test_matches_direct_lead_tables(self):
+        from bridge.dd_compute import compute_lead_table, parse_lead_card
+        from bridge.dd_enrich import enrich_lead_tables
+
+        rows = self._rows()
+        df = pd.DataFrame(rows, index=[7, 7, 3, 1, 0])  # duplicate labels on purpose
+        result = enrich_lead_tables(df)
+        assert list(result.index) == [7, 7, 3, 1, 0]
+
+        for pos, row in enumerate(rows):
+            table = compute_lead_table(row)
+            best = min(table, key=lambda k: (table[k], k))
+            assert result["dd_best_lead"].iloc[pos] == best
+            assert result["dd_best_lead_tricks"].iloc[pos] == table[best]
+            lead_key = parse_lead_card(row["lead"])
+            if lead_key is None:
+                assert result["lead_cost"].iloc[pos] is None
+            else:
+                assert result["lead_dd_tricks"].iloc[pos] == table[lead_key]
+                assert result["lead_cost"].iloc[pos] == table[lead_key] - table[best]
+
+    def test_each_contract_resolved_once(self, monkeypatch):
+        import bridge.dd_enrich as enrich_module
+
+        requested = []
+        real_get = enrich_module.get_lead_tables
+
+        def _recording_get(keys):
+            keys = list(keys)
+            requested.append(keys)
+            return real_get(keys)
+
+        monkeypatch.setattr(enrich_module, "get_lead_tables", _recording_get)
+        enrich_module.enrich_lead_tables(pd.DataFrame(self._rows()))
+
+        # precompute + join: each looks up the two distinct contracts once
+        assert [len(keys) for keys in requested] == [2, 2]
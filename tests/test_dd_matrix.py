@@ -0,0 +1,60 @@
+"""Tests for bridge.dd_matrix — the (rows × seat × strain) DD trick array."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def _dd_row(valid, **overrides) -> dict:
+    row = {"dd_valid": valid}
+    for seat in ("N", "Ø", "S", "V"):
+        for k, strain in enumerate(("NT", "S", "H", "D", "C")):
+            row[f"dd_{seat}_{strain}"] = 6 + k
+    row.update(overrides)
+    return row
+
+
+def test_dd_matrix_layout_and_validity():
+    from bridge.dd_matrix import MISSING, dd_matrix
+
+    df = pd.DataFrame([
+        _dd_row(True, dd_Ø_H=12.0),
+        _dd_row(False),
+        _dd_row(np.nan, dd_V_C=None),     # NaN dd_valid counts as valid
+    ], index=[7, 8, 9])
+    dd = dd_matrix(df)
+    assert dd.shape == (3, 4, 5) and dd.dtype == np.int8
+    assert dd[0, 1, 2] == 12 and dd[0, 0].tolist() == [6, 7, 8, 9, 10]
+    assert (dd[1] == MISSING).all()
+    assert dd[2, 3, 4] == MISSING and dd[2, 3, 0] == 6
+
+
+def test_optional_ints_is_nullable_int8():
+    from bridge.dd_matrix import optional_ints
+
+    s = optional_ints(np.array([1, -2, 3]), np.array([False, False, True]), pd.RangeIndex(3))
+    assert s.dtype == "Int8"
+    assert s.tolist()[:2] == [1, -2] and s.isna().tolist() == [False, False, True]
+
+
+def test_hole_flags_from_dd_matrix():
+    from bridge.hole_analysis import add_hole_analysis_features
+
+    base = {"ns1": "Henrik Friis", "ns2": "Per Føge Jensen", "ew1": "A", "ew2": "B"}
+    df = pd.DataFrame([
+        {**base, **_dd_row(True, dd_S_D=12), "level": 3, "strain": "NT", "field_mode_contract": "6♦"},
+        {**base, **_dd_row(True), "level": 5, "strain": "♥", "field_mode_contract": "4♥"},
+        {**base, **_dd_row(False), "level": 2, "strain": "♠", "field_mode_contract": "4♠"},
+    ])
+    out = add_hole_analysis_features(df)
+    # N/S: NT 6, ♠ 7, ♥ 8, ♦ 9, ♣ 10 – partscore only, except 12 in ♦ in row 0
+    assert out["dd_best_zone"].tolist()[:2] == ["Lilleslem", "Partscore"]
+    assert out["dd_minor_max_tricks"].tolist()[:2] == [12, 10]
+    assert out[["dd_best_zone", "dd_minor_max_tricks", "zone_vs_dd"]].iloc[2].isna().all()
+    assert out["nt_instead_of_minor_slam"].tolist() == [True, False, False]
+    assert out["is_slam_miss"].tolist() == [True, False, False]
+    assert out["is_overcontract"].tolist() == [False, True, False]
+    assert out["five_major_avoidable"].tolist() == [False, True, False]
+    assert out["is_game_miss"].tolist() == [False, False, True]
+    assert out["zone_vs_dd"].tolist()[:2] == ["underbid", "overbid"]
@@ -0,0 +1,157 @@
+"""Tests for bridge.enriched_store — per-date materialized enrichment."""
+
+from __future__ import annotations
+
+import re
+
+import pandas as pd
+
+
+def _frame():
+    return pd.DataFrame({
+        "tournament_date": ["2026-03-03", "2026-03-10", "2026-03-03", "2026-03-10", "2026-03-17"],
+        "board": [1, 1, 2, 2, 1],
+        "pct_NS": [60.0, 40.0, 55.0, 45.0, 50.0],
+    }, index=[10, 11, 12, 13, 14])
+
+
+def _stages(calls):
+    from bridge.enriched_store import EnrichStage
+
+    def double(df):
+        calls.append(("double", df["tournament_date"].iloc[0]))
+        out = df.copy()
+        out["pct2"] = out["pct_NS"] * 2
+        return out
+
+    def note(df):
+        calls.append(("note", df["tournament_date"].iloc[0]))
+        out = df.copy()
+        # all-missing on some dates (object), str on others: must concat as str
+        out["note"] = out["pct_NS"].apply(lambda v: "high" if v > 58 else None)
+        return out[out["board"] == 1]
+
+    return (
+        EnrichStage("double", double, ("features.py",)),
+        EnrichStage("note", note, ("mvp_metrics.py",)),
+    )
+
+
+def _reference(df, stages):
+    out = df
+    for stage in stages:
+        out = stage.run(out)
+    return out
+
+
+def test_matches_whole_frame_and_reuses_unchanged_dates(tmp_path):
+    from bridge.enriched_store import EnrichedStore, enrich_incremental
+
+    calls: list = []
+    stages = _stages(calls)
+    store = EnrichedStore(tmp_path / "enriched.db")
+    df = _frame()
+
+    out, stats = enrich_incremental(df, store, stages=stages)
+    expected = _reference(df, _stages([]))
+    pd.testing.assert_frame_equal(out, expected)
+    assert stats.recomputed == 3 and stats.reused == 0 and stats.stages_run == 6
+
+    calls.clear()
+    again, stats = enrich_incremental(df, store, stages=stages)
+    pd.testing.assert_frame_equal(again, expected)
+    assert calls == [] and stats.reused == 3
+
+    # A new date plus a changed row: only those two dates are recomputed
+    df2 = pd.concat([
+        pd.DataFrame({"tournament_date": ["2026-03-24"], "board": [1], "pct_NS": [70.0]}),
+        df,
+    ], ignore_index=True)
+    df2.loc[df2["tournament_date"] == "2026-03-17", "pct_NS"] = 65.0
+    calls.clear()
+    out2, stats = enrich_incremental(df2, store, stages=stages)
+    pd.testing.assert_frame_equal(out2, _reference(df2, _stages([])))
+    assert sorted({d for _, d in calls}) == ["2026-03-17", "2026-03-24"]
+    assert stats.reused == 2 and stats.recomputed == 2
+
+
+def test_version_change_resumes_from_last_valid_stage(tmp_path, monkeypatch):
+    from bridge import enriched_store
+    from bridge.enriched_store import EnrichedStore, enrich_incremental
+
+    calls: list = []
+    stages = _stages(calls)
+    store = EnrichedStore(tmp_path / "enriched.db")
+    enrich_incremental(_frame(), store, stages=stages)
+
+    real_digest = enriched_store._file_digest
+    monkeypatch.setattr(
+        enriched_store, "_file_digest",
+        lambda name: "edited" if name == "mvp_metrics.py" else real_digest(name),
+    )
+    calls.clear()
+    _, stats = enrich_incremental(_frame(), store, stages=stages)
+    assert {name for name, _ in calls} == {"note"}
+    assert stats.recomputed == 3
+
+
+def test_prune_drops_dates_no_longer_present(tmp_path):
+    from bridge.enriched_store import EnrichedStore, enrich_incremental
+
+    store = EnrichedStore(tmp_path / "enriched.db")
+    stages = _stages([])
+    enrich_incremental(_frame(), store, namespace="period", stages=stages)
+    enrich_incremental(_frame(), store, namespace="history", stages=stages)
+
+    recent = _frame()[lambda d: d["tournament_date"] > "2026-03-05"]
+    _, stats = enrich_incremental(recent, store, namespace="period", stages=stages, prune=True)
+    assert stats.pruned == 1
+    assert store.partitions("period") == {"2026-03-10", "2026-03-17"}
+    assert len(store.partitions("history")) == 3
+
+
+def test_lead_tables_solved_once_for_recomputed_dates(tmp_path, monkeypatch):
+    import bridge.dd_enrich as enrich_module
+    import bridge.enriched_store as store_module
+
+    calls: list = []
+    stages = _stages([])
+    monkeypatch.setattr(store_module, "FEATURES_STAGE", stages[0])
+    monkeypatch.setattr(
+        enrich_module, "precompute_lead_tables",
+        lambda df, max_workers=1: calls.append((len(df), max_workers)) or 0,
+    )
+    store = store_module.EnrichedStore(tmp_path / "enriched.db")
+    df = _frame()
+
+    store_module.enrich_incremental(df, store, stages=stages, lead_workers=3)
+    assert calls == [(5, 3)]           # all three dates, one call
+
+    calls.clear()
+    changed = df.copy()
+    changed.loc[14, "pct_NS"] = 51.0
+    store_module.enrich_incremental(changed, store, stages=stages, lead_workers=3)
+    assert calls == [(1, 3)]           # only the changed date
+    store.close()
+
+
+def test_stage_versions_cover_modules_and_solver(monkeypatch):
+    from bridge import enriched_store
+    from bridge.enriched_store import FEATURES_STAGE, HISTORY_STAGES, stage_versions
+
+    # Every bridge module a stage's modules import is one of its sources
+    for stage in HISTORY_STAGES:
+        for name in stage.sources:
+            if name.endswith(".py"):
+                text = (enriched_store._BRIDGE_DIR / name).read_text(encoding="utf-8")
+                imported = set(re.findall(r"from bridge\.(\w+) import", text))
+                assert {f"{m}.py" for m in imported} <= set(stage.sources), (stage.name, name)
+    assert "dd_compute.py" in FEATURES_STAGE.sources
+
+    before = stage_versions(HISTORY_STAGES)
+    monkeypatch.setattr(
+        enriched_store, "_package_version",
+        lambda name: "missing" if name == "endplay" else "x",
+    )
+    after = stage_versions(HISTORY_STAGES)
+    assert all(b != a for b, a in zip(before, after))
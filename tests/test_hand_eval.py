@@ -0,0 +1,135 @@
+"""Tests for bridge.hand_eval — columnar evaluation vs. the per-hand reference."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from bridge.hand_eval import evaluate_hand, evaluate_hands, hand_rank_counts
+
+
+_HANDS = [
+    "7.AT86.876.KQ972",
+    "KJ54.K.QJ942.A64",
+    "A962.932.KT5.853",
+    "QT83.QJ754.A3.JT",
+    "T9875.983.Q.AQ74",
+    "AKQJT98765432...",
+    "....",
+    "- .AK.—.Q2",
+    "A.K.Q.J.T9",
+]
+
+
+def test_rank_counts_shape_and_totals():
+    counts = hand_rank_counts(_HANDS[:4])
+    assert counts.shape == (4, 4, 13)
+    assert counts.sum(axis=(1, 2)).tolist() == [13, 13, 13, 13]
+    # "7.AT86..." → one spade, the 7 (rank index 7 in A..2 order)
+    assert counts[0, 0].tolist() == [0] * 7 + [1] + [0] * 5
+
+
+def test_evaluate_hands_matches_evaluate_hand():
+    evals = evaluate_hands(_HANDS)
+    for i, hand in enumerate(_HANDS):
+        expected = evaluate_hand(hand)
+        for key, values in evals.items():
+            value = values[i]
+            value = value.item() if isinstance(value, np.generic) else value
+            assert value == expected[key], f"{hand!r} {key}: {value} != {expected[key]}"
+
+
+def test_empty_input():
+    evals = evaluate_hands([])
+    assert all(len(v) == 0 for v in evals.values())
+
+
+def test_add_hand_features_missing_hand_gives_nan():
+    from bridge.features import add_hand_features
+
+    row = {
+        "N_hand": _HANDS[0], "Ø_hand": _HANDS[1], "S_hand": _HANDS[2], "V_hand": _HANDS[3],
+        "decl": "Ø", "strain": "♦", "lead": "♥ 5",
+    }
+    df = pd.DataFrame([row, {**row, "N_hand": None, "decl": None}])
+    out = add_hand_features(df)
+
+    assert out["N_HCP"].tolist()[0] == 9
+    assert pd.isna(out["N_HCP"].iloc[1])
+    assert out["N_balanced"].iloc[1] is None
+    assert out["ØV_HCP"].tolist() == [24.0, 24.0]
+    assert pd.isna(out["NS_HCP"].iloc[1])
+    assert out["Declarer_Side"].iloc[0] == "ØV"
+    assert out["HCP_diff"].iloc[0] == 24.0 - 16.0
+    assert pd.isna(out["Declarer_HCP"].iloc[1])
+
+
+def test_evaluate_hand_cached_matches_and_counts_hits():
+    import dataclasses
+
+    import pytest
+
+    from bridge.hand_eval import (
+        clear_hand_eval_cache,
+        evaluate_hand_cached,
+        hand_eval_cache_stats,
+    )
+
+    clear_hand_eval_cache()
+    for hand in _HANDS:
+        ev = evaluate_hand_cached(hand)
+        assert ev.as_dict() == evaluate_hand(hand)
+        assert evaluate_hand_cached(f" {hand}") is ev  # key is stripped
+
+    stats = hand_eval_cache_stats()
+    assert stats["misses"] == len(set(h.strip() for h in _HANDS))
+    assert stats["hits"] == len(_HANDS) * 2 - stats["misses"]
+    assert 0.0 < stats["hit_rate"] < 1.0
+
+    ev = evaluate_hand_cached(_HANDS[1])
+    assert ev.length("D") == 5 and ev.suit("C") == "A64"
+    assert ev.suit_hcp == (4, 3, 3, 4)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        ev.hcp = 0
+    assert not hasattr(ev, "__dict__")
+
+
+def test_lead_analysis_hand_hcp_uses_normalised_key():
+    from bridge.lead_analysis import _hand_hcp
+
+    assert _hand_hcp("KJ54.K.QJ942.A64") == 14.0
+    assert _hand_hcp("kb54.K.DB942.E64") == 14.0  # Danish / lower-case ranks
+    assert _hand_hcp("...") is None
+
+
+def test_bitboard_hand_matches_parsed_hand():
+    from bridge.hand_eval import Hand, controls, hcp, ltc_adjusted, parse_hand
+
+    for dot in _HANDS:
+        hand = Hand.from_dot(dot)
+        ph = parse_hand(dot)
+        assert hcp(hand) == hcp(ph)
+        assert controls(hand) == controls(ph)
+        assert ltc_adjusted(hand) == ltc_adjusted(ph)
+        assert hand.lengths() == tuple(len(set(ph.suits[s])) for s in "SHDC")
+
+    hand = Hand.from_dot("KJ54.K.QJ942.A64")
+    assert hand == Hand.from_dot(" KJ54.K.QJ942.A64 ")
+    assert len({hand, Hand.from_dot("KJ54.K.QJ942.A64")}) == 1
+    assert hand.mask.bit_count() == 13
+    assert hand.dot() == "KJ54.K.QJ942.A64"
+    assert hand.ranks("D") == "QJ942" and hand.length("C") == 3
+    assert hand.has("S", "K") and not hand.has("S", "A")
+    assert hand.suit_hcp("S") == 4 and hand.honours("D") == 2
+    assert hand.stopper("S") and not hand.stopper("H")  # singleton K
+    assert Hand.from_dot("QT72...").stopper("S") and not Hand.from_dot("QT7...").stopper("S")
+
+
+def test_bitboard_hand_from_endplay():
+    from endplay.types import Deal
+
+    from bridge.hand_eval import Hand
+
+    deal = Deal("N:" + " ".join(_HANDS[:4]))
+    for player, dot in zip((deal.north, deal.east, deal.south, deal.west), _HANDS[:4]):
+        assert Hand.from_endplay(player) == Hand.from_dot(dot)
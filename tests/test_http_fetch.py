@@ -0,0 +1,191 @@
+"""Tests for bridge.http_fetch — ordered concurrent fetching and pacing."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _restore_settings():
+    from bridge import http_fetch
+
+    saved = dict(http_fetch._settings)
+    yield
+    http_fetch.configure(**saved)
+
+
+class TestMapOrdered:
+    def test_results_in_input_order_despite_completion_order(self):
+        from bridge.http_fetch import map_ordered
+
+        def slow_first(n):
+            time.sleep(0.05 if n == 0 else 0.0)
+            return n * 10
+
+        out = list(map_ordered(slow_first, range(6), max_workers=3))
+        assert out == [(n, n * 10) for n in range(6)]
+
+    def test_exceptions_are_yielded_not_raised(self):
+        from bridge.http_fetch import map_ordered
+
+        def fn(n):
+            if n == 1:
+                raise ValueError("boom")
+            return n
+
+        for workers in (1, 3):
+            out = list(map_ordered(fn, [0, 1, 2], max_workers=workers))
+            assert out[0] == (0, 0) and out[2] == (2, 2)
+            assert isinstance(out[1][1], ValueError)
+
+    def test_concurrency_is_bounded_and_lazy(self):
+        from bridge.http_fetch import map_ordered
+
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0, "started": 0}
+
+        def fn(n):
+            with lock:
+                state["active"] += 1
+                state["started"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return n
+
+        gen = map_ordered(fn, range(100), max_workers=2)
+        assert next(gen) == (0, 0)
+        gen.close()
+        assert state["peak"] <= 2
+        assert state["started"] < 10
+
+
+def test_politeness_delay_spaces_request_starts():
+    from bridge import http_fetch
+
+    http_fetch.configure(delay=0.05)
+    http_fetch._next_start = 0.0
+    t0 = time.monotonic()
+    for _ in range(3):
+        http_fetch._wait_politely()
+    assert time.monotonic() - t0 >= 0.09
+
+
+def test_session_is_shared_until_reconfigured():
+    from bridge import http_fetch
+
+    session = http_fetch.get_session()
+    assert http_fetch.get_session() is session
+    adapter = session.get_adapter("https://resultater.bridge.dk/")
+    assert adapter.max_retries.total == http_fetch._settings["retries"]
+
+    http_fetch.configure(concurrency=2, retries=5)
+    rebuilt = http_fetch.get_session()
+    assert rebuilt is not session
+    assert rebuilt.get_adapter("https://resultater.bridge.dk/").max_retries.total == 5
+
+
+class _FakeResponse:
+    def __init__(self, status_code, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+        self.encoding = None
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.sent_headers.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+class TestFetchPage:
+    URL = "https://resultater.bridge.dk/template/spilresultater.php?x=1"
+
+    def _setup(self, monkeypatch, tmp_path, responses):
+        from bridge import http_cache, http_fetch
+
+        monkeypatch.setattr(http_cache, "_DB_PATH", tmp_path / "http_cache.db")
+        session = _FakeSession(responses)
+        monkeypatch.setattr(http_fetch, "get_session", lambda: session)
+        http_fetch.configure(delay=0.0)
+        return session
+
+    def test_conditional_get_and_304_serves_cached_body(self, monkeypatch, tmp_path):
+        from bridge.http_fetch import fetch_page
+
+        session = self._setup(monkeypatch, tmp_path, [
+            _FakeResponse(200, "<html>v1</html>", {"ETag": '"abc"', "Last-Modified": "Tue, 10 Mar 2026"}),
+            _FakeResponse(304, "", {"ETag": '"abc"'}),
+        ])
+
+        first = fetch_page(self.URL)
+        assert first.changed and first.text == "<html>v1</html>"
+        assert session.sent_headers[0] == {}
+
+        second = fetch_page(self.URL)
+        assert session.sent_headers[1] == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Tue, 10 Mar 2026",
+        }
+        assert second.not_modified and not second.changed
+        assert second.text == first.text and second.content_hash == first.content_hash
+
+    def test_content_hash_detects_unchanged_and_changed_bodies(self, monkeypatch, tmp_path):
+        from bridge.http_fetch import fetch_page
+
+        self._setup(monkeypatch, tmp_path, [
+            _FakeResponse(200, "<html>v1</html>"),
+            _FakeResponse(200, "<html>v1</html>"),
+            _FakeResponse(200, "<html>v2</html>"),
+        ])
+
+        assert fetch_page(self.URL).changed
+        assert not fetch_page(self.URL).changed
+        third = fetch_page(self.URL)
+        assert third.changed and third.text == "<html>v2</html>"
+
+    def test_saved_rows_reused_only_for_the_saved_page_hash(self, monkeypatch, tmp_path):
+        import main
+        from bridge.data_cache import DataCache
+        from bridge.http_fetch import fetch_page
+
+        self._setup(monkeypatch, tmp_path, [
+            _FakeResponse(200, "<html>v1</html>"),
+            _FakeResponse(200, "<html>v2</html>"),
+            _FakeResponse(200, "<html>v2</html>"),
+        ])
+        cache = DataCache(data_dir=str(tmp_path / "data"))
+
+        def save(page):
+            data = {"sections": {"A": [{"board_no": 1}]}, "page_hashes": {"A": page.content_hash}}
+            cache.save_tournament_data(
+                tournament_id=7, tournament_date=datetime(2026, 3, 10), sections=[{"name": "A"}],
+                data=data, clubno=1,
+            )
+            return cache.get_cached_tournament(7, clubno=1)
+
+        saved = save(fetch_page(self.URL))
+        # v2 is fetched (and kept in the http cache), but the run stops before it is saved
+        assert fetch_page(self.URL).changed
+        page = fetch_page(self.URL)
+        assert not page.changed
+        assert main._unchanged_section_rows(saved, "A", page.content_hash) is None
+
+        saved = save(page)
+        rows = main._unchanged_section_rows(saved, "A", page.content_hash)
+        assert [row["board_no"] for row in rows] == [1]
+        assert main._unchanged_section_rows(saved, "B", page.content_hash) is None
@@ -20,7 +20,6 @@ from bridge.mvp_metrics import (
     _expected_level_hcp,
     _extract_lead_suit,
     _extract_lead_card,
-    _dd_tricks_for_decl,
 )
 
 
@@ -259,18 +258,31 @@ class TestDdTrickSelection:
     def test_dd_tricks_none_when_dd_not_valid(self):
         row = _base_row(dd_valid=False)
         df = add_mvp_metrics(_make_df(row))
-        assert df.loc[0, "dd_tricks_declarer"] is None
+        assert pd.isna(df.loc[0, "dd_tricks_declarer"])
 
     def test_dd_tricks_none_when_dd_valid_missing(self):
         row = _base_row()
         del row["dd_valid"]
         df = add_mvp_metrics(_make_df(row))
-        assert df.loc[0, "dd_tricks_declarer"] is None
+        assert pd.isna(df.loc[0, "dd_tricks_declarer"])
 
     def test_dd_tricks_none_for_unknown_decl(self):
         row = _base_row(decl="X", dd_valid=True)
         df = add_mvp_metrics(_make_df(row))
-        assert df.loc[0, "dd_tricks_declarer"] is None
+        assert pd.isna(df.loc[0, "dd_tricks_declarer"])
+
+    def test_dd_tricks_ignore_rows_without_dd_data(self):
+        rows = [
+            _base_row(decl="N", strain="H", dd_valid=True),
+            _base_row(decl="S", strain="S", dd_valid=False),
+            _base_row(decl="Ø", strain="NT", dd_valid=True, dd_Ø_NT=None),
+            _base_row(decl="N", strain="X", dd_valid=True),
+        ]
+        df = add_mvp_metrics(_make_df(*rows))
+        for col in ("dd_tricks_declarer", "play_precision_dd", "contract_hardness_dd"):
+            assert df[col].dtype == "Int8"
+        assert df["dd_tricks_declarer"].isna().tolist() == [False, True, True, True]
+        assert df.loc[0, "dd_tricks_declarer"] == 10
 
 
 # ===========================================================================
@@ -297,7 +309,7 @@ class TestPlayPrecision:
     def test_play_precision_none_when_dd_invalid(self):
         row = _base_row(dd_valid=False)
         df = add_mvp_metrics(_make_df(row))
-        assert df.loc[0, "play_precision_dd"] is None
+        assert pd.isna(df.loc[0, "play_precision_dd"])
 
     def test_contract_hardness_dd(self):
         # dd_N_H=10, contract_required=6+4=10 -> hardness=0
@@ -314,7 +326,7 @@ class TestPlayPrecision:
     def test_hardness_none_when_dd_invalid(self):
         row = _base_row(dd_valid=False)
         df = add_mvp_metrics(_make_df(row))
-        assert df.loc[0, "contract_hardness_dd"] is None
+        assert pd.isna(df.loc[0, "contract_hardness_dd"])
 
 
 # ===========================================================================
@@ -239,11 +239,17 @@ def test_competitive_bidding_v2_adapter_preserves_current_getters(monkeypatch):
         },
     }
 
-    monkeypatch.setattr(
-        opening_bid_module,
-        "_system_def_for_seat",
-        lambda _seat: v2_sys_def["system_library"]["test_system"],
-    )
+    def _fake_load_yaml_file(path):
+        name = path.name
+        if name == "systemdefinition.yaml":
+            return v2_sys_def
+        if name == "system_profiles.yaml":
+            return {"system_profiles": {"default": {"system_definition": "test_system"}}}
+        if name == "match_config.yaml":
+            return {"match_config": {"NS_system": "default", "EW_system": "default"}}
+        return {}
+
+    monkeypatch.setattr(opening_bid_module, "_load_yaml_file", _fake_load_yaml_file)
 
     comp = opening_bid_module._competitive_bidding_for_seat("N")
     neg = opening_bid_module._negative_double_params_for_seat("N")
@@ -290,4 +296,141 @@ def test_opening_flow_v2_adapter_prefers_context_node_steps_over_legacy_list():
         "evaluate_major_opening",
         "evaluate_minor_opening",
         "if_no_opening_then_pass",
-    ]
\ No newline at end of file
+    ]
+
+def test_load_bundle_compiles_seat_systems_once(monkeypatch):
+    sys_def = _minimal_systemdefinition(version="0.9")
+    system = sys_def["system_library"]["test_system"]
+    system["opening_decision_flow"] = [{"step": " Evaluate_Major_Opening "}, {"step": "if_no_opening_then_pass"}]
+    system["major_opening_logic"] = [
+        {"when": {"major_style": "five_card"}, "rules": [
+            {"id": "broken", "condition": "spades >=", "open": "1S"},
+            {"id": "hearts_5", "condition": "hearts >= 5", "open": "1H"},
+        ]},
+        {"when": {"major_style": "four_card"}, "rules": [
+            {"id": "spades_4", "condition": "spades >= 4", "open": "1S"},
+        ]},
+        {"when": {"major_style": "five_card"}, "rules": [
+            {"id": "spades_5", "condition": "spades >= 5", "open": "1S"},
+        ]},
+    ]
+    profiles = {
+        "ns": {"system_definition": "test_system", "major_style": "five_card"},
+        "ew": {"system_definition": "test_system", "major_style": "four_card"},
+    }
+
+    def _fake_load_yaml_file(path):
+        name = path.name
+        if name == "systemdefinition.yaml":
+            return sys_def
+        if name == "system_profiles.yaml":
+            return {"system_profiles": profiles}
+        if name == "match_config.yaml":
+            return {"match_config": {"NS_system": "ns", "EW_system": "ew"}}
+        return {}
+
+    monkeypatch.setattr(opening_bid_module, "_load_yaml_file", _fake_load_yaml_file)
+
+    north = opening_bid_module._seat_system("N")
+    assert opening_bid_module._seat_system("S") is north
+    assert north.profile_name == "ns" and opening_bid_module._seat_system("V").profile_name == "ew"
+    assert north.flow == ("evaluate_major_opening", "if_no_opening_then_pass")
+    # Blocks for the profile's style are flattened in order; bad conditions never match
+    assert [r.rule_id for r in north.major_opening.rules] == ["broken", "hearts_5", "spades_5"]
+    assert north.major_opening.rules[0].condition is None
+
+    row = {"dealer": "N", "N_hand": "AKJ52.Q73.84.K62"}
+    suggestion = opening_bid_module.suggest_opening_for_row(row)
+    assert (suggestion["bid"], suggestion["rule_id"]) == ("1S", "spades_5")
+
+    east = opening_bid_module.suggest_opening_for_row({"dealer": "Ø", "Ø_hand": "AKJ5.Q73.84.K762"})
+    assert (east["bid"], east["rule_id"]) == ("1S", "spades_4")
+
+
+def test_seat_params_resolve_defaults_and_two_over_one_overrides(monkeypatch):
+    sys_def = _minimal_systemdefinition(version="0.9")
+    sys_def["system_library"]["test_system"]["hand_strength_model"] = {
+        "responder_sequence_rules": {
+            "one_major_one_nt": {
+                "hcp_range": [6, 9],
+                "if_two_over_one_game_force": {"hcp_range": [6, 12], "forcing": "forcing_one_round"},
+            },
+        },
+    }
+    profiles = {
+        "ns": {"system_definition": "test_system", "two_over_one_game_force": "enabled"},
+        "ew": {"system_definition": "test_system"},
+    }
+
+    def _fake_load_yaml_file(path):
+        name = path.name
+        if name == "systemdefinition.yaml":
+            return sys_def
+        if name == "system_profiles.yaml":
+            return {"system_profiles": profiles}
+        if name == "match_config.yaml":
+            return {"match_config": {"NS_system": "ns", "EW_system": "ew"}}
+        return {}
+
+    monkeypatch.setattr(opening_bid_module, "_load_yaml_file", _fake_load_yaml_file)
+
+    north = opening_bid_module._seat_params("N")
+    west = opening_bid_module._seat_params("V")
+    assert opening_bid_module._seat_params("S") is north
+    assert north.two_over_one_gf and not west.two_over_one_gf
+    assert north.one_nt_over_major == (6, 12, "forcing_one_round", True)
+    assert west.one_nt_over_major == (6, 9, "non_forcing", True)
+    assert west.opener_buckets == (12, 14, 15, 17, 18)
+    assert west.negative_double == {"enabled": True, "hcp_min": 6, "max_level": 2}
+    assert opening_bid_module._one_nt_over_major_params_for_seat("Ø") == west.one_nt_over_major
+
+
+def test_bundle_loader_uses_binary_cache_and_reloads_edited_yaml(tmp_path, monkeypatch):
+    import os
+    import shutil
+    from pathlib import Path
+
+    source_dir = Path(opening_bid_module.__file__).resolve().parent
+    for name in opening_bid_module._BUNDLE_FILES:
+        if (source_dir / name).exists():
+            shutil.copy(source_dir / name, tmp_path / name)
+    monkeypatch.setattr(opening_bid_module, "_BUNDLE_DIR", tmp_path)
+    monkeypatch.setattr(opening_bid_module, "_BUNDLE_CACHE_FILE", tmp_path / "bundle.pickle")
+    monkeypatch.setattr(opening_bid_module, "_BUNDLE_CHECK_SECONDS", 0.0)
+
+    parsed = []
+    original_load_yaml_file = opening_bid_module._load_yaml_file
+
+    def _counting_load_yaml_file(path):
+        parsed.append(path.name)
+        return original_load_yaml_file(path)
+
+    monkeypatch.setattr(opening_bid_module, "_load_yaml_file", _counting_load_yaml_file)
+
+    loader = opening_bid_module._BundleLoader()
+    first = loader()
+    assert parsed == list(opening_bid_module._BUNDLE_FILES)
+    assert loader() is first
+
+    # A fresh process reads the parsed bundle from the binary cache
+    parsed.clear()
+    cached = opening_bid_module._BundleLoader()()
+    assert parsed == []
+    assert cached["system_profiles"] == first["system_profiles"]
+    assert cached["migration_warnings"] == first["migration_warnings"]
+    assert cached["seat_systems"]["NS"].params == first["seat_systems"]["NS"].params
+
+    # An edited YAML file is picked up without a restart
+    profiles = tmp_path / "system_profiles.yaml"
+    profiles.write_text(profiles.read_text(encoding="utf-8") + "\n# edited\n", encoding="utf-8")
+    stat = profiles.stat()
+    os.utime(profiles, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    reloaded = loader()
+    assert reloaded is not first
+    assert parsed == list(opening_bid_module._BUNDLE_FILES)
+
+    # cache_clear() re-parses the YAML even though the binary cache is current
+    parsed.clear()
+    loader.cache_clear()
+    loader()
+    assert parsed == list(opening_bid_module._BUNDLE_FILES)
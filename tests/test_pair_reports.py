@@ -0,0 +1,75 @@
+"""Tests for bridge.pair_reports — pair selection and per-pair workbooks."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+
+def _boards() -> pd.DataFrame:
+    rows = []
+    for date in ("2026-01-06", "2026-01-13"):
+        for board in range(1, 4):
+            rows.append({
+                "tournament_date": date, "board": board, "section": "A",
+                "ns1": "Anna", "ns2": "Bo", "ew1": "Carl", "ew2": "Dorte",
+                "decl": "N" if board % 2 else "Ø", "contract": "4♠", "contract_raw": "4S",
+                "level": 4, "strain": "S", "tricks": 10,
+                "pct_NS": 60.0, "pct_ØV": 40.0,
+            })
+            rows.append({
+                "tournament_date": date, "board": board, "section": "A",
+                "ns1": "Carl", "ns2": "Oversidder", "ew1": "Eva", "ew2": "Bo",
+                "decl": "V", "contract": "3NT", "contract_raw": "3NT",
+                "level": 3, "strain": "NT", "tricks": 9,
+                "pct_NS": 45.0, "pct_ØV": 55.0,
+            })
+    return pd.DataFrame(rows)
+
+
+def test_load_pair_registry(tmp_path):
+    from bridge.pair_reports import PairSpec, load_pair_registry
+
+    path = tmp_path / "pair_registry.yaml"
+    path.write_text(
+        "pair_registry:\n"
+        "  - pair_id: ab\n"
+        "    players: {north_or_east: Anna, south_or_west: Bo}\n"
+        "  - players: {north_or_east: Carl}\n",
+        encoding="utf-8",
+    )
+    assert load_pair_registry(path) == [PairSpec("ab", "Anna", "Bo")]
+    assert load_pair_registry(tmp_path / "missing.yaml") == []
+    assert load_pair_registry()[0].players == ("Henrik Friis", "Per Føge Jensen")
+
+
+def test_pairs_with_min_boards():
+    from bridge.pair_reports import PairSpec, pairs_with_min_boards
+
+    # Eva/Bo sit ØV (listed Eva, Bo) – the pair is the same in either order
+    assert pairs_with_min_boards(_boards(), 6) == [
+        PairSpec("anna_bo", "Anna", "Bo"),
+        PairSpec("bo_eva", "Bo", "Eva"),
+        PairSpec("carl_dorte", "Carl", "Dorte"),
+    ]
+    assert pairs_with_min_boards(_boards(), 7) == []
+    assert all("Oversidder" not in p.players for p in pairs_with_min_boards(_boards(), 1))
+
+
+def test_report_set_is_relabelled_and_written(tmp_path):
+    from bridge.pair_reports import PairSpec, make_pair_report_set, run_pair_reports
+
+    df = _boards()
+    pair = PairSpec("anna_bo", "Anna", "Bo")
+    reports = make_pair_report_set(df[df["ew1"] == "Carl"], pair)
+    assert reports["Role_Summary"]["Player"].unique().tolist() == ["Anna", "Bo"]
+    assert "Anna_total_pct" in reports["Tournament_Summary"].columns
+    assert "Bo_Declarer" in reports["Rapport - Aften"].columns
+    assert len(reports["Declarer_Analysis"]) == 6
+
+    results = list(run_pair_reports(
+        df, [pair, PairSpec("nobody", "X", "Y")], tmp_path, max_workers=1,
+    ))
+    assert [(r.pair_id, r.boards) for r in results] == [("anna_bo", 6), ("nobody", 0)]
+    assert results[1].path is None
+    sheets = pd.read_excel(results[0].path, sheet_name=None)
+    assert {"Role_Summary", "Declarer_List", "Tournament_Summary"} <= set(sheets)
@@ -0,0 +1,77 @@
+"""Tests for bridge.phase21_fields — the shared vectorized Phase 2.1 layer."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _rows(contracts, section="A", board_no=1, status="PLAYED", pct=50.0) -> pd.DataFrame:
+    return pd.DataFrame({
+        "tournament_date": "2026-02-03",
+        "board_no": board_no,
+        "section": section,
+        "contract": contracts,
+        "result_status_code": status,
+        "pct": pct,
+    })
+
+
+def test_split_double_state():
+    from bridge.phase21_fields import split_double_state
+
+    norm, state = split_double_state(pd.Series(["4♥X", "3NTXX", "2♠", None, "X"], dtype=object))
+    assert norm.tolist() == ["4♥", "3NT", "2♠", "None", ""]
+    assert state.tolist() == ["X", "XX", "", "", "X"]
+
+
+def test_mode_ties_go_to_first_contract_and_unplayed_rows():
+    from bridge.phase21_fields import add_phase21_fields
+
+    df = pd.concat([
+        _rows(["3NT", "4♥X", "4♥", "3NT", "5♣"], pct=[40.0, 60.0, 62.0, 44.0, 50.0]),
+        _rows(["4♠"], board_no=2, status="SITOUT"),
+    ], ignore_index=True)
+    out = add_phase21_fields(df, n_min=3)
+
+    board1 = out.iloc[0]
+    assert board1["reference_scope"] == "SECTION" and board1["N_section_played"] == 5
+    # 3NT and 4♥ both have 2 – 3NT appears first
+    assert (board1["field_mode_contract"], board1["top2_contract_2"]) == ("3NT", "4♥")
+    assert (board1["field_mode_count"], board1["top2_count_2"]) == (2, 2)
+    assert board1["Board_Type"] == "Split" and bool(board1["competitive_flag"])
+    # mode count < 3 → expected_pct is the whole group's mean
+    assert board1["expected_pct"] == pytest.approx(np.mean([40, 60, 62, 44, 50]))
+
+    sitout = out.iloc[5]
+    assert sitout["N_club_played"] == 0 and sitout["reference_scope"] == "LOW_SAMPLE"
+    assert sitout["field_mode_contract"] is None and sitout["expected_pct"] is None
+    assert out["field_mode_contract"].dtype == object
+
+
+def test_section_then_club_scope():
+    from bridge.phase21_fields import add_phase21_fields
+
+    df = pd.concat([_rows(["4♥"] * 4), _rows(["3NT"] * 4, section="B")], ignore_index=True)
+    out = add_phase21_fields(df, n_min=6)
+    assert set(out["reference_scope"]) == {"CLUB"}
+    assert out["reference_n_played"].tolist() == [8] * 8
+    assert out["expected_pct"].tolist() == [50.0] * 8   # 4 × 4♥ at 50
+
+    with pytest.raises(ValueError):
+        add_phase21_fields(df.drop(columns=["pct"]))
+
+
+def test_reference_adapter_and_analysis_share_the_core():
+    from bridge.analysis import add_phase21_fields as via_analysis
+    from bridge.phase21_reference import add_phase21_fields as via_reference
+
+    scraped = pd.DataFrame({
+        "tournament_date": "2026-02-03", "board": ["1"] * 13,
+        "contract": ["4♥"] * 10 + ["3NT"] * 3, "pct_NS": [55.0] * 10 + [30.0] * 3,
+    })
+    out = via_reference(scraped)
+    assert out["Board_Type"].iloc[0] == "Dominant" and out["section"].iloc[0] == "A"
+    again = via_analysis(out[scraped.columns.tolist() + ["board_no", "pct", "section", "result_status_code"]])
+    pd.testing.assert_frame_equal(again, out)
@@ -0,0 +1,226 @@
+"""Tests for bridge.pipeline — stage DAG ordering, concurrency, caching, rerun."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+
+def _stages(calls, barrier=None):
+    from bridge.pipeline import Stage
+
+    def load(n):
+        calls.append("load")
+        return {"df": pd.DataFrame({"x": range(n)})}
+
+    def left(df):
+        calls.append("left")
+        if barrier is not None:
+            barrier.wait(timeout=2)
+        print("left says hi")
+        return {"total": int(df["x"].sum())}
+
+    def right(df):
+        calls.append("right")
+        if barrier is not None:
+            barrier.wait(timeout=2)
+        return {"count": len(df)}
+
+    def report(total, count):
+        calls.append("report")
+        return {"report": f"{total}/{count}"}
+
+    return [
+        Stage("report", report, inputs=("total", "count"), outputs=("report",)),
+        Stage("left", left, inputs=("df",), outputs=("total",), cache=True),
+        Stage("right", right, inputs=("df",), outputs=("count",), cache=True),
+        Stage("load", load, inputs=("n",), outputs=("df",)),
+    ]
+
+
+def test_runs_in_dependency_order_and_reports():
+    from bridge.pipeline import Pipeline
+
+    calls: list = []
+    pipeline = Pipeline(_stages(calls))
+    assert pipeline.order.index("load") < pipeline.order.index("left") < pipeline.order.index("report")
+
+    result = pipeline.run({"n": 4}, max_workers=1)
+    assert result.values["report"] == "6/4"
+    assert calls[0] == "load" and calls[-1] == "report"
+    assert {r.name for r in result.records} == {"load", "left", "right", "report"}
+    assert all(r.status == "run" and r.seconds >= 0 for r in result.records)
+
+
+def test_independent_stages_run_concurrently(capsys):
+    from bridge.pipeline import Pipeline
+
+    # Both branches must be inside their stage at the same time to pass the barrier
+    barrier = threading.Barrier(2)
+    result = Pipeline(_stages([], barrier)).run({"n": 3}, max_workers=2)
+    assert result.values["report"] == "3/3"
+    # output of a concurrently running stage is printed in one block
+    assert "left says hi" in capsys.readouterr().out
+
+
+def test_fingerprint_cache_and_rerun(tmp_path):
+    from bridge.pipeline import Pipeline, PipelineError, StageStore
+
+    store = StageStore(tmp_path / "pipeline_cache.db")
+    calls: list = []
+    pipeline = Pipeline(_stages(calls))
+    pipeline.run({"n": 5}, store=store, max_workers=1)
+
+    calls.clear()
+    result = pipeline.run({"n": 5}, store=store, max_workers=1)
+    assert calls == ["load", "report"]   # left/right: same input → cached
+    assert {r.name: r.status for r in result.records}["left"] == "cache"
+
+    calls.clear()
+    result = pipeline.run({"n": 6}, store=store, max_workers=1)
+    assert sorted(calls) == ["left", "load", "report", "right"]
+    assert result.values["report"] == "15/6"
+
+    # Re-run one stage: upstream inputs come from the store, dependents re-run
+    calls.clear()
+    result = pipeline.run({}, store=store, rerun=["right"], max_workers=1)
+    assert calls == ["right", "report"]
+    assert result.values["report"] == "15/6"
+    assert pipeline.downstream(["left"]) == {"left", "report"}
+
+    with pytest.raises(PipelineError):
+        pipeline.run({}, store=StageStore(tmp_path / "empty.db"), rerun=["right"])
+
+
+def test_handle_inputs_are_not_fingerprinted(tmp_path):
+    from bridge.pipeline import Pipeline, Stage, StageStore
+
+    calls: list = []
+
+    def history(cache, store_fingerprint):
+        calls.append(store_fingerprint)
+        return {"rows": len(cache.rows)}
+
+    class _Cache:   # a new object per run, like main's DataCache
+        def __init__(self, rows):
+            self.rows = rows
+            self._lock = threading.Lock()   # does not pickle
+
+    pipeline = Pipeline([
+        Stage("history", history, inputs=("cache", "store_fingerprint"), outputs=("rows",),
+              cache=True, handles=("cache",)),
+    ])
+    store = StageStore(tmp_path / "pipeline_cache.db")
+    pipeline.run({"cache": _Cache([1, 2]), "store_fingerprint": "a"}, store=store, max_workers=1)
+    result = pipeline.run({"cache": _Cache([1, 2]), "store_fingerprint": "a"}, store=store, max_workers=1)
+    assert calls == ["a"] and result.values["rows"] == 2
+
+    result = pipeline.run({"cache": _Cache([1, 2, 3]), "store_fingerprint": "b"}, store=store, max_workers=1)
+    assert calls == ["a", "b"] and result.values["rows"] == 3
+
+
+def test_yaml_source_change_invalidates_stage(tmp_path):
+    from bridge.pipeline import Pipeline, Stage, StageStore
+
+    config = tmp_path / "system.yaml"
+    config.write_text("opening: 1NT\n", encoding="utf-8")
+    calls: list = []
+
+    def review(n):
+        calls.append("review")
+        return {"layout": n}
+
+    # An absolute path stays absolute when joined to the project root
+    pipeline = Pipeline([
+        Stage("review", review, inputs=("n",), outputs=("layout",),
+              cache=True, sources=("bridge.opening_bid", str(config))),
+    ])
+    store = StageStore(tmp_path / "pipeline_cache.db")
+    pipeline.run({"n": 1}, store=store, max_workers=1)
+    pipeline.run({"n": 1}, store=store, max_workers=1)
+    assert calls == ["review"]
+
+    config.write_text("opening: 2C\n", encoding="utf-8")
+    result = pipeline.run({"n": 1}, store=store, max_workers=1)
+    assert calls == ["review", "review"]
+    assert {r.name: r.status for r in result.records}["review"] == "run"
+
+
+def test_main_cached_stages_list_their_code_and_yaml():
+    import importlib.util
+    import re
+    from pathlib import Path
+
+    import main
+    from bridge import opening_bid
+    from bridge.pipeline import is_file_source
+
+    stages = main._build_pipeline().stages
+    review_sources = set(stages["board_review"].sources)
+    assert {f"bridge/{name}" for name in opening_bid._BUNDLE_FILES} <= review_sources
+
+    # Every bridge module a cached stage's modules import is a source too
+    for stage in stages.values():
+        if not stage.cache:
+            continue
+        modules = {s for s in stage.sources if not is_file_source(s)}
+        for module in modules:
+            text = Path(importlib.util.find_spec(module).origin).read_text(encoding="utf-8")
+            imported = {f"bridge.{m}" for m in re.findall(r"from bridge\.(\w+) import", text)}
+            assert imported <= modules, (stage.name, module, imported - modules)
+
+
+def test_stop_ends_run_without_error():
+    from bridge.pipeline import Pipeline, PipelineStop, Stage
+
+    def nothing():
+        raise PipelineStop("Ingen data fundet.")
+
+    after = []
+    pipeline = Pipeline([
+        Stage("collect", nothing, outputs=("rows",)),
+        Stage("use", lambda rows: after.append(rows) or {}, inputs=("rows",)),
+    ])
+    result = pipeline.run({})
+    assert result.stopped == "Ingen data fundet." and after == []
+
+
+def test_invalid_graphs_are_rejected():
+    from bridge.pipeline import Pipeline, PipelineError, Stage
+
+    with pytest.raises(PipelineError):
+        Pipeline([
+            Stage("a", dict, inputs=("y",), outputs=("x",)),
+            Stage("b", dict, inputs=("x",), outputs=("y",)),
+        ])
+    with pytest.raises(PipelineError):
+        Pipeline([Stage("a", dict, outputs=("x",)), Stage("b", dict, outputs=("x",))])
+    with pytest.raises(PipelineError):
+        Pipeline([Stage("a", dict, inputs=("missing",), outputs=("x",))]).run({})
+    with pytest.raises(PipelineError):
+        Pipeline([Stage("a", dict, inputs=("x",), outputs=("y",), handles=("cache",))])
+
+
+def test_capture_output_is_per_thread(capsys):
+    from bridge.pipeline import capture_output
+
+    seen = {}
+
+    def worker():
+        with capture_output() as buf:
+            print("from worker")
+            time.sleep(0.05)
+        seen["worker"] = buf.getvalue()
+
+    t = threading.Thread(target=worker)
+    t.start()
+    time.sleep(0.01)
+    print("from main")
+    t.join()
+    assert seen["worker"] == "from worker\n"
+    out = capsys.readouterr().out
+    assert "from main" in out and "from worker" not in out
+
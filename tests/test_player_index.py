@@ -0,0 +1,59 @@
+"""Tests for bridge.player_index — interned players, pair/declarer queries."""
+
+from __future__ import annotations
+
+import pickle
+
+import pandas as pd
+
+HENRIK = "Henrik Friis"
+PER = "Per Føge Jensen"
+
+
+def _boards() -> pd.DataFrame:
+    return pd.DataFrame({
+        "ns1": [HENRIK, "A", "A", PER, None, "C"],
+        "ns2": [PER, "B", "B", "X", "B", "D"],
+        "ew1": ["C", PER, HENRIK, "Y", HENRIK, "A"],
+        "ew2": ["D", HENRIK, "C", HENRIK, PER, "B"],
+        "decl": ["N", "V", "Ø", "V", "", "S"],
+    })
+
+
+def test_pair_and_player_rows():
+    from bridge.player_index import PlayerIndex
+
+    index = PlayerIndex.from_frame(_boards())
+    assert len(index) == 6 and index.id_of("nobody") is None
+    assert index.rows(HENRIK).tolist() == [0, 1, 2, 3, 4]
+    assert index.rows(HENRIK, seats=("V",)).tolist() == [1, 3]
+    assert index.pair_rows(HENRIK, PER).tolist() == [0, 1, 3, 4]
+    assert index.pair_rows(HENRIK, "nobody").tolist() == []
+    assert index.declarer_rows(HENRIK).tolist() == [0, 1, 2, 3]
+    assert index.declarer_rows("B").tolist() == []
+    assert index.mask(index.pair_rows("A", "B")).tolist() == [False, True, True, False, False, True]
+
+
+def test_seat_of_matches_find_position():
+    from bridge.declarer_analysis import find_position
+    from bridge.player_index import PlayerIndex
+
+    df = _boards()
+    index = PlayerIndex.from_frame(df)
+    for name in (HENRIK, PER, "A", "nobody"):
+        assert index.seat_of(name).tolist() == [find_position(r, name) for _, r in df.iterrows()]
+
+
+def test_pair_boards_matches_row_scan_and_pickles():
+    from bridge.hole_analysis import filter_pair_boards
+    from bridge.player_index import PlayerIndex, pair_boards
+
+    df = _boards().set_index(pd.Index([10, 11, 12, 13, 14, 15]))
+    names = {HENRIK, PER}
+    expected = df[df.apply(lambda r: names.issubset({r["ns1"], r["ns2"], r["ew1"], r["ew2"]}), axis=1)]
+    pd.testing.assert_frame_equal(pair_boards(df, HENRIK, PER), expected)
+    pd.testing.assert_frame_equal(filter_pair_boards(df), expected)
+
+    index = pickle.loads(pickle.dumps(PlayerIndex.from_frame(df)))
+    assert index.pair_rows(HENRIK, PER).tolist() == [0, 1, 3, 4]
+    assert len(PlayerIndex.from_frame(pd.DataFrame())) == 0
@@ -0,0 +1,39 @@
+"""Tests for bridge.schema — canonical dtypes of the result DataFrame."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+
+def test_apply_schema_casts_and_is_idempotent():
+    from bridge.schema import apply_schema
+
+    df = pd.DataFrame({
+        "ns1": ["Henrik Friis", "Anne", "Henrik Friis"],
+        "contract": ["3NT", None, "4♥"],
+        "tricks": [9, None, "x"],
+        "dd_N_NT": [9.0, 13.0, None],
+        "pct_NS": [62.5, None, 37.5],
+        "board_no": [1, 2, 3],
+    })
+    out = apply_schema(df)
+    assert isinstance(out["ns1"].dtype, pd.CategoricalDtype)
+    assert list(out["ns1"].cat.categories) == ["Anne", "Henrik Friis"]
+    assert out["contract"].isna().tolist() == [False, True, False]
+    assert str(out["tricks"].dtype) == "Int8" and out["tricks"].isna().tolist() == [False, True, True]
+    assert out["dd_N_NT"].tolist()[:2] == [9, 13]
+    assert out["pct_NS"].dtype == "float64"
+    assert out["board_no"].dtype == "int64"      # not in the schema
+
+    again = apply_schema(out.copy())
+    pd.testing.assert_frame_equal(again, out)
+
+
+def test_union_categories_keeps_concat_categorical():
+    from bridge.schema import apply_schema, union_categories
+
+    a = apply_schema(pd.DataFrame({"decl": ["N", "S"]}))
+    b = apply_schema(pd.DataFrame({"decl": ["Ø", None]}))
+    out = pd.concat(union_categories([a, b]), ignore_index=True)
+    assert isinstance(out["decl"].dtype, pd.CategoricalDtype)
+    assert out["decl"].tolist()[:3] == ["N", "S", "Ø"] and pd.isna(out["decl"].iloc[3])